@@ -0,0 +1,93 @@
+"""
+설정 캐시 벤치마크
+
+GUI 사용 패턴(목록 조회 위주, 가끔 추가/삭제/이동)을 흉내 낸 1,000회 작업 세션을 실행하여
+ConfigManager의 설정 캐시 사용 여부에 따른 소요 시간과 파일 읽기 횟수를 비교합니다.
+
+실행 방법:
+    python benchmarks/bench_config_cache.py --ops 1000 --servers 50
+"""
+
+import os
+import sys
+import time
+import random
+import logging
+import argparse
+import tempfile
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config_manager import ConfigManager
+
+
+class UncachedConfigManager(ConfigManager):
+    """캐시를 사용하지 않는 ConfigManager (이전 동작 비교용)"""
+
+    def _update_cache(self, config, key):
+        pass
+
+
+def make_server(i):
+    """벤치마크용 서버 항목을 생성합니다."""
+    return {
+        'name': f"server-{i}",
+        'command': 'npx',
+        'args': ['-y', f"@example/server-{i}"],
+        'env': {'API_KEY': 'x' * 16},
+    }
+
+
+def run_session(config_path, ops, servers, manager_class, seed=42):
+    """작업 세션을 실행하고 (전체 소요 시간, 조회 소요 시간, 캐시 통계)를 반환합니다."""
+    manager = manager_class(config_path=config_path)
+    manager.save_mcp_servers([make_server(i) for i in range(servers)])
+    manager.cache_stats = {'disk_reads': 0, 'avoided_reads': 0}
+
+    rng = random.Random(seed)
+    next_id = servers
+    read_time = 0.0
+    start = time.perf_counter()
+    for _ in range(ops):
+        roll = rng.random()
+        if roll < 0.80:
+            t = time.perf_counter()
+            manager.get_mcp_servers()
+            read_time += time.perf_counter() - t
+        elif roll < 0.90:
+            count = len(manager.get_mcp_servers())
+            manager.move_mcp_server(rng.randrange(count), rng.randrange(count))
+        elif roll < 0.95:
+            manager.add_mcp_server(make_server(next_id))
+            next_id += 1
+        else:
+            current = manager.get_mcp_servers()
+            manager.delete_mcp_server(rng.choice(current)['name'])
+    elapsed = time.perf_counter() - start
+    return elapsed, read_time, manager.cache_stats
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="ConfigManager 설정 캐시 벤치마크")
+    parser.add_argument('--ops', type=int, default=1000, help="세션 작업 수")
+    parser.add_argument('--servers', type=int, default=50, help="초기 서버 수")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    results = {}
+    for label, manager_class in (("캐시 없음", UncachedConfigManager), ("캐시 사용", ConfigManager)):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = os.path.join(temp_dir, "claude_desktop_config.json")
+            results[label] = run_session(config_path, args.ops, args.servers, manager_class)
+
+    print(f"작업 수: {args.ops}, 초기 서버 수: {args.servers}")
+    for label, (elapsed, read_time, stats) in results.items():
+        print(f"  {label}: 전체 {elapsed * 1000:.1f} ms, 조회 작업 {read_time * 1000:.1f} ms, "
+              f"파일 읽기 {stats['disk_reads']}회, 생략된 읽기 {stats['avoided_reads']}회")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+ConfigManager 부하/확장성 벤치마크
+
+서버 10개부터 10,000개까지의 설정(큰 env 블록, 긴 args)을 만들어 ConfigManager의 주요 작업을 측정합니다.
+    - load: 캐시를 비운 뒤 설정 파일 로드 (파일 읽기와 파싱 포함)
+    - get: MCP 서버 목록 조회
+    - add / delete / move: 서버 추가, 삭제, 순서 변경 (각각 한 번의 저장)
+    - save: 서버 하나를 바꾼 전체 설정 저장
+    - backup / restore: 백업 생성, 지정한 백업에서 복원
+    - list: 백업 목록 조회
+backup, restore, list는 기존 백업이 없을 때와 --backups개(기본 1,000개) 있을 때를 모두 측정합니다.
+
+작업마다 초당 처리 수, 작업당 쓴 바이트 수(Linux의 /proc/self/io 기준), 최대 메모리(tracemalloc)를 보고합니다.
+
+실행 방법:
+    python benchmarks/bench_config_stress.py --sizes 10,100,1000,10000 --ops 20 --backups 1000
+    python benchmarks/bench_config_stress.py --output baseline.json
+    python benchmarks/bench_config_stress.py --write-delay 0.5   # 쓰기 지연 모드 (add/delete/move는 메모리 반영까지만 측정)
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import tempfile
+import tracemalloc
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config_manager import ConfigManager
+from config.backup_store import REASON_MANUAL
+from utils import json_io
+
+OPERATIONS = ('load', 'get', 'add', 'delete', 'move', 'save', 'backup', 'restore', 'list')
+BACKUP_OPERATIONS = ('backup', 'restore', 'list')
+
+
+def make_server(i, env_keys, arg_count):
+    """큰 env 블록과 긴 args를 가진 벤치마크용 서버 설정을 생성합니다."""
+    return {
+        'command': 'npx',
+        'args': ['-y', f"@example/server-{i}"] + [f"--option-{j}=/very/long/path/to/some/resource/{i}/{j}"
+                                                  for j in range(arg_count)],
+        'env': {f"ENV_VAR_{j}": f"value-{i}-{j}-" + 'x' * 32 for j in range(env_keys)},
+        'description': f"Example server {i}",
+    }
+
+
+def make_config(servers, env_keys, arg_count):
+    """벤치마크용 설정을 생성합니다."""
+    return {
+        'globalShortcut': 'Ctrl+Space',
+        'mcpServers': {f"server-{i}": make_server(i, env_keys, arg_count) for i in range(servers)},
+    }
+
+
+def written_bytes():
+    """지금까지 이 프로세스가 쓴 바이트 수를 반환합니다 (/proc/self/io가 없으면 None)."""
+    try:
+        with open('/proc/self/io', 'r') as f:
+            for line in f:
+                if line.startswith('wchar:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+class StressCase:
+    """서버 수 하나에 대한 측정 환경"""
+
+    def __init__(self, temp_dir, servers, env_keys, arg_count, write_delay=None):
+        self.config_path = os.path.join(temp_dir, "claude_desktop_config.json")
+        self.servers = servers
+        self.env_keys = env_keys
+        self.arg_count = arg_count
+        with open(self.config_path, 'wb') as f:
+            f.write(json_io.dumps_bytes(make_config(servers, env_keys, arg_count), pretty=True))
+        self.manager = ConfigManager(config_path=self.config_path, write_delay=write_delay)
+        self.next_id = servers
+        self.revision = 0
+        self.added = []
+
+    def touch(self):
+        """서버 하나의 args를 바꿔 저장합니다 (백업 내용이 매번 달라지도록)."""
+        self.revision += 1
+        config = self.manager.load_config()
+        config['mcpServers']['server-0']['args'][0] = f"-y{self.revision}"
+        self.manager.save_config(config)
+
+    def populate_backups(self, count):
+        """최근 1시간 안의 서로 다른 백업 count개를 만듭니다 (보존 정책으로 지워지지 않음)."""
+        store = self.manager.backup_store
+        now = time.time()
+        for i in range(count):
+            data = json_io.dumps_bytes({'mcpServers': {f"backup-{i}": {'command': 'npx'}}}, pretty=True)
+            store.put(data, reason=REASON_MANUAL, timestamp=now - 3000 + i * 3000 / max(count, 1))
+
+    # 작업별 (준비, 실행) 함수. 준비는 측정하지 않습니다.
+    def prepare(self, operation):
+        if operation == 'delete' and not self.added:
+            self.run('add')
+        elif operation == 'save':
+            self.revision += 1
+            config = self.manager.load_config()
+            config['mcpServers']['server-0']['args'][0] = f"-y{self.revision}"
+            return config
+        elif operation == 'backup':
+            # 변경 없는 설정은 기존 백업을 재사용하므로 매번 내용을 바꿈
+            self.touch()
+        elif operation == 'restore':
+            self.touch()
+            return self.manager.backup_store.latest()['name']
+        return None
+
+    def run(self, operation, prepared=None):
+        manager = self.manager
+        if operation == 'load':
+            manager.invalidate_cache()
+            manager.load_config()
+        elif operation == 'get':
+            manager.get_mcp_servers()
+        elif operation == 'add':
+            name = f"server-{self.next_id}"
+            self.next_id += 1
+            manager.add_mcp_server(dict(make_server(self.next_id, self.env_keys, self.arg_count), name=name))
+            self.added.append(name)
+        elif operation == 'delete':
+            manager.delete_mcp_server(self.added.pop())
+        elif operation == 'move':
+            manager.move_mcp_server(0, self.servers - 1)
+        elif operation == 'save':
+            manager.save_config(prepared)
+        elif operation == 'backup':
+            manager._backup_config(reason=REASON_MANUAL)
+        elif operation == 'restore':
+            manager.restore_backup(prepared)
+        elif operation == 'list':
+            manager.get_backup_list()
+
+
+def measure_operation(case, operation, ops):
+    """
+    작업을 ops번 실행하여 (초당 처리 수, 작업당 쓴 바이트 수, 최대 메모리 바이트)를 반환합니다.
+    시간과 쓴 바이트는 tracemalloc 없이 측정하고, 최대 메모리는 한 번 더 실행하여 측정합니다.
+    """
+    elapsed = 0.0
+    written = 0
+    for _ in range(ops):
+        prepared = case.prepare(operation)
+        before = written_bytes()
+        start = time.perf_counter()
+        case.run(operation, prepared)
+        elapsed += time.perf_counter() - start
+        after = written_bytes()
+        if before is not None and after is not None:
+            written += after - before
+
+    prepared = case.prepare(operation)
+    tracemalloc.start()
+    case.run(operation, prepared)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'ops_per_sec': ops / elapsed if elapsed > 0 else float('inf'),
+        'bytes_per_op': written / ops if written_bytes() is not None else None,
+        'peak_memory': peak,
+    }
+
+
+def format_bytes(value):
+    """바이트 수를 읽기 쉬운 문자열로 변환합니다."""
+    if value is None:
+        return "-"
+    for unit in ("B", "KB", "MB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+def run_size(servers, args):
+    """서버 수 하나에 대해 모든 작업을 측정합니다."""
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        case = StressCase(temp_dir, servers, args.env_keys, args.args, args.write_delay)
+        size = os.path.getsize(case.config_path)
+        for operation in OPERATIONS:
+            results[operation] = measure_operation(case, operation, args.ops)
+        if args.backups:
+            case.populate_backups(args.backups)
+            for operation in BACKUP_OPERATIONS:
+                results[f"{operation} ({args.backups} backups)"] = measure_operation(case, operation, args.ops)
+        case.manager.flush()
+    return size, results
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="ConfigManager 부하/확장성 벤치마크")
+    parser.add_argument('--sizes', default="10,100,1000,10000", help="서버 수 목록 (쉼표로 구분)")
+    parser.add_argument('--ops', type=int, default=20, help="작업별 반복 횟수")
+    parser.add_argument('--env-keys', type=int, default=20, help="서버당 env 항목 수")
+    parser.add_argument('--args', type=int, default=20, help="서버당 추가 args 수")
+    parser.add_argument('--backups', type=int, default=1000, help="미리 만들어 둘 백업 수 (0이면 생략)")
+    parser.add_argument('--write-delay', type=float, help="쓰기 지연 시간 (초, 지정하면 쓰기 지연 모드로 측정)")
+    parser.add_argument('--output', help="결과를 저장할 JSON 파일 경로 (기준값 비교용)")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    report = {'json_backend': json_io.backend(), 'ops': args.ops, 'env_keys': args.env_keys,
+              'args': args.args, 'write_delay': args.write_delay, 'sizes': {}}
+    for servers in (int(size) for size in args.sizes.split(',')):
+        size, results = run_size(servers, args)
+        report['sizes'][servers] = {'config_bytes': size, 'operations': results}
+
+        print(f"서버 {servers}개 (설정 파일 {format_bytes(size)}, 작업별 {args.ops}회, JSON 백엔드 {json_io.backend()})")
+        print(f"  {'작업':<24}{'초당 처리':>12}{'작업당 쓰기':>14}{'최대 메모리':>14}")
+        for operation, result in results.items():
+            print(f"  {operation:<24}{result['ops_per_sec']:>12.1f}{format_bytes(result['bytes_per_op']):>14}"
+                  f"{format_bytes(result['peak_memory']):>14}")
+        print()
+
+    if args.output:
+        with open(args.output, 'wb') as f:
+            f.write(json_io.dumps_bytes(report, pretty=True))
+        print(f"결과를 저장했습니다: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
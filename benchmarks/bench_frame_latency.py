@@ -0,0 +1,118 @@
+"""
+메인 스레드 프레임 지연 벤치마크
+
+카탈로그 새로고침 중 Qt 메인 스레드의 타이머 지연(프레임 간격)을 측정합니다.
+스레드 모드(MCPLoaderThread)와 작업자 프로세스 모드(MCPProcessLoaderThread)를 비교합니다.
+
+실행 방법:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_frame_latency.py --entries 5000
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import tempfile
+import statistics
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QTimer, QEventLoop
+
+import main as app_main
+from crawler.github_crawler import GitHubCrawler
+
+# 타이머 간격 (밀리초, 60fps 기준)
+FRAME_INTERVAL_MS = 16
+
+
+def make_readme(entries):
+    """지정한 수의 서버 항목을 가진 README.md 내용을 생성합니다."""
+    lines = ["# Model Context Protocol servers", "", "## Reference Servers", ""]
+    for i in range(entries // 2):
+        lines.append(f"- **[Server {i}](src/server{i})** - Reference server {i} for web search and file access")
+    lines += ["", "## Official Integrations", ""]
+    for i in range(entries - entries // 2):
+        lines.append(f"- **[Vendor {i}](https://example.com/{i})** - Official integration {i} with database tools")
+    return "\n".join(lines) + "\n"
+
+
+def measure(app, loader):
+    """로더 실행 중 타이머 간격을 측정합니다."""
+    gaps = []
+    last = [time.perf_counter()]
+
+    def on_tick():
+        now = time.perf_counter()
+        gaps.append((now - last[0]) * 1000)
+        last[0] = now
+
+    timer = QTimer()
+    timer.timeout.connect(on_tick)
+    timer.start(FRAME_INTERVAL_MS)
+
+    loop = QEventLoop()
+    result = {}
+    loader.finished.connect(lambda servers: result.setdefault('count', len(servers)))
+    loader.finished.connect(loop.quit)
+    loader.error.connect(lambda msg: print(f"  오류: {msg}"))
+
+    start = time.perf_counter()
+    last[0] = start
+    loader.start()
+    loop.exec()
+    elapsed = time.perf_counter() - start
+    timer.stop()
+    loader.wait()
+
+    gaps = gaps or [0.0]
+    ordered = sorted(gaps)
+    return {
+        'count': result.get('count', 0),
+        'elapsed_s': elapsed,
+        'p50_ms': statistics.median(ordered),
+        'p95_ms': ordered[int(len(ordered) * 0.95) - 1] if len(ordered) > 1 else ordered[0],
+        'max_ms': ordered[-1],
+    }
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="카탈로그 새로고침 중 메인 스레드 프레임 지연 측정")
+    parser.add_argument('--entries', type=int, default=5000, help="README 서버 항목 수")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    app = QApplication(sys.argv)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        readme_file = os.path.join(temp_dir, "README.md")
+        with open(readme_file, 'w', encoding='utf-8') as f:
+            f.write(make_readme(args.entries))
+
+        # 스레드 모드: 같은 README를 스레드 안에서 파싱
+        def parse_local(self, force_refresh=False):
+            with open(readme_file, 'r', encoding='utf-8') as f:
+                return self._parse_readme(f.read())
+
+        original = GitHubCrawler.get_mcp_servers
+        GitHubCrawler.get_mcp_servers = parse_local
+        try:
+            thread_stats = measure(app, app_main.MCPLoaderThread(force_refresh=True))
+        finally:
+            GitHubCrawler.get_mcp_servers = original
+
+        process_stats = measure(app, app_main.MCPProcessLoaderThread(force_refresh=True, readme_file=readme_file))
+
+    print(f"README 항목 수: {args.entries}, 타이머 간격: {FRAME_INTERVAL_MS} ms")
+    for label, stats in (("thread ", thread_stats), ("process", process_stats)):
+        print(f"  {label}: 서버 {stats['count']}개, 소요 {stats['elapsed_s']:.2f} s, "
+              f"프레임 간격 p50 {stats['p50_ms']:.1f} ms / p95 {stats['p95_ms']:.1f} ms / "
+              f"최대 {stats['max_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
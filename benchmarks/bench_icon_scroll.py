@@ -0,0 +1,157 @@
+"""
+목록 아이콘 스크롤 벤치마크
+
+5,000개 행의 사용 가능한 MCP 목록을 일정 속도로 스크롤하면서 Qt 메인 스레드의 프레임 간격을 측정합니다.
+아이콘은 지연 시간을 흉내 내는 로컬 HTTP 서버에서 내려받습니다 (실제 GitHub 요청 없음).
+아이콘 로더를 연결하지 않은 경우와 연결한 경우를 비교합니다.
+
+실행 방법:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_icon_scroll.py --rows 5000
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import tempfile
+import threading
+import statistics
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QTimer, QEventLoop, QBuffer, QIODevice
+from PyQt6.QtGui import QImage, QColor
+
+from ui.main_window import MainWindow
+from ui.image_cache import ImageLoader
+
+# 타이머 간격 (밀리초, 60fps 기준)
+FRAME_INTERVAL_MS = 16
+
+
+def make_png(index, size=256):
+    """소유자마다 다른 색상의 PNG 이미지를 생성합니다 (실제 아바타 크기)."""
+    image = QImage(size, size, QImage.Format.Format_ARGB32)
+    image.fill(QColor.fromHsv(index * 37 % 360, 160, 220))
+    buffer = QBuffer()
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(buffer.data())
+
+
+def start_image_server(latency):
+    """지연 시간을 흉내 내는 로컬 이미지 서버를 시작합니다."""
+    images = {}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            owner = int(self.path.strip('/').split('.')[0].replace('owner', '') or 0)
+            with lock:
+                if owner not in images:
+                    images[owner] = make_png(owner)
+                data = images[owner]
+            self.send_response(200)
+            self.send_header('Content-Type', 'image/png')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_servers(rows, port):
+    """로컬 이미지 서버를 아바타로 사용하는 서버 목록을 생성합니다 (소유자당 서버 2개)."""
+    return [{
+        'name': f"Server {i}",
+        'description': f"Benchmark server {i}",
+        'avatar_url': f"http://127.0.0.1:{port}/owner{i // 2}.png",
+    } for i in range(rows)]
+
+
+def measure(app, window, seconds, rows_per_frame):
+    """목록을 스크롤하면서 타이머 간격을 측정합니다."""
+    gaps = []
+    last = [time.perf_counter()]
+    scroll_bar = window.mcp_list.verticalScrollBar()
+
+    def on_tick():
+        now = time.perf_counter()
+        gaps.append((now - last[0]) * 1000)
+        last[0] = now
+        scroll_bar.setValue((scroll_bar.value() + rows_per_frame) % max(1, scroll_bar.maximum()))
+
+    timer = QTimer()
+    timer.timeout.connect(on_tick)
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+
+    scroll_bar.setValue(0)
+    last[0] = time.perf_counter()
+    timer.start(FRAME_INTERVAL_MS)
+    loop.exec()
+    timer.stop()
+
+    ordered = sorted(gaps) or [0.0]
+    return {
+        'frames': len(gaps),
+        'p50_ms': statistics.median(ordered),
+        'p95_ms': ordered[int(len(ordered) * 0.95) - 1] if len(ordered) > 1 else ordered[0],
+        'max_ms': ordered[-1],
+    }
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="아이콘 로딩 중 목록 스크롤 프레임 간격 측정")
+    parser.add_argument('--rows', type=int, default=5000, help="목록 행 수")
+    parser.add_argument('--seconds', type=float, default=5.0, help="측정 시간 (초)")
+    parser.add_argument('--latency', type=float, default=0.05, help="이미지 서버 응답 지연 (초)")
+    parser.add_argument('--speed', type=int, default=3, help="프레임당 스크롤 행 수")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    app = QApplication(sys.argv)
+    server = start_image_server(args.latency)
+
+    window = MainWindow()
+    window.resize(1000, 700)
+    window.show()
+    window.populate_mcp_list(make_servers(args.rows, server.server_address[1]))
+    app.processEvents()
+
+    baseline = measure(app, window, args.seconds, args.speed)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        loader = ImageLoader(cache_dir=temp_dir)
+        window.set_image_loader(loader)
+        requests_before = []
+        original_set_wanted = loader.set_wanted
+        loader.set_wanted = lambda urls: requests_before.append(original_set_wanted(urls)) or requests_before[-1]
+
+        cold = measure(app, window, args.seconds, args.speed)
+        fetched = sum(requests_before)
+        warm = measure(app, window, args.seconds, args.speed)
+        loader.shutdown()
+
+    server.shutdown()
+
+    print(f"행 수: {args.rows}, 스크롤 속도: {args.speed}행/프레임, 이미지 지연: {args.latency * 1000:.0f} ms")
+    for label, stats in (("아이콘 없음     ", baseline), ("아이콘 (콜드)   ", cold), ("아이콘 (캐시)   ", warm)):
+        print(f"  {label}: 프레임 {stats['frames']}개, 간격 p50 {stats['p50_ms']:.1f} ms / "
+              f"p95 {stats['p95_ms']:.1f} ms / 최대 {stats['max_ms']:.1f} ms")
+    print(f"  콜드 스크롤 중 시작된 이미지 요청: {fetched}개 (화면 밖 요청은 시작 전 취소)")
+
+
+if __name__ == "__main__":
+    main()
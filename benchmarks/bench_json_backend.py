@@ -0,0 +1,86 @@
+"""
+JSON 백엔드 벤치마크
+
+큰 Claude 설정 파일과 서버 카탈로그 캐시를 표준 라이브러리 json과 orjson으로
+파싱/직렬화하는 시간을 비교합니다.
+    - 설정 파일: 들여쓰기(pretty) 저장
+    - 카탈로그 캐시: 압축 형식 저장 (이전에는 indent=2로 저장)
+
+실행 방법:
+    python benchmarks/bench_json_backend.py --servers 10000 --repeat 5
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import json_io
+from benchmarks.bench_schema_validation import make_config, measure
+
+
+def make_catalog(servers):
+    """벤치마크용 서버 카탈로그 캐시를 생성합니다."""
+    return [{
+        'name': f"server-{i}",
+        'description': f"Example MCP server {i} — 예제 서버 설명입니다. " * 3,
+        'url': f"https://github.com/example/server-{i}",
+        'stars': i * 7 % 5000,
+        'topics': ['mcp', 'ai', f"topic-{i % 50}"],
+        'install': {'command': 'npx', 'args': ['-y', f"@example/server-{i}"]},
+        'updated_at': "2024-05-01T12:00:00Z",
+    } for i in range(servers)]
+
+
+def bench_backend(name, cases, repeat):
+    """백엔드 하나의 (케이스, 작업) 별 시간(초)을 측정합니다."""
+    json_io.set_backend(name)
+    results = {}
+    for label, value, pretty in cases:
+        data = json_io.dumps_bytes(value, pretty)
+        results[(label, 'dumps')] = measure(lambda: json_io.dumps_bytes(value, pretty), repeat)
+        results[(label, 'loads')] = measure(lambda: json_io.loads(data), repeat)
+        results[(label, 'size')] = len(data)
+    return results
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="JSON 백엔드 벤치마크")
+    parser.add_argument('--servers', type=int, default=10000, help="서버 수")
+    parser.add_argument('--repeat', type=int, default=5, help="반복 횟수")
+    args = parser.parse_args()
+
+    config = make_config(args.servers)
+    catalog = make_catalog(args.servers)
+    cases = [("설정 파일 (pretty)", config, True), ("카탈로그 캐시 (압축)", catalog, False)]
+
+    # 변경 전 방식: 모든 파일을 indent=2로 저장
+    legacy_catalog = measure(lambda: json.dumps(catalog, ensure_ascii=False, indent=2), args.repeat)
+    legacy_size = len(json.dumps(catalog, ensure_ascii=False, indent=2).encode('utf-8'))
+
+    backends = ['json'] + (['orjson'] if json_io.orjson is not None else [])
+    results = {name: bench_backend(name, cases, args.repeat) for name in backends}
+
+    print(f"서버 수: {args.servers}, 반복: {args.repeat}회 (최솟값)")
+    print(f"  변경 전 카탈로그 저장 (json, indent=2): {legacy_catalog * 1000:.1f} ms, {legacy_size / 1024:.0f} KB")
+    for label, _, _ in cases:
+        print(f"  {label}")
+        base = results['json']
+        for name in backends:
+            result = results[name]
+            print(f"    {name:>6}: 직렬화 {result[(label, 'dumps')] * 1000:7.1f} ms "
+                  f"({base[(label, 'dumps')] / result[(label, 'dumps')]:.1f}배), "
+                  f"파싱 {result[(label, 'loads')] * 1000:7.1f} ms "
+                  f"({base[(label, 'loads')] / result[(label, 'loads')]:.1f}배), "
+                  f"{result[(label, 'size')] / 1024:.0f} KB")
+    if 'orjson' not in backends:
+        print("  orjson이 설치되어 있지 않아 표준 라이브러리만 측정했습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+설정 스키마 검증 벤치마크
+
+10,000개 서버가 있는 설정으로 다음 세 가지 검증 시간을 비교합니다.
+    - 스키마를 매번 해석하는 검증 (비교용)
+    - 컴파일된 검증기의 전체 검증
+    - 컴파일된 검증기의 증분 검증 (서버 하나만 변경)
+
+실행 방법:
+    python benchmarks/bench_schema_validation.py --servers 10000 --repeat 5
+"""
+
+import os
+import sys
+import copy
+import time
+import argparse
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.schema import ConfigValidator, CONFIG_SCHEMA
+
+_TYPES = {
+    'object': dict, 'array': list, 'string': str, 'boolean': bool, 'null': type(None),
+}
+
+
+def interpret(schema, value, path, errors):
+    """스키마를 매번 해석하며 검증합니다 (비교용)."""
+    types = schema.get('type')
+    if types is not None:
+        types = [types] if isinstance(types, str) else types
+        if not any(isinstance(value, _TYPES[name]) for name in types):
+            errors.append((path, "type"))
+            return
+    if 'enum' in schema and value not in schema['enum']:
+        errors.append((path, "enum"))
+    if 'minLength' in schema and isinstance(value, str) and len(value) < schema['minLength']:
+        errors.append((path, "minLength"))
+    if 'items' in schema and isinstance(value, list):
+        for index, item in enumerate(value):
+            interpret(schema['items'], item, f"{path}[{index}]", errors)
+    if isinstance(value, dict):
+        for key in schema.get('required', ()):
+            if key not in value:
+                errors.append((path, "required"))
+        properties = schema.get('properties', {})
+        additional = schema.get('additionalProperties', True)
+        for key, item in value.items():
+            if 'propertyNames' in schema:
+                interpret(schema['propertyNames'], key, f"{path}.{key}", errors)
+            if key in properties:
+                interpret(properties[key], item, f"{path}.{key}", errors)
+            elif isinstance(additional, dict):
+                interpret(additional, item, f"{path}.{key}", errors)
+
+
+def make_config(servers):
+    """벤치마크용 설정을 생성합니다."""
+    return {
+        'globalShortcut': 'Ctrl+Space',
+        'mcpServers': {
+            f"server-{i}": {
+                'command': 'npx',
+                'args': ['-y', f"@example/server-{i}", '--port', str(3000 + i % 100)],
+                'env': {'API_KEY': 'x' * 16, 'LOG_LEVEL': 'info'},
+                'description': f"Example server {i}",
+                'category': "일반",
+            } for i in range(servers)
+        },
+    }
+
+
+def measure(func, repeat):
+    """함수를 반복 실행하여 가장 짧은 시간(초)을 반환합니다."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="설정 스키마 검증 벤치마크")
+    parser.add_argument('--servers', type=int, default=10000, help="서버 수")
+    parser.add_argument('--repeat', type=int, default=5, help="반복 횟수")
+    args = parser.parse_args()
+
+    config = make_config(args.servers)
+    changed = copy.deepcopy(config)
+    changed['mcpServers']['server-7']['args'].append('--verbose')
+
+    start = time.perf_counter()
+    validator = ConfigValidator()
+    compile_time = time.perf_counter() - start
+
+    interpreted = measure(lambda: interpret(CONFIG_SCHEMA, config, "$", []), args.repeat)
+    full = measure(lambda: validator.validate(config), args.repeat)
+    incremental = measure(lambda: validator.validate(changed, previous=config), args.repeat)
+    assert validator.last_checked == 1
+
+    print(f"서버 수: {args.servers}, 반복: {args.repeat}회 (최솟값)")
+    print(f"  스키마 컴파일: {compile_time * 1000:.2f} ms")
+    print(f"  해석 방식 전체 검증: {interpreted * 1000:.1f} ms")
+    print(f"  컴파일 방식 전체 검증: {full * 1000:.1f} ms ({interpreted / full:.1f}배)")
+    print(f"  컴파일 방식 증분 검증 (1개 변경): {incremental * 1000:.1f} ms ({interpreted / incremental:.1f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,13 @@ MCP 설정 관리자의 설정 패키지
 설정 파일 관리 기능을 제공합니다.
 """
 
-from .config_manager import ConfigManager
+from .config_manager import ConfigManager, ConfigTransaction, merge_configs
+from .backup_store import BackupStore
+from .retention import RetentionPolicy
+from .journal import ConfigJournal
+from .schema import ConfigValidator
+from .profiles import ProfileStore
+from .server_model import ServerModel
+from .history import ConfigHistory
 
-__all__ = ['ConfigManager']
+__all__ = ['ConfigManager', 'ConfigTransaction', 'merge_configs', 'BackupStore', 'RetentionPolicy', 'ConfigJournal', 'ConfigValidator', 'ProfileStore', 'ServerModel', 'ConfigHistory']
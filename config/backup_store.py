@@ -0,0 +1,444 @@
+"""
+백업 저장소 모듈
+
+설정 파일 백업을 내용 주소(SHA-256) 기반의 압축 blob으로 저장합니다.
+같은 내용은 한 번만 저장하고, 각 백업은 추가 전용 매니페스트의 (시각, 해시, 사유) 항목으로 기록합니다.
+
+매니페스트(manifest.jsonl)는 한 줄에 하나의 레코드를 기록합니다.
+    {"op": "add", "entry": {...}}      백업 추가
+    {"op": "remove", "names": [...]}   백업 삭제
+blob을 먼저 기록하고 fsync한 뒤 매니페스트 줄을 추가하므로, 중간에 중단되어도
+매니페스트가 없는 blob을 가리키지 않습니다. 기록 도중 잘린 마지막 줄은 읽을 때 버립니다.
+"""
+
+import os
+import re
+import gzip
+import time
+import hashlib
+import itertools
+import collections
+import logging
+import threading
+from datetime import datetime
+
+from utils import json_io
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('backup_store')
+
+# 백업 사유
+REASON_SAVE = "save"
+REASON_MANUAL = "manual"
+REASON_ERROR = "error"
+REASON_BEFORE_RESTORE = "before_restore"
+REASON_RECOVERED = "recovered"
+REASON_CHECKPOINT = "checkpoint"
+REASON_PROFILE = "profile"
+
+# 삭제 레코드가 이 수를 넘고 살아 있는 항목 수보다 많으면 매니페스트를 다시 씀
+COMPACT_THRESHOLD = 256
+
+# 이전 버전이 만든 백업 파일 이름 (claude_desktop_config_YYYYmmdd_HHMMSS[_error].json 등)
+LEGACY_BACKUP_PATTERN = re.compile(r"^claude_desktop_config_(before_restore_)?\d{8}_\d{6}(_error)?\.json$")
+# 저장소로 옮긴 이전 백업 파일을 보관하는 하위 디렉토리
+LEGACY_DIR = "legacy"
+
+
+class BackupStore:
+    """내용 주소 기반 백업 저장소 클래스"""
+
+    def __init__(self, backup_dir, max_backups=1000, retention=None):
+        """
+        BackupStore 초기화
+
+        Args:
+            backup_dir (str): 백업 디렉토리 경로
+            max_backups (int, optional): 매니페스트에 유지할 최대 백업 수. 기본값은 1000입니다.
+            retention (RetentionPolicy, optional): 시간 구간별 보존 정책. 기본값은 None으로,
+                                                  이 경우 최대 백업 수만 적용합니다.
+        """
+        self.backup_dir = backup_dir
+        self.objects_dir = os.path.join(backup_dir, "objects")
+        self.manifest_path = os.path.join(backup_dir, "manifest.jsonl")
+        self.max_backups = max_backups
+        self._lock = threading.Lock()
+        # 이름 -> 항목 (시각, id 순서로 유지), 해시 -> 참조하는 항목 수
+        self._entries = {}
+        self._refs = collections.Counter()
+        self._dead_records = 0
+        self._load_manifest()
+        self._next_id = max((entry['id'] for entry in self._entries.values()), default=0) + 1
+
+        # 보존 정책은 시작할 때 한 번 전체 항목으로 상태를 만들고, 이후에는 새 백업만 처리
+        self.retention = retention
+        if self.retention is not None:
+            with self._lock:
+                self._remove_locked(self.retention.reset(list(self._entries.values())))
+
+        self._migrate_legacy_backups()
+
+    def _load_manifest(self):
+        """매니페스트를 재생하여 항목 목록을 만듭니다. 없거나 읽을 수 없으면 blob 디렉토리에서 다시 만듭니다."""
+        if not os.path.exists(self.manifest_path):
+            legacy_manifest = os.path.join(self.backup_dir, "manifest.json")
+            if os.path.exists(legacy_manifest):
+                self._import_json_manifest(legacy_manifest)
+            elif os.path.isdir(self.objects_dir):
+                self.rebuild()
+            return
+
+        try:
+            with open(self.manifest_path, 'rb') as f:
+                lines = f.read().split(b"\n")
+        except OSError as e:
+            logger.error(f"백업 매니페스트 로드 오류: {e}")
+            self.rebuild()
+            return
+
+        valid_size = 0
+        for line in lines[:-1]:
+            try:
+                self._apply_record(json_io.loads(line))
+            except (ValueError, KeyError, TypeError):
+                break
+            valid_size += len(line) + 1
+        self._sort_entries()
+
+        # 마지막 줄이 완전히 기록되지 않았거나 손상된 레코드가 있으면 그 뒤를 잘라냄
+        if valid_size != sum(len(line) + 1 for line in lines) - 1:
+            logger.warning(f"백업 매니페스트의 불완전한 레코드를 버립니다: {self.manifest_path}")
+            with open(self.manifest_path, 'r+b') as f:
+                f.truncate(valid_size)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _import_json_manifest(self, path):
+        """이전 형식(전체를 다시 쓰는 manifest.json)의 매니페스트를 추가 전용 형식으로 옮깁니다."""
+        try:
+            for entry in json_io.load(path)['backups']:
+                self._apply_record({'op': 'add', 'entry': entry})
+        except Exception as e:
+            logger.error(f"이전 백업 매니페스트 변환 오류: {e}")
+            self.rebuild()
+            return
+        self._compact()
+        os.remove(path)
+
+    def _apply_record(self, record):
+        """매니페스트 레코드 하나를 메모리 항목에 반영합니다."""
+        if record['op'] == 'add':
+            entry = record['entry']
+            self._entries[entry['name']] = entry
+            self._refs[entry['hash']] += 1
+        elif record['op'] == 'remove':
+            for name in record['names']:
+                entry = self._entries.pop(name, None)
+                if entry is not None:
+                    self._refs[entry['hash']] -= 1
+                    if self._refs[entry['hash']] <= 0:
+                        del self._refs[entry['hash']]
+            self._dead_records += len(record['names']) + 1
+        else:
+            raise KeyError(record['op'])
+
+    def _append_records(self, records):
+        """매니페스트 끝에 레코드를 추가하고 디스크에 반영될 때까지 기다립니다."""
+        os.makedirs(self.backup_dir, exist_ok=True)
+        data = b"".join(json_io.dumps_bytes(record) + b"\n" for record in records)
+        with open(self.manifest_path, 'ab') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _compact(self):
+        """살아 있는 항목만으로 매니페스트를 다시 씁니다 (임시 파일에 쓴 뒤 교체)."""
+        os.makedirs(self.backup_dir, exist_ok=True)
+        temp_path = f"{self.manifest_path}.tmp"
+        with open(temp_path, 'wb') as f:
+            for entry in self._entries.values():
+                f.write(json_io.dumps_bytes({'op': 'add', 'entry': entry}) + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.manifest_path)
+        self._dead_records = 0
+
+    def _maybe_compact(self):
+        """삭제 레코드가 쌓였으면 매니페스트를 압축합니다."""
+        if self._dead_records > COMPACT_THRESHOLD and self._dead_records > len(self._entries):
+            self._compact()
+
+    def rebuild(self):
+        """
+        blob 디렉토리에서 매니페스트를 다시 만듭니다.
+        
+        원래 시각과 사유는 알 수 없으므로 blob 파일의 수정 시각과 "recovered" 사유를 사용합니다.
+
+        Returns:
+            int: 복구된 항목 수
+        """
+        blobs = []
+        for root, _, files in os.walk(self.objects_dir):
+            for filename in files:
+                if filename.endswith(".json.gz"):
+                    path = os.path.join(root, filename)
+                    blobs.append((os.path.getmtime(path), filename[:-len(".json.gz")], path))
+        blobs.sort()
+
+        self._entries = {}
+        self._refs = collections.Counter()
+        self._next_id = 1
+        for mtime, digest, path in blobs:
+            try:
+                with open(path, 'rb') as f:
+                    size = len(gzip.decompress(f.read()))
+            except Exception as e:
+                logger.warning(f"손상된 백업 blob을 건너뜁니다 ({path}): {e}")
+                continue
+            self._apply_record({'op': 'add', 'entry': self._make_entry(digest, size, REASON_RECOVERED, mtime)})
+        self._compact()
+        logger.info(f"백업 매니페스트를 다시 만들었습니다: {len(self._entries)}개 항목")
+        return len(self._entries)
+
+    def _object_path(self, digest):
+        """blob 파일 경로를 반환합니다."""
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.json.gz")
+
+    def _write_object(self, digest, data):
+        """blob이 없을 때만 압축하여 저장합니다."""
+        path = self._object_path(digest)
+        if os.path.exists(path):
+            return False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(gzip.compress(data, compresslevel=9, mtime=0))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+        return True
+
+    def _make_entry(self, digest, size, reason, timestamp, pinned=False):
+        """매니페스트 항목을 만듭니다."""
+        entry_id = self._next_id
+        self._next_id += 1
+        stamp = datetime.fromtimestamp(timestamp).strftime("%Y%m%d_%H%M%S")
+        entry = {
+            'id': entry_id,
+            'name': f"{stamp}_{entry_id}",
+            'timestamp': timestamp,
+            'hash': digest,
+            'reason': reason,
+            'size': size,
+        }
+        if pinned:
+            entry['pinned'] = True
+        return entry
+
+    def put(self, data, reason=REASON_SAVE, timestamp=None, pinned=False):
+        """
+        백업을 추가합니다.
+
+        Args:
+            data (bytes): 백업할 설정 파일 내용
+            reason (str, optional): 백업 사유. 기본값은 "save"입니다.
+            timestamp (float, optional): 백업 시각. 기본값은 현재 시각입니다.
+            pinned (bool, optional): 보존 정책에서 제외할지 여부 (최대 백업 수만 적용). 기본값은 False입니다.
+
+        Returns:
+            dict: 추가된 항목. 최신 백업과 내용이 같으면 새 항목 없이 최신 항목을 반환합니다.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            # 바로 앞 시각의 백업과 같은 내용이면 기록할 것이 없음
+            previous = self._previous(timestamp)
+            if previous is not None and previous['hash'] == digest:
+                return previous
+
+            self._write_object(digest, data)
+            latest = self._latest()
+            entry = self._make_entry(digest, len(data), reason, timestamp, pinned)
+            records = [{'op': 'add', 'entry': entry}]
+            excess = len(self._entries) + 1 - self.max_backups
+            removed = list(itertools.islice(self._entries.values(), excess)) if excess > 0 else []
+            if self.retention is not None:
+                self.retention.add(entry)
+                expired = {name for name in self.retention.expire() if name in self._entries}
+                removed += [self._entries[name] for name in expired if self._entries[name] not in removed]
+            if removed:
+                records.append({'op': 'remove', 'names': [old['name'] for old in removed]})
+            self._append_records(records)
+
+            for record in records:
+                self._apply_record(record)
+            self._collect_garbage({old['hash'] for old in removed})
+            if latest is not None and timestamp < latest['timestamp']:
+                # 과거 시각의 백업(이전 백업 파일 이전)은 시간 순서 자리로 옮기고 매니페스트도 그 순서로 다시 씀
+                self._sort_entries()
+                self._compact()
+            else:
+                self._maybe_compact()
+            return entry
+
+    def get(self, name):
+        """
+        백업 내용을 반환합니다.
+
+        Args:
+            name (str): 백업 이름
+
+        Returns:
+            bytes: 백업 내용. 백업이 없으면 None을 반환합니다.
+        """
+        entry = self.find(name)
+        if entry is None:
+            return None
+        with open(self._object_path(entry['hash']), 'rb') as f:
+            return gzip.decompress(f.read())
+
+    def find(self, name):
+        """이름으로 백업 항목을 찾습니다."""
+        with self._lock:
+            return self._entries.get(name)
+
+    def latest(self):
+        """가장 최근 백업 항목을 반환합니다. 백업이 없으면 None을 반환합니다."""
+        with self._lock:
+            return self._latest()
+
+    def _latest(self):
+        """최신 항목을 반환합니다 (잠금을 잡은 상태에서 호출)."""
+        return next(reversed(self._entries.values()), None)
+
+    def _previous(self, timestamp):
+        """주어진 시각 이전의 가장 최근 항목을 반환합니다 (잠금을 잡은 상태에서 호출)."""
+        for entry in reversed(self._entries.values()):
+            if entry['timestamp'] <= timestamp:
+                return entry
+        return None
+
+    def _sort_entries(self):
+        """항목을 시각, id 순서로 정렬합니다. 이미 정렬되어 있으면 그대로 둡니다."""
+        entries = list(self._entries.values())
+        if all(a['timestamp'] <= b['timestamp'] for a, b in zip(entries, entries[1:])):
+            return
+        entries.sort(key=lambda entry: (entry['timestamp'], entry['id']))
+        self._entries = {entry['name']: entry for entry in entries}
+
+    def entries(self):
+        """백업 항목 목록을 최신 순으로 반환합니다."""
+        with self._lock:
+            return list(reversed(self._entries.values()))
+
+    def remove(self, names):
+        """
+        백업 항목을 삭제하고 더 이상 참조되지 않는 blob을 지웁니다.
+
+        Args:
+            names (iterable): 삭제할 백업 이름 목록
+
+        Returns:
+            int: 삭제된 항목 수
+        """
+        with self._lock:
+            return self._remove_locked(names)
+
+    def _remove_locked(self, names):
+        """백업 항목을 삭제합니다 (잠금을 잡은 상태에서 호출)."""
+        removed = [self._entries[name] for name in set(names) if name in self._entries]
+        if not removed:
+            return 0
+        record = {'op': 'remove', 'names': [entry['name'] for entry in removed]}
+        self._append_records([record])
+        self._apply_record(record)
+        self._collect_garbage({entry['hash'] for entry in removed})
+        self._maybe_compact()
+        return len(removed)
+
+    def prune(self, dry_run=False, now=None):
+        """
+        보존 정책을 전체 백업에 다시 적용합니다.
+
+        Args:
+            dry_run (bool, optional): True이면 삭제하지 않고 결과만 반환합니다. 기본값은 False입니다.
+            now (float, optional): 기준 시각. 기본값은 현재 시각입니다.
+
+        Returns:
+            dict: 유지할 항목('keep')과 삭제할 항목('drop') 목록, 각각 최신 순
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+            if self.retention is None:
+                return {'keep': entries[::-1], 'drop': []}
+
+            policy = self.retention.clone()
+            dropped = set(policy.reset(entries, now))
+            result = {
+                'keep': [entry for entry in reversed(entries) if entry['name'] not in dropped],
+                'drop': [entry for entry in reversed(entries) if entry['name'] in dropped],
+            }
+            if not dry_run:
+                self._remove_locked(dropped)
+                self.retention = policy
+                logger.info(f"보존 정책으로 백업 {len(result['drop'])}개를 정리했습니다.")
+            return result
+
+    def _collect_garbage(self, digests):
+        """남은 항목이 참조하지 않는 blob을 삭제합니다."""
+        if not digests:
+            return
+        for digest in digests:
+            if digest in self._refs:
+                continue
+            try:
+                os.remove(self._object_path(digest))
+            except OSError as e:
+                logger.warning(f"백업 blob 삭제 오류 ({digest}): {e}")
+
+    def disk_usage(self):
+        """blob 저장소가 차지하는 바이트 수를 반환합니다."""
+        total = 0
+        for root, _, files in os.walk(self.objects_dir):
+            total += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+        return total
+
+    def _migrate_legacy_backups(self):
+        """
+        이전 버전의 전체 복사 백업 파일을 저장소로 옮깁니다.
+
+        원래 시각이 오래되었더라도 바로 만료되지 않도록 보존 정책에서 제외(pinned)하고,
+        저장소에서 같은 내용을 읽을 수 있는지 확인한 파일만 legacy 하위 디렉토리로 옮겨 보관합니다.
+        """
+        try:
+            legacy_files = [f for f in os.listdir(self.backup_dir) if LEGACY_BACKUP_PATTERN.match(f)]
+        except OSError:
+            return
+        if not legacy_files:
+            return
+
+        paths = sorted((os.path.join(self.backup_dir, f) for f in legacy_files), key=os.path.getmtime)
+        legacy_dir = os.path.join(self.backup_dir, LEGACY_DIR)
+        migrated = 0
+        for path in paths:
+            filename = os.path.basename(path)
+            if filename.startswith("claude_desktop_config_before_restore_"):
+                reason = REASON_BEFORE_RESTORE
+            elif filename.endswith("_error.json"):
+                reason = REASON_ERROR
+            else:
+                reason = REASON_SAVE
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                entry = self.put(data, reason=reason, timestamp=os.path.getmtime(path), pinned=True)
+                if self.get(entry['name']) != data:
+                    logger.error(f"이전 백업 파일을 저장소에서 확인하지 못해 그대로 둡니다: {path}")
+                    continue
+                os.makedirs(legacy_dir, exist_ok=True)
+                os.replace(path, os.path.join(legacy_dir, filename))
+                migrated += 1
+            except Exception as e:
+                logger.error(f"이전 백업 파일 이전 오류 ({path}): {e}")
+        logger.info(f"이전 백업 파일 {migrated}개를 백업 저장소로 옮겼습니다.")
@@ -5,38 +5,393 @@ MCP 설정 관리자의 설정 파일 관리 기능을 제공합니다.
 """
 
 import os
+import copy
 import json
+import hashlib
 import platform
-import shutil
+import atexit
 import logging
+import threading
+import contextlib
 from datetime import datetime
 
+from .backup_store import BackupStore, REASON_SAVE, REASON_ERROR, REASON_BEFORE_RESTORE, REASON_CHECKPOINT, REASON_PROFILE
+from .retention import RetentionPolicy
+from .journal import ConfigJournal
+from .schema import ConfigValidator
+from .profiles import ProfileStore, split_settings
+from .server_model import ServerModel
+from .history import ConfigHistory, HistoryEntry
+from utils import json_io
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('config_manager')
 
+# get_mcp_servers가 내부 목록 형식으로 변환할 때 채워 넣는 기본값
+# (정규화할 때는 값이 없는 것과 같게 취급)
+SERVER_DEFAULTS = {'description': "설명 없음", 'category': "일반"}
+
+# MCP 설정 관리자 설정 파일 (Claude 설정 파일 경로를 직접 지정할 때 사용)
+MANAGER_CONFIG_PATH = os.path.join(os.path.expanduser("~"), ".config", "mcp_manager", "config.json")
+
+# Claude Desktop이 서버를 실행할 때 사용하는 필드
+LAUNCH_KEYS = ('command', 'args', 'env', 'cwd', 'type', 'url', 'headers')
+
+# 쓰기 지연 모드에서 마지막 변경 후 파일에 쓰기까지 기다리는 시간 (초)
+WRITE_BEHIND_DELAY = 0.5
+
+
+def _normalize(value):
+    """None과 빈 목록/객체를 제거하여 JSON 값을 정규화합니다."""
+    if isinstance(value, dict):
+        normalized = {}
+        for key, item in value.items():
+            item = _normalize(item)
+            if item is not None and item != [] and item != {}:
+                normalized[key] = item
+        return normalized
+    if isinstance(value, list):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def _normalize_server(server):
+    """서버 설정을 정규화합니다 (이름 필드와 변환 기본값 제외)."""
+    normalized = _normalize({key: value for key, value in server.items() if key != 'name'})
+    for key, default in SERVER_DEFAULTS.items():
+        if normalized.get(key) == default:
+            del normalized[key]
+    return normalized
+
+
+def _server_items(config):
+    """설정 정보에서 (서버 이름, 서버 설정) 목록을 순서대로 반환합니다."""
+    if isinstance(config.get('mcpServers'), dict):
+        return [(name, server) for name, server in config['mcpServers'].items() if isinstance(server, dict)]
+    if isinstance(config.get('mcp_servers'), list):
+        return [(server.get('name'), server) for server in config['mcp_servers'] if isinstance(server, dict)]
+    return []
+
+
+def _digest(value):
+    """JSON 값의 키 순서와 무관한 SHA-256 해시를 반환합니다."""
+    text = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+# 3-way 병합에서 값이 없음을 나타내는 표시
+_MISSING = object()
+
+
+def _merge_value(base, ours, theirs, normalize):
+    """
+    한 항목의 세 값을 비교하여 병합합니다. 양쪽이 서로 다르게 바꾸면 충돌로 보고 외부 값을 유지합니다.
+    
+    Returns:
+        tuple: (병합된 값 또는 _MISSING, 충돌 여부)
+    """
+    b, o, t = (value if value is _MISSING else normalize(value) for value in (base, ours, theirs))
+    if o == t or t == b:
+        return ours, False
+    if o == b:
+        return theirs, False
+    return theirs, True
+
+
+def _merge_order(base, ours, theirs):
+    """
+    서버 순서를 병합합니다. 한쪽만 순서를 바꿨으면 그 순서를 따르고,
+    다른 쪽에서 추가된 서버는 그쪽에서 바로 뒤에 있던 서버 앞에 (없으면 끝에) 끼워 넣습니다.
+    
+    Returns:
+        tuple: (서버 이름 목록, 순서 충돌 여부)
+    """
+    common = set(base) & set(ours) & set(theirs)
+    relative = lambda names: [name for name in names if name in common]
+    ours_moved = relative(ours) != relative(base)
+    theirs_moved = relative(theirs) != relative(base)
+    conflict = ours_moved and theirs_moved and relative(ours) != relative(theirs)
+    primary, secondary = (ours, theirs) if ours_moved and not conflict else (theirs, ours)
+    
+    names = list(primary)
+    seen = set(names)
+    following = None
+    for name in reversed(secondary):
+        if name not in seen:
+            names.insert(names.index(following) if following is not None else len(names), name)
+            seen.add(name)
+        following = name
+    return names, conflict
+
+
+def merge_configs(base, ours, theirs):
+    """
+    설정 정보를 서버 단위로 3-way 병합합니다.
+    한쪽에서만 바뀐 서버와 설정은 자동으로 반영하고, 양쪽에서 서로 다르게 바뀐 항목은
+    외부(theirs) 값을 유지한 채 충돌로 보고합니다.
+    
+    Args:
+        base (dict): 공통 기준 설정 (우리가 불러왔던 설정)
+        ours (dict): 저장하려는 설정
+        theirs (dict): 현재 파일의 설정 (외부에서 변경됨)
+        
+    Returns:
+        tuple: (병합된 설정 정보, 충돌 목록)
+               충돌은 {'type': 'server'|'setting'|'order', 'name', 'ours', 'theirs'} 형식이며
+               값이 없는 쪽(삭제)은 None입니다.
+    """
+    server_keys = ('mcpServers', 'mcp_servers')
+    merged = {}
+    conflicts = []
+    
+    # 서버 외 설정 (키 순서는 현재 파일 기준)
+    for key in list(theirs) + [key for key in ours if key not in theirs]:
+        if key in server_keys:
+            merged.setdefault('mcpServers', None)
+            continue
+        if key in merged:
+            continue
+        value, conflict = _merge_value(base.get(key, _MISSING), ours.get(key, _MISSING),
+                                       theirs.get(key, _MISSING), _normalize)
+        if conflict:
+            conflicts.append({'type': 'setting', 'name': key, 'ours': ours.get(key), 'theirs': theirs.get(key)})
+        if value is not _MISSING:
+            merged[key] = value
+    
+    # 서버
+    base_servers, our_servers, their_servers = (dict(_server_items(config)) for config in (base, ours, theirs))
+    names, order_conflict = _merge_order(list(base_servers), list(our_servers), list(their_servers))
+    if order_conflict:
+        conflicts.append({'type': 'order', 'name': None, 'ours': list(our_servers), 'theirs': list(their_servers)})
+    
+    servers = {}
+    for name in names:
+        value, conflict = _merge_value(base_servers.get(name, _MISSING), our_servers.get(name, _MISSING),
+                                       their_servers.get(name, _MISSING), _normalize_server)
+        if conflict:
+            conflicts.append({'type': 'server', 'name': name,
+                              'ours': our_servers.get(name), 'theirs': their_servers.get(name)})
+        if value is not _MISSING:
+            servers[name] = {key: item for key, item in value.items() if key != 'name'}
+    merged['mcpServers'] = servers
+    return merged, conflicts
+
+def _strip_name(server_info):
+    """서버 항목에서 이름 필드를 뺀 서버 설정을 만듭니다."""
+    return {key: value for key, value in server_info.items() if key != 'name'}
+
+class ConfigTransaction:
+    """
+    설정 변경 트랜잭션 클래스
+    
+    메모리의 서버 모델에 여러 변경을 모아 두었다가 커밋 시 한 번만 검증/백업/저장합니다.
+    ConfigManager.transaction()으로 생성합니다.
+    """
+    
+    def __init__(self, servers):
+        """
+        ConfigTransaction 초기화
+        
+        Args:
+            servers (ServerModel | list): 현재 MCP 서버 모델 (트랜잭션이 소유하는 복사본) 또는 목록
+        """
+        self.model = servers if isinstance(servers, ServerModel) else ServerModel.from_list(servers)
+        self.operations = 0
+        self.committed = None
+        # 저널에 기록할 논리적 변경 목록 ([작업, 인자...])
+        self.log = []
+    
+    @property
+    def servers(self):
+        """현재 MCP 서버 목록 (목록 형식 보기, 수정하면 안 됨)"""
+        return self.model.to_list()
+    
+    def __contains__(self, server_name):
+        return server_name in self.model
+    
+    def index_of(self, server_name):
+        """
+        서버 이름의 위치를 반환합니다.
+        
+        Args:
+            server_name (str): 서버 이름
+            
+        Returns:
+            int: 서버 위치. 없으면 -1
+        """
+        return self.model.index_of(server_name)
+    
+    def add(self, server_info, before=None):
+        """
+        서버를 추가합니다.
+        
+        Args:
+            server_info (dict): 추가할 서버 정보
+            before (str, optional): 이 서버 앞에 추가. 기본값은 None으로, 이 경우 끝에 추가합니다.
+            
+        Returns:
+            bool: 추가 여부 (이름이 없거나 이미 존재하면 False)
+        """
+        name = server_info.get('name')
+        if not name or not self.model.insert(name, _strip_name(server_info), before):
+            logger.warning(f"이미 존재하거나 이름이 없는 서버입니다: {name}")
+            return False
+        if before is None:
+            self._record('add', server_info)
+        else:
+            self._record('add', server_info, before)
+        return True
+    
+    def delete(self, server_name):
+        """
+        서버를 삭제합니다.
+        
+        Args:
+            server_name (str): 삭제할 서버 이름
+            
+        Returns:
+            bool: 삭제 여부
+        """
+        if self.model.remove(server_name) is None:
+            logger.warning(f"삭제할 서버를 찾지 못했습니다: {server_name}")
+            return False
+        self._record('delete', server_name)
+        return True
+    
+    def move(self, from_index, to_index):
+        """
+        서버의 순서를 변경합니다.
+        
+        Args:
+            from_index (int): 현재 위치
+            to_index (int): 이동할 위치
+            
+        Returns:
+            bool: 이동 여부
+        """
+        if not self.model.move_index(from_index, to_index):
+            logger.error(f"잘못된 인덱스입니다: from={from_index}, to={to_index}")
+            return False
+        self._record('move', from_index, to_index)
+        return True
+    
+    def place(self, server_name, before=None):
+        """
+        서버를 다른 서버 앞으로 이동합니다 (이름 기준).
+        
+        Args:
+            server_name (str): 이동할 서버 이름
+            before (str, optional): 이 서버 앞으로 이동. 기본값은 None으로, 이 경우 끝으로 이동합니다.
+            
+        Returns:
+            bool: 이동 여부
+        """
+        if not self.model.move(server_name, before):
+            logger.error(f"서버를 이동할 수 없습니다: {server_name} (앞: {before})")
+            return False
+        self._record('place', server_name, before)
+        return True
+    
+    def update(self, server_name, server_info):
+        """
+        서버 정보를 교체합니다.
+        
+        Args:
+            server_name (str): 교체할 서버 이름
+            server_info (dict): 새 서버 정보 (이름 변경 가능)
+            
+        Returns:
+            bool: 교체 여부
+        """
+        new_name = server_info.get('name')
+        if not new_name or not self.model.replace(server_name, new_name, _strip_name(server_info)):
+            logger.warning(f"서버를 갱신할 수 없습니다: {server_name}")
+            return False
+        self._record('update', server_name, server_info)
+        return True
+    
+    def _record(self, op, *args):
+        """적용한 변경을 기록합니다."""
+        self.log.append([op, *args])
+        self.operations += 1
+    
+    def replay(self, ops):
+        """
+        기록된 변경 목록을 다시 적용합니다.
+        
+        Args:
+            ops (list): 변경 목록 ([작업, 인자...])
+            
+        Returns:
+            bool: 모든 변경 적용 여부
+        """
+        for op, *args in ops:
+            if op not in ('add', 'delete', 'move', 'place', 'update') or not getattr(self, op)(*args):
+                logger.error(f"변경을 다시 적용하지 못했습니다: {op} {args}")
+                return False
+        return True
+
 class ConfigManager:
     """설정 파일 관리자 클래스"""
     
-    def __init__(self, config_path=None):
+    def __init__(self, config_path=None, write_delay=None):
         """
         ConfigManager 초기화
         
         Args:
             config_path (str, optional): 설정 파일 경로. 기본값은 None으로, 
                                         이 경우 OS별 기본 경로를 사용합니다.
+            write_delay (float, optional): 쓰기 지연 시간 (초). 지정하면 서버 변경은 저널에 기록하고
+                                          메모리에 바로 반영한 뒤, 이 시간 동안 다른 변경이 없을 때
+                                          백그라운드에서 한 번에 파일에 씁니다. 기본값은 None으로,
+                                          이 경우 변경마다 바로 씁니다.
         """
+        # 쓰기 지연 모드: 파일에 쓰지 않은 (설정 정보, 해시, 파일에 있는 설정)과 쓰기 타이머
+        self.write_delay = write_delay
+        self._pending = None
+        # 쓰기를 기다리는 동안 설정 파일에 있는 상태의 해시 (저널 복구 판단용)
+        self._pending_disk_hash = None
+        self._flush_timer = None
+        self._lock = threading.RLock()
+        self._flush_at_exit = False
+        
+        # 파싱된 설정 캐시 (파일의 mtime_ns, 크기, inode로 유효성 확인)
+        self._cache_key = None
+        self._cached_config = None
+        self._cached_model = None
+        self._cached_hash = None
+        self.cache_stats = {'disk_reads': 0, 'avoided_reads': 0}
+        self._backup_store = None
+        self._journal = None
+        self._profile_store = None
+        
+        # 컴파일된 스키마 검증기와 마지막으로 검증을 통과해 저장한 설정 (변경된 서버만 검증)
+        self.validator = ConfigValidator()
+        self._validated_config = None
+        
+        # 마지막 저장에서 실행 설정이 바뀐 서버 ({'added', 'removed', 'changed'})
+        self.last_changes = self.diff_launch({}, {})
+        
+        # 호출자에게 마지막으로 전달한 설정과 해시 (저장 시 외부 변경 확인과 3-way 병합의 기준)
+        self._loaded_config = None
+        self._loaded_hash = None
+        # 마지막 저장에서 외부 변경과 충돌하여 외부 값을 유지한 항목 (merge_configs 충돌 형식)
+        self.last_conflicts = []
+        
+        # 서버 변경 실행 취소/다시 실행 기록 (메모리, 바뀐 서버만 보관)
+        self.history = ConfigHistory()
+        self._recording_history = True
+        
         # 먼저 사용자 지정 파일로 직접 지정되었는지 확인
         try:
             # MCP 설정 관리자 설정 파일 경로
-            config_dir = os.path.join(os.path.expanduser("~"), ".config", "mcp_manager")
-            manager_config_path = os.path.join(config_dir, "config.json")
+            manager_config_path = MANAGER_CONFIG_PATH
             
             logger.info(f"MCP 설정 관리자 설정 파일 경로: {manager_config_path}")
             
             if os.path.exists(manager_config_path):
-                with open(manager_config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                config = json_io.load(manager_config_path)
                 
                 # 직접 설정 파일 경로를 지정한 경우
                 if "claude_config_file" in config and os.path.exists(config["claude_config_file"]):
@@ -49,6 +404,7 @@ class ConfigManager:
                     
                     logger.info(f"설정 파일 경로: {self.config_path}")
                     logger.info(f"백업 디렉토리: {self.backup_dir}")
+                    self.recover_from_journal()
                     return
         except Exception as e:
             logger.error(f"직접 지정된 설정 파일 로드 오류: {e}")
@@ -74,6 +430,7 @@ class ConfigManager:
         
         logger.info(f"설정 파일 경로: {self.config_path}")
         logger.info(f"백업 디렉토리: {self.backup_dir}")
+        self.recover_from_journal()
     
     def _get_custom_config_path(self):
         """
@@ -84,8 +441,7 @@ class ConfigManager:
         """
         try:
             # MCP 설정 관리자 설정 파일 경로
-            config_dir = os.path.join(os.path.expanduser("~"), ".config", "mcp_manager")
-            config_path = os.path.join(config_dir, "config.json")
+            config_path = MANAGER_CONFIG_PATH
             
             logger.info(f"사용자 지정 설정 파일 경로: {config_path}")
             
@@ -93,7 +449,7 @@ class ConfigManager:
                 with open(config_path, 'r', encoding='utf-8') as f:
                     config_content = f.read()
                     logger.info(f"설정 파일 내용: {config_content}")
-                    config = json.loads(config_content)
+                    config = json_io.loads(config_content)
                 
                 # 직접 설정 파일 경로를 지정한 경우
                 if "claude_config_file" in config and os.path.exists(config["claude_config_file"]):
@@ -137,33 +493,198 @@ class ConfigManager:
         
         return os.path.join(config_dir, "claude_desktop_config.json")
     
-    def load_config(self):
+    def _stat_key(self):
         """
-        설정 파일을 로드합니다.
+        설정 파일의 변경 여부 확인용 키를 반환합니다.
         
         Returns:
-            dict: 설정 정보. 파일이 없거나 오류가 발생하면 기본 설정을 반환합니다.
+            tuple: (mtime_ns, 크기, inode). 파일이 없으면 None
         """
         try:
-            if os.path.exists(self.config_path):
-                logger.info(f"설정 파일 경로가 존재합니다: {self.config_path}")
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    file_content = f.read()
-                    logger.info(f"설정 파일 내용: {file_content}")
-                    config = json.loads(file_content)
-                logger.info(f"설정 파일을 로드했습니다. MCP 서버 수: {len(config.get('mcp_servers', []))}")
-                return config
-            else:
-                logger.warning(f"설정 파일이 없습니다: {self.config_path}. 기본 설정을 사용합니다.")
+            st = os.stat(self.config_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+    
+    def invalidate_cache(self):
+        """설정 캐시를 비웁니다. 다음 로드 시 파일을 다시 읽습니다 (쓰기를 기다리는 변경은 먼저 반영)."""
+        self.flush()
+        self._cache_key = None
+        self._cached_config = None
+        self._cached_model = None
+        self._cached_hash = None
+    
+    def _update_cache(self, config, key):
+        """
+        설정 캐시를 갱신합니다.
+        
+        Args:
+            config (dict): 파싱된 설정 정보 (캐시가 소유하므로 이후 변경 금지)
+            key (tuple): 설정 파일의 변경 여부 확인용 키
+        """
+        self._cache_key = key
+        self._cached_config = config
+        self._cached_model = None
+        self._cached_hash = None
+    
+    def _load_cached_config(self):
+        """
+        캐시된 설정을 반환합니다. 파일이 변경되었으면 다시 읽습니다.
+        반환된 객체는 캐시와 공유되므로 수정하면 안 됩니다.
+        
+        Returns:
+            dict: 설정 정보
+        """
+        with self._lock:
+            key = self._stat_key()
+            if self._pending is not None and key != self._cache_key:
+                # 쓰기를 기다리는 동안 외부에서 파일이 바뀌었으면 병합하여 먼저 반영
+                self.flush()
+                key = self._stat_key()
+            if key is not None and key == self._cache_key:
+                self.cache_stats['avoided_reads'] += 1
+                return self._cached_config
+            self.invalidate_cache()
+            try:
+                if key is not None:
+                    logger.info(f"설정 파일 경로가 존재합니다: {self.config_path}")
+                    # 설정 내용(env의 API 키 등)은 로그에 남기지 않음
+                    with open(self.config_path, 'r', encoding='utf-8') as f:
+                        config = json_io.loads(f.read())
+                    self.cache_stats['disk_reads'] += 1
+                    logger.info(f"설정 파일을 로드했습니다. MCP 서버 수: {len(_server_items(config))}")
+                    # 읽는 도중 파일이 바뀌었으면 캐시하지 않음
+                    if self._stat_key() == key:
+                        self._update_cache(config, key)
+                    return config
+                else:
+                    logger.warning(f"설정 파일이 없습니다: {self.config_path}. 기본 설정을 사용합니다.")
+                    return self._get_default_config()
+            except json_io.JSONDecodeError as e:
+                logger.error(f"설정 파일 파싱 오류: {e}, 경로: {self.config_path}")
+                # 오류가 있는 파일 백업
+                self._backup_config(error=True)
                 return self._get_default_config()
-        except json.JSONDecodeError as e:
-            logger.error(f"설정 파일 파싱 오류: {e}, 경로: {self.config_path}")
-            # 오류가 있는 파일 백업
-            self._backup_config(error=True)
-            return self._get_default_config()
-        except Exception as e:
-            logger.error(f"설정 파일 로드 오류: {e}, 경로: {self.config_path}")
-            return self._get_default_config()
+            except Exception as e:
+                logger.error(f"설정 파일 로드 오류: {e}, 경로: {self.config_path}")
+                return self._get_default_config()
+    
+    def config_hash(self, config):
+        """
+        설정 정보의 정규화된 해시를 계산합니다.
+        키 순서, None 값, 빈 목록/객체, 변환 기본값의 차이는 무시하지만
+        서버 순서(내 MCP 목록 순서)는 반영합니다.
+        
+        Args:
+            config (dict): 설정 정보
+            
+        Returns:
+            str: SHA-256 해시
+        """
+        canonical = _normalize({key: value for key, value in config.items()
+                                if key not in ('mcpServers', 'mcp_servers')})
+        # Claude Desktop은 mcpServers만 읽으므로 이전 형식(mcp_servers)과는 다른 설정으로 취급
+        servers_key = 'mcp_servers' if isinstance(config.get('mcp_servers'), list) and \
+            not isinstance(config.get('mcpServers'), dict) else 'mcpServers'
+        canonical[servers_key] = [[name, _normalize_server(server)] for name, server in _server_items(config)]
+        return _digest(canonical)
+    
+    def launch_snapshot(self, config=None):
+        """
+        Claude Desktop이 실행할 서버별 실행 설정 해시를 계산합니다.
+        서버 순서와 설명 등 실행에 영향을 주지 않는 필드는 무시합니다.
+        
+        Args:
+            config (dict, optional): 설정 정보. 기본값은 None으로, 이 경우 현재 설정 파일을 사용합니다.
+            
+        Returns:
+            dict: {서버 이름: 실행 설정 해시}
+        """
+        if config is None:
+            config = self._load_cached_config()
+        snapshot = {}
+        for name, server in _server_items(config):
+            normalized = _normalize_server(server)
+            snapshot[name] = _digest({key: normalized[key] for key in LAUNCH_KEYS if key in normalized})
+        return snapshot
+    
+    @staticmethod
+    def diff_launch(old_snapshot, new_snapshot):
+        """
+        두 실행 설정 스냅샷을 비교합니다.
+        
+        Args:
+            old_snapshot (dict): 이전 스냅샷 ({서버 이름: 해시})
+            new_snapshot (dict): 새 스냅샷
+            
+        Returns:
+            dict: {'added': [...], 'removed': [...], 'changed': [...]} (서버 이름 정렬 목록)
+        """
+        return {
+            'added': sorted(name for name in new_snapshot if name not in old_snapshot),
+            'removed': sorted(name for name in old_snapshot if name not in new_snapshot),
+            'changed': sorted(name for name in new_snapshot
+                              if name in old_snapshot and old_snapshot[name] != new_snapshot[name]),
+        }
+    
+    def _current_hash(self):
+        """
+        디스크에 있는 설정의 정규화된 해시를 반환합니다 (캐시와 함께 재사용).
+        
+        Returns:
+            str: SHA-256 해시. 설정 파일이 없으면 None
+        """
+        if self._stat_key() is None:
+            return None
+        config = self._load_cached_config()
+        if config is not self._cached_config:
+            return self.config_hash(config)
+        if self._cached_hash is None:
+            self._cached_hash = self.config_hash(config)
+        return self._cached_hash
+    
+    def load_config(self):
+        """
+        설정 파일을 로드합니다. 파일이 바뀌지 않았으면 메모리 캐시를 사용합니다.
+        
+        Returns:
+            dict: 설정 정보. 파일이 없거나 오류가 발생하면 기본 설정을 반환합니다.
+        """
+        config = self._load_cached_config()
+        self._mark_loaded(config)
+        return copy.deepcopy(config)
+    
+    def _mark_loaded(self, config):
+        """호출자에게 전달한 설정을 다음 저장의 병합 기준으로 기록합니다."""
+        if config is not None and config is self._cached_config:
+            if self._cached_hash is None:
+                self._cached_hash = self.config_hash(config)
+            self._loaded_config, self._loaded_hash = config, self._cached_hash
+        else:
+            self._loaded_config = self._loaded_hash = None
+    
+    def _changed_externally(self, loaded_hash, current_hash):
+        """불러온 뒤 다른 프로세스가 설정 파일을 바꿨는지 확인합니다."""
+        return loaded_hash is not None and current_hash is not None and current_hash != loaded_hash
+    
+    def _merge_external(self, base_config, config):
+        """
+        외부에서 바뀐 현재 설정과 저장하려는 설정을 3-way 병합하고 충돌을 last_conflicts에 기록합니다.
+        
+        Args:
+            base_config (dict): 불러왔던 설정
+            config (dict): 저장하려는 설정
+            
+        Returns:
+            dict: 병합된 설정 정보
+        """
+        merged, self.last_conflicts = merge_configs(base_config, config, self._load_cached_config())
+        if self.last_conflicts:
+            names = ', '.join(str(conflict['name'] or "서버 순서") for conflict in self.last_conflicts)
+            logger.warning(f"외부에서 변경된 설정과 충돌하여 외부 변경을 유지합니다: {names}")
+        else:
+            logger.info("외부에서 변경된 설정과 자동으로 병합했습니다.")
+        return merged
     
     def save_config(self, config):
         """
@@ -175,24 +696,145 @@ class ConfigManager:
         Returns:
             bool: 저장 성공 여부
         """
-        try:
-            # 저장 전 설정 파일 검증
-            if not self._validate_config(config):
-                logger.error("설정 파일 검증 실패")
+        with self._lock:
+            # 명시적 저장이므로 쓰기를 기다리는 변경을 먼저 반영
+            self.flush()
+            try:
+                # 불러온 뒤 외부에서 바뀌었으면 덮어쓰지 않고 병합
+                self.last_conflicts = []
+                current_hash = self._current_hash()
+                if self._changed_externally(self._loaded_hash, current_hash):
+                    config = self._merge_external(self._loaded_config, config)
+                
+                # 저장 전 설정 파일 검증
+                if not self._validate_config(config):
+                    logger.error("설정 파일 검증 실패")
+                    return False
+                
+                # 내용이 같으면 저장과 백업 생략
+                new_hash = self.config_hash(config)
+                if new_hash == current_hash:
+                    self.last_changes = self.diff_launch({}, {})
+                    logger.info("변경 사항이 없어 설정 파일 저장을 생략합니다.")
+                    return True
+                
+                # 저장 전 백업
+                self._backup_config()
+                
+                self._write_config(config, new_hash)
+                return True
+            except Exception as e:
+                self.invalidate_cache()
+                logger.error(f"설정 파일 저장 오류: {e}")
                 return False
+    
+    def _write_config(self, config, new_hash, defer=False):
+        """
+        검증된 설정을 파일에 씁니다. 실패하면 예외가 발생합니다.
+        
+        Args:
+            config (dict): 저장할 설정 정보
+            new_hash (str): 설정 해시
+            defer (bool, optional): 메모리에만 반영하고 파일 쓰기는 write_delay 뒤로 미룰지 여부
+                                   (설정 파일이 있을 때만). 기본값은 False입니다.
+        """
+        with self._lock:
+            old_config = self._load_cached_config() if self._stat_key() is not None else None
+            old_snapshot = self.launch_snapshot(old_config) if old_config is not None else {}
+            # 캐시된 모델의 서버 설정 객체를 실행 취소 기록과 공유
+            old_servers = self._server_model(old_config).to_mcp_servers() \
+                if old_config is not None and self._recording_history else None
             
-            # 저장 전 백업
-            self._backup_config()
+            if defer and old_config is not None:
+                # 파일은 그대로 두고 캐시 키도 유지 (외부 변경 확인용)
+                disk_config = self._pending[2] if self._pending is not None else old_config
+                key = self._cache_key
+            else:
+                # 설정 파일 저장 (임시 파일에 쓴 뒤 교체하여 중간에 실패해도 기존 파일 유지)
+                temp_path = f"{self.config_path}.tmp"
+                json_io.dump(config, temp_path, pretty=True)
+                os.replace(temp_path, self.config_path)
+                self._cancel_flush()
+                self._pending = disk_config = None
+                key = self._stat_key()
             
-            # 설정 파일 저장
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
+            # 방금 저장한 내용으로 캐시 갱신 (다시 읽지 않음)
+            self._update_cache(copy.deepcopy(config), key)
+            self._cached_hash = new_hash
+            self._validated_config = self._cached_config
+            self._loaded_config, self._loaded_hash = self._cached_config, new_hash
+            self.last_changes = self.diff_launch(old_snapshot, self.launch_snapshot(config))
+            if old_servers is not None:
+                entry = HistoryEntry.diff(old_servers, self._server_model(self._cached_config).to_mcp_servers())
+                if entry is not None:
+                    self.history.record(entry)
             
-            logger.info("설정 파일을 저장했습니다.")
-            return True
-        except Exception as e:
-            logger.error(f"설정 파일 저장 오류: {e}")
-            return False
+            if disk_config is not None:
+                self._pending = (self._cached_config, new_hash, disk_config)
+                self._schedule_flush()
+                logger.info(f"설정 변경을 메모리에 반영했습니다. {self.write_delay}초 뒤 파일에 씁니다.")
+            else:
+                logger.info("설정 파일을 저장했습니다.")
+    
+    def _schedule_flush(self):
+        """마지막 변경 후 write_delay 동안 다른 변경이 없으면 백그라운드에서 파일에 쓰도록 예약합니다."""
+        self._cancel_flush()
+        if not self._flush_at_exit:
+            # 종료 시 남은 쓰기 반영
+            atexit.register(self.flush)
+            self._flush_at_exit = True
+        self._flush_timer = threading.Timer(self.write_delay, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+    
+    def _cancel_flush(self):
+        """예약된 백그라운드 쓰기를 취소합니다."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+    
+    def has_pending_writes(self):
+        """파일에 쓰지 않은 설정 변경이 있는지 확인합니다."""
+        return self._pending is not None
+    
+    def flush(self):
+        """
+        쓰기 지연 모드에서 파일에 쓰지 않은 설정 변경을 바로 씁니다.
+        모인 변경은 한 번의 원자적 쓰기(임시 파일 후 교체)로 반영되며, 그동안 외부에서 파일이 바뀌었으면
+        save_config와 같이 3-way 병합합니다. 변경은 이미 저널에 기록되어 있으므로 쓰기 전에 프로그램이
+        비정상 종료되어도 다음 실행 시 recover_from_journal로 복구됩니다.
+        
+        Returns:
+            bool: 성공 여부 (쓸 변경이 없으면 True)
+        """
+        with self._lock:
+            self._cancel_flush()
+            if self._pending is None:
+                return True
+            config, config_hash, disk_config = self._pending
+            self._pending = None
+            try:
+                if self._stat_key() != self._cache_key:
+                    logger.warning("쓰기를 기다리는 동안 설정 파일이 외부에서 변경되어 병합합니다.")
+                    self.invalidate_cache()
+                    self._loaded_config, self._loaded_hash = disk_config, self.config_hash(disk_config)
+                    return self.save_config(config)
+                
+                temp_path = f"{self.config_path}.tmp"
+                json_io.dump(config, temp_path, pretty=True)
+                os.replace(temp_path, self.config_path)
+                self._cache_key = self._stat_key()
+                
+                # 체크포인트는 파일과 저널이 일치할 때만 만듦 (복구 시 파일 상태를 저널에서 찾을 수 있도록)
+                if self.journal.needs_checkpoint():
+                    self._checkpoint(config, config_hash)
+                logger.info("쓰기를 기다리던 설정 변경을 파일에 저장했습니다.")
+                return True
+            except Exception as e:
+                # 다음 변경이나 종료 시 다시 시도
+                self._pending = (config, config_hash, disk_config)
+                logger.error(f"설정 파일 지연 쓰기 오류: {e}")
+                return False
     
     def _get_default_config(self):
         """
@@ -207,7 +849,8 @@ class ConfigManager:
     
     def _validate_config(self, config):
         """
-        설정 정보를 검증합니다.
+        설정 정보를 스키마로 검증하고 모든 오류를 JSON 경로와 함께 기록합니다.
+        마지막으로 저장한 설정과 내용이 같은 서버는 다시 검사하지 않습니다.
         
         Args:
             config (dict): 검증할 설정 정보
@@ -216,226 +859,209 @@ class ConfigManager:
             bool: 검증 성공 여부
         """
         try:
-            # 기본 구조 검증
-            if not isinstance(config, dict):
-                logger.error("설정 파일이 JSON 객체가 아닙니다.")
-                return False
-            
-            # mcp_servers 필드 검증
-            if "mcp_servers" not in config:
-                logger.error("설정 파일에 mcp_servers 필드가 없습니다.")
-                return False
-            
-            if not isinstance(config["mcp_servers"], list):
-                logger.error("mcp_servers 필드가 배열이 아닙니다.")
-                return False
-            
-            # 각 MCP 서버 항목 검증
-            for i, server in enumerate(config["mcp_servers"]):
-                if not isinstance(server, dict):
-                    logger.error(f"mcp_servers[{i}]가 JSON 객체가 아닙니다.")
-                    return False
-                
-                # 필수 필드 검증
-                required_fields = ["name"]
-                for field in required_fields:
-                    if field not in server:
-                        logger.error(f"mcp_servers[{i}]에 필수 필드 '{field}'가 없습니다.")
-                        return False
-            
-            return True
+            errors = self.validator.validate(config, previous=self._validated_config)
+            for path, message in errors:
+                logger.error(f"설정 검증 오류 {path}: {message}")
+            return not errors
         except Exception as e:
             logger.error(f"설정 파일 검증 오류: {e}")
             return False
     
-    def _backup_config(self, error=False):
+    @property
+    def backup_store(self):
+        """백업 디렉토리의 백업 저장소 (처음 사용할 때 생성)"""
+        if self._backup_store is None or self._backup_store.backup_dir != self.backup_dir:
+            self._backup_store = BackupStore(self.backup_dir, retention=RetentionPolicy())
+        return self._backup_store
+    
+    def _backup_config(self, error=False, reason=None):
         """
         설정 파일을 백업합니다.
         
         Args:
             error (bool, optional): 오류로 인한 백업인지 여부. 기본값은 False입니다.
+            reason (str, optional): 백업 사유. 기본값은 None으로, error에 따라 결정됩니다.
+            
+        Returns:
+            dict: 백업 항목. 설정 파일이 없거나 오류가 발생하면 None을 반환합니다.
         """
+        # 파일을 백업하므로 쓰기를 기다리는 변경을 먼저 반영
+        self.flush()
         if not os.path.exists(self.config_path):
             logger.warning("백업할 설정 파일이 없습니다.")
-            return
+            return None
         
         try:
-            # 백업 파일 이름 생성
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_filename = f"claude_desktop_config_{timestamp}"
-            if error:
-                backup_filename += "_error"
-            backup_filename += ".json"
+            with open(self.config_path, 'rb') as f:
+                data = f.read()
             
-            backup_path = os.path.join(self.backup_dir, backup_filename)
+            # 같은 내용은 한 번만 저장되므로 변경 없는 백업은 매니페스트 확인만으로 끝남
+            entry = self.backup_store.put(data, reason=reason or (REASON_ERROR if error else REASON_SAVE))
             
-            # 파일 복사
-            shutil.copy2(self.config_path, backup_path)
-            
-            logger.info(f"설정 파일을 {backup_path}에 백업했습니다.")
-            
-            # 오래된 백업 파일 정리 (최대 10개 유지)
-            self._cleanup_old_backups()
+            logger.info(f"설정 파일을 백업했습니다: {entry['name']} ({entry['hash'][:12]})")
+            return entry
         except Exception as e:
             logger.error(f"설정 파일 백업 오류: {e}")
-    
-    def _cleanup_old_backups(self, max_backups=10):
-        """
-        오래된 백업 파일을 정리합니다.
-        
-        Args:
-            max_backups (int, optional): 유지할 최대 백업 파일 수. 기본값은 10입니다.
-        """
-        try:
-            # 백업 파일 목록 가져오기
-            backup_files = [f for f in os.listdir(self.backup_dir) 
-                           if f.startswith("claude_desktop_config_") and f.endswith(".json")]
-            
-            # 파일 수가 최대 개수를 초과하면 오래된 파일 삭제
-            if len(backup_files) > max_backups:
-                # 수정 시간 기준으로 정렬
-                backup_files.sort(key=lambda f: os.path.getmtime(os.path.join(self.backup_dir, f)))
-                
-                # 오래된 파일 삭제
-                for i in range(len(backup_files) - max_backups):
-                    old_file = os.path.join(self.backup_dir, backup_files[i])
-                    os.remove(old_file)
-                    logger.info(f"오래된 백업 파일 {old_file}을 삭제했습니다.")
-        except Exception as e:
-            logger.error(f"백업 파일 정리 오류: {e}")
+            return None
     
     def restore_backup(self, backup_file=None):
         """
-        백업 파일에서 설정을 복원합니다.
+        백업에서 설정을 복원합니다.
         
         Args:
-            backup_file (str, optional): 복원할 백업 파일 이름. 기본값은 None으로,
-                                        이 경우 가장 최근 백업 파일을 사용합니다.
+            backup_file (str, optional): 복원할 백업 이름. 기본값은 None으로, 이 경우 저널의
+                                        마지막 변경 직전 상태나 가장 최근 백업을 사용합니다.
             
         Returns:
             bool: 복원 성공 여부
         """
+        # 복원한 파일을 나중에 덮어쓰지 않도록 쓰기를 기다리는 변경을 먼저 반영
+        self.flush()
         try:
-            # 백업 파일 경로 결정
-            if backup_file:
-                backup_path = os.path.join(self.backup_dir, backup_file)
-            else:
-                # 가장 최근 백업 파일 찾기
-                backup_files = [f for f in os.listdir(self.backup_dir) 
-                               if f.startswith("claude_desktop_config_") and f.endswith(".json")]
-                
-                if not backup_files:
-                    logger.error("복원할 백업 파일이 없습니다.")
-                    return False
-                
-                # 수정 시간 기준으로 정렬 (최신 순)
-                backup_files.sort(key=lambda f: os.path.getmtime(os.path.join(self.backup_dir, f)), reverse=True)
-                
-                backup_path = os.path.join(self.backup_dir, backup_files[0])
+            # 백업을 지정하지 않았고 설정 파일이 저널의 최신 상태이면 마지막 변경 직전 상태로 복원
+            if not backup_file:
+                previous = self._journal_previous_config()
+                if previous is not None:
+                    if os.path.exists(self.config_path):
+                        self._backup_config(reason=REASON_BEFORE_RESTORE)
+                    previous_hash = self.config_hash(previous)
+                    self._write_config(previous, previous_hash)
+                    self._journal_replaced(previous, previous_hash)
+                    logger.info("저널에서 마지막 변경 직전 설정을 복원했습니다.")
+                    return True
             
-            # 백업 파일 존재 확인
-            if not os.path.exists(backup_path):
-                logger.error(f"백업 파일 {backup_path}이 존재하지 않습니다.")
+            # 복원할 백업 결정
+            entry = self.backup_store.find(backup_file) if backup_file else self.backup_store.latest()
+            if entry is None:
+                logger.error(f"복원할 백업이 없습니다: {backup_file or '최신'}")
                 return False
             
-            # 현재 설정 파일 백업
-            current_backup = f"claude_desktop_config_before_restore_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            current_backup_path = os.path.join(self.backup_dir, current_backup)
+            data = self.backup_store.get(entry['name'])
             
+            # 현재 설정 파일 백업
             if os.path.exists(self.config_path):
-                shutil.copy2(self.config_path, current_backup_path)
-                logger.info(f"복원 전 현재 설정 파일을 {current_backup_path}에 백업했습니다.")
+                self._backup_config(reason=REASON_BEFORE_RESTORE)
             
-            # 백업 파일 복원
-            shutil.copy2(backup_path, self.config_path)
+            # 백업 내용 복원 (임시 파일에 쓴 뒤 교체)
+            temp_path = f"{self.config_path}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, self.config_path)
+            self.invalidate_cache()
+            try:
+                restored = json_io.loads(data)
+            except ValueError:
+                logger.warning(f"복원한 백업이 JSON이 아니어서 저널에 기록하지 않습니다: {entry['name']}")
+                restored = None
+            self._journal_replaced(restored)
             
-            logger.info(f"설정 파일을 {backup_path}에서 복원했습니다.")
+            logger.info(f"설정 파일을 백업 {entry['name']}에서 복원했습니다.")
             return True
         except Exception as e:
             logger.error(f"설정 파일 복원 오류: {e}")
             return False
     
+    def prune_backups(self, dry_run=False):
+        """
+        백업 보존 정책(최근 1시간 전체, 하루 동안 1시간마다, 한 달 동안 하루마다, 1년 동안 일주일마다)을 적용합니다.
+        
+        Args:
+            dry_run (bool, optional): True이면 삭제하지 않고 유지/삭제될 백업만 반환합니다. 기본값은 False입니다.
+            
+        Returns:
+            dict: 유지할 백업 이름('keep')과 삭제할 백업 이름('drop') 목록
+        """
+        try:
+            result = self.backup_store.prune(dry_run=dry_run)
+            return {key: [entry['name'] for entry in entries] for key, entries in result.items()}
+        except Exception as e:
+            logger.error(f"백업 정리 오류: {e}")
+            return {'keep': [], 'drop': []}
+    
+    def _journal_previous_config(self):
+        """설정 파일이 저널의 최신 상태와 같으면 마지막 변경 직전 설정을 반환합니다."""
+        if not os.path.isdir(os.path.join(self.backup_dir, "journal")):
+            return None
+        # 체크포인트 직후이면 보관된 세그먼트의 마지막 변경
+        mutation = self.journal.last_mutation() or (self.journal.history() or [None])[-1]
+        if mutation is None or self._current_hash() != mutation['hash']:
+            return None
+        return self.config_at(mutation['seq'] - 1)
+    
     def get_backup_list(self):
         """
-        백업 파일 목록을 반환합니다.
+        백업 목록을 반환합니다.
         
         Returns:
-            list: 백업 파일 정보 목록 (파일 이름, 날짜, 크기)
+            list: 백업 정보 목록 (이름, 날짜, 크기, 사유, 해시), 최신 순
         """
         try:
-            backup_files = [f for f in os.listdir(self.backup_dir) 
-                           if f.startswith("claude_desktop_config_") and f.endswith(".json")]
-            
-            # 백업 파일 정보 수집
-            backup_info = []
-            for filename in backup_files:
-                file_path = os.path.join(self.backup_dir, filename)
-                mtime = os.path.getmtime(file_path)
-                size = os.path.getsize(file_path)
-                
-                # 날짜 형식 변환
-                date = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
-                
-                # 크기 형식 변환 (KB)
-                size_kb = size / 1024
-                
-                backup_info.append({
-                    "filename": filename,
-                    "date": date,
-                    "size": f"{size_kb:.1f} KB"
-                })
-            
-            # 날짜 기준 정렬 (최신 순)
-            backup_info.sort(key=lambda x: x["date"], reverse=True)
-            
-            return backup_info
+            return [{
+                "filename": entry['name'],
+                "date": datetime.fromtimestamp(entry['timestamp']).strftime("%Y-%m-%d %H:%M:%S"),
+                "size": f"{entry['size'] / 1024:.1f} KB",
+                "reason": entry['reason'],
+                "hash": entry['hash'],
+            } for entry in self.backup_store.entries()]
         except Exception as e:
-            logger.error(f"백업 파일 목록 가져오기 오류: {e}")
+            logger.error(f"백업 목록 가져오기 오류: {e}")
             return []
     
     def get_mcp_servers(self):
-        """설정 파일에서 MCP 서버 목록을 가져옵니다."""
-        config = self.load_config()
-        
-        # 실제 Claude 설정 파일 형식("mcpServers": {}) 처리
-        if "mcpServers" in config and isinstance(config["mcpServers"], dict):
-            logger.info("'mcpServers' 객체 형식 발견. 리스트 형식으로 변환합니다.")
-            mcp_servers_list = []
-            for server_name, server_config in config["mcpServers"].items():
-                # server_config가 딕셔너리인지 확인
-                if isinstance(server_config, dict):
-                    new_server_entry = {
-                        'name': server_name, 
-                        # command, args, env 등 다른 키들을 안전하게 복사
-                        'command': server_config.get('command'),
-                        'args': server_config.get('args', []), # args가 없을 경우 빈 리스트
-                        'env': server_config.get('env', {}),    # env가 없을 경우 빈 딕셔너리
-                        # 필요에 따라 다른 필드도 추가 (예: description, category 등은 기본값 설정)
-                        'description': server_config.get('description', "설명 없음"),
-                        'category': server_config.get('category', "일반")
-                        # enabled 상태 등 다른 정보는 필요시 추가/관리
-                    }
-                    mcp_servers_list.append(new_server_entry)
-                    logger.debug(f"변환된 서버 정보: {new_server_entry}") # 변환된 정보 디버그 로깅
-                else:
-                     logger.warning(f"'{server_name}' 서버 설정이 올바른 형식이 아닙니다(객체여야 함): {server_config}")
-            
-            # 로그 추가: 변환 후 MCP 서버 목록 개수 출력
-            logger.info(f"리스트로 변환된 MCP 서버 수: {len(mcp_servers_list)}")
-            return mcp_servers_list
-        # 이전 버전 또는 예상 형식 ("mcp_servers": []) 처리 (하위 호환성)
-        elif "mcp_servers" in config and isinstance(config["mcp_servers"], list):
-            logger.info("'mcp_servers' 리스트 형식 발견.")
-            server_list = config.get("mcp_servers", [])
-            logger.info(f"로드된 MCP 서버 수 (리스트 형식): {len(server_list)}")
-            return server_list
-        else:
-            logger.warning("설정 파일에서 'mcpServers'(객체) 또는 'mcp_servers'(리스트) 키를 찾을 수 없거나 형식이 잘못되었습니다.")
-            return []
+        """설정 파일에서 MCP 서버 목록을 가져옵니다. 서버 모델과 목록 형식 보기는 설정 캐시와 함께 재사용됩니다."""
+        config = self._load_cached_config()
+        self._mark_loaded(config)
+        
+        # 호출자가 목록과 항목을 수정해도 캐시가 바뀌지 않도록 복사
+        return [self._copy_server(server) for server in self._server_model(config).to_list()]
+    
+    def _server_model(self, config):
+        """
+        설정 정보의 서버 모델을 반환합니다. 캐시된 설정이면 모델을 한 번만 만들어 재사용합니다
+        (이전 형식 mcp_servers도 이때 한 번만 변환). 반환된 모델은 공유되므로 수정하려면 copy()를 사용합니다.
+        
+        Args:
+            config (dict): 설정 정보
+            
+        Returns:
+            ServerModel: 서버 모델
+        """
+        if config is self._cached_config and self._cached_model is not None:
+            return self._cached_model
+        model = ServerModel.from_config(config)
+        logger.info(f"MCP 서버 모델을 만들었습니다. 서버 수: {len(model)}")
+        if config is self._cached_config:
+            self._cached_model = model
+        return model
+    
+    def _copy_server(self, server):
+        """서버 항목을 복사합니다 (args, env 등 중첩 값 포함)."""
+        return {key: (value.copy() if isinstance(value, (list, dict)) else value)
+                for key, value in server.items()}
     
     def save_mcp_servers(self, mcp_servers_list):
         """MCP 서버 목록을 설정 파일에 저장합니다."""
-        config = self.load_config()
+        return self.save_config(self._build_config(mcp_servers_list))
+    
+    def _build_config(self, mcp_servers_list, base_config=None):
+        """
+        서버 모델 또는 내부 리스트 형식의 서버 목록으로 설정 정보를 만듭니다.
+        
+        Args:
+            mcp_servers_list (ServerModel | list): MCP 서버 모델 또는 목록
+            base_config (dict, optional): 서버 외 설정을 가져올 설정 정보. 기본값은 None으로,
+                                         이 경우 현재 설정 파일을 사용합니다.
+            
+        Returns:
+            dict: 설정 정보
+        """
+        # 캐시된 설정은 공유 객체이므로 최상위만 복사 (mcpServers 키는 새 객체로 교체)
+        config = dict(self._load_cached_config() if base_config is None else base_config)
+        
+        if isinstance(mcp_servers_list, ServerModel):
+            config["mcpServers"] = dict(mcp_servers_list.to_mcp_servers())
+            config.pop("mcp_servers", None)
+            return config
         
         # 내부적으로 사용하는 리스트 형식을 Claude가 사용하는 객체 형식으로 변환
         mcp_servers_object = {}
@@ -453,42 +1079,420 @@ class ConfigManager:
         if "mcp_servers" in config:
             del config["mcp_servers"]
             
-        return self.save_config(config)
+        return config
     
-    def add_mcp_server(self, server_info):
-        """MCP 서버를 설정 파일에 추가합니다."""
-        my_mcp_servers = self.get_mcp_servers()
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        여러 변경을 묶어 한 번에 저장하는 트랜잭션을 시작합니다.
+        블록이 정상 종료되면 변경이 있을 때만 한 번 검증/백업/저장하고,
+        블록에서 예외가 발생하면 아무것도 저장하지 않습니다 (전체 롤백).
+        블록이 끝날 때까지 설정 잠금을 가지므로 다른 스레드의 변경은 커밋 뒤에 실행됩니다.
         
-        # 중복 확인 (이름 기준)
-        if any(s['name'] == server_info.get('name') for s in my_mcp_servers):
-            logger.warning(f"이미 존재하는 서버입니다: {server_info.get('name')}")
-            return False
+        사용 예:
+            with config_manager.transaction() as txn:
+                txn.move(3, 2)
+                txn.delete("old-server")
+            if txn.committed is False:
+                ...  # 저장 실패
         
-        my_mcp_servers.append(server_info)
-        return self.save_mcp_servers(my_mcp_servers)
+        Yields:
+            ConfigTransaction: 트랜잭션 객체. 종료 후 committed에 저장 결과가 기록됩니다
+                               (변경이 없으면 None).
+        """
+        # 기준 설정을 불러온 뒤 커밋할 때까지 다른 스레드(작업 스레드, 지연 쓰기 타이머)의 쓰기가 끼어들지 않도록 잠금
+        with self._lock:
+            config = self._load_cached_config()
+            self._mark_loaded(config)
+            txn = ConfigTransaction(self._server_model(config).copy())
+            base = (self._loaded_config, self._loaded_hash)
+            try:
+                yield txn
+            except Exception:
+                logger.error(f"트랜잭션 중 오류가 발생하여 {txn.operations}개 변경을 취소했습니다.")
+                txn.committed = False
+                raise
+            
+            if txn.operations:
+                txn.committed = self._commit_journaled(txn.log, txn.model, base)
+                if txn.committed:
+                    logger.info(f"트랜잭션 커밋: {txn.operations}개 변경을 한 번에 저장했습니다.")
     
-    def delete_mcp_server(self, server_name):
-        """MCP 서버를 설정 파일에서 삭제합니다."""
-        my_mcp_servers = self.get_mcp_servers()
-        original_length = len(my_mcp_servers)
+    @property
+    def journal(self):
+        """백업 디렉토리의 설정 변경 저널 (처음 사용할 때 생성)"""
+        journal_dir = os.path.join(self.backup_dir, "journal")
+        if self._journal is None or self._journal.journal_dir != journal_dir:
+            self._journal = ConfigJournal(journal_dir)
+        return self._journal
+    
+    def _checkpoint(self, config, config_hash):
+        """현재 설정 파일을 백업하고 저널의 새 체크포인트로 기록합니다."""
+        self._backup_config(reason=REASON_CHECKPOINT)
+        self.journal.checkpoint(config, config_hash)
+    
+    def _journal_replaced(self, config, config_hash=None):
+        """
+        ConfigManager가 변경 목록 없이 설정 파일을 통째로 바꾼 경우(복원, 프로필 전환) 새 상태를 체크포인트로 기록합니다.
+        저널의 이전 상태와 같은 파일을 다음 실행에서 반영되지 못한 변경으로 오인하여 재생하지 않도록 합니다.
         
-        my_mcp_servers = [s for s in my_mcp_servers if s.get('name') != server_name]
+        Args:
+            config (dict): 새 설정 정보. None이면(JSON이 아닌 백업 복원) 기록하지 않습니다.
+            config_hash (str, optional): 설정 해시
+        """
+        if config is None or not os.path.isdir(os.path.join(self.backup_dir, "journal")):
+            return
+        config_hash = config_hash or self.config_hash(config)
+        if self.journal.last_hash != config_hash:
+            self.journal.checkpoint(config, config_hash)
+    
+    def _commit_journaled(self, ops, model, base=None):
+        """
+        변경 목록을 저널에 먼저 기록한 뒤 설정 파일에 반영합니다.
+        변경마다 전체 백업을 만들지 않고, 저널 체크포인트를 만들 때만 백업합니다.
         
-        if len(my_mcp_servers) < original_length:
-            return self.save_mcp_servers(my_mcp_servers)
-        else:
-             logger.warning(f"삭제할 서버를 찾지 못했습니다: {server_name}")
-             return False
+        Args:
+            ops (list): 변경 목록 ([작업, 인자...])
+            model (ServerModel): 변경을 적용한 MCP 서버 모델
+            base (tuple, optional): 트랜잭션 시작 시 불러온 (설정 정보, 해시).
+                                   그 뒤 외부에서 설정이 바뀌었으면 3-way 병합합니다.
+            
+        Returns:
+            bool: 저장 성공 여부
+        """
+        with self._lock:
+            try:
+                self.last_conflicts = []
+                config = self._build_config(model)
+                base_hash = self._current_hash()
+                merged = base is not None and self._changed_externally(base[1], base_hash)
+                if merged:
+                    config = self._merge_external(base[0], config)
+                
+                if not self._validate_config(config):
+                    logger.error("설정 파일 검증 실패")
+                    return False
+                
+                new_hash = self.config_hash(config)
+                if new_hash == base_hash:
+                    self.last_changes = self.diff_launch({}, {})
+                    logger.info("변경 사항이 없어 설정 파일 저장을 생략합니다.")
+                    return True
+                
+                # 저널 밖에서 바뀐 설정(처음 사용, 외부 편집, 백업 복원)은 새 체크포인트로 기록
+                base_config = self._load_cached_config()
+                if base_hash is None:
+                    base_hash = self.config_hash(base_config)
+                if self.journal.last_hash != base_hash:
+                    self._checkpoint(base_config, base_hash)
+                
+                # 병합 결과는 변경 목록의 재생과 다를 수 있으므로 전체 설정을 체크포인트로 기록
+                if merged:
+                    self._write_config(config, new_hash)
+                    self._checkpoint(config, new_hash)
+                    return True
+                
+                # 쓰기 지연 모드에서는 저널 기록만 바로 하고 파일 쓰기는 모아서 나중에 함
+                disk_hash = self._pending_disk_hash if self._pending is not None else base_hash
+                seq = self.journal.append(ops, base_hash, new_hash, disk_hash)
+                try:
+                    self._write_config(config, new_hash, defer=self.write_delay is not None)
+                except Exception:
+                    self.journal.abort(seq)
+                    raise
+                self._pending_disk_hash = disk_hash if self._pending is not None else None
+                
+                if self._pending is None and self.journal.needs_checkpoint():
+                    self._checkpoint(config, new_hash)
+                return True
+            except Exception as e:
+                self.invalidate_cache()
+                logger.error(f"설정 파일 저장 오류: {e}")
+                return False
+    
+    def config_at(self, seq=None):
+        """
+        저널의 체크포인트와 변경을 재생하여 지정한 시점의 설정을 만듭니다.
+        
+        Args:
+            seq (int, optional): 변경 순번. 기본값은 None으로, 이 경우 저널의 최신 상태를 만듭니다.
+            
+        Returns:
+            dict: 설정 정보. 저널에 없는 시점이거나 재생에 실패하면 None을 반환합니다.
+        """
+        plan = self.journal.replay_plan(seq)
+        if plan is None:
+            return None
+        checkpoint_config, ops_list = copy.deepcopy(plan)
+        if not ops_list:
+            return checkpoint_config
+        
+        txn = ConfigTransaction(ServerModel.from_config(checkpoint_config))
+        for ops in ops_list:
+            if not txn.replay(ops):
+                return None
+        return self._build_config(txn.model, base_config=checkpoint_config)
+    
+    def journal_history(self):
+        """
+        저널에 기록된 변경 목록을 반환합니다.
+        
+        Returns:
+            list: 변경 정보 목록 (순번, 날짜, 변경 목록), 오래된 순
+        """
+        try:
+            return [{
+                "seq": record['seq'],
+                "date": datetime.fromtimestamp(record['ts']).strftime("%Y-%m-%d %H:%M:%S"),
+                "ops": record['ops'],
+            } for record in self.journal.history()]
+        except Exception as e:
+            logger.error(f"저널 기록 가져오기 오류: {e}")
+            return []
+    
+    def recover_from_journal(self):
+        """
+        설정 파일에 반영되지 못한 저널 변경이 있으면 재생하여 복구합니다.
+        설정 파일이 없거나 손상되었거나, 마지막 변경을 기록할 때의 상태(쓰기 도중 또는 쓰기 지연 중 종료)로
+        남아 있을 때만 복구하고 그 밖의 설정(외부 편집, 저널의 더 이전 상태로 되돌린 파일)은 그대로 둡니다.
+        
+        Returns:
+            bool: 복구 여부
+        """
+        if not os.path.isdir(os.path.join(self.backup_dir, "journal")):
+            return False
+        try:
+            expected = self.journal.last_hash
+            if expected is None:
+                return False
+            
+            try:
+                current_hash = self.config_hash(json_io.load(self.config_path))
+            except (OSError, ValueError):
+                current_hash = None
+            if current_hash == expected:
+                return False
+            
+            # 파일이 마지막 변경을 기록할 때의 상태(쓰기 지연 중이면 모인 변경 전의 상태)일 때만 재생하고,
+            # 저널의 다른 이전 상태(복원, 직접 되돌린 편집)는 의도한 변경으로 보고 그대로 둠
+            if current_hash is not None and current_hash != self.journal.in_flight_base():
+                return False
+            
+            config = self.config_at()
+            if config is None or self.config_hash(config) != expected:
+                logger.error("저널 재생 결과가 기록된 해시와 다릅니다. 복구하지 않습니다.")
+                return False
+            self._write_config(config, expected)
+            logger.info(f"저널을 재생하여 설정 파일을 복구했습니다 (seq {self.journal.last_seq}).")
+            return True
+        except Exception as e:
+            self.invalidate_cache()
+            logger.error(f"저널 복구 오류: {e}")
+            return False
+    
+    def add_mcp_server(self, server_info):
+        """MCP 서버를 설정 파일에 추가합니다."""
+        with self.transaction() as txn:
+            if not txn.add(server_info):
+                return False
+        return bool(txn.committed)
+    
+    def delete_mcp_server(self, server_name):
+        """MCP 서버를 설정 파일에서 삭제합니다."""
+        with self.transaction() as txn:
+            if not txn.delete(server_name):
+                return False
+        return bool(txn.committed)
     
     def move_mcp_server(self, from_index, to_index):
         """MCP 서버의 순서를 변경합니다."""
-        my_mcp_servers = self.get_mcp_servers()
+        with self.transaction() as txn:
+            if not txn.move(from_index, to_index):
+                return False
+        return bool(txn.committed)
+    
+    def can_undo(self):
+        """실행 취소할 서버 변경이 있는지 확인합니다."""
+        return self.history.can_undo()
+    
+    def can_redo(self):
+        """다시 실행할 서버 변경이 있는지 확인합니다."""
+        return self.history.can_redo()
+    
+    def undo(self):
+        """
+        마지막 서버 변경을 실행 취소합니다.
+        기록은 메모리에만 있으며, 결과는 일반 변경처럼 저널에 기록하고 저장합니다 (전체 백업 복사 없음).
+        기록 뒤 외부에서 바뀐 서버는 그대로 두고 last_conflicts에 보고합니다.
         
-        if 0 <= from_index < len(my_mcp_servers) and 0 <= to_index < len(my_mcp_servers):
-            # 리스트 순서 변경
-            server_to_move = my_mcp_servers.pop(from_index)
-            my_mcp_servers.insert(to_index, server_to_move)
-            return self.save_mcp_servers(my_mcp_servers)
-        else:
-            logger.error(f"잘못된 인덱스입니다: from={from_index}, to={to_index}")
+        Returns:
+            bool: 실행 취소 여부 (기록이 없거나 저장에 실패하면 False)
+        """
+        return self._apply_history(undo=True)
+    
+    def redo(self):
+        """
+        실행 취소한 서버 변경을 다시 실행합니다.
+        
+        Returns:
+            bool: 다시 실행 여부 (기록이 없거나 저장에 실패하면 False)
+        """
+        return self._apply_history(undo=False)
+    
+    def _apply_history(self, undo):
+        """실행 취소/다시 실행 기록 하나를 적용하고 반대쪽 기록으로 옮깁니다."""
+        action = "실행 취소" if undo else "다시 실행"
+        # 기록 조회부터 적용, 기록 이동까지 다른 스레드(작업 스레드, 지연 쓰기 타이머)의 쓰기와 섞이지 않도록 잠금
+        with self._lock:
+            entry = self.history.peek(undo)
+            if entry is None:
+                logger.info(f"{action}할 변경이 없습니다.")
+                return False
+        
+            # 적용 결과는 새 변경으로 기록하지 않고 기존 기록을 반대쪽으로 옮김
+            self._recording_history = False
+            try:
+                with self.transaction() as txn:
+                    conflicts = entry.apply(txn, undo)
+            finally:
+                self._recording_history = True
+            if txn.committed is False:
+                logger.error(f"{action} 결과를 저장하지 못했습니다.")
+                return False
+        
+            self.history.step(undo)
+            if conflicts:
+                model = self._server_model(self._load_cached_config())
+                self.last_conflicts += [{'type': 'server', 'name': name,
+                                         'ours': entry.servers[name][0 if undo else 1], 'theirs': model.get(name)}
+                                        for name in conflicts]
+                logger.warning(f"{action} 중 외부에서 바뀐 서버를 건너뛰었습니다: {', '.join(conflicts)}")
+            logger.info(f"서버 변경을 {action}했습니다.")
+            return True
+    
+    @property
+    def profile_store(self):
+        """설정 파일 옆 profiles 디렉토리의 프로필 저장소 (처음 사용할 때 생성)"""
+        profiles_dir = os.path.join(os.path.dirname(self.config_path), "profiles")
+        if self._profile_store is None or self._profile_store.profiles_dir != profiles_dir:
+            self._profile_store = ProfileStore(profiles_dir)
+        return self._profile_store
+    
+    def _current_settings(self):
+        """현재 설정을 (서버 외 설정, 서버 설정 객체)로 나눕니다. 이전 형식은 객체 형식으로 변환합니다."""
+        config = self._load_cached_config()
+        if not isinstance(config.get('mcpServers'), dict):
+            config = self._build_config(ServerModel.from_config(config), base_config=config)
+        return split_settings(config)
+    
+    def get_profiles(self):
+        """
+        저장된 프로필 목록을 반환합니다.
+        
+        Returns:
+            list: 프로필 정보 목록 (이름, 서버 수, 현재 프로필 여부), 이름 순
+        """
+        try:
+            store = self.profile_store
+            active = store.active_profile()
+            return [{
+                "name": name,
+                "servers": len(store.load_profile(name)['servers']),
+                "active": name == active,
+            } for name in store.list_profiles()]
+        except Exception as e:
+            logger.error(f"프로필 목록 가져오기 오류: {e}")
+            return []
+    
+    def save_profile(self, name, server_names=None):
+        """
+        현재 설정의 MCP 서버를 프로필로 저장합니다.
+        
+        Args:
+            name (str): 프로필 이름 (영문, 숫자, '_', '-', '.')
+            server_names (list, optional): 프로필에 넣을 서버 이름 목록. 기본값은 None으로,
+                                          이 경우 현재 설정의 모든 서버를 저장합니다.
+            
+        Returns:
+            bool: 저장 성공 여부
+        """
+        try:
+            settings, servers = self._current_settings()
+            if server_names is not None:
+                missing = [server_name for server_name in server_names if server_name not in servers]
+                if missing:
+                    logger.error(f"프로필에 넣을 서버가 없습니다: {', '.join(missing)}")
+                    return False
+                servers = {server_name: servers[server_name] for server_name in server_names}
+            
+            store = self.profile_store
+            store.save_profile(name, servers)
+            # 전환할 때 이름 변경만 하도록 설정 파일을 미리 만들어 둠
+            store.build(name, settings)
+            return True
+        except Exception as e:
+            logger.error(f"프로필 저장 오류: {e}")
+            return False
+    
+    def delete_profile(self, name):
+        """
+        프로필을 삭제합니다. 다른 프로필이 쓰지 않는 서버 설정 조각도 함께 삭제됩니다.
+        
+        Args:
+            name (str): 프로필 이름
+            
+        Returns:
+            bool: 삭제 성공 여부
+        """
+        try:
+            return self.profile_store.delete_profile(name)
+        except Exception as e:
+            logger.error(f"프로필 삭제 오류: {e}")
+            return False
+    
+    def switch_profile(self, name):
+        """
+        프로필로 전환합니다. 서버를 하나씩 삭제/추가하지 않고 미리 만든 설정 파일로 한 번에 교체하며,
+        서버 외 설정(globalShortcut 등)은 현재 설정 파일의 값을 유지합니다.
+        
+        Args:
+            name (str): 프로필 이름
+            
+        Returns:
+            bool: 전환 성공 여부
+        """
+        self.flush()
+        try:
+            settings, _ = self._current_settings()
+            store = self.profile_store
+            built_path, config = store.build(name, settings)
+            if built_path is None:
+                logger.error(f"프로필이 없습니다: {name}")
+                return False
+            if not self._validate_config(config):
+                logger.error(f"프로필 '{name}' 설정 검증 실패")
+                return False
+            
+            old_snapshot = {}
+            if os.path.exists(self.config_path):
+                old_snapshot = self.launch_snapshot()
+                # 전환 전 상태는 백업 하나로 남김 (같은 내용이면 기존 백업 재사용)
+                self._backup_config(reason=REASON_PROFILE)
+            
+            store.install(name, built_path, self.config_path)
+            
+            # 전환한 상태를 저널 체크포인트로 기록 (다음 실행에서 이전 상태로 오인하지 않도록)
+            self._update_cache(config, self._stat_key())
+            self._cached_hash = self.config_hash(config)
+            self._journal_replaced(config, self._cached_hash)
+            self._validated_config = config
+            self._loaded_config, self._loaded_hash = config, self._cached_hash
+            self.last_changes = self.diff_launch(old_snapshot, self.launch_snapshot(config))
+            
+            # 다음 전환도 이름 변경만 하도록 다른 프로필의 설정 파일을 미리 만들어 둠
+            store.prebuild_all(settings)
+            return True
+        except Exception as e:
+            self.invalidate_cache()
+            logger.error(f"프로필 전환 오류: {e}")
             return False
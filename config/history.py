@@ -0,0 +1,204 @@
+"""
+설정 변경 기록 모듈
+
+MCP 서버 변경을 메모리에 기록하여 실행 취소/다시 실행을 제공합니다.
+각 기록은 전체 설정이 아니라 바뀐 서버의 이전/이후 설정 객체와 순서가 바뀐 서버의 이웃만 가지며,
+서버 설정 객체는 설정 캐시와 다른 기록이 공유합니다 (변경하지 않고 교체).
+따라서 기록 수백 개를 유지해도 메모리 사용량은 바뀐 서버 수에 비례합니다.
+
+순서 변경은 최장 증가 부분 수열로 제자리에 남은 서버를 찾고, 나머지 서버만
+"다음 서버" 이름으로 기록하여 이름 기준 이동(ServerModel.move)으로 되돌립니다.
+"""
+
+import bisect
+import collections
+import logging
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('history')
+
+# 기본 기록 수
+MAX_STEPS = 500
+
+
+def _stable_names(old_names, new_names):
+    """
+    두 순서에서 상대 순서가 유지된 서버 이름(최장 증가 부분 수열)을 반환합니다.
+
+    Returns:
+        set: 제자리에 남은 서버 이름
+    """
+    old_index = {name: i for i, name in enumerate(old_names)}
+    sequence = [name for name in new_names if name in old_index]
+    tails = []       # 길이별 마지막 원소의 이전 위치
+    tail_names = []  # 길이별 마지막 원소 이름
+    parent = {}
+    for name in sequence:
+        position = old_index[name]
+        length = bisect.bisect_left(tails, position)
+        if length == len(tails):
+            tails.append(position)
+            tail_names.append(name)
+        else:
+            tails[length] = position
+            tail_names[length] = name
+        parent[name] = tail_names[length - 1] if length else None
+
+    stable = set()
+    name = tail_names[-1] if tail_names else None
+    while name is not None:
+        stable.add(name)
+        name = parent[name]
+    return stable
+
+
+def _moved_with_next(names, stable):
+    """제자리에 남지 않은 서버를 (이름, 다음 서버 이름) 목록으로 반환합니다."""
+    last = len(names) - 1
+    return [(name, names[i + 1] if i < last else None) for i, name in enumerate(names) if name not in stable]
+
+
+class HistoryEntry:
+    """설정 변경 기록 하나"""
+
+    __slots__ = ('servers', 'before_order', 'after_order')
+
+    def __init__(self, servers, before_order, after_order):
+        """
+        HistoryEntry 초기화
+
+        Args:
+            servers (dict): {서버 이름: (이전 설정, 이후 설정)}. 없는 쪽은 None
+            before_order (list): 이전 순서에서 위치가 바뀐/삭제된 서버의 (이름, 다음 서버 이름)
+            after_order (list): 이후 순서에서 위치가 바뀐/추가된 서버의 (이름, 다음 서버 이름)
+        """
+        self.servers = servers
+        self.before_order = before_order
+        self.after_order = after_order
+
+    @classmethod
+    def diff(cls, old_servers, new_servers):
+        """
+        두 서버 설정 객체를 비교하여 기록을 만듭니다.
+
+        Args:
+            old_servers (dict): 이전 {서버 이름: 서버 설정} (순서 유지)
+            new_servers (dict): 이후 {서버 이름: 서버 설정} (순서 유지)
+
+        Returns:
+            HistoryEntry: 변경 기록. 바뀐 것이 없으면 None
+        """
+        servers = {}
+        for name, server in new_servers.items():
+            previous = old_servers.get(name)
+            if previous is None or (previous is not server and previous != server):
+                servers[name] = (previous, server)
+        for name, server in old_servers.items():
+            if name not in new_servers:
+                servers[name] = (server, None)
+
+        old_names, new_names = list(old_servers), list(new_servers)
+        if old_names == new_names:
+            before_order = after_order = []
+        else:
+            stable = _stable_names(old_names, new_names)
+            before_order = _moved_with_next(old_names, stable)
+            after_order = _moved_with_next(new_names, stable)
+
+        if not servers and not before_order and not after_order:
+            return None
+        return cls(servers, before_order, after_order)
+
+    def apply(self, txn, undo=True):
+        """
+        기록을 트랜잭션에 적용합니다 (undo=True이면 이전 상태로, False이면 이후 상태로).
+        현재 서버가 기록의 반대쪽 상태와 다르면(기록 뒤 외부에서 바뀐 서버) 건너뛰고 충돌로 보고합니다.
+
+        Args:
+            txn (ConfigTransaction): 현재 설정의 트랜잭션
+            undo (bool, optional): 실행 취소 여부. 기본값은 True입니다.
+
+        Returns:
+            list: 충돌한 서버 이름 목록
+        """
+        side, other = (0, 1) if undo else (1, 0)
+        order = self.before_order if undo else self.after_order
+        model = txn.model
+        conflicts = []
+        skipped = set()
+
+        for name, pair in self.servers.items():
+            target, expected = pair[side], pair[other]
+            current = model.get(name)
+            if current != expected:
+                conflicts.append(name)
+                skipped.add(name)
+            elif target is None:
+                txn.delete(name)
+            elif current is not None and current != target:
+                txn.update(name, dict(target, name=name))
+
+        # 다음 서버가 먼저 자리를 잡도록 뒤에서부터 이동/추가
+        for name, following in reversed(order):
+            if name in skipped:
+                continue
+            before = following if following in model else None
+            if name in model:
+                if model.index_of(name) != (model.index_of(before) - 1 if before is not None else len(model) - 1):
+                    txn.place(name, before)
+            else:
+                target = self.servers.get(name, (None, None))[side]
+                if target is not None:
+                    txn.add(dict(target, name=name), before)
+        return conflicts
+
+
+class ConfigHistory:
+    """실행 취소/다시 실행 기록 클래스"""
+
+    def __init__(self, max_steps=MAX_STEPS):
+        """
+        ConfigHistory 초기화
+
+        Args:
+            max_steps (int, optional): 유지할 최대 기록 수. 기본값은 500입니다.
+        """
+        self._undo = collections.deque(maxlen=max_steps)
+        self._redo = []
+
+    def record(self, entry):
+        """새 변경을 기록합니다. 다시 실행 기록은 비웁니다."""
+        self._undo.append(entry)
+        self._redo.clear()
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def peek(self, undo=True):
+        """
+        다음에 실행 취소(또는 다시 실행)할 기록을 반환합니다.
+
+        Returns:
+            HistoryEntry: 기록. 없으면 None
+        """
+        stack = self._undo if undo else self._redo
+        return stack[-1] if stack else None
+
+    def step(self, undo=True):
+        """peek()으로 적용한 기록을 반대쪽 스택으로 옮깁니다."""
+        if undo:
+            self._redo.append(self._undo.pop())
+        else:
+            self._undo.append(self._redo.pop())
+
+    def clear(self):
+        """모든 기록을 지웁니다."""
+        self._undo.clear()
+        self._redo.clear()
+
+    def __len__(self):
+        return len(self._undo)
@@ -0,0 +1,260 @@
+"""
+설정 변경 저널 모듈
+
+ConfigManager의 논리적 변경(add/delete/move/update)을 설정 파일에 반영하기 전에
+추가 전용 저널(journal.jsonl)에 fsync하여 기록합니다.
+
+저널 세그먼트는 체크포인트(그 시점의 전체 설정) 레코드로 시작하고 변경 레코드가 이어집니다.
+    {"type": "checkpoint", "seq": 12, "ts": ..., "hash": "...", "config": {...}}
+    {"type": "mutation", "seq": 13, "ts": ..., "ops": [["move", 3, 2]], "base": "...", "hash": "...", "disk": "..."}
+    {"type": "abort", "seq": 13}
+disk는 변경을 기록할 때 설정 파일에 있던 상태의 해시로, 쓰기 지연 중이라 base와 다를 때만 기록합니다.
+변경이 일정 수 쌓이면 새 체크포인트로 세그먼트를 교체하고, 이전 세그먼트는
+segment_<체크포인트 seq>.jsonl로 보관하므로 체크포인트와 변경 재생으로 과거 상태를 다시 만들 수 있습니다.
+"""
+
+import os
+import time
+import logging
+
+from utils import json_io
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('journal')
+
+JOURNAL_FILENAME = "journal.jsonl"
+SEGMENT_PREFIX = "segment_"
+
+
+def _read_records(path):
+    """
+    저널 파일의 레코드를 읽습니다. 기록 도중 잘린 마지막 줄은 버립니다.
+
+    Returns:
+        tuple: (레코드 목록, 유효한 바이트 수, 파일 크기)
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    records = []
+    valid_size = 0
+    for line in data.split(b"\n")[:-1]:
+        try:
+            records.append(json_io.loads(line))
+        except ValueError:
+            break
+        valid_size += len(line) + 1
+    return records, valid_size, len(data)
+
+
+class ConfigJournal:
+    """설정 변경 저널 클래스"""
+
+    def __init__(self, journal_dir, checkpoint_every=100, max_segments=50):
+        """
+        ConfigJournal 초기화
+
+        Args:
+            journal_dir (str): 저널 디렉토리 경로
+            checkpoint_every (int, optional): 새 체크포인트를 만들 변경 수. 기본값은 100입니다.
+            max_segments (int, optional): 보관할 이전 세그먼트 수. 기본값은 50입니다.
+        """
+        self.journal_dir = journal_dir
+        self.path = os.path.join(journal_dir, JOURNAL_FILENAME)
+        self.checkpoint_every = checkpoint_every
+        self.max_segments = max_segments
+        self._records = []
+        self._load()
+
+    def _load(self):
+        """현재 세그먼트를 읽고 불완전한 마지막 레코드를 잘라냅니다."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            records, valid_size, size = _read_records(self.path)
+        except OSError as e:
+            logger.error(f"저널 로드 오류: {e}")
+            return
+        if valid_size != size:
+            logger.warning(f"저널의 불완전한 레코드를 버립니다: {self.path}")
+            with open(self.path, 'r+b') as f:
+                f.truncate(valid_size)
+                f.flush()
+                os.fsync(f.fileno())
+        if records and records[0].get('type') == 'checkpoint':
+            self._records = records
+        elif records:
+            logger.error(f"저널이 체크포인트로 시작하지 않아 무시합니다: {self.path}")
+
+    @property
+    def last_seq(self):
+        """마지막 레코드의 순번 (저널이 비어 있으면 0)"""
+        return self._records[-1]['seq'] if self._records else 0
+
+    @property
+    def last_hash(self):
+        """저널을 모두 반영한 설정의 해시 (저널이 비어 있으면 None)"""
+        mutation = self.last_mutation()
+        if mutation is not None:
+            return mutation['hash']
+        return self._records[0]['hash'] if self._records else None
+
+    def last_mutation(self):
+        """현재 세그먼트에서 취소되지 않은 마지막 변경 레코드를 반환합니다."""
+        aborted = set()
+        for record in reversed(self._records):
+            if record['type'] == 'abort':
+                aborted.add(record['seq'])
+            elif record['type'] == 'mutation' and record['seq'] not in aborted:
+                return record
+        return None
+
+    def in_flight_base(self):
+        """
+        마지막 변경을 기록할 때 설정 파일에 있던 상태의 해시를 반환합니다.
+        설정 파일이 이 상태이면 마지막 변경(쓰기 지연 중이면 모인 변경 전체)이 파일에 반영되지 못한 것입니다.
+
+        Returns:
+            str: 설정 해시. 현재 세그먼트에 변경이 없으면 None
+        """
+        mutation = self.last_mutation()
+        if mutation is None:
+            return None
+        return mutation.get('disk', mutation['base'])
+
+    def needs_checkpoint(self):
+        """현재 세그먼트의 변경 수가 체크포인트 주기에 도달했는지 확인합니다."""
+        return len(self._records) - 1 >= self.checkpoint_every
+
+    def _append(self, record):
+        """레코드를 추가하고 디스크에 반영될 때까지 기다립니다."""
+        with open(self.path, 'ab') as f:
+            f.write(json_io.dumps_bytes(record) + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._records.append(record)
+
+    def append(self, ops, base_hash, new_hash, disk_hash=None):
+        """
+        변경 레코드를 기록합니다. 설정 파일에 반영하기 전에 호출해야 합니다.
+
+        Args:
+            ops (list): 변경 목록 ([작업, 인자...])
+            base_hash (str): 변경 전 설정 해시
+            new_hash (str): 변경 후 설정 해시
+            disk_hash (str, optional): 설정 파일에 있는 상태의 해시. 기본값은 None으로,
+                                      이 경우 base_hash와 같다고 봅니다.
+
+        Returns:
+            int: 변경 레코드 순번
+        """
+        if not self._records:
+            raise RuntimeError("체크포인트 없이 변경을 기록할 수 없습니다.")
+        seq = self.last_seq + 1
+        record = {'type': 'mutation', 'seq': seq, 'ts': time.time(), 'ops': ops,
+                  'base': base_hash, 'hash': new_hash}
+        if disk_hash is not None and disk_hash != base_hash:
+            record['disk'] = disk_hash
+        self._append(record)
+        return seq
+
+    def abort(self, seq):
+        """설정 파일에 반영하지 못한 변경 레코드를 취소로 표시합니다."""
+        self._append({'type': 'abort', 'seq': seq})
+
+    def checkpoint(self, config, config_hash):
+        """
+        현재 설정으로 새 세그먼트를 시작합니다. 이전 세그먼트는 보관합니다.
+
+        Args:
+            config (dict): 현재 설정 정보
+            config_hash (str): 설정 해시
+        """
+        os.makedirs(self.journal_dir, exist_ok=True)
+        record = {'type': 'checkpoint', 'seq': self.last_seq, 'ts': time.time(),
+                  'hash': config_hash, 'config': config}
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(json_io.dumps_bytes(record) + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        # 변경 레코드가 있는 세그먼트만 보관 (체크포인트만 있으면 새 체크포인트로 대체)
+        if len(self._records) > 1:
+            segment_path = os.path.join(self.journal_dir, f"{SEGMENT_PREFIX}{self._records[0]['seq']:08d}.jsonl")
+            os.replace(self.path, segment_path)
+        os.replace(temp_path, self.path)
+        self._records = [record]
+        self._prune_segments()
+        logger.info(f"저널 체크포인트를 만들었습니다: seq {record['seq']}")
+
+    def _segment_paths(self):
+        """보관된 세그먼트 경로를 오래된 순으로 반환합니다."""
+        try:
+            names = sorted(f for f in os.listdir(self.journal_dir)
+                           if f.startswith(SEGMENT_PREFIX) and f.endswith(".jsonl"))
+        except OSError:
+            return []
+        return [os.path.join(self.journal_dir, name) for name in names]
+
+    def _prune_segments(self):
+        """보관 개수를 넘는 오래된 세그먼트를 삭제합니다."""
+        segments = self._segment_paths()
+        for path in segments[:max(0, len(segments) - self.max_segments)]:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning(f"저널 세그먼트 삭제 오류 ({path}): {e}")
+
+    def _segments(self):
+        """보관된 세그먼트와 현재 세그먼트의 레코드 목록을 오래된 순으로 반환합니다."""
+        for path in self._segment_paths():
+            try:
+                records, _, _ = _read_records(path)
+            except OSError as e:
+                logger.warning(f"저널 세그먼트 읽기 오류 ({path}): {e}")
+                continue
+            if records and records[0].get('type') == 'checkpoint':
+                yield records
+        if self._records:
+            yield self._records
+
+    def replay_plan(self, seq=None):
+        """
+        지정한 순번의 상태를 만들기 위한 체크포인트와 변경 목록을 반환합니다.
+
+        Args:
+            seq (int, optional): 상태 순번. 기본값은 None으로, 이 경우 최신 상태를 사용합니다.
+
+        Returns:
+            tuple: (체크포인트 설정, 적용할 변경 목록의 목록). 저널에 없는 순번이면 None
+        """
+        seq = self.last_seq if seq is None else seq
+        if seq >= self.last_seq and self._records:
+            # 가장 흔한 경우 (최신 상태)
+            segments = [self._records]
+        else:
+            segments = list(self._segments())
+        for records in reversed(segments):
+            checkpoint = records[0]
+            if checkpoint['seq'] > seq:
+                continue
+            aborted = {record['seq'] for record in records if record['type'] == 'abort'}
+            ops = [record['ops'] for record in records[1:]
+                   if record['type'] == 'mutation' and record['seq'] <= seq and record['seq'] not in aborted]
+            return checkpoint['config'], ops
+        return None
+
+    def history(self):
+        """
+        기록된 변경 목록을 반환합니다 (취소된 변경 제외).
+
+        Returns:
+            list: 변경 레코드 목록 (오래된 순)
+        """
+        history = []
+        for records in self._segments():
+            aborted = {record['seq'] for record in records if record['type'] == 'abort'}
+            history.extend(record for record in records
+                           if record['type'] == 'mutation' and record['seq'] not in aborted)
+        return history
@@ -0,0 +1,262 @@
+"""
+설정 프로필 모듈
+
+이름 있는 MCP 서버 구성(프로필)을 설정 파일 옆의 profiles 디렉토리에 저장합니다.
+
+    profiles/
+        servers/<sha256>.json     서버 설정 조각 (내용 주소, 여러 프로필이 공유)
+        <이름>.profile.json       프로필 ({"name", "servers": [[서버 이름, 조각 해시], ...]})
+        built/<이름>-<해시>.json  미리 만들어 둔 전체 설정 파일 (전환 시 이름 변경으로 교체)
+        state.json                현재 프로필
+
+프로필 전환은 미리 만든 설정 파일을 os.replace로 설정 파일 위치에 옮기는 한 번의 원자적 작업입니다.
+"""
+
+import os
+import re
+import json
+import hashlib
+import logging
+
+from utils import json_io
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('profiles')
+
+PROFILE_SUFFIX = ".profile.json"
+PROFILE_NAME_PATTERN = re.compile(r"^[\w.-]{1,64}$")
+
+
+def _canonical(value):
+    """키 순서와 무관한 JSON 문자열을 반환합니다."""
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+
+
+def _digest(value):
+    """JSON 값의 SHA-256 해시를 반환합니다."""
+    return hashlib.sha256(_canonical(value).encode('utf-8')).hexdigest()
+
+
+def _write_atomic(path, data):
+    """임시 파일에 쓰고 디스크에 반영한 뒤 교체합니다."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def split_settings(config):
+    """설정 정보를 (서버 외 설정, 서버 설정 객체)로 나눕니다."""
+    settings = {key: value for key, value in config.items() if key not in ('mcpServers', 'mcp_servers')}
+    servers = config.get('mcpServers') if isinstance(config.get('mcpServers'), dict) else {}
+    return settings, servers
+
+
+class ProfileStore:
+    """설정 프로필 저장소 클래스"""
+
+    def __init__(self, profiles_dir):
+        """
+        ProfileStore 초기화
+
+        Args:
+            profiles_dir (str): 프로필 디렉토리 경로
+        """
+        self.profiles_dir = profiles_dir
+        self.servers_dir = os.path.join(profiles_dir, "servers")
+        self.built_dir = os.path.join(profiles_dir, "built")
+        self.state_path = os.path.join(profiles_dir, "state.json")
+
+    def _profile_path(self, name):
+        """프로필 파일 경로를 반환합니다."""
+        if not PROFILE_NAME_PATTERN.match(name or ""):
+            raise ValueError(f"잘못된 프로필 이름입니다: {name!r}")
+        return os.path.join(self.profiles_dir, f"{name}{PROFILE_SUFFIX}")
+
+    def _fragment_path(self, digest):
+        """서버 설정 조각 경로를 반환합니다."""
+        return os.path.join(self.servers_dir, f"{digest}.json")
+
+    def list_profiles(self):
+        """저장된 프로필 이름 목록을 반환합니다."""
+        try:
+            return sorted(f[:-len(PROFILE_SUFFIX)] for f in os.listdir(self.profiles_dir) if f.endswith(PROFILE_SUFFIX))
+        except OSError:
+            return []
+
+    def load_profile(self, name):
+        """
+        프로필을 읽습니다.
+
+        Returns:
+            dict: 프로필 정보. 없으면 None
+        """
+        path = self._profile_path(name)
+        if not os.path.exists(path):
+            return None
+        return json_io.load(path)
+
+    def save_profile(self, name, servers):
+        """
+        서버 설정 객체를 프로필로 저장합니다. 같은 서버 설정은 조각 하나를 공유합니다.
+
+        Args:
+            name (str): 프로필 이름
+            servers (dict): {서버 이름: 서버 설정} (순서 유지)
+
+        Returns:
+            dict: 저장된 프로필 정보
+        """
+        path = self._profile_path(name)
+        os.makedirs(self.servers_dir, exist_ok=True)
+        entries = []
+        for server_name, server in servers.items():
+            digest = _digest(server)
+            fragment_path = self._fragment_path(digest)
+            if not os.path.exists(fragment_path):
+                _write_atomic(fragment_path, _canonical(server).encode('utf-8'))
+            entries.append([server_name, digest])
+
+        profile = {'name': name, 'servers': entries}
+        _write_atomic(path, json_io.dumps_bytes(profile, pretty=True))
+        self._remove_built(name)
+        self.collect_garbage()
+        logger.info(f"프로필 '{name}'을 저장했습니다: 서버 {len(entries)}개")
+        return profile
+
+    def delete_profile(self, name):
+        """
+        프로필을 삭제하고 더 이상 쓰이지 않는 조각을 정리합니다.
+
+        Returns:
+            bool: 삭제 여부
+        """
+        path = self._profile_path(name)
+        if not os.path.exists(path):
+            return False
+        os.remove(path)
+        self._remove_built(name)
+        if self.active_profile() == name:
+            self._set_active(None)
+        self.collect_garbage()
+        return True
+
+    def profile_servers(self, name):
+        """
+        프로필의 서버 설정 객체를 조각에서 조립합니다.
+
+        Returns:
+            dict: {서버 이름: 서버 설정}. 프로필이 없으면 None
+        """
+        profile = self.load_profile(name)
+        if profile is None:
+            return None
+        servers = {}
+        for server_name, digest in profile['servers']:
+            servers[server_name] = json_io.load(self._fragment_path(digest))
+        return servers
+
+    def _built_path(self, name, settings):
+        """서버 외 설정에 따라 달라지는 미리 만든 설정 파일 경로를 반환합니다."""
+        return os.path.join(self.built_dir, f"{name}-{_digest(settings)[:16]}.json")
+
+    def _remove_built(self, name):
+        """프로필의 미리 만든 설정 파일을 모두 삭제합니다."""
+        try:
+            for filename in os.listdir(self.built_dir):
+                if filename.rsplit('-', 1)[0] == name:
+                    os.remove(os.path.join(self.built_dir, filename))
+        except OSError:
+            pass
+
+    def build(self, name, settings):
+        """
+        프로필의 전체 설정 파일을 미리 만듭니다 (이미 있으면 그대로 사용).
+
+        Args:
+            name (str): 프로필 이름
+            settings (dict): 서버 외 설정 (현재 설정 파일의 값)
+
+        Returns:
+            tuple: (미리 만든 파일 경로, 설정 정보). 프로필이 없으면 (None, None)
+        """
+        servers = self.profile_servers(name)
+        if servers is None:
+            return None, None
+        config = dict(settings)
+        config['mcpServers'] = servers
+        path = self._built_path(name, settings)
+        if not os.path.exists(path):
+            self._remove_built(name)
+            os.makedirs(self.built_dir, exist_ok=True)
+            _write_atomic(path, json_io.dumps_bytes(config, pretty=True))
+        return path, config
+
+    def prebuild_all(self, settings):
+        """모든 프로필의 설정 파일을 미리 만듭니다."""
+        for name in self.list_profiles():
+            try:
+                self.build(name, settings)
+            except Exception as e:
+                logger.warning(f"프로필 '{name}' 미리 만들기 오류: {e}")
+
+    def install(self, name, built_path, config_path):
+        """
+        미리 만든 설정 파일을 설정 파일 위치로 옮기고 현재 프로필로 기록합니다.
+        같은 파일 시스템 안의 이름 변경이므로 설정 파일은 항상 이전 또는 새 내용 중 하나입니다.
+
+        Args:
+            name (str): 프로필 이름
+            built_path (str): build()가 반환한 파일 경로
+            config_path (str): 설정 파일 경로
+        """
+        os.replace(built_path, config_path)
+        self._set_active(name)
+        logger.info(f"프로필 '{name}'으로 전환했습니다.")
+
+    def switch(self, name, config_path, settings):
+        """
+        프로필의 설정 파일을 (없으면 만든 뒤) 설정 파일 위치로 옮겨 프로필을 전환합니다.
+
+        Args:
+            name (str): 프로필 이름
+            config_path (str): 설정 파일 경로
+            settings (dict): 서버 외 설정 (현재 설정 파일의 값)
+
+        Returns:
+            dict: 전환된 설정 정보. 프로필이 없으면 None
+        """
+        path, config = self.build(name, settings)
+        if path is None:
+            return None
+        self.install(name, path, config_path)
+        return config
+
+    def active_profile(self):
+        """현재 프로필 이름을 반환합니다. 없으면 None"""
+        try:
+            return json_io.load(self.state_path).get('active')
+        except (OSError, ValueError):
+            return None
+
+    def _set_active(self, name):
+        """현재 프로필 이름을 기록합니다."""
+        os.makedirs(self.profiles_dir, exist_ok=True)
+        _write_atomic(self.state_path, json_io.dumps_bytes({'active': name}))
+
+    def collect_garbage(self):
+        """어떤 프로필도 참조하지 않는 서버 설정 조각을 삭제합니다."""
+        referenced = set()
+        for name in self.list_profiles():
+            profile = self.load_profile(name)
+            referenced.update(digest for _, digest in profile['servers'])
+        try:
+            fragments = os.listdir(self.servers_dir)
+        except OSError:
+            return
+        for filename in fragments:
+            if filename.endswith(".json") and filename[:-len(".json")] not in referenced:
+                os.remove(os.path.join(self.servers_dir, filename))
@@ -0,0 +1,109 @@
+"""
+백업 보존 정책 모듈
+
+GFS(Grandfather-Father-Son) 방식의 시간 구간별 백업 보존 정책을 제공합니다.
+기본 정책은 최근 1시간의 백업은 모두, 하루 동안은 1시간마다 하나, 한 달 동안은 하루에 하나,
+1년 동안은 일주일에 하나를 남기고 그보다 오래된 백업은 삭제합니다.
+
+각 구간(tier)은 아직 다음 구간으로 넘어가지 않은 백업을 시간 순서의 큐로 가지고 있어,
+정리할 때는 구간 경계를 넘은 백업만 확인합니다. 백업 하나는 구간마다 한 번씩만 처리되므로
+백업 시점의 정리 비용은 새 백업 수에 비례합니다.
+"""
+
+import time
+import collections
+import logging
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('retention')
+
+HOUR = 3600
+DAY = 24 * HOUR
+WEEK = 7 * DAY
+
+# (구간 길이(초), 버킷 크기(초)) 목록. 버킷 크기가 None이면 구간의 백업을 모두 유지
+# 버킷 크기는 앞 구간의 버킷 크기로 나누어떨어져야 함 (1시간 ⊂ 1일 ⊂ 1주)
+DEFAULT_TIERS = (
+    (HOUR, None),
+    (DAY, HOUR),
+    (30 * DAY, DAY),
+    (365 * DAY, WEEK),
+)
+
+
+class RetentionPolicy:
+    """시간 구간별 백업 보존 정책 클래스"""
+
+    def __init__(self, tiers=DEFAULT_TIERS):
+        """
+        RetentionPolicy 초기화
+
+        Args:
+            tiers (tuple, optional): (구간 길이, 버킷 크기) 목록. 기본값은 DEFAULT_TIERS입니다.
+        """
+        self.tiers = tuple(tiers)
+        self._queues = [collections.deque() for _ in self.tiers]
+
+    def clone(self):
+        """같은 구간 설정을 가진 빈 정책을 반환합니다."""
+        return RetentionPolicy(self.tiers)
+
+    def reset(self, entries, now=None):
+        """
+        상태를 비우고 기존 백업 전체에 정책을 적용합니다.
+
+        Args:
+            entries (iterable): 시간 순서(오래된 순)의 백업 항목
+            now (float, optional): 기준 시각. 기본값은 현재 시각입니다.
+
+        Returns:
+            list: 삭제할 백업 이름 목록
+        """
+        self._queues = [collections.deque() for _ in self.tiers]
+        for entry in entries:
+            self.add(entry)
+        return self.expire(now)
+
+    def add(self, entry):
+        """새 백업을 첫 구간에 추가합니다. 고정된(pinned) 백업은 정책에서 제외합니다."""
+        if self._queues and not entry.get('pinned'):
+            self._queues[0].append((entry['timestamp'], entry['name']))
+
+    def expire(self, now=None):
+        """
+        구간 경계를 넘은 백업을 다음 구간으로 옮기고 남기지 않을 백업을 반환합니다.
+
+        Args:
+            now (float, optional): 기준 시각. 기본값은 현재 시각입니다.
+
+        Returns:
+            list: 삭제할 백업 이름 목록
+        """
+        now = time.time() if now is None else now
+        dropped = []
+        for index, (window, _) in enumerate(self.tiers):
+            queue = self._queues[index]
+            boundary = now - window
+            while queue and queue[0][0] < boundary:
+                item = queue.popleft()
+                if index + 1 == len(self.tiers):
+                    # 마지막 구간보다 오래된 백업
+                    dropped.append(item[1])
+                    continue
+                dropped.extend(self._enter(index + 1, item))
+        return dropped
+
+    def _enter(self, index, item):
+        """백업이 구간에 들어갈 때 같은 버킷의 이전 백업을 밀어냅니다 (버킷마다 가장 최근 백업 유지)."""
+        bucket = self.tiers[index][1]
+        queue = self._queues[index]
+        dropped = []
+        if bucket is not None and queue and queue[-1][0] // bucket == item[0] // bucket:
+            dropped.append(queue.pop()[1])
+        queue.append(item)
+        return dropped
+
+    def pending(self):
+        """구간별로 남아 있는 백업 수를 반환합니다."""
+        return [len(queue) for queue in self._queues]
@@ -0,0 +1,270 @@
+"""
+설정 스키마 검증 모듈
+
+Claude Desktop 설정 파일(claude_desktop_config.json)의 스키마를 정의하고,
+스키마를 한 번만 해석하여 노드별 검사 함수로 컴파일합니다.
+검증은 한 번의 순회로 모든 오류를 JSON 경로와 함께 보고하며,
+이전에 검증한 설정을 넘기면 바뀐 서버만 다시 검사합니다.
+
+지원하는 스키마 키워드 (JSON Schema의 일부):
+    type, enum, minLength, items, properties, required,
+    additionalProperties, propertyNames
+"""
+
+import re
+import logging
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('schema')
+
+STRING_MAP = {'type': 'object', 'additionalProperties': {'type': 'string'}}
+
+# mcpServers의 서버 항목 (알 수 없는 키는 허용)
+# command는 get_mcp_servers 변환에서 값이 없으면 None으로 채워지므로 null 허용
+# type은 전송 방식(stdio, sse 등) 외에 이전 버전이 카탈로그에서 복사한 값('reference' 등)도 있으므로 값은 제한하지 않음
+SERVER_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'command': {'type': ['string', 'null'], 'minLength': 1},
+        'args': {'type': 'array', 'items': {'type': 'string'}},
+        'env': STRING_MAP,
+        'cwd': {'type': 'string'},
+        'type': {'type': 'string'},
+        'url': {'type': 'string', 'minLength': 1},
+        'headers': STRING_MAP,
+        'disabled': {'type': 'boolean'},
+        'description': {'type': 'string'},
+        'category': {'type': 'string'},
+    },
+    'additionalProperties': True,
+}
+
+# 이전 형식(mcp_servers 배열)의 서버 항목
+LEGACY_SERVER_SCHEMA = {
+    'type': 'object',
+    'properties': {'name': {'type': 'string', 'minLength': 1}},
+    'required': ['name'],
+    'additionalProperties': True,
+}
+
+CONFIG_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'mcpServers': {
+            'type': 'object',
+            'propertyNames': {'minLength': 1},
+            'additionalProperties': SERVER_SCHEMA,
+        },
+        'mcp_servers': {'type': 'array', 'items': LEGACY_SERVER_SCHEMA},
+    },
+    'additionalProperties': True,
+}
+
+ROOT = None
+
+_TYPE_CHECKS = {
+    'object': lambda value: isinstance(value, dict),
+    'array': lambda value: isinstance(value, list),
+    'string': lambda value: isinstance(value, str),
+    'boolean': lambda value: isinstance(value, bool),
+    'integer': lambda value: isinstance(value, int) and not isinstance(value, bool),
+    'number': lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    'null': lambda value: value is None,
+}
+
+_TYPE_NAMES = {
+    'object': "객체", 'array': "배열", 'string': "문자열", 'boolean': "불리언",
+    'integer': "정수", 'number': "숫자", 'null': "null",
+}
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def format_path(path):
+    """
+    검사 함수가 사용하는 (부모 경로, 키) 연결 경로를 JSON 경로 문자열로 변환합니다.
+
+    Args:
+        path (tuple): (부모 경로, 키) 또는 ROOT
+
+    Returns:
+        str: JSON 경로 (예: $.mcpServers.fetch.args[0], $.mcpServers['my server'])
+    """
+    keys = []
+    while path is not ROOT:
+        path, key = path
+        keys.append(key)
+    parts = ["$"]
+    for key in reversed(keys):
+        if isinstance(key, int):
+            parts.append(f"[{key}]")
+        elif _IDENTIFIER.match(key):
+            parts.append(f".{key}")
+        else:
+            parts.append(f"[{key!r}]")
+    return "".join(parts)
+
+
+def compile_schema(schema):
+    """
+    스키마를 검사 함수로 컴파일합니다.
+    검사 함수는 check(value, path, errors) 형태이며 오류를 (경로, 메시지)로 errors에 추가합니다.
+
+    Args:
+        schema (dict): 스키마
+
+    Returns:
+        function: 검사 함수
+    """
+    checks = []
+
+    types = schema.get('type')
+    if types is not None:
+        types = [types] if isinstance(types, str) else list(types)
+        type_checks = tuple(_TYPE_CHECKS[name] for name in types)
+        message = f"{' 또는 '.join(_TYPE_NAMES[name] for name in types)} 형식이어야 합니다."
+        if len(type_checks) == 1:
+            type_check = type_checks[0]
+        else:
+            type_check = lambda value: any(check(value) for check in type_checks)
+    else:
+        type_check = None
+
+    if 'enum' in schema:
+        allowed = frozenset(schema['enum'])
+        enum_message = f"허용되지 않는 값입니다 (가능한 값: {', '.join(map(str, schema['enum']))})."
+
+        def check_enum(value, path, errors):
+            if value not in allowed:
+                errors.append((path, enum_message))
+        checks.append(check_enum)
+
+    if 'minLength' in schema:
+        min_length = schema['minLength']
+
+        def check_min_length(value, path, errors):
+            if isinstance(value, str) and len(value) < min_length:
+                errors.append((path, "빈 문자열일 수 없습니다." if min_length == 1 else f"{min_length}자 이상이어야 합니다."))
+        checks.append(check_min_length)
+
+    if 'items' in schema:
+        check_item = compile_schema(schema['items'])
+
+        def check_items(value, path, errors):
+            if isinstance(value, list):
+                for index, item in enumerate(value):
+                    check_item(item, (path, index), errors)
+        checks.append(check_items)
+
+    if 'properties' in schema or 'required' in schema or 'additionalProperties' in schema or 'propertyNames' in schema:
+        checks.append(_compile_object(schema))
+
+    # 하위 검사가 없으면 타입 검사만 하는 함수로 특수화
+    if not checks:
+        def check_type(value, path, errors):
+            if type_check is not None and not type_check(value):
+                errors.append((path, message))
+        return check_type
+
+    def check(value, path, errors):
+        if type_check is not None and not type_check(value):
+            errors.append((path, message))
+            return
+        for sub_check in checks:
+            sub_check(value, path, errors)
+    return check
+
+
+def _compile_object(schema):
+    """객체 스키마의 속성 검사 함수를 컴파일합니다."""
+    properties = {key: compile_schema(sub) for key, sub in schema.get('properties', {}).items()}
+    required = tuple(schema.get('required', ()))
+    additional = schema.get('additionalProperties', True)
+    check_additional = compile_schema(additional) if isinstance(additional, dict) else None
+    reject_additional = additional is False
+    check_name = compile_schema(schema['propertyNames']) if 'propertyNames' in schema else None
+
+    def check_object(value, path, errors):
+        if not isinstance(value, dict):
+            return
+        for key in required:
+            if key not in value:
+                errors.append((path, f"필수 필드 '{key}'가 없습니다."))
+        for key, item in value.items():
+            if check_name is not None:
+                check_name(key, (path, key), errors)
+            checker = properties.get(key)
+            if checker is None:
+                if reject_additional:
+                    errors.append(((path, key), "알 수 없는 필드입니다."))
+                    continue
+                checker = check_additional
+                if checker is None:
+                    continue
+            checker(item, (path, key), errors)
+    return check_object
+
+
+class ConfigValidator:
+    """Claude 설정 파일 검증 클래스"""
+
+    def __init__(self, schema=CONFIG_SCHEMA):
+        """
+        ConfigValidator 초기화 (스키마를 한 번 컴파일)
+
+        Args:
+            schema (dict, optional): 설정 스키마. 기본값은 CONFIG_SCHEMA입니다.
+        """
+        servers_schema = schema['properties']['mcpServers']
+        top_schema = dict(schema, properties={key: sub for key, sub in schema['properties'].items()
+                                               if key != 'mcpServers'})
+        self._check_config = compile_schema(schema)
+        self._check_top = compile_schema(top_schema)
+        self._check_server = compile_schema(servers_schema['additionalProperties'])
+        self._check_server_name = compile_schema(servers_schema['propertyNames'])
+        # 마지막 검증에서 실제로 검사한 서버 수
+        self.last_checked = 0
+
+    def validate(self, config, previous=None):
+        """
+        설정 정보를 검증합니다.
+
+        Args:
+            config (dict): 검증할 설정 정보
+            previous (dict, optional): 이전에 검증을 통과한 설정 정보.
+                                      지정하면 내용이 같은 서버는 다시 검사하지 않습니다.
+
+        Returns:
+            list: (JSON 경로, 오류 메시지) 목록. 오류가 없으면 빈 목록
+        """
+        errors = []
+        if not isinstance(config, dict):
+            errors.append((ROOT, "설정 파일이 JSON 객체가 아닙니다."))
+        elif 'mcpServers' not in config and 'mcp_servers' not in config:
+            errors.append((ROOT, "mcpServers 또는 mcp_servers 필드가 없습니다."))
+
+        servers = config.get('mcpServers') if isinstance(config, dict) else None
+        if not isinstance(servers, dict):
+            self.last_checked = len(config.get('mcp_servers') or ()) if isinstance(config, dict) else 0
+            if isinstance(config, dict):
+                self._check_config(config, ROOT, errors)
+            return [(format_path(path), message) for path, message in errors]
+
+        previous_servers = previous.get('mcpServers') if isinstance(previous, dict) else None
+        if not isinstance(previous_servers, dict):
+            previous_servers = {}
+
+        self._check_top(config, ROOT, errors)
+        servers_path = (ROOT, 'mcpServers')
+        checked = 0
+        missing = object()
+        for name, server in servers.items():
+            # 이전 검증을 통과한 서버와 같으면 건너뜀
+            if previous_servers.get(name, missing) == server:
+                continue
+            self._check_server_name(name, (servers_path, name), errors)
+            self._check_server(server, (servers_path, name), errors)
+            checked += 1
+        self.last_checked = checked
+        return [(format_path(path), message) for path, message in errors]
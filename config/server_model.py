@@ -0,0 +1,370 @@
+"""
+MCP 서버 모델 모듈
+
+설정 파일의 MCP 서버를 이름으로 찾는 순서 있는 모델로 관리합니다.
+
+    - 서버 설정: {이름: 서버 설정} 딕셔너리 (O(1) 조회/추가/삭제)
+    - 순서: 이름으로 연결한 이중 연결 리스트 (이름 기준 이동 O(1))
+    - 이름 목록, 위치 색인, 목록 형식 보기, mcpServers 객체는 필요할 때 만들고 변경 전까지 재사용
+
+이전 형식(mcp_servers 배열)의 설정은 모델을 만들 때 한 번만 변환합니다.
+모델이 가진 서버 설정 객체는 변경하지 않고 교체하므로 copy()는 서버 설정을 공유합니다.
+copy()는 내부 딕셔너리와 캐시도 공유하고, 스냅숏 세대가 바뀐 뒤 첫 변경 때만 자기 몫을 복사합니다.
+"""
+
+import logging
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('server_model')
+
+# 목록 형식 보기에서 값이 없을 때 채워 넣는 기본값
+VIEW_DEFAULTS = (('command', None), ('args', []), ('env', {}), ('description', "설명 없음"), ('category', "일반"))
+
+
+def make_view(name, server):
+    """
+    서버 설정을 목록 형식 항목(이름 포함, 기본값 채움)으로 변환합니다.
+
+    Args:
+        name (str): 서버 이름
+        server (dict): 서버 설정
+
+    Returns:
+        dict: 서버 항목
+    """
+    view = {'name': name}
+    view.update(server)
+    for key, default in VIEW_DEFAULTS:
+        if key not in view:
+            view[key] = default.copy() if isinstance(default, (list, dict)) else default
+    return view
+
+
+class ServerModel:
+    """이름으로 찾는 순서 있는 MCP 서버 모델 클래스"""
+
+    def __init__(self, servers=()):
+        """
+        ServerModel 초기화
+
+        Args:
+            servers (iterable, optional): (서버 이름, 서버 설정) 목록
+        """
+        self._servers = {}
+        self._prev = {}
+        self._next = {}
+        self._head = None
+        self._tail = None
+        # 세대는 copy()마다 올라가고, 소유 세대와 다르면 다음 변경 전에 공유 상태를 복사
+        self._generation = 0
+        self._owned_generation = 0
+        self._invalidate()
+        for name, server in servers:
+            self.insert(name, server)
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        설정 정보에서 모델을 만듭니다. 이전 형식(mcp_servers 배열)은 여기서 변환합니다.
+
+        Args:
+            config (dict): 설정 정보
+
+        Returns:
+            ServerModel: 서버 모델
+        """
+        servers = config.get('mcpServers')
+        if isinstance(servers, dict):
+            items = []
+            for name, server in servers.items():
+                if isinstance(server, dict):
+                    items.append((name, server))
+                else:
+                    logger.warning(f"'{name}' 서버 설정이 올바른 형식이 아닙니다(객체여야 함): {server}")
+            return cls(items)
+
+        legacy = config.get('mcp_servers')
+        if isinstance(legacy, list):
+            logger.info(f"이전 형식(mcp_servers)의 서버 {len(legacy)}개를 변환합니다.")
+            return cls.from_list(legacy)
+
+        logger.warning("설정 파일에서 'mcpServers'(객체) 또는 'mcp_servers'(리스트) 키를 찾을 수 없거나 형식이 잘못되었습니다.")
+        return cls()
+
+    @classmethod
+    def from_list(cls, servers):
+        """
+        목록 형식(이름 포함 서버 항목 목록)에서 모델을 만듭니다. 이름이 없거나 중복된 항목은 건너뜁니다.
+
+        Args:
+            servers (list): 서버 항목 목록
+
+        Returns:
+            ServerModel: 서버 모델
+        """
+        model = cls()
+        for server in servers:
+            name = server.get('name') if isinstance(server, dict) else None
+            if not name or name in model:
+                logger.warning("이름이 없거나 중복된 서버를 건너뛰었습니다: %s", server)
+                continue
+            model.insert(name, {key: value for key, value in server.items() if key != 'name'})
+        return model
+
+    def copy(self):
+        """
+        모델을 복사합니다. 서버 설정 객체와 내부 상태는 공유하고, 양쪽 모두 다음 첫 변경 때만 복사합니다.
+
+        Returns:
+            ServerModel: 복사된 모델
+        """
+        model = ServerModel()
+        model._servers = self._servers
+        model._prev = self._prev
+        model._next = self._next
+        model._head = self._head
+        model._tail = self._tail
+        model._order = self._order
+        model._positions = self._positions
+        model._view = self._view
+        model._mapping = self._mapping
+        model._generation = 1
+        self._generation += 1
+        return model
+
+    def _own(self):
+        """이 세대에서 처음 변경하기 전에 공유 중인 딕셔너리와 캐시를 복사합니다."""
+        if self._owned_generation == self._generation:
+            return
+        self._servers = dict(self._servers)
+        self._prev = dict(self._prev)
+        self._next = dict(self._next)
+        if self._order is not None:
+            self._order = list(self._order)
+        if self._positions is not None:
+            self._positions = dict(self._positions)
+        if self._view is not None:
+            self._view = list(self._view)
+        if self._mapping is not None:
+            self._mapping = dict(self._mapping)
+        self._owned_generation = self._generation
+
+    def _invalidate(self):
+        """이름 목록, 위치 색인, 보기 캐시를 비웁니다."""
+        self._order = None
+        self._positions = None
+        self._view = None
+        self._mapping = None
+
+    def __len__(self):
+        return len(self._servers)
+
+    def __contains__(self, name):
+        return name in self._servers
+
+    def __iter__(self):
+        """이름을 순서대로 반환합니다."""
+        return iter(self.names())
+
+    def get(self, name):
+        """
+        서버 설정을 반환합니다 (모델과 공유되므로 수정하면 안 됨).
+
+        Returns:
+            dict: 서버 설정. 없으면 None
+        """
+        return self._servers.get(name)
+
+    def names(self):
+        """
+        서버 이름 목록을 순서대로 반환합니다 (모델과 공유되므로 수정하면 안 됨).
+
+        Returns:
+            list: 서버 이름 목록
+        """
+        if self._order is None:
+            order = []
+            name = self._head
+            while name is not None:
+                order.append(name)
+                name = self._next[name]
+            self._order = order
+        return self._order
+
+    def index_of(self, name):
+        """
+        서버 위치를 반환합니다.
+
+        Returns:
+            int: 서버 위치. 없으면 -1
+        """
+        if name not in self._servers:
+            return -1
+        if self._positions is None:
+            self._positions = {item: index for index, item in enumerate(self.names())}
+        return self._positions[name]
+
+    def name_at(self, index):
+        """
+        위치의 서버 이름을 반환합니다.
+
+        Returns:
+            str: 서버 이름. 범위를 벗어나면 None
+        """
+        names = self.names()
+        return names[index] if 0 <= index < len(names) else None
+
+    def _link(self, name, before):
+        """이름을 before 앞(None이면 끝)에 연결합니다."""
+        if before is None:
+            prev = self._tail
+            self._tail = name
+        else:
+            prev = self._prev[before]
+            self._prev[before] = name
+        self._prev[name] = prev
+        self._next[name] = before
+        if prev is None:
+            self._head = name
+        else:
+            self._next[prev] = name
+
+    def _unlink(self, name):
+        """이름을 연결 리스트에서 뗍니다."""
+        prev = self._prev.pop(name)
+        following = self._next.pop(name)
+        if prev is None:
+            self._head = following
+        else:
+            self._next[prev] = following
+        if following is None:
+            self._tail = prev
+        else:
+            self._prev[following] = prev
+
+    def insert(self, name, server, before=None):
+        """
+        서버를 추가합니다.
+
+        Args:
+            name (str): 서버 이름
+            server (dict): 서버 설정 (이름 필드 제외, 이후 모델이 소유)
+            before (str, optional): 이 서버 앞에 추가. 기본값은 None으로, 이 경우 끝에 추가합니다.
+
+        Returns:
+            bool: 추가 여부 (이미 있거나 before가 없으면 False)
+        """
+        if name in self._servers or (before is not None and before not in self._servers):
+            return False
+        self._own()
+        self._servers[name] = server
+        self._link(name, before)
+        if before is None and self._order is not None:
+            # 끝에 추가하면 캐시를 버리지 않고 이어 붙임
+            self._order.append(name)
+            if self._positions is not None:
+                self._positions[name] = len(self._order) - 1
+            if self._view is not None:
+                self._view.append(make_view(name, server))
+            if self._mapping is not None:
+                self._mapping[name] = server
+        else:
+            self._invalidate()
+        return True
+
+    def remove(self, name):
+        """
+        서버를 삭제합니다.
+
+        Returns:
+            dict: 삭제된 서버 설정. 없으면 None
+        """
+        if name not in self._servers:
+            return None
+        self._own()
+        self._unlink(name)
+        self._invalidate()
+        return self._servers.pop(name)
+
+    def replace(self, name, new_name, server):
+        """
+        서버 설정을 교체합니다. 이름이 바뀌어도 위치는 유지합니다.
+
+        Args:
+            name (str): 교체할 서버 이름
+            new_name (str): 새 서버 이름
+            server (dict): 새 서버 설정 (이름 필드 제외)
+
+        Returns:
+            bool: 교체 여부 (서버가 없거나 새 이름이 이미 있으면 False)
+        """
+        if name not in self._servers or (new_name != name and new_name in self._servers):
+            return False
+        self._own()
+        if new_name != name:
+            following = self._next[name]
+            self._unlink(name)
+            del self._servers[name]
+            self._link(new_name, following)
+        self._servers[new_name] = server
+        self._invalidate()
+        return True
+
+    def move(self, name, before=None):
+        """
+        서버를 다른 서버 앞(None이면 끝)으로 이동합니다.
+
+        Returns:
+            bool: 이동 여부
+        """
+        if name not in self._servers or (before is not None and before not in self._servers):
+            return False
+        if before == name:
+            return True
+        self._own()
+        self._unlink(name)
+        self._link(name, before)
+        self._invalidate()
+        return True
+
+    def move_index(self, from_index, to_index):
+        """
+        서버를 위치 기준으로 이동합니다 (list.insert(to_index, list.pop(from_index))와 같은 결과).
+
+        Returns:
+            bool: 이동 여부 (범위를 벗어나면 False)
+        """
+        names = self.names()
+        if not (0 <= from_index < len(names) and 0 <= to_index < len(names)):
+            return False
+        if from_index == to_index:
+            return True
+        name = names[from_index]
+        # 뒤로 이동하면 to_index 서버 뒤에, 앞으로 이동하면 to_index 서버 앞에 놓임
+        before = names[to_index + 1] if to_index + 1 < len(names) else None
+        if to_index < from_index:
+            before = names[to_index]
+        return self.move(name, before)
+
+    def to_mcp_servers(self):
+        """
+        Claude 설정 형식의 mcpServers 객체를 반환합니다 (모델과 공유되므로 수정하면 안 됨).
+
+        Returns:
+            dict: {서버 이름: 서버 설정} (순서 유지)
+        """
+        if self._mapping is None:
+            self._mapping = {name: self._servers[name] for name in self.names()}
+        return self._mapping
+
+    def to_list(self):
+        """
+        목록 형식 보기(이름 포함, 기본값 채움)를 반환합니다 (모델과 공유되므로 수정하면 안 됨).
+
+        Returns:
+            list: 서버 항목 목록
+        """
+        if self._view is None:
+            self._view = [make_view(name, self._servers[name]) for name in self.names()]
+        return self._view
@@ -5,5 +5,7 @@ GitHub에서 MCP 서버 정보를 크롤링하는 기능을 제공합니다.
 """
 
 from .github_crawler import GitHubCrawler
+from .catalog_store import CatalogStore
+from .catalog_bundle import export_bundle, import_bundle
 
-__all__ = ['GitHubCrawler']
+__all__ = ['GitHubCrawler', 'CatalogStore', 'export_bundle', 'import_bundle']
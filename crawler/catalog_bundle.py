@@ -0,0 +1,254 @@
+"""
+카탈로그 번들 모듈
+
+MCP 서버 카탈로그를 압축된 단일 파일(번들)로 빌드, 내보내기, 가져오기하는 기능을 제공합니다.
+번들에는 서버 레코드와 카탈로그 버전, 생성 시각이 포함되어 있어
+네트워크 없이도 첫 실행 시 전체 카탈로그를 바로 표시할 수 있습니다.
+카테고리와 검색 인덱스는 가져올 때 카탈로그 저장소(SQLite)가 만들므로 번들에 넣지 않습니다.
+
+빌드 방법:
+    python -m crawler.catalog_bundle build --output resources/catalog_bundle.json.gz
+"""
+
+import os
+import sys
+import gzip
+import json
+import time
+import shutil
+import hashlib
+import logging
+import argparse
+
+from utils import json_io
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('catalog_bundle')
+
+# 번들 형식 버전 (호환되지 않는 변경 시 증가)
+BUNDLE_FORMAT_VERSION = 1
+
+# 번들 파일 이름
+BUNDLE_FILENAME = "catalog_bundle.json.gz"
+
+def get_shipped_bundle_path():
+    """
+    애플리케이션과 함께 배포된 번들 파일 경로를 반환합니다.
+    PyInstaller로 패키징된 경우 압축 해제 디렉토리를 기준으로 합니다.
+
+    Returns:
+        str: 배포된 번들 파일 경로
+    """
+    base_dir = getattr(sys, '_MEIPASS', os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(base_dir, "resources", BUNDLE_FILENAME)
+
+
+def build_bundle(mcp_servers, source=None):
+    """
+    MCP 서버 목록으로 번들 데이터를 생성합니다.
+
+    Args:
+        mcp_servers (list): MCP 서버 정보 목록
+        source (str, optional): 카탈로그 출처 (예: README URL)
+
+    Returns:
+        dict: 번들 데이터
+    """
+    records = [server for server in mcp_servers if server.get('name')]
+
+    # 레코드 내용 기반 카탈로그 버전 (백엔드와 무관하게 같은 해시가 나오도록 표준 라이브러리로 정규화)
+    digest = hashlib.sha256(
+        json.dumps(records, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    ).hexdigest()
+
+    return {
+        'format_version': BUNDLE_FORMAT_VERSION,
+        'catalog_version': digest[:16],
+        'created_at': time.time(),
+        'source': source,
+        'count': len(records),
+        'records': records,
+    }
+
+
+def write_bundle(bundle, path):
+    """
+    번들 데이터를 gzip으로 압축하여 원자적으로 저장합니다.
+
+    Args:
+        bundle (dict): 번들 데이터
+        path (str): 저장할 파일 경로
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = f"{path}.tmp"
+    payload = json_io.dumps_bytes(bundle)
+    with gzip.open(temp_path, 'wb', compresslevel=9) as f:
+        f.write(payload)
+    os.replace(temp_path, path)
+    logger.info(f"카탈로그 번들을 저장했습니다: {path} ({bundle.get('count', 0)}개 서버)")
+
+
+def read_bundle(path):
+    """
+    번들 파일을 읽고 형식을 검증합니다.
+
+    Args:
+        path (str): 번들 파일 경로
+
+    Returns:
+        dict: 번들 데이터. 파일이 없거나 형식이 잘못되었으면 None
+    """
+    if not path or not os.path.exists(path):
+        return None
+
+    try:
+        with gzip.open(path, 'rb') as f:
+            bundle = json_io.loads(f.read())
+    except (OSError, ValueError) as e:
+        logger.error(f"카탈로그 번들 읽기 실패: {e}, 경로: {path}")
+        return None
+
+    if not isinstance(bundle, dict) or not isinstance(bundle.get('records'), list):
+        logger.error(f"카탈로그 번들 형식이 올바르지 않습니다: {path}")
+        return None
+
+    if bundle.get('format_version') != BUNDLE_FORMAT_VERSION:
+        logger.warning(f"지원하지 않는 카탈로그 번들 버전입니다: {bundle.get('format_version')}, 경로: {path}")
+        return None
+
+    return bundle
+
+
+def find_latest_bundle(cache_dir=None):
+    """
+    사용자 캐시에 설치된 번들과 배포된 번들 중 더 최근에 생성된 번들을 반환합니다.
+
+    Args:
+        cache_dir (str, optional): 사용자 번들을 찾을 캐시 디렉토리
+
+    Returns:
+        dict: 번들 데이터. 사용 가능한 번들이 없으면 None
+    """
+    candidates = [get_shipped_bundle_path()]
+    if cache_dir:
+        candidates.append(os.path.join(cache_dir, BUNDLE_FILENAME))
+
+    latest = None
+    for path in candidates:
+        bundle = read_bundle(path)
+        if bundle and (latest is None or bundle.get('created_at', 0) > latest.get('created_at', 0)):
+            latest = bundle
+    return latest
+
+
+def export_bundle(mcp_servers, path, source=None):
+    """
+    MCP 서버 목록을 번들 파일로 내보냅니다.
+
+    Args:
+        mcp_servers (list): MCP 서버 정보 목록
+        path (str): 저장할 파일 경로
+        source (str, optional): 카탈로그 출처
+
+    Returns:
+        dict: 저장된 번들 데이터
+    """
+    bundle = build_bundle(mcp_servers, source=source)
+    write_bundle(bundle, path)
+    return bundle
+
+
+def import_bundle(path, cache_dir, catalog_store=None):
+    """
+    번들 파일을 사용자 캐시에 설치합니다. README를 다시 파싱하지 않고
+    레코드를 그대로 캐시와 카탈로그 저장소에 일괄 적재합니다.
+
+    Args:
+        path (str): 가져올 번들 파일 경로
+        cache_dir (str): 크롤러 캐시 디렉토리
+        catalog_store (CatalogStore, optional): 함께 갱신할 카탈로그 저장소
+
+    Returns:
+        dict: 가져온 번들 데이터. 실패하면 None
+    """
+    bundle = read_bundle(path)
+    if bundle is None:
+        return None
+
+    os.makedirs(cache_dir, exist_ok=True)
+    target_path = os.path.join(cache_dir, BUNDLE_FILENAME)
+    if os.path.abspath(path) != os.path.abspath(target_path):
+        shutil.copyfile(path, f"{target_path}.tmp")
+        os.replace(f"{target_path}.tmp", target_path)
+
+    # 크롤러 캐시 파일에 레코드 일괄 저장
+    servers_cache_file = os.path.join(cache_dir, "mcp_servers.json")
+    json_io.dump(bundle['records'], f"{servers_cache_file}.tmp")
+    os.replace(f"{servers_cache_file}.tmp", servers_cache_file)
+
+    if catalog_store is not None:
+        catalog_store.upsert_servers(bundle['records'])
+        catalog_store.record_history('bundle_import', payload={
+            'catalog_version': bundle.get('catalog_version'),
+            'count': bundle.get('count'),
+        })
+
+    logger.info(f"카탈로그 번들을 가져왔습니다: {path} (버전 {bundle.get('catalog_version')}, "
+                f"{bundle.get('count')}개 서버)")
+    return bundle
+
+
+def main(argv=None):
+    """명령줄 진입점"""
+    parser = argparse.ArgumentParser(description="MCP 서버 카탈로그 번들 도구")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help="GitHub README에서 번들을 빌드합니다.")
+    build_parser.add_argument('--output', default=get_shipped_bundle_path(), help="출력 파일 경로")
+    build_parser.add_argument('--readme', help="네트워크 대신 사용할 로컬 README.md 파일")
+
+    import_parser = subparsers.add_parser('import', help="번들을 사용자 캐시에 설치합니다.")
+    import_parser.add_argument('path', help="가져올 번들 파일 경로")
+
+    export_parser = subparsers.add_parser('export', help="현재 캐시를 번들로 내보냅니다.")
+    export_parser.add_argument('path', help="저장할 번들 파일 경로")
+
+    args = parser.parse_args(argv)
+
+    from crawler.github_crawler import GitHubCrawler
+    crawler = GitHubCrawler()
+
+    if args.command == 'build':
+        if args.readme:
+            with open(args.readme, 'r', encoding='utf-8') as f:
+                readme_content = f.read()
+            source = os.path.abspath(args.readme)
+        else:
+            readme_content = crawler._download_readme()
+            source = crawler.readme_url
+        mcp_servers = crawler._parse_readme(readme_content) if readme_content else []
+        if not mcp_servers:
+            logger.error("README에서 MCP 서버를 찾지 못해 번들을 빌드하지 않았습니다.")
+            return 1
+        export_bundle(mcp_servers, args.output, source=source)
+    elif args.command == 'import':
+        # 앱과 같은 카탈로그 저장소(캐시 디렉토리의 catalog.db)도 함께 갱신
+        from crawler.catalog_store import CatalogStore
+        catalog_store = CatalogStore(os.path.join(crawler.cache_dir, "catalog.db"))
+        try:
+            if import_bundle(args.path, crawler.cache_dir, catalog_store=catalog_store) is None:
+                return 1
+        finally:
+            catalog_store.close()
+    elif args.command == 'export':
+        mcp_servers = crawler._load_cache()
+        if not mcp_servers:
+            logger.error("내보낼 캐시가 없습니다.")
+            return 1
+        export_bundle(mcp_servers, args.path, source=crawler.servers_cache_file)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
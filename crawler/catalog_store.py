@@ -0,0 +1,433 @@
+"""
+카탈로그 저장소 모듈
+
+MCP 서버 카탈로그, 보강(enrichment) 정보, 변경 이력을 SQLite 데이터베이스에
+저장하고 인덱스 기반 검색/필터/정렬 기능을 제공합니다.
+"""
+
+import os
+import time
+import sqlite3
+import logging
+
+from utils import json_io
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('catalog_store')
+
+# 스키마 버전 (스키마가 바뀌면 증가)
+SCHEMA_VERSION = 2
+
+# trigram 토크나이저가 검색할 수 있는 최소 검색어 길이 (더 짧으면 LIKE 검색)
+TRIGRAM_MIN_LENGTH = 3
+
+# 지원하는 정렬 방식과 ORDER BY 절
+SORT_ORDERS = {
+    'default': 's.position ASC',
+    'name': 's.name COLLATE NOCASE ASC',
+    'stars': 's.stars DESC, s.position ASC',
+}
+
+
+class CatalogStore:
+    """SQLite 기반 MCP 서버 카탈로그 저장소 클래스"""
+
+    def __init__(self, db_path=None):
+        """
+        CatalogStore 초기화
+
+        Args:
+            db_path (str, optional): 데이터베이스 파일 경로. 기본값은 None으로,
+                                    이 경우 ~/.mcp_config_manager/cache/catalog.db를 사용합니다.
+                                    ':memory:'를 지정하면 메모리 데이터베이스를 사용합니다.
+        """
+        if db_path is None:
+            home_dir = os.path.expanduser("~")
+            db_path = os.path.join(home_dir, ".mcp_config_manager", "cache", "catalog.db")
+
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.fts_enabled = False
+
+        self._create_schema()
+        logger.info(f"카탈로그 저장소 경로: {self.db_path} (FTS5 사용: {self.fts_enabled})")
+
+    def _create_schema(self):
+        """테이블, 인덱스, 전문 검색 인덱스를 생성합니다."""
+        with self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS servers (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL UNIQUE,
+                    description TEXT NOT NULL DEFAULT '',
+                    category TEXT NOT NULL DEFAULT 'general',
+                    type TEXT NOT NULL DEFAULT '',
+                    stars INTEGER NOT NULL DEFAULT 0,
+                    position INTEGER NOT NULL DEFAULT 0,
+                    data TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_servers_category ON servers(category);
+                CREATE INDEX IF NOT EXISTS idx_servers_type ON servers(type);
+                CREATE INDEX IF NOT EXISTS idx_servers_stars ON servers(stars DESC);
+                CREATE INDEX IF NOT EXISTS idx_servers_position ON servers(position);
+
+                CREATE TABLE IF NOT EXISTS server_install_options (
+                    server_id INTEGER NOT NULL REFERENCES servers(id) ON DELETE CASCADE,
+                    option TEXT NOT NULL,
+                    PRIMARY KEY (server_id, option)
+                );
+                CREATE INDEX IF NOT EXISTS idx_install_options_option
+                    ON server_install_options(option, server_id);
+
+                CREATE TABLE IF NOT EXISTS enrichment (
+                    name TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS history (
+                    id INTEGER PRIMARY KEY,
+                    timestamp REAL NOT NULL,
+                    event TEXT NOT NULL,
+                    name TEXT,
+                    payload TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_history_name ON history(name, timestamp);
+            """)
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        # FTS5(trigram)는 SQLite 빌드에 따라 없을 수 있으므로 실패 시 LIKE 검색으로 대체
+        # trigram 토크나이저는 LIKE와 같은 부분 문자열 검색을 제공함 ("hub" -> GitHub)
+        try:
+            existing = self.conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'servers_fts'").fetchone()
+            rebuild = existing is None or 'trigram' not in existing['sql']
+            with self.conn:
+                if existing is not None and rebuild:
+                    # 이전 버전의 단어 단위(unicode61) 인덱스는 지우고 다시 만듦
+                    self.conn.executescript("""
+                        DROP TRIGGER IF EXISTS servers_fts_ai;
+                        DROP TRIGGER IF EXISTS servers_fts_ad;
+                        DROP TRIGGER IF EXISTS servers_fts_au;
+                        DROP TABLE servers_fts;
+                    """)
+                self.conn.executescript("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS servers_fts USING fts5(
+                        name, description,
+                        content='servers', content_rowid='id',
+                        tokenize='trigram'
+                    );
+                    CREATE TRIGGER IF NOT EXISTS servers_fts_ai AFTER INSERT ON servers BEGIN
+                        INSERT INTO servers_fts(rowid, name, description)
+                        VALUES (new.id, new.name, new.description);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS servers_fts_ad AFTER DELETE ON servers BEGIN
+                        INSERT INTO servers_fts(servers_fts, rowid, name, description)
+                        VALUES ('delete', old.id, old.name, old.description);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS servers_fts_au
+                    AFTER UPDATE OF name, description ON servers BEGIN
+                        INSERT INTO servers_fts(servers_fts, rowid, name, description)
+                        VALUES ('delete', old.id, old.name, old.description);
+                        INSERT INTO servers_fts(rowid, name, description)
+                        VALUES (new.id, new.name, new.description);
+                    END;
+                """)
+                if rebuild:
+                    # 새로 만든 인덱스에 기존 서버 행을 채움
+                    self.conn.execute("INSERT INTO servers_fts(servers_fts) VALUES ('rebuild')")
+            self.fts_enabled = True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 trigram 검색을 사용할 수 없습니다. LIKE 검색을 사용합니다: {e}")
+
+    def upsert_servers(self, mcp_servers, prune=True):
+        """
+        MCP 서버 목록을 하나의 트랜잭션으로 저장합니다.
+
+        Args:
+            mcp_servers (list): MCP 서버 정보 목록
+            prune (bool, optional): 목록에 없는 기존 서버를 삭제할지 여부. 기본값은 True입니다.
+
+        Returns:
+            int: 저장된 서버 수
+        """
+        now = time.time()
+        rows = []
+        for position, server in enumerate(mcp_servers):
+            name = server.get('name')
+            if not name:
+                logger.warning(f"이름 없는 서버 항목을 건너뜁니다: {server}")
+                continue
+            rows.append((
+                name,
+                server.get('description') or '',
+                server.get('category') or 'general',
+                server.get('type') or '',
+                int(server.get('stars') or 0),
+                position,
+                json_io.dumps(server),
+                now,
+            ))
+
+        with self.conn:
+            self.conn.executemany("""
+                INSERT INTO servers (name, description, category, type, stars, position, data, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    description = excluded.description,
+                    category = excluded.category,
+                    type = excluded.type,
+                    stars = CASE WHEN excluded.stars > 0 THEN excluded.stars ELSE servers.stars END,
+                    position = excluded.position,
+                    data = excluded.data,
+                    updated_at = excluded.updated_at
+            """, rows)
+
+            if prune:
+                self.conn.execute("DELETE FROM servers WHERE updated_at < ?", (now,))
+
+            # 설치 옵션 인덱스 테이블 재구성
+            self.conn.execute("""
+                DELETE FROM server_install_options
+                WHERE server_id IN (SELECT id FROM servers WHERE updated_at = ?)
+                   OR server_id NOT IN (SELECT id FROM servers)
+            """, (now,))
+            option_rows = []
+            ids = dict(self.conn.execute("SELECT name, id FROM servers WHERE updated_at = ?", (now,)).fetchall())
+            for server in mcp_servers:
+                server_id = ids.get(server.get('name'))
+                if server_id is None:
+                    continue
+                for option in set(server.get('installation_options') or []):
+                    option_rows.append((server_id, str(option).lower()))
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO server_install_options (server_id, option) VALUES (?, ?)",
+                option_rows)
+
+        logger.info(f"카탈로그 저장소에 {len(rows)}개의 서버를 저장했습니다.")
+        return len(rows)
+
+    def count(self):
+        """
+        저장된 서버 수를 반환합니다.
+
+        Returns:
+            int: 서버 수
+        """
+        return self.conn.execute("SELECT COUNT(*) FROM servers").fetchone()[0]
+
+    def get_server(self, name):
+        """
+        이름으로 서버 정보를 가져옵니다.
+
+        Args:
+            name (str): 서버 이름
+
+        Returns:
+            dict: 서버 정보. 없으면 None
+        """
+        row = self.conn.execute("SELECT data FROM servers WHERE name = ?", (name,)).fetchone()
+        return json_io.loads(row['data']) if row else None
+
+    def _build_fts_query(self, search_text):
+        """
+        검색어를 FTS5 trigram 부분 문자열 검색 쿼리로 변환합니다.
+
+        Args:
+            search_text (str): 사용자 검색어
+
+        Returns:
+            str: FTS5 MATCH 쿼리. 유효한 토큰이 없거나 trigram으로 찾을 수 없는 짧은 토큰이 있으면 None
+        """
+        tokens = [token.replace('"', '""') for token in search_text.split() if token.strip()]
+        if not tokens or any(len(token) < TRIGRAM_MIN_LENGTH for token in tokens):
+            return None
+        return " AND ".join(f'"{token}"' for token in tokens)
+
+    def _build_query(self, columns, search_text=None, category=None, install_method=None,
+                     server_type=None, sort='default', limit=None):
+        """검색 조건에 맞는 SQL 쿼리와 파라미터를 생성합니다."""
+        sql = f"SELECT {columns} FROM servers s"
+        where = []
+        params = []
+
+        if search_text and search_text.strip():
+            fts_query = self._build_fts_query(search_text) if self.fts_enabled else None
+            if fts_query:
+                sql += " JOIN servers_fts f ON f.rowid = s.id"
+                where.append("servers_fts MATCH ?")
+                params.append(fts_query)
+            else:
+                pattern = f"%{search_text.strip().lower()}%"
+                where.append("(lower(s.name) LIKE ? OR lower(s.description) LIKE ?)")
+                params.extend([pattern, pattern])
+
+        if category:
+            where.append("s.category = ?")
+            params.append(category.lower())
+
+        if server_type:
+            where.append("s.type = ?")
+            params.append(server_type)
+
+        if install_method:
+            where.append("s.id IN (SELECT server_id FROM server_install_options WHERE option = ?)")
+            params.append(install_method.lower())
+
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+
+        sql += " ORDER BY " + SORT_ORDERS.get(sort, SORT_ORDERS['default'])
+
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        return sql, params
+
+    def search(self, search_text=None, category=None, install_method=None,
+               server_type=None, sort='default', limit=None):
+        """
+        조건에 맞는 서버 목록을 인덱스 기반 쿼리로 검색합니다.
+
+        Args:
+            search_text (str, optional): 이름 또는 설명 검색어
+            category (str, optional): 카테고리 필터
+            install_method (str, optional): 설치 방법 필터 (예: 'npm')
+            server_type (str, optional): 서버 유형 필터 ('reference' 또는 'official')
+            sort (str, optional): 정렬 방식 ('default', 'name', 'stars'). 기본값은 'default'입니다.
+            limit (int, optional): 최대 결과 수
+
+        Returns:
+            list: 서버 정보 목록
+        """
+        sql, params = self._build_query("s.data", search_text, category, install_method,
+                                        server_type, sort, limit)
+        return [json_io.loads(row['data']) for row in self.conn.execute(sql, params)]
+
+    def search_names(self, search_text=None, category=None, install_method=None,
+                     server_type=None, sort='default', limit=None):
+        """
+        조건에 맞는 서버 이름 목록을 반환합니다. JSON 역직렬화를 하지 않으므로
+        목록 필터링에 적합합니다.
+
+        Args:
+            search_text (str, optional): 이름 또는 설명 검색어
+            category (str, optional): 카테고리 필터
+            install_method (str, optional): 설치 방법 필터
+            server_type (str, optional): 서버 유형 필터
+            sort (str, optional): 정렬 방식. 기본값은 'default'입니다.
+            limit (int, optional): 최대 결과 수
+
+        Returns:
+            list: 서버 이름 목록
+        """
+        sql, params = self._build_query("s.name", search_text, category, install_method,
+                                        server_type, sort, limit)
+        return [row['name'] for row in self.conn.execute(sql, params)]
+
+    def get_categories(self):
+        """
+        카테고리별 서버 수를 반환합니다.
+
+        Returns:
+            dict: {카테고리: 서버 수}
+        """
+        rows = self.conn.execute(
+            "SELECT category, COUNT(*) AS n FROM servers GROUP BY category ORDER BY category")
+        return {row['category']: row['n'] for row in rows}
+
+    def set_enrichment(self, name, data):
+        """
+        서버의 보강 정보(별 수, 최근 업데이트 등)를 저장합니다.
+
+        Args:
+            name (str): 서버 이름
+            data (dict): 보강 정보. 'stars' 키가 있으면 정렬 인덱스에도 반영됩니다.
+        """
+        with self.conn:
+            self.conn.execute("""
+                INSERT INTO enrichment (name, data, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at
+            """, (name, json_io.dumps(data), time.time()))
+            if 'stars' in data:
+                self.conn.execute("UPDATE servers SET stars = ? WHERE name = ?",
+                                  (int(data.get('stars') or 0), name))
+
+    def get_enrichment(self, name):
+        """
+        서버의 보강 정보를 가져옵니다.
+
+        Args:
+            name (str): 서버 이름
+
+        Returns:
+            dict: 보강 정보. 없으면 None
+        """
+        row = self.conn.execute("SELECT data FROM enrichment WHERE name = ?", (name,)).fetchone()
+        return json_io.loads(row['data']) if row else None
+
+    def get_all_enrichment(self):
+        """
+        모든 서버의 보강 정보를 한 번의 쿼리로 가져옵니다.
+
+        Returns:
+            dict: {서버 이름: 보강 정보}
+        """
+        rows = self.conn.execute("SELECT name, data FROM enrichment")
+        return {row['name']: json_io.loads(row['data']) for row in rows}
+
+    def record_history(self, event, name=None, payload=None):
+        """
+        이력 이벤트를 기록합니다.
+
+        Args:
+            event (str): 이벤트 종류 (예: 'refresh', 'apply')
+            name (str, optional): 관련 서버 이름
+            payload (dict, optional): 부가 정보
+        """
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO history (timestamp, event, name, payload) VALUES (?, ?, ?, ?)",
+                (time.time(), event, name,
+                 json_io.dumps(payload) if payload is not None else None))
+
+    def get_history(self, name=None, limit=100):
+        """
+        이력 이벤트 목록을 최신 순으로 반환합니다.
+
+        Args:
+            name (str, optional): 특정 서버의 이력만 가져올 경우 서버 이름
+            limit (int, optional): 최대 항목 수. 기본값은 100입니다.
+
+        Returns:
+            list: 이력 정보 목록
+        """
+        if name is None:
+            rows = self.conn.execute(
+                "SELECT * FROM history ORDER BY timestamp DESC, id DESC LIMIT ?", (limit,))
+        else:
+            rows = self.conn.execute(
+                "SELECT * FROM history WHERE name = ? ORDER BY timestamp DESC, id DESC LIMIT ?",
+                (name, limit))
+        return [{
+            'timestamp': row['timestamp'],
+            'event': row['event'],
+            'name': row['name'],
+            'payload': json_io.loads(row['payload']) if row['payload'] else None,
+        } for row in rows]
+
+    def close(self):
+        """데이터베이스 연결을 닫습니다."""
+        try:
+            self.conn.close()
+        except Exception as e:
+            logger.error(f"카탈로그 저장소 닫기 오류: {e}")
@@ -0,0 +1,360 @@
+"""
+크롤 프런티어 모듈
+
+보강(enrichment) 작업(상세 정보, 메타데이터, 아이콘 등)을 캐시 디렉토리의 SQLite 파일에
+영속적으로 저장하는 우선순위 작업 큐를 제공합니다. 앱 종료, 네트워크 단절, 사용량 제한으로
+중단되어도 재시작 시 남은 작업부터 이어서 처리합니다.
+"""
+
+import os
+import time
+import sqlite3
+import logging
+
+from utils import json_io
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('crawl_frontier')
+
+# 우선순위 (작을수록 먼저 처리)
+PRIORITY_USER = 0       # 내 설정 파일에 있거나 선택된 서버
+PRIORITY_VISIBLE = 1    # 목록에 현재 보이는 서버
+PRIORITY_DEFAULT = 2    # 그 외 모든 서버
+
+# 작업 상태
+STATE_PENDING = 'pending'
+STATE_IN_PROGRESS = 'in_progress'
+STATE_DONE = 'done'
+STATE_FAILED = 'failed'
+
+# 처리량 계산 구간 (초)
+THROUGHPUT_WINDOW = 60
+
+
+class CrawlFrontier:
+    """영속적인 우선순위 크롤 작업 큐 클래스"""
+
+    def __init__(self, db_path=None, max_retries=5, backoff_base=30.0):
+        """
+        CrawlFrontier 초기화
+
+        Args:
+            db_path (str, optional): 데이터베이스 파일 경로. 기본값은 None으로,
+                                    이 경우 ~/.mcp_config_manager/cache/crawl_frontier.db를 사용합니다.
+            max_retries (int, optional): 실패로 표시하기 전 최대 재시도 횟수. 기본값은 5입니다.
+            backoff_base (float, optional): 재시도 대기 시간 기준값 (초). 기본값은 30입니다.
+        """
+        if db_path is None:
+            home_dir = os.path.expanduser("~")
+            db_path = os.path.join(home_dir, ".mcp_config_manager", "cache", "crawl_frontier.db")
+
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self.db_path = db_path
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+
+        # 메인 스레드와 작업 스레드가 각자 연결을 열어 같은 파일을 공유
+        self.conn = sqlite3.connect(db_path, timeout=10)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        """테이블과 인덱스를 생성합니다."""
+        with self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS frontier (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    url TEXT,
+                    state TEXT NOT NULL DEFAULT 'pending',
+                    priority INTEGER NOT NULL DEFAULT 2,
+                    base_priority INTEGER NOT NULL DEFAULT 2,
+                    boost INTEGER NOT NULL DEFAULT 2,
+                    retries INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    result TEXT,
+                    enqueued_at REAL NOT NULL,
+                    completed_at REAL,
+                    UNIQUE (name, kind)
+                );
+                CREATE INDEX IF NOT EXISTS idx_frontier_queue
+                    ON frontier(state, priority, next_attempt_at, id);
+                CREATE INDEX IF NOT EXISTS idx_frontier_completed
+                    ON frontier(completed_at);
+            """)
+
+    def enqueue(self, items, priority=PRIORITY_DEFAULT):
+        """
+        작업을 큐에 추가합니다. 이미 있는 작업은 더 높은 우선순위로만 갱신됩니다.
+
+        Args:
+            items (iterable): (서버 이름, 작업 종류, URL) 튜플 목록
+            priority (int, optional): 작업 우선순위. 기본값은 PRIORITY_DEFAULT입니다.
+
+        Returns:
+            int: 추가되거나 갱신된 작업 수
+        """
+        now = time.time()
+        rows = [(name, kind, url, priority, priority, now) for name, kind, url in items]
+        with self.conn:
+            before = self.conn.total_changes
+            self.conn.executemany("""
+                INSERT INTO frontier (name, kind, url, priority, base_priority, enqueued_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(name, kind) DO UPDATE SET
+                    url = COALESCE(excluded.url, frontier.url),
+                    priority = MIN(frontier.priority, excluded.priority),
+                    base_priority = MIN(frontier.base_priority, excluded.base_priority)
+            """, rows)
+            changed = self.conn.total_changes - before
+        logger.info(f"크롤 프런티어에 {len(rows)}개 작업을 등록했습니다.")
+        return changed
+
+    def set_user_servers(self, names):
+        """
+        내 설정 파일에 있는 서버들을 최우선 순위로 지정합니다.
+
+        Args:
+            names (iterable): 서버 이름 목록
+        """
+        with self.conn:
+            self.conn.execute("UPDATE frontier SET base_priority = ? WHERE base_priority = ?",
+                              (PRIORITY_DEFAULT, PRIORITY_USER))
+            self._update_names("UPDATE frontier SET base_priority = ? WHERE name IN ({})",
+                               PRIORITY_USER, list(names))
+            self._refresh_priority()
+
+    def set_visible(self, names):
+        """
+        현재 목록에 보이는 서버를 지정합니다. 이전에 보이던 서버는 원래 우선순위로 돌아갑니다.
+
+        Args:
+            names (iterable): 서버 이름 목록
+        """
+        with self.conn:
+            self.conn.execute("UPDATE frontier SET boost = ? WHERE boost = ?",
+                              (PRIORITY_DEFAULT, PRIORITY_VISIBLE))
+            self._update_names("UPDATE frontier SET boost = MIN(boost, ?) WHERE name IN ({})",
+                               PRIORITY_VISIBLE, list(names))
+            self._refresh_priority()
+
+    def promote(self, names, priority=PRIORITY_USER):
+        """
+        지정한 서버의 작업을 높은 우선순위로 올립니다 (예: 선택된 서버).
+
+        Args:
+            names (iterable): 서버 이름 목록
+            priority (int, optional): 적용할 우선순위. 기본값은 PRIORITY_USER입니다.
+        """
+        with self.conn:
+            self._update_names("UPDATE frontier SET boost = MIN(boost, ?) WHERE name IN ({})",
+                               priority, list(names))
+            self._refresh_priority()
+
+    def _refresh_priority(self):
+        """기본 우선순위와 일시적 우선순위 중 높은 쪽을 실제 우선순위로 반영합니다."""
+        self.conn.execute("""
+            UPDATE frontier SET priority = MIN(base_priority, boost)
+            WHERE priority != MIN(base_priority, boost)
+        """)
+
+    def _update_names(self, sql, value, names):
+        """이름 목록에 대해 SQLite 변수 개수 제한을 넘지 않도록 나눠서 갱신합니다."""
+        for start in range(0, len(names), 500):
+            chunk = names[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            self.conn.execute(sql.format(placeholders), (value, *chunk))
+
+    def recover(self):
+        """
+        이전 실행에서 처리 중이던 작업을 대기 상태로 되돌립니다 (재시작 시 이어서 처리).
+
+        Returns:
+            int: 복구된 작업 수
+        """
+        with self.conn:
+            cursor = self.conn.execute(
+                "UPDATE frontier SET state = ? WHERE state = ?", (STATE_PENDING, STATE_IN_PROGRESS))
+        if cursor.rowcount:
+            logger.info(f"중단된 작업 {cursor.rowcount}개를 대기 상태로 복구했습니다.")
+        return cursor.rowcount
+
+    def claim(self, limit=1, kinds=None):
+        """
+        처리할 작업을 우선순위 순으로 가져와 처리 중 상태로 표시합니다.
+
+        Args:
+            limit (int, optional): 가져올 최대 작업 수. 기본값은 1입니다.
+            kinds (list, optional): 가져올 작업 종류 목록
+
+        Returns:
+            list: 작업 정보 목록
+        """
+        now = time.time()
+        sql = "SELECT * FROM frontier WHERE state = ? AND next_attempt_at <= ?"
+        params = [STATE_PENDING, now]
+        if kinds:
+            sql += f" AND kind IN ({','.join('?' * len(kinds))})"
+            params.extend(kinds)
+        sql += " ORDER BY priority, next_attempt_at, id LIMIT ?"
+        params.append(limit)
+
+        with self.conn:
+            # 여러 연결이 동시에 같은 작업을 가져가지 않도록 쓰기 잠금을 먼저 획득
+            self.conn.execute("BEGIN IMMEDIATE")
+            rows = self.conn.execute(sql, params).fetchall()
+            self.conn.executemany(
+                "UPDATE frontier SET state = ? WHERE id = ?",
+                [(STATE_IN_PROGRESS, row['id']) for row in rows])
+        return [self._row_to_item(row) for row in rows]
+
+    def complete(self, item_id, result=None):
+        """
+        작업을 완료로 표시합니다.
+
+        Args:
+            item_id (int): 작업 ID
+            result (dict, optional): 작업 결과
+        """
+        with self.conn:
+            self.conn.execute(
+                "UPDATE frontier SET state = ?, result = ?, last_error = NULL, completed_at = ? WHERE id = ?",
+                (STATE_DONE, json_io.dumps(result) if result is not None else None,
+                 time.time(), item_id))
+
+    def fail(self, item_id, error, retry_after=None):
+        """
+        작업 실패를 기록합니다. 최대 재시도 횟수 이내이면 지수 백오프 후 다시 시도합니다.
+
+        Args:
+            item_id (int): 작업 ID
+            error (str): 오류 메시지
+            retry_after (float, optional): 재시도까지 기다릴 시간 (초). 사용량 제한 시 사용합니다.
+        """
+        row = self.conn.execute("SELECT retries FROM frontier WHERE id = ?", (item_id,)).fetchone()
+        if row is None:
+            return
+        retries = row['retries'] + 1
+        if retries >= self.max_retries:
+            state = STATE_FAILED
+            next_attempt_at = 0
+        else:
+            state = STATE_PENDING
+            delay = retry_after if retry_after is not None else self.backoff_base * (2 ** (retries - 1))
+            next_attempt_at = time.time() + delay
+
+        with self.conn:
+            self.conn.execute(
+                "UPDATE frontier SET state = ?, retries = ?, next_attempt_at = ?, last_error = ? WHERE id = ?",
+                (state, retries, next_attempt_at, str(error), item_id))
+
+    def defer_all(self, delay):
+        """
+        대기 중인 모든 작업을 지정한 시간만큼 미룹니다 (전역 사용량 제한 시 사용).
+
+        Args:
+            delay (float): 미룰 시간 (초)
+        """
+        until = time.time() + delay
+        with self.conn:
+            self.conn.execute(
+                "UPDATE frontier SET next_attempt_at = MAX(next_attempt_at, ?) WHERE state = ?",
+                (until, STATE_PENDING))
+
+    def requeue_stale(self, max_age, kinds=None):
+        """
+        오래전에 완료된 작업을 다시 대기 상태로 되돌립니다 (메타데이터 갱신용).
+
+        Args:
+            max_age (float): 결과 유효 시간 (초)
+            kinds (list, optional): 대상 작업 종류 목록
+
+        Returns:
+            int: 되돌린 작업 수
+        """
+        sql = "UPDATE frontier SET state = ?, retries = 0, next_attempt_at = 0 WHERE state = ? AND completed_at < ?"
+        params = [STATE_PENDING, STATE_DONE, time.time() - max_age]
+        if kinds:
+            sql += f" AND kind IN ({','.join('?' * len(kinds))})"
+            params.extend(kinds)
+        with self.conn:
+            cursor = self.conn.execute(sql, params)
+        return cursor.rowcount
+
+    def retry_failed(self):
+        """
+        실패한 작업을 재시도 횟수를 초기화하여 다시 대기 상태로 되돌립니다.
+
+        Returns:
+            int: 되돌린 작업 수
+        """
+        with self.conn:
+            cursor = self.conn.execute(
+                "UPDATE frontier SET state = ?, retries = 0, next_attempt_at = 0 WHERE state = ?",
+                (STATE_PENDING, STATE_FAILED))
+        return cursor.rowcount
+
+    def get_result(self, name, kind):
+        """
+        완료된 작업의 결과를 가져옵니다.
+
+        Args:
+            name (str): 서버 이름
+            kind (str): 작업 종류
+
+        Returns:
+            dict: 작업 결과. 없으면 None
+        """
+        row = self.conn.execute(
+            "SELECT result FROM frontier WHERE name = ? AND kind = ? AND state = ?",
+            (name, kind, STATE_DONE)).fetchone()
+        return json_io.loads(row['result']) if row and row['result'] else None
+
+    def stats(self):
+        """
+        큐 깊이와 처리량 통계를 반환합니다.
+
+        Returns:
+            dict: 상태별 작업 수, 준비된 작업 수, 최근 처리량(작업/분)
+        """
+        now = time.time()
+        counts = {STATE_PENDING: 0, STATE_IN_PROGRESS: 0, STATE_DONE: 0, STATE_FAILED: 0}
+        for row in self.conn.execute("SELECT state, COUNT(*) AS n FROM frontier GROUP BY state"):
+            counts[row['state']] = row['n']
+        ready = self.conn.execute(
+            "SELECT COUNT(*) FROM frontier WHERE state = ? AND next_attempt_at <= ?",
+            (STATE_PENDING, now)).fetchone()[0]
+        recent = self.conn.execute(
+            "SELECT COUNT(*) FROM frontier WHERE completed_at >= ?",
+            (now - THROUGHPUT_WINDOW,)).fetchone()[0]
+        return {
+            'queue_depth': counts[STATE_PENDING] + counts[STATE_IN_PROGRESS],
+            'ready': ready,
+            'states': counts,
+            'throughput_per_min': recent * 60.0 / THROUGHPUT_WINDOW,
+        }
+
+    def _row_to_item(self, row):
+        """데이터베이스 행을 작업 정보 딕셔너리로 변환합니다."""
+        return {
+            'id': row['id'],
+            'name': row['name'],
+            'kind': row['kind'],
+            'url': row['url'],
+            'priority': row['priority'],
+            'retries': row['retries'],
+        }
+
+    def close(self):
+        """데이터베이스 연결을 닫습니다."""
+        try:
+            self.conn.close()
+        except Exception as e:
+            logger.error(f"크롤 프런티어 닫기 오류: {e}")
@@ -0,0 +1,163 @@
+"""
+크롤링 작업자 프로세스 모듈
+
+README 다운로드와 마크다운/BeautifulSoup 파싱을 별도 프로세스에서 실행하여
+GUI 프로세스의 GIL을 점유하지 않도록 합니다. 결과는 간결한 JSON 청크로 스트리밍됩니다.
+"""
+
+import os
+import logging
+import multiprocessing
+
+from utils import json_io
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('crawl_worker')
+
+# 한 번에 전송할 레코드 수
+CHUNK_SIZE = 200
+
+# 메시지 종류
+MSG_PROGRESS = 'progress'
+MSG_RECORDS = 'records'
+MSG_DONE = 'done'
+MSG_ERROR = 'error'
+
+
+def _send_message(conn, kind, value):
+    """제어 메시지를 JSON 객체 바이트로 전송합니다."""
+    conn.send_bytes(json_io.dumps_bytes({'type': kind, 'value': value}))
+
+
+def encode_records(records):
+    """레코드 목록을 간결한 JSON 바이트로 직렬화합니다."""
+    return json_io.dumps_bytes(records)
+
+
+def crawl_worker_main(conn, cache_dir=None, force_refresh=False, readme_file=None):
+    """
+    작업자 프로세스 진입점. 크롤링 결과를 파이프로 전송합니다.
+
+    Args:
+        conn (multiprocessing.connection.Connection): 부모 프로세스와 연결된 파이프
+        cache_dir (str, optional): 크롤러 캐시 디렉토리
+        force_refresh (bool, optional): 캐시를 무시하고 강제로 새로고침할지 여부
+        readme_file (str, optional): 네트워크 대신 파싱할 로컬 README.md 파일
+    """
+    from crawler.github_crawler import GitHubCrawler
+
+    # 백그라운드 작업이 UI 프로세스와 CPU를 다투지 않도록 우선순위를 낮춤
+    if hasattr(os, 'nice'):
+        try:
+            os.nice(10)
+        except OSError:
+            pass
+
+    try:
+        _send_message(conn, MSG_PROGRESS, "MCP 서버 목록을 가져오는 중...")
+        crawler = GitHubCrawler(cache_dir=cache_dir)
+
+        if readme_file:
+            with open(readme_file, 'r', encoding='utf-8') as f:
+                mcp_servers = crawler._parse_readme(f.read())
+        else:
+            mcp_servers = crawler.get_mcp_servers(force_refresh=force_refresh)
+
+        _send_message(conn, MSG_PROGRESS, f"총 {len(mcp_servers)}개의 MCP 서버를 찾았습니다.")
+        for start in range(0, len(mcp_servers), CHUNK_SIZE):
+            conn.send_bytes(encode_records(mcp_servers[start:start + CHUNK_SIZE]))
+        _send_message(conn, MSG_DONE, len(mcp_servers))
+    except Exception as e:
+        logger.error(f"작업자 프로세스 크롤링 오류: {e}")
+        try:
+            _send_message(conn, MSG_ERROR, str(e))
+        except Exception:
+            pass
+    finally:
+        conn.close()
+
+
+class CrawlProcess:
+    """크롤링 작업자 프로세스를 관리하는 클래스"""
+
+    def __init__(self, cache_dir=None, force_refresh=False, readme_file=None):
+        """
+        CrawlProcess 초기화
+
+        Args:
+            cache_dir (str, optional): 크롤러 캐시 디렉토리
+            force_refresh (bool, optional): 캐시를 무시하고 강제로 새로고침할지 여부
+            readme_file (str, optional): 네트워크 대신 파싱할 로컬 README.md 파일
+        """
+        # Qt 스레드가 있는 프로세스에서 fork는 안전하지 않으므로 spawn 사용
+        self._context = multiprocessing.get_context('spawn')
+        self._conn, child_conn = self._context.Pipe(duplex=False)
+        self._child_conn = child_conn
+        self.process = self._context.Process(
+            target=crawl_worker_main,
+            args=(child_conn, cache_dir, force_refresh, readme_file),
+            daemon=True,
+        )
+
+    def start(self):
+        """작업자 프로세스를 시작합니다."""
+        self.process.start()
+        # 부모 쪽의 송신 단을 닫아야 자식 종료 시 EOF를 받을 수 있음
+        self._child_conn.close()
+
+    def messages(self, timeout=0.1, should_stop=None):
+        """
+        작업자 메시지를 순서대로 반환하는 제너레이터입니다.
+        레코드 청크는 (MSG_RECORDS, list) 형태로 역직렬화되어 반환됩니다.
+        작업자가 응답 없이 종료되면 (MSG_ERROR, 메시지)를 반환합니다.
+
+        Args:
+            timeout (float, optional): 메시지 대기 간격 (초). 기본값은 0.1입니다.
+            should_stop (callable, optional): True를 반환하면 작업을 취소합니다.
+
+        Yields:
+            tuple: (메시지 종류, 내용)
+        """
+        try:
+            yield from self._read_messages(timeout, should_stop)
+        finally:
+            self._conn.close()
+
+    def _read_messages(self, timeout, should_stop):
+        """파이프에서 메시지를 읽어 반환합니다."""
+        while True:
+            if should_stop is not None and should_stop():
+                self.cancel()
+                return
+
+            try:
+                if not self._conn.poll(timeout):
+                    if not self.process.is_alive() and not self._conn.poll():
+                        yield (MSG_ERROR, f"작업자 프로세스가 비정상 종료되었습니다 (종료 코드: {self.process.exitcode})")
+                        return
+                    continue
+                payload = self._conn.recv_bytes()
+            except (EOFError, OSError):
+                self.process.join(1)
+                yield (MSG_ERROR, f"작업자 프로세스가 비정상 종료되었습니다 (종료 코드: {self.process.exitcode})")
+                return
+
+            # 레코드 청크는 JSON 배열, 제어 메시지는 JSON 객체
+            data = json_io.loads(payload)
+            if isinstance(data, list):
+                yield (MSG_RECORDS, data)
+                continue
+
+            message = (data['type'], data['value'])
+            yield message
+            if message[0] in (MSG_DONE, MSG_ERROR):
+                self.process.join(1)
+                return
+
+    def cancel(self):
+        """작업자 프로세스를 중단합니다."""
+        if self.process.is_alive():
+            logger.info("크롤링 작업자 프로세스를 중단합니다.")
+            self.process.terminate()
+            self.process.join(1)
@@ -5,18 +5,36 @@ MCP 서버 목록을 GitHub 저장소에서 크롤링하고 상세 정보를 수
 """
 
 import os
-import json
 import time
+import hashlib
 import requests
 import logging
 import re
+from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 import markdown
 
+from .catalog_bundle import find_latest_bundle
+from utils import json_io
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('github_crawler')
 
+class RateLimitError(Exception):
+    """GitHub API 사용량 제한 오류"""
+    
+    def __init__(self, message, retry_after=None):
+        """
+        RateLimitError 초기화
+        
+        Args:
+            message (str): 오류 메시지
+            retry_after (float, optional): 재시도까지 기다릴 시간 (초)
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
 class GitHubCrawler:
     """GitHub 저장소에서 MCP 서버 정보를 크롤링하는 클래스"""
     
@@ -44,6 +62,8 @@ class GitHubCrawler:
         
         # README URL
         self.readme_url = "https://raw.githubusercontent.com/modelcontextprotocol/servers/main/README.md"
+        self.repo_url = "https://github.com/modelcontextprotocol/servers"
+        self.api_url = "https://api.github.com"
     
     def _is_cache_valid(self):
         """
@@ -70,9 +90,8 @@ class GitHubCrawler:
             list: MCP 서버 정보 목록
         """
         try:
-            with open(self.servers_cache_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError) as e:
+            return json_io.load(self.servers_cache_file)
+        except (json_io.JSONDecodeError, FileNotFoundError) as e:
             logger.error(f"캐시 로드 실패: {e}")
             return None
     
@@ -84,8 +103,7 @@ class GitHubCrawler:
             data (list): 저장할 MCP 서버 정보 목록
         """
         try:
-            with open(self.servers_cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            json_io.dump(data, self.servers_cache_file)
             logger.info(f"캐시 저장 성공: {self.servers_cache_file}")
         except Exception as e:
             logger.error(f"캐시 저장 실패: {e}")
@@ -122,14 +140,32 @@ class GitHubCrawler:
                 logger.info(f"GitHub에서 {len(mcp_servers)}개의 MCP 서버를 찾았습니다.")
                 return mcp_servers
         
-        # 파싱 실패 시 하드코딩된 데이터 반환
-        logger.warning("GitHub에서 MCP 서버 정보를 가져오지 못했습니다. 기본 데이터를 사용합니다.")
-        mcp_servers = self._get_default_mcp_servers()
+        # 실패 시 만료된 캐시, 번들, 기본 데이터 순으로 사용하되 대체 데이터로 사용자 캐시를 덮어쓰지 않음
+        logger.warning("GitHub에서 MCP 서버 정보를 가져오지 못했습니다. 오프라인 데이터를 사용합니다.")
+        return self.get_offline_servers()
+    
+    def get_offline_servers(self):
+        """
+        네트워크 없이 즉시 사용할 수 있는 MCP 서버 목록을 가져옵니다.
+        만료된 캐시라도 있으면 캐시를 사용하지만, 캐시보다 나중에 만들어진 카탈로그 번들이 있으면 번들을 사용합니다.
+        둘 다 없으면 기본 데이터를 사용합니다.
         
-        # 캐시에 저장
-        self._save_cache(mcp_servers)
+        Returns:
+            list: MCP 서버 정보 목록
+        """
+        if os.path.exists(self.servers_cache_file):
+            bundle = find_latest_bundle(self.cache_dir)
+            if bundle and bundle['records'] and bundle.get('created_at', 0) > os.path.getmtime(self.servers_cache_file):
+                logger.info(f"캐시보다 최신인 카탈로그 번들에서 {bundle['count']}개의 MCP 서버를 로드했습니다 "
+                            f"(버전 {bundle.get('catalog_version')}).")
+                return bundle['records']
+            
+            cached_data = self._load_cache()
+            if cached_data:
+                logger.info("캐시에서 MCP 서버 정보를 로드했습니다 (오프라인).")
+                return cached_data
         
-        return mcp_servers
+        return self._get_default_mcp_servers()
     
     def _download_readme(self):
         """
@@ -239,8 +275,9 @@ class GitHubCrawler:
                 if not a:
                     continue
                 
-                # 서버 이름과 설명 추출
+                # 서버 이름, 링크, 설명 추출
                 name = a.text.strip()
+                url = self._resolve_url(a.get('href'))
                 description = li.text.replace(name, '', 1).strip()
                 
                 if description.startswith('-'):
@@ -263,7 +300,8 @@ class GitHubCrawler:
                     'env_vars': [],
                     'args': [],
                     'category': category,
-                    'type': section_type
+                    'type': section_type,
+                    'url': url
                 }
                 
                 servers.append(server_info)
@@ -294,9 +332,9 @@ class GitHubCrawler:
                 reference_section = reference_section_match.group(1)
                 
                 # 목록 항목 파싱
-                list_items = re.findall(r'[-*]\s+\[([^]]+)\]\([^)]+\)([^\n]*)', reference_section)
+                list_items = re.findall(r'[-*]\s+\[([^]]+)\]\(([^)]+)\)([^\n]*)', reference_section)
                 
-                for name, description in list_items:
+                for name, href, description in list_items:
                     description = description.strip()
                     if description.startswith('-'):
                         description = description[1:].strip()
@@ -313,7 +351,8 @@ class GitHubCrawler:
                         'env_vars': [],
                         'args': [],
                         'category': category,
-                        'type': 'reference'
+                        'type': 'reference',
+                        'url': self._resolve_url(href)
                     }
                     
                     servers.append(server_info)
@@ -326,9 +365,9 @@ class GitHubCrawler:
                 official_section = official_section_match.group(1)
                 
                 # 목록 항목 파싱
-                list_items = re.findall(r'[-*]\s+\[([^]]+)\]\([^)]+\)([^\n]*)', official_section)
+                list_items = re.findall(r'[-*]\s+\[([^]]+)\]\(([^)]+)\)([^\n]*)', official_section)
                 
-                for name, description in list_items:
+                for name, href, description in list_items:
                     description = description.strip()
                     if description.startswith('-'):
                         description = description[1:].strip()
@@ -345,7 +384,8 @@ class GitHubCrawler:
                         'env_vars': [],
                         'args': [],
                         'category': category,
-                        'type': 'official'
+                        'type': 'official',
+                        'url': self._resolve_url(href)
                     }
                     
                     servers.append(server_info)
@@ -356,6 +396,134 @@ class GitHubCrawler:
         
         return servers
     
+    def _parse_github_url(self, url):
+        """
+        GitHub URL에서 소유자, 저장소, 하위 경로를 추출합니다.
+        
+        Args:
+            url (str): GitHub URL
+            
+        Returns:
+            tuple: (owner, repo, path). GitHub URL이 아니면 None
+        """
+        match = re.match(r'^https?://github\.com/([^/#?]+)/([^/#?]+)(?:/(?:tree|blob)/[^/]+/([^#?]*))?', url or '')
+        if not match:
+            return None
+        owner, repo, path = match.groups()
+        if repo.endswith('.git'):
+            repo = repo[:-4]
+        return owner, repo, (path or '').strip('/')
+    
+    def fetch_repo_metadata(self, url):
+        """
+        GitHub API에서 저장소 메타데이터(별 수, 최근 업데이트, 소유자 아바타)를 가져옵니다.
+        
+        Args:
+            url (str): 서버의 GitHub URL
+            
+        Returns:
+            dict: 메타데이터. GitHub URL이 아니면 None
+            
+        Raises:
+            RateLimitError: API 사용량 제한에 걸린 경우
+            requests.RequestException: 네트워크 오류
+        """
+        parsed = self._parse_github_url(url)
+        if parsed is None:
+            return None
+        owner, repo, path = parsed
+        
+        headers = {
+            'User-Agent': 'MCP-Config-Manager/1.0',
+            'Accept': 'application/vnd.github+json'
+        }
+        token = os.environ.get('GITHUB_TOKEN')
+        if token:
+            headers['Authorization'] = f"Bearer {token}"
+        
+        response = requests.get(f"{self.api_url}/repos/{owner}/{repo}", headers=headers, timeout=10)
+        
+        if response.status_code == 429 or (response.status_code == 403 and
+                                           response.headers.get('X-RateLimit-Remaining') == '0'):
+            retry_after = response.headers.get('Retry-After')
+            if retry_after is None and response.headers.get('X-RateLimit-Reset'):
+                retry_after = max(0.0, float(response.headers['X-RateLimit-Reset']) - time.time())
+            raise RateLimitError("GitHub API 사용량 제한에 도달했습니다.",
+                                 retry_after=float(retry_after) if retry_after is not None else None)
+        
+        response.raise_for_status()
+        data = response.json()
+        
+        return {
+            'owner': owner,
+            'repo': repo,
+            'path': path,
+            'stars': data.get('stargazers_count', 0),
+            'forks': data.get('forks_count', 0),
+            'open_issues': data.get('open_issues_count', 0),
+            'pushed_at': data.get('pushed_at'),
+            'archived': data.get('archived', False),
+            'license': (data.get('license') or {}).get('spdx_id'),
+            'default_branch': data.get('default_branch', 'main'),
+            'avatar_url': (data.get('owner') or {}).get('avatar_url'),
+            'fetched_at': time.time()
+        }
+    
+    def fetch_server_readme(self, url):
+        """
+        서버 저장소(또는 하위 경로)의 README.md 원문을 가져옵니다.
+        다운로드한 README는 캐시 디렉토리에 저장되며, 다운로드에 실패하면 만료된 캐시를 사용합니다.
+        
+        Args:
+            url (str): 서버의 GitHub URL
+            
+        Returns:
+            str: README 마크다운 원문. 가져올 수 없으면 None
+        """
+        parsed = self._parse_github_url(url)
+        if parsed is None:
+            return None
+        owner, repo, path = parsed
+        
+        readme_dir = os.path.join(self.cache_dir, "readmes")
+        cache_file = os.path.join(readme_dir, f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.md")
+        if os.path.exists(cache_file) and time.time() - os.path.getmtime(cache_file) < self.cache_expiry:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return f.read()
+        
+        raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/HEAD/{path + '/' if path else ''}README.md"
+        try:
+            response = requests.get(raw_url, headers={'User-Agent': 'MCP-Config-Manager/1.0'}, timeout=10)
+            response.raise_for_status()
+            os.makedirs(readme_dir, exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                f.write(response.text)
+            return response.text
+        except Exception as e:
+            logger.error(f"서버 README 다운로드 실패: {e}, URL: {raw_url}")
+            if os.path.exists(cache_file):
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    return f.read()
+            return None
+    
+    def _resolve_url(self, href):
+        """
+        README 링크를 절대 URL로 변환합니다. 상대 경로는 servers 저장소의 main 브랜치 기준으로 해석합니다
+        ('./src/x', 'src/x', '../x', '.github/x' 모두 URL 규칙대로).
+        
+        Args:
+            href (str): README의 링크 주소
+            
+        Returns:
+            str: 절대 URL. 링크가 없으면 None
+        """
+        if not href:
+            return None
+        href = href.strip()
+        if re.match(r'^[a-z]+://', href):
+            return href
+        return urljoin(f"{self.repo_url}/tree/main/", href)
+    
     def _estimate_category(self, description):
         """
         설명을 기반으로 서버 카테고리를 추정합니다.
@@ -399,10 +567,18 @@ class GitHubCrawler:
     def _get_default_mcp_servers(self):
         """
         기본 MCP 서버 목록을 반환합니다.
+        사용자 캐시 또는 애플리케이션에 포함된 카탈로그 번들이 있으면 번들의 레코드를 사용하고,
+        없으면 하드코딩된 목록을 사용합니다.
         
         Returns:
             list: 기본 MCP 서버 정보 목록
         """
+        bundle = find_latest_bundle(self.cache_dir)
+        if bundle and bundle['records']:
+            logger.info(f"카탈로그 번들에서 {bundle['count']}개의 MCP 서버를 로드했습니다 "
+                        f"(버전 {bundle.get('catalog_version')}).")
+            return bundle['records']
+        
         return [
             {
                 'name': 'AWS KB Retrieval',
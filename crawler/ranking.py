@@ -0,0 +1,169 @@
+"""
+카탈로그 순위 모듈
+
+로컬에 있는 보강 정보(별 수, 최근 업데이트, 섹션 유형, 문서 완성도)로 카탈로그 전체의
+복합 점수를 벡터 연산으로 한 번에 계산하고, 정렬 방식별 순열을 미리 만들어 둡니다.
+UI에서 정렬 방식을 바꿀 때는 미리 계산된 순열을 조회하기만 하면 됩니다.
+"""
+
+import time
+import logging
+from datetime import datetime
+
+import numpy as np
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('ranking')
+
+# 지원하는 정렬 방식
+SORT_DEFAULT = 'default'
+SORT_NAME = 'name'
+SORT_POPULAR = 'popular'
+SORT_RECENT = 'recent'
+SORT_MAINTAINED = 'maintained'
+SORT_KEYS = (SORT_DEFAULT, SORT_NAME, SORT_POPULAR, SORT_RECENT, SORT_MAINTAINED)
+
+# 섹션 유형별 가중치 (공식 참조 서버 > 공식 통합 > 커뮤니티)
+SECTION_WEIGHTS = {
+    'reference': 1.0,
+    'official': 0.8,
+    'community': 0.4,
+}
+
+# 최근 업데이트 점수의 반감기 (일)
+RECENCY_HALF_LIFE_DAYS = 90.0
+
+# 유지 관리 점수 가중치 (별 수, 최근 업데이트, 섹션 유형, 문서 완성도)
+MAINTAINED_WEIGHTS = (0.2, 0.4, 0.15, 0.25)
+
+
+def _parse_timestamp(value):
+    """ISO 8601 문자열 또는 숫자 시각을 UNIX 시간으로 변환합니다. 알 수 없으면 NaN"""
+    if value is None or value == '':
+        return np.nan
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return np.nan
+
+
+def _doc_completeness(server):
+    """설명, 링크, 설치 옵션, 환경 변수/인자 정보, 라이선스가 있는 비율을 반환합니다."""
+    checks = (
+        len(server.get('description') or '') >= 20,
+        bool(server.get('url')),
+        bool(server.get('installation_options')),
+        bool(server.get('env_vars') or server.get('args')),
+        bool(server.get('license')),
+    )
+    return sum(checks) / len(checks)
+
+
+class RankingEngine:
+    """정렬 방식별 순열을 미리 계산하는 카탈로그 순위 엔진 클래스"""
+
+    def __init__(self):
+        """RankingEngine 초기화"""
+        self.names = []
+        self.scores = {}
+        self.orders = {}
+        self.name_to_row = {}
+
+    def build(self, servers, enrichment=None, now=None):
+        """
+        카탈로그 전체의 점수와 정렬 순열을 계산합니다.
+
+        Args:
+            servers (list): MCP 서버 정보 목록 (README 순서)
+            enrichment (dict, optional): {서버 이름: 보강 정보}. 서버 정보보다 우선합니다.
+            now (float, optional): 기준 시각 (UNIX 시간). 기본값은 현재 시각입니다.
+        """
+        enrichment = enrichment or {}
+        now = time.time() if now is None else now
+        merged = [{**server, **enrichment.get(server.get('name'), {})} for server in servers]
+        n = len(merged)
+
+        self.names = [server.get('name', '') for server in merged]
+        self.name_to_row = {name: row for row, name in enumerate(self.names)}
+
+        stars = np.fromiter((float(server.get('stars') or 0) for server in merged), dtype=np.float64, count=n)
+        pushed = np.fromiter((_parse_timestamp(server.get('pushed_at')) for server in merged),
+                             dtype=np.float64, count=n)
+        section = np.fromiter((SECTION_WEIGHTS.get(server.get('type'), 0.4) for server in merged),
+                              dtype=np.float64, count=n)
+        docs = np.fromiter((_doc_completeness(server) for server in merged), dtype=np.float64, count=n)
+        archived = np.fromiter((bool(server.get('archived')) for server in merged), dtype=bool, count=n)
+
+        # 별 수는 로그 척도로 0~1 정규화
+        log_stars = np.log1p(stars)
+        star_score = log_stars / log_stars.max() if n and log_stars.max() > 0 else np.zeros(n)
+
+        # 최근 업데이트는 지수 감쇠 (업데이트 정보가 없으면 0)
+        age_days = np.maximum(0.0, (now - pushed) / 86400.0)
+        recency = np.where(np.isnan(pushed), 0.0, np.exp2(-age_days / RECENCY_HALF_LIFE_DAYS))
+
+        w_stars, w_recency, w_section, w_docs = MAINTAINED_WEIGHTS
+        maintained = w_stars * star_score + w_recency * recency + w_section * section + w_docs * docs
+        maintained[archived] -= 1.0
+
+        self.scores = {
+            SORT_POPULAR: star_score + 0.01 * maintained,
+            SORT_RECENT: recency,
+            SORT_MAINTAINED: maintained,
+        }
+
+        # 정렬 순열 (안정 정렬로 동점이면 README 순서 유지)
+        self.orders = {
+            SORT_DEFAULT: np.arange(n),
+            SORT_NAME: np.argsort(np.array([name.lower() for name in self.names], dtype=str), kind='stable'),
+        }
+        for key, score in self.scores.items():
+            self.orders[key] = np.argsort(-score, kind='stable')
+
+        logger.info(f"카탈로그 순위를 계산했습니다: {n}개 서버")
+
+    def order(self, sort_key):
+        """
+        정렬 방식의 미리 계산된 순열을 반환합니다.
+
+        Args:
+            sort_key (str): 정렬 방식 (SORT_KEYS 중 하나)
+
+        Returns:
+            numpy.ndarray: 행 번호 순열. 알 수 없는 정렬 방식이면 기본 순서
+        """
+        return self.orders.get(sort_key, self.orders.get(SORT_DEFAULT, np.arange(0)))
+
+    def ordered(self, servers, sort_key):
+        """
+        build에 전달한 서버 목록을 정렬 방식에 따라 재배열합니다.
+
+        Args:
+            servers (list): build에 전달한 MCP 서버 정보 목록
+            sort_key (str): 정렬 방식
+
+        Returns:
+            list: 정렬된 서버 정보 목록
+        """
+        if len(servers) != len(self.names):
+            return list(servers)
+        return [servers[row] for row in self.order(sort_key)]
+
+    def score(self, name, sort_key):
+        """
+        서버의 정렬 점수를 반환합니다.
+
+        Args:
+            name (str): 서버 이름
+            sort_key (str): 점수 기반 정렬 방식 (popular, recent, maintained)
+
+        Returns:
+            float: 점수. 알 수 없으면 None
+        """
+        row = self.name_to_row.get(name)
+        if row is None or sort_key not in self.scores:
+            return None
+        return float(self.scores[sort_key][row])
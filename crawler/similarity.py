@@ -0,0 +1,266 @@
+"""
+유사 서버 추천 모듈
+
+카탈로그의 각 MCP 서버(이름 + 설명 + 카테고리)를 해시된 n-gram TF-IDF 벡터로 변환하고,
+정규화된 행렬 하나와 행렬-벡터 곱으로 코사인 유사도 상위 k개 서버를 찾습니다.
+"""
+
+import os
+import re
+import zlib
+import hashlib
+import logging
+
+import numpy as np
+
+from utils import json_io
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('similarity')
+
+# 인덱스 파일 이름
+INDEX_FILENAME = "similarity_index.npz"
+
+# 단어 토큰 정규식
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _server_text(server):
+    """벡터화에 사용할 서버 텍스트를 반환합니다."""
+    return " ".join([
+        server.get('name') or '',
+        server.get('description') or '',
+        server.get('category') or '',
+    ]).lower()
+
+
+def _server_digest(server):
+    """서버 텍스트의 변경 여부 확인용 해시를 반환합니다."""
+    return hashlib.sha1(_server_text(server).encode('utf-8')).hexdigest()[:16]
+
+
+class SimilarityIndex:
+    """해시 n-gram TF-IDF 기반 유사 서버 인덱스 클래스"""
+
+    def __init__(self, dim=1024, ngram=3):
+        """
+        SimilarityIndex 초기화
+
+        Args:
+            dim (int, optional): 해시 벡터 차원 수. 기본값은 1024입니다.
+            ngram (int, optional): 문자 n-gram 길이. 기본값은 3입니다.
+        """
+        self.dim = dim
+        self.ngram = ngram
+        self.names = []
+        self.digests = []
+        self.name_to_row = {}
+        self.counts = np.zeros((0, dim), dtype=np.float32)
+        self.idf = np.ones(dim, dtype=np.float32)
+        self.matrix = np.zeros((0, dim), dtype=np.float32)
+
+    def copy(self):
+        """
+        인덱스를 복사합니다. build()와 update()는 배열을 제자리에서 바꾸지 않고 새로 만들어 교체하므로
+        복사본을 작업 스레드에서 갱신하는 동안 원본을 계속 조회할 수 있습니다.
+
+        Returns:
+            SimilarityIndex: 복사된 인덱스
+        """
+        index = SimilarityIndex(dim=self.dim, ngram=self.ngram)
+        index.names = self.names
+        index.digests = self.digests
+        index.name_to_row = self.name_to_row
+        index.counts = self.counts
+        index.idf = self.idf
+        index.matrix = self.matrix
+        return index
+
+    def _features(self, text):
+        """
+        텍스트의 해시 특성 인덱스 목록을 반환합니다 (단어 + 문자 n-gram).
+        프로세스 간에 동일한 값을 얻기 위해 crc32를 사용합니다.
+        """
+        features = []
+        for word in _WORD_RE.findall(text):
+            features.append(zlib.crc32(b"w:" + word.encode('utf-8')) % self.dim)
+            padded = f" {word} "
+            for i in range(max(1, len(padded) - self.ngram + 1)):
+                features.append(zlib.crc32(padded[i:i + self.ngram].encode('utf-8')) % self.dim)
+        return features
+
+    def _count_rows(self, servers):
+        """서버 목록의 특성 빈도 행렬을 한 번에 계산합니다."""
+        rows = []
+        cols = []
+        for row, server in enumerate(servers):
+            features = self._features(_server_text(server))
+            rows.extend([row] * len(features))
+            cols.extend(features)
+
+        flat = np.bincount(np.asarray(rows, dtype=np.int64) * self.dim + np.asarray(cols, dtype=np.int64),
+                           minlength=len(servers) * self.dim)
+        counts = flat.reshape(len(servers), self.dim).astype(np.float32)
+        # 빈도 감쇠 (sublinear tf)
+        np.log1p(counts, out=counts)
+        return counts
+
+    def _weight(self, counts):
+        """빈도 행렬에 IDF를 곱하고 행 단위로 L2 정규화합니다."""
+        weighted = counts * self.idf
+        norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return weighted / norms
+
+    def build(self, servers):
+        """
+        전체 카탈로그로 인덱스를 새로 만듭니다.
+
+        Args:
+            servers (list): MCP 서버 정보 목록
+        """
+        servers = [server for server in servers if server.get('name')]
+        self.names = [server['name'] for server in servers]
+        self.digests = [_server_digest(server) for server in servers]
+        self.name_to_row = {name: row for row, name in enumerate(self.names)}
+        self.counts = self._count_rows(servers)
+
+        n_docs = max(1, len(servers))
+        df = np.count_nonzero(self.counts, axis=0).astype(np.float32)
+        self.idf = (np.log((1.0 + n_docs) / (1.0 + df)) + 1.0).astype(np.float32)
+        self.matrix = self._weight(self.counts)
+        logger.info(f"유사도 인덱스를 생성했습니다: {len(self.names)}개 서버, {self.dim}차원")
+
+    def update(self, servers, rebuild_ratio=0.3):
+        """
+        변경된 서버의 행만 다시 계산합니다. 변경 비율이 높으면 전체를 다시 만듭니다.
+        IDF 가중치는 전체 재생성 시에만 갱신됩니다.
+
+        Args:
+            servers (list): 최신 MCP 서버 정보 목록
+            rebuild_ratio (float, optional): 전체 재생성 기준 변경 비율. 기본값은 0.3입니다.
+
+        Returns:
+            int: 다시 계산된 행 수
+        """
+        servers = [server for server in servers if server.get('name')]
+        if not self.names:
+            self.build(servers)
+            return len(servers)
+
+        new_names = [server['name'] for server in servers]
+        new_digests = [_server_digest(server) for server in servers]
+        changed = [i for i, (name, digest) in enumerate(zip(new_names, new_digests))
+                   if name not in self.name_to_row or self.digests[self.name_to_row[name]] != digest]
+
+        if len(changed) > rebuild_ratio * max(1, len(servers)):
+            self.build(servers)
+            return len(servers)
+
+        # 기존 행 재사용 (삭제된 서버는 제외, 순서는 새 목록 기준)
+        old_rows = np.asarray([self.name_to_row.get(name, 0) for name in new_names], dtype=np.int64)
+        counts = self.counts[old_rows] if len(old_rows) else np.zeros((0, self.dim), dtype=np.float32)
+        matrix = self.matrix[old_rows] if len(old_rows) else np.zeros((0, self.dim), dtype=np.float32)
+
+        if changed:
+            changed_counts = self._count_rows([servers[i] for i in changed])
+            counts[changed] = changed_counts
+            matrix[changed] = self._weight(changed_counts)
+
+        self.names = new_names
+        self.digests = new_digests
+        self.name_to_row = {name: row for row, name in enumerate(new_names)}
+        self.counts = counts
+        self.matrix = matrix
+        logger.info(f"유사도 인덱스를 갱신했습니다: {len(changed)}개 행 재계산")
+        return len(changed)
+
+    def _top_k(self, query, k, exclude_row=None):
+        """쿼리 벡터와 코사인 유사도가 높은 상위 k개 (이름, 점수)를 반환합니다."""
+        if not self.names:
+            return []
+        scores = self.matrix @ query
+        if exclude_row is not None:
+            scores[exclude_row] = -np.inf
+        k = min(k, len(self.names) - (1 if exclude_row is not None else 0))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.names[i], float(scores[i])) for i in top if scores[i] > 0]
+
+    def most_similar(self, name, k=5):
+        """
+        지정한 서버와 가장 유사한 서버 목록을 반환합니다.
+
+        Args:
+            name (str): 기준 서버 이름
+            k (int, optional): 반환할 서버 수. 기본값은 5입니다.
+
+        Returns:
+            list: (서버 이름, 유사도 점수) 튜플 목록. 서버가 인덱스에 없으면 빈 목록
+        """
+        row = self.name_to_row.get(name)
+        if row is None:
+            return []
+        return self._top_k(self.matrix[row], k, exclude_row=row)
+
+    def similar_to_text(self, text, k=5):
+        """
+        임의의 텍스트와 가장 유사한 서버 목록을 반환합니다.
+
+        Args:
+            text (str): 검색 텍스트
+            k (int, optional): 반환할 서버 수. 기본값은 5입니다.
+
+        Returns:
+            list: (서버 이름, 유사도 점수) 튜플 목록
+        """
+        counts = self._count_rows([{'name': text}])
+        return self._top_k(self._weight(counts)[0], k)
+
+    def save(self, path):
+        """
+        인덱스를 파일로 저장합니다.
+
+        Args:
+            path (str): 저장할 .npz 파일 경로
+        """
+        temp_path = f"{path}.tmp.npz"
+        np.savez(temp_path,
+                 counts=self.counts, idf=self.idf, matrix=self.matrix,
+                 meta=np.frombuffer(json_io.dumps_bytes({
+                     'dim': self.dim, 'ngram': self.ngram,
+                     'names': self.names, 'digests': self.digests,
+                 }), dtype=np.uint8))
+        os.replace(temp_path, path)
+        logger.info(f"유사도 인덱스를 저장했습니다: {path}")
+
+    @classmethod
+    def load(cls, path):
+        """
+        파일에서 인덱스를 불러옵니다.
+
+        Args:
+            path (str): .npz 파일 경로
+
+        Returns:
+            SimilarityIndex: 불러온 인덱스. 파일이 없거나 손상되었으면 None
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as data:
+                meta = json_io.loads(data['meta'].tobytes())
+                index = cls(dim=meta['dim'], ngram=meta['ngram'])
+                index.counts = data['counts']
+                index.idf = data['idf']
+                index.matrix = data['matrix']
+            index.names = meta['names']
+            index.digests = meta['digests']
+            index.name_to_row = {name: row for row, name in enumerate(index.names)}
+            return index
+        except Exception as e:
+            logger.error(f"유사도 인덱스 로드 실패: {e}, 경로: {path}")
+            return None
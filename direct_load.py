@@ -7,7 +7,6 @@
 
 import os
 import sys
-import json
 import logging
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, 
                             QHBoxLayout, QLabel, QPushButton, 
@@ -16,6 +15,8 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout,
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
+from utils import json_io
+
 # 로깅 설정
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('direct_load')
@@ -94,7 +95,7 @@ class DirectLoadWindow(QMainWindow):
                 self.content_text.setText(content)
                 
                 # JSON 파싱
-                config = json.loads(content)
+                config = json_io.loads(content)
                 
                 # MCP 서버 목록 추출
                 servers = self.extract_servers(config)
@@ -207,8 +208,7 @@ class DirectLoadWindow(QMainWindow):
                 try:
                     # 설정 저장
                     config = {"claude_config_path": os.path.dirname(self.config_path), "claude_config_file": self.config_path}
-                    with open(config_path, 'w', encoding='utf-8') as f:
-                        json.dump(config, f, ensure_ascii=False, indent=2)
+                    json_io.dump(config, config_path, pretty=True)
                     
                     QMessageBox.information(
                         self,
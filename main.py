@@ -8,24 +8,54 @@ import os
 import sys
 import logging
 import subprocess
-import json
+import multiprocessing
 from PyQt6.QtWidgets import QApplication, QMessageBox, QListWidgetItem, QFileDialog
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTranslator, QLocale
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal, QTranslator, QLocale
+from PyQt6.QtGui import QShortcut, QKeySequence
 
 from ui.main_window import MainWindow
-from crawler.github_crawler import GitHubCrawler
-from config.config_manager import ConfigManager
+from ui.image_cache import ImageLoader
+from ui.readme_preview import ReadmePreviewLoader
+from ui.config_watcher import ConfigWatcher
+from ui.config_worker import AsyncConfigManager
+from ui.catalog_worker import CatalogWorker
+from crawler.github_crawler import GitHubCrawler, RateLimitError
+from crawler.catalog_store import CatalogStore
+from crawler.similarity import SimilarityIndex, INDEX_FILENAME
+from crawler.crawl_worker import CrawlProcess, MSG_PROGRESS, MSG_RECORDS, MSG_DONE, MSG_ERROR
+from crawler.crawl_frontier import CrawlFrontier
+from crawler.ranking import RankingEngine
+from config.config_manager import ConfigManager, MANAGER_CONFIG_PATH, WRITE_BEHIND_DELAY
+from config.backup_store import REASON_MANUAL
 import utils
+from utils import json_io
 
 # 로깅 설정
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(name)s - %(message)s')
 logger = logging.getLogger('main')
 
+# 카탈로그(GitHubCrawler) 항목에만 있는 키 (Claude 설정 파일에 쓰지 않음, type은 전송 방식과 이름이 겹침)
+CATALOG_ONLY_KEYS = ('type', 'url', 'installation_options', 'env_vars', 'config_sample')
+
+def catalog_server_config(entry):
+    """
+    카탈로그 항목에서 내 MCP에 추가할 서버 항목을 만듭니다 (카탈로그 전용 키 제외, 활성화 상태 추가).
+    
+    Args:
+        entry (dict): 카탈로그 서버 정보
+        
+    Returns:
+        dict: 서버 항목
+    """
+    server = {key: value for key, value in entry.items() if key not in CATALOG_ONLY_KEYS}
+    server['enabled'] = True
+    return server
+
 class MCPLoaderThread(QThread):
     """MCP 서버 정보를 비동기적으로 로드하는 스레드"""
     
     # 시그널 정의
-    finished = pyqtSignal(list)
+    finished = pyqtSignal(object)
     progress = pyqtSignal(str)
     error = pyqtSignal(str)
     
@@ -58,6 +88,146 @@ class MCPLoaderThread(QThread):
             logger.error(f"MCP 서버 로드 오류: {e}")
             self.error.emit(f"MCP 서버 로드 오류: {e}")
 
+class MCPProcessLoaderThread(MCPLoaderThread):
+    """
+    MCP 서버 정보를 별도 작업자 프로세스에서 크롤링하는 스레드
+    
+    스레드는 파이프에서 결과를 기다리기만 하므로(대기 중 GIL 해제) README 파싱이
+    Qt 메인 스레드를 방해하지 않습니다. 작업자 프로세스를 시작할 수 없으면
+    기존 스레드 내 크롤링으로 대체합니다.
+    """
+    
+    def __init__(self, force_refresh=False, readme_file=None):
+        """
+        MCPProcessLoaderThread 초기화
+        
+        Args:
+            force_refresh (bool, optional): 캐시를 무시하고 강제로 새로고침할지 여부. 기본값은 False입니다.
+            readme_file (str, optional): 네트워크 대신 파싱할 로컬 README.md 파일
+        """
+        super().__init__(force_refresh=force_refresh)
+        self.readme_file = readme_file
+        self.crawl_process = None
+    
+    def run(self):
+        """스레드 실행"""
+        try:
+            self.crawl_process = CrawlProcess(force_refresh=self.force_refresh, readme_file=self.readme_file)
+            self.crawl_process.start()
+        except Exception as e:
+            logger.warning(f"작업자 프로세스를 시작할 수 없어 스레드에서 크롤링합니다: {e}")
+            super().run()
+            return
+        
+        mcp_servers = []
+        for kind, value in self.crawl_process.messages(should_stop=self.isInterruptionRequested):
+            if kind == MSG_PROGRESS:
+                self.progress.emit(value)
+            elif kind == MSG_RECORDS:
+                mcp_servers.extend(value)
+                self.progress.emit(f"MCP 서버 {len(mcp_servers)}개 수신 중...")
+            elif kind == MSG_DONE:
+                self.finished.emit(mcp_servers)
+                return
+            elif kind == MSG_ERROR:
+                if self.isInterruptionRequested():
+                    break
+                
+                # 작업자 오류/비정상 종료 시 네트워크 없이 사용할 수 있는 목록으로 대체
+                logger.error(f"MCP 서버 로드 오류 (작업자 프로세스): {value}")
+                self.error.emit(f"MCP 서버 로드 오류: {value}")
+                try:
+                    self.finished.emit(GitHubCrawler().get_offline_servers())
+                except Exception as e:
+                    logger.error(f"오프라인 MCP 서버 목록 로드 오류: {e}")
+                return
+        
+        logger.info("MCP 서버 로드가 취소되었습니다.")
+    
+    def cancel(self):
+        """진행 중인 크롤링을 취소합니다."""
+        self.requestInterruption()
+        if self.crawl_process is not None:
+            self.crawl_process.cancel()
+
+class MCPEnrichmentThread(QThread):
+    """크롤 프런티어의 보강 작업(저장소 메타데이터 등)을 우선순위 순으로 처리하는 스레드"""
+    
+    # 시그널 정의
+    item_done = pyqtSignal(str, str, object)
+    stats_changed = pyqtSignal(object)
+    
+    def __init__(self, db_path, request_interval_ms=1000, idle_interval_ms=5000):
+        """
+        MCPEnrichmentThread 초기화
+        
+        Args:
+            db_path (str): 크롤 프런티어 데이터베이스 경로
+            request_interval_ms (int, optional): 요청 간 대기 시간 (밀리초). 기본값은 1000입니다.
+            idle_interval_ms (int, optional): 처리할 작업이 없을 때 대기 시간 (밀리초). 기본값은 5000입니다.
+        """
+        super().__init__()
+        self.db_path = db_path
+        self.request_interval_ms = request_interval_ms
+        self.idle_interval_ms = idle_interval_ms
+    
+    def _sleep(self, msecs):
+        """중단 요청을 확인하면서 대기합니다."""
+        while msecs > 0 and not self.isInterruptionRequested():
+            self.msleep(min(100, msecs))
+            msecs -= 100
+    
+    def _process(self, crawler, item):
+        """
+        작업 하나를 처리합니다.
+        
+        Args:
+            crawler (GitHubCrawler): GitHub 크롤러
+            item (dict): 작업 정보
+            
+        Returns:
+            dict: 작업 결과
+        """
+        if item['kind'] == 'metadata':
+            return crawler.fetch_repo_metadata(item['url']) or {}
+        raise ValueError(f"알 수 없는 작업 종류입니다: {item['kind']}")
+    
+    def run(self):
+        """스레드 실행"""
+        # SQLite 연결은 스레드별로 생성
+        frontier = CrawlFrontier(db_path=self.db_path)
+        crawler = GitHubCrawler()
+        try:
+            frontier.recover()
+            while not self.isInterruptionRequested():
+                items = frontier.claim(limit=1)
+                if not items:
+                    self.stats_changed.emit(frontier.stats())
+                    self._sleep(self.idle_interval_ms)
+                    continue
+                
+                item = items[0]
+                try:
+                    result = self._process(crawler, item)
+                    frontier.complete(item['id'], result)
+                    self.item_done.emit(item['name'], item['kind'], result)
+                except RateLimitError as e:
+                    # 사용량 제한은 모든 작업에 적용되므로 큐 전체를 미룸
+                    delay = e.retry_after if e.retry_after is not None else 60.0
+                    logger.warning(f"GitHub API 사용량 제한: {delay:.0f}초 후 재시도합니다.")
+                    frontier.fail(item['id'], e, retry_after=delay)
+                    frontier.defer_all(delay)
+                except Exception as e:
+                    logger.error(f"보강 작업 실패 ({item['name']}, {item['kind']}): {e}")
+                    frontier.fail(item['id'], e)
+                
+                self.stats_changed.emit(frontier.stats())
+                self._sleep(self.request_interval_ms)
+        finally:
+            # 처리 중이던 작업은 다음 실행에서 이어서 처리
+            frontier.recover()
+            frontier.close()
+
 class MCPConfigManager:
     """MCP 설정 관리자 메인 클래스"""
     
@@ -73,7 +243,55 @@ class MCPConfigManager:
         self.main_window = MainWindow()
         
         # 설정 파일 관리자 생성
-        self.config_manager = ConfigManager()
+        # 연속된 서버 변경(이동, 삭제 등)은 모아서 백그라운드에서 한 번에 저장
+        self.config_manager = ConfigManager(write_delay=WRITE_BEHIND_DELAY)
+        # 저장/백업/복원 등 파일 작업은 작업 스레드에서 실행 (메인 창이 디스크를 기다리지 않음)
+        self.config_async = AsyncConfigManager(self.config_manager)
+        
+        # Claude Desktop이 현재 실행 중인 서버 설정 (재시작 필요 여부 판단 기준, 작업 스레드에서 읽은 뒤 채움)
+        self.launched_servers = {}
+        
+        # 카탈로그 로더 모드 ('process' 또는 'thread')
+        self.loader_mode = os.environ.get('MCP_LOADER_MODE', 'process')
+        
+        # 카탈로그 저장소 생성 (선택 사항, 실패 시 목록 순회 검색 사용)
+        self.catalog_store = self._create_catalog_store()
+        
+        # 유사 서버 인덱스 (캐시 디렉토리에 저장된 인덱스 재사용)
+        self.similarity_index_path = os.path.join(GitHubCrawler().cache_dir, INDEX_FILENAME)
+        self.similarity_index = SimilarityIndex.load(self.similarity_index_path) or SimilarityIndex()
+        self.catalog_by_name = {}
+        
+        # 카탈로그 후처리(저장소 갱신, 유사 서버 인덱스, 순위 계산, 보강 정보 저장)는 작업 스레드에서 실행
+        self.catalog_worker = CatalogWorker(
+            db_path=self.catalog_store.db_path if self.catalog_store is not None else None,
+            index_path=self.similarity_index_path)
+        
+        # 카탈로그 순위 엔진 (새로고침 시 정렬 순열을 미리 계산)
+        self.ranking = RankingEngine()
+        self.catalog_servers = []
+        self.ranking_dirty = False
+        
+        # 보강 작업 크롤 프런티어 (선택 사항)
+        self.crawl_frontier = self._create_crawl_frontier()
+        self.enrichment_thread = None
+        self.my_server_names = []
+        
+        # 목록 아이콘 비동기 로더 (보이는 행만 로드)
+        self.image_loader = self._create_image_loader()
+        
+        # README 미리보기 로더 (작업 스레드에서 변환, 문서 해시로 캐시)
+        self.readme_loader = ReadmePreviewLoader()
+        self.readme_url = None
+        
+        # 설정 파일 외부 변경 감시 (Claude Desktop, 편집기 등)
+        self.config_watcher = ConfigWatcher([self.config_manager.config_path, MANAGER_CONFIG_PATH])
+        
+        # 보이는 항목 우선순위 갱신 타이머 (스크롤 이벤트 묶음 처리)
+        self.visible_timer = QTimer()
+        self.visible_timer.setSingleShot(True)
+        self.visible_timer.setInterval(200)
+        self.visible_timer.timeout.connect(self._update_visible_priority)
         
         # 설정 파일 경로 검증
         self._validate_config_path()
@@ -87,6 +305,47 @@ class MCPConfigManager:
         # 기본 언어 설정 (예: 영어)
         self._load_language('en') 
     
+    def _create_catalog_store(self):
+        """
+        SQLite 카탈로그 저장소를 생성합니다.
+        
+        Returns:
+            CatalogStore: 카탈로그 저장소. 생성에 실패하면 None
+        """
+        try:
+            return CatalogStore()
+        except Exception as e:
+            logger.warning(f"카탈로그 저장소를 사용할 수 없습니다: {e}")
+            return None
+    
+    def _create_crawl_frontier(self):
+        """
+        보강 작업용 크롤 프런티어를 생성합니다.
+        
+        Returns:
+            CrawlFrontier: 크롤 프런티어. 생성에 실패하면 None
+        """
+        try:
+            return CrawlFrontier()
+        except Exception as e:
+            logger.warning(f"크롤 프런티어를 사용할 수 없습니다: {e}")
+            return None
+    
+    def _create_image_loader(self):
+        """
+        목록 아이콘용 비동기 이미지 로더를 생성합니다.
+        
+        Returns:
+            ImageLoader: 이미지 로더. 생성에 실패하면 None
+        """
+        try:
+            image_loader = ImageLoader()
+            self.main_window.set_image_loader(image_loader)
+            return image_loader
+        except Exception as e:
+            logger.warning(f"아이콘 로더를 사용할 수 없습니다: {e}")
+            return None
+    
     def _validate_config_path(self):
         """설정 파일 경로 검증"""
         # 설정 파일이 존재하는지 확인
@@ -120,7 +379,7 @@ class MCPConfigManager:
                 # 선택한 파일이 유효한 claude_desktop_config.json인지 확인
                 with open(file_path, 'r', encoding='utf-8') as f:
                     try:
-                        config_data = json.load(f)
+                        config_data = json_io.loads(f.read())
                         # 기본 구조 확인
                         if not isinstance(config_data, dict):
                             raise ValueError("설정 파일이 JSON 객체가 아닙니다.")
@@ -129,9 +388,9 @@ class MCPConfigManager:
                         if "mcp_servers" in config_data and not isinstance(config_data["mcp_servers"], list):
                             raise ValueError("mcp_servers 필드가 배열이 아닙니다.")
                             
-                        logger.info(f"선택한 설정 파일 내용: {json.dumps(config_data, ensure_ascii=False)}")
+                        logger.info(f"선택한 설정 파일 내용: {json_io.dumps(config_data)}")
                         
-                    except json.JSONDecodeError:
+                    except json_io.JSONDecodeError:
                         raise ValueError("선택한 파일이 유효한 JSON 형식이 아닙니다.")
                         
                 # MCP 설정 관리자 설정 파일 경로
@@ -142,8 +401,7 @@ class MCPConfigManager:
                 
                 # 설정 저장 (파일 경로 직접 저장)
                 config = {"claude_config_path": os.path.dirname(file_path), "claude_config_file": file_path}
-                with open(config_path, 'w', encoding='utf-8') as f:
-                    json.dump(config, f, ensure_ascii=False, indent=2)
+                json_io.dump(config, config_path, pretty=True)
                 
                 logger.info(f"Claude 설정 파일 경로 저장: {file_path}")
                 
@@ -173,7 +431,12 @@ class MCPConfigManager:
         
         # 사용 가능한 MCP 탭 이벤트
         self.main_window.mcp_list.itemClicked.connect(self._on_mcp_selected)
+        self.main_window.similar_list.itemClicked.connect(self._on_similar_selected)
+        self.readme_loader.preview_ready.connect(self._on_readme_ready)
+        self.readme_loader.preview_failed.connect(self._on_readme_failed)
+        self.main_window.mcp_list.verticalScrollBar().valueChanged.connect(lambda _: self.visible_timer.start())
         self.main_window.search_button.clicked.connect(self._on_search)
+        self.main_window.sort_combo.currentIndexChanged.connect(self._on_sort_changed)
         self.main_window.select_all_button.clicked.connect(self._on_select_all)
         self.main_window.deselect_all_button.clicked.connect(self._on_deselect_all)
         self.main_window.apply_button.clicked.connect(self._on_apply)
@@ -187,20 +450,35 @@ class MCPConfigManager:
         self.main_window.move_down_button.clicked.connect(self._on_move_down)
         self.main_window.save_button.clicked.connect(self._on_save)
         
+        # 서버 변경 실행 취소/다시 실행 (Ctrl+Z / Ctrl+Y 등 플랫폼 기본 단축키)
+        QShortcut(QKeySequence.StandardKey.Undo, self.main_window, activated=self._on_undo)
+        QShortcut(QKeySequence.StandardKey.Redo, self.main_window, activated=self._on_redo)
+        
         # 백업/복원 이벤트
         self.main_window.backup_button.clicked.connect(self._on_backup)
         self.main_window.restore_button.clicked.connect(self._on_restore)
         
+        # 프로필 이벤트 (activated는 사용자가 선택했을 때만 발생)
+        self.main_window.profile_combo.activated.connect(self._on_profile_selected)
+        self.main_window.save_profile_button.clicked.connect(self._on_save_profile)
+        
         # 설정 파일 경로 변경 버튼 추가
         self.main_window.change_config_path_button.clicked.connect(self._on_change_config_path)
+        
+        # 설정 파일 외부 변경
+        self.config_watcher.file_changed.connect(self._on_config_file_changed)
     
     def _initialize(self):
         """초기 설정"""
         # 설정 파일 경로 표시
         self.main_window.set_config_path(self.config_manager.config_path)
         
-        # 내 MCP 서버 목록 로드
-        self._load_my_mcp_servers()
+        # 내 MCP 서버 목록, 실행 설정 스냅샷, 프로필 목록을 작업 스레드에서 읽은 뒤 반영
+        config_manager = self.config_manager
+        self.config_async.reload(on_done=lambda result: self._on_config_switched(result, config_manager))
+        
+        # 캐시 또는 카탈로그 번들로 목록을 즉시 표시 (네트워크 불필요)
+        self._load_offline_mcp_servers()
         
         # MCP 서버 목록 로드 (비동기, 강제 새로고침 추가)
         self._load_mcp_servers(force_refresh=True)
@@ -215,8 +493,17 @@ class MCPConfigManager:
         # 상태 표시줄 업데이트
         self.main_window.statusBar().showMessage("MCP 서버 목록을 가져오는 중...")
         
-        # 로더 스레드 생성
-        self.loader_thread = MCPLoaderThread(force_refresh=force_refresh)
+        # 진행 중인 로드가 있으면 취소
+        if getattr(self, 'loader_thread', None) is not None and self.loader_thread.isRunning():
+            if isinstance(self.loader_thread, MCPProcessLoaderThread):
+                self.loader_thread.cancel()
+            self.loader_thread.wait()
+        
+        # 로더 스레드 생성 (작업자 프로세스 모드, MCP_LOADER_MODE=thread이면 스레드 모드)
+        if self.loader_mode == 'process':
+            self.loader_thread = MCPProcessLoaderThread(force_refresh=force_refresh)
+        else:
+            self.loader_thread = MCPLoaderThread(force_refresh=force_refresh)
         
         # 시그널 연결
         self.loader_thread.finished.connect(self._on_mcp_servers_loaded)
@@ -226,15 +513,27 @@ class MCPConfigManager:
         # 스레드 시작
         self.loader_thread.start()
     
-    def _load_my_mcp_servers(self):
-        """내 MCP 서버 목록을 로드합니다."""
+    def _load_offline_mcp_servers(self):
+        """캐시 또는 카탈로그 번들에서 MCP 서버 목록을 즉시 로드합니다."""
+        self.catalog_worker.load_offline(
+            on_done=lambda mcp_servers: self._on_mcp_servers_loaded(mcp_servers) if mcp_servers else None)
+    
+    def _load_my_mcp_servers(self, my_mcp_servers=None):
+        """
+        내 MCP 서버 목록을 로드합니다.
+        
+        Args:
+            my_mcp_servers (list, optional): 작업 스레드에서 이미 가져온 서버 목록. 기본값은 None으로,
+                                            이 경우 설정 파일에서 가져옵니다.
+        """
         try:
-            # 로그 추가: 설정 파일 경로 출력
-            logger.info(f"현재 설정 파일 경로: {self.config_manager.config_path}")
-            logger.info(f"설정 파일 존재 여부: {os.path.exists(self.config_manager.config_path)}")
-            
-            # 설정 파일에서 MCP 서버 목록 가져오기
-            my_mcp_servers = self.config_manager.get_mcp_servers()
+            if my_mcp_servers is None:
+                # 로그 추가: 설정 파일 경로 출력
+                logger.info(f"현재 설정 파일 경로: {self.config_manager.config_path}")
+                logger.info(f"설정 파일 존재 여부: {os.path.exists(self.config_manager.config_path)}")
+                
+                # 설정 파일에서 MCP 서버 목록 가져오기
+                my_mcp_servers = self.config_manager.get_mcp_servers()
             
             # 로그 추가: MCP 서버 목록 개수 및 정보 출력
             logger.info(f"로드된 MCP 서버 수: {len(my_mcp_servers)}")
@@ -242,40 +541,16 @@ class MCPConfigManager:
             if my_mcp_servers: # 목록이 비어있지 않을 때만 로깅
                  logger.debug("로드된 서버 상세 정보:")
                  for i, server in enumerate(my_mcp_servers):
-                     logger.debug(f"  Server {i+1}: {json.dumps(server, ensure_ascii=False)}")
+                     logger.debug(f"  Server {i+1}: {json_io.dumps(server)}")
             
-            # 필수 필드가 없는 서버 항목 처리 (기존 로직 유지)
-            processed_servers = []
-            for server in my_mcp_servers:
-                # name 필드가 없으면 로그 남기고 건너뛰거나 기본값 설정
-                if 'name' not in server or not server['name']:
-                    logger.warning(f"서버 항목에 'name' 필드가 없거나 비어있습니다. 건너뜁니다: {server}")
-                    continue # 또는 server['name'] = "이름 없는 MCP 서버" 로 설정
-                
-                # description 필드가 없으면 기본값 설정
-                if 'description' not in server:
-                    server['description'] = "설명 없음"
-                
-                # 필요한 다른 필드 기본값 설정 (기존 로직 유지)
-                if 'installation_options' not in server:
-                    server['installation_options'] = []
-                
-                if 'env_vars' not in server:
-                    server['env_vars'] = []
-                
-                if 'args' not in server:
-                    server['args'] = []
-                
-                if 'category' not in server:
-                    server['category'] = "일반"
-                
-                processed_servers.append(server)
+            processed_servers = self._prepare_my_servers(my_mcp_servers)
             
             # 로그 추가: 처리 후 MCP 서버 목록 개수 출력
             logger.info(f"UI에 표시할 처리된 MCP 서버 수: {len(processed_servers)}")
             
             # 내 MCP 서버 목록 채우기
             self.main_window.populate_my_mcp_list(processed_servers)
+            self._set_my_server_names(processed_servers)
             
             # 상태 표시줄 업데이트
             self.main_window.statusBar().showMessage(f"내 MCP 서버 {len(processed_servers)}개를 로드했습니다.")
@@ -284,19 +559,294 @@ class MCPConfigManager:
             logger.exception("상세 오류 정보:") # 예외 발생 시 스택 트레이스 포함
             self.main_window.show_error_message("오류", f"내 MCP 서버 로드 오류: {e}")
     
+    def _prepare_my_servers(self, my_mcp_servers):
+        """
+        내 MCP 목록에 표시할 서버 목록을 만듭니다 (필수 필드가 없는 항목 처리).
+        
+        Args:
+            my_mcp_servers (list): 설정 파일의 MCP 서버 목록
+            
+        Returns:
+            list: 표시할 MCP 서버 목록
+        """
+        processed_servers = []
+        for server in my_mcp_servers:
+            # name 필드가 없으면 로그 남기고 건너뛰거나 기본값 설정
+            if 'name' not in server or not server['name']:
+                logger.warning(f"서버 항목에 'name' 필드가 없거나 비어있습니다. 건너뜁니다: {server}")
+                continue # 또는 server['name'] = "이름 없는 MCP 서버" 로 설정
+            
+            # description 필드가 없으면 기본값 설정
+            if 'description' not in server:
+                server['description'] = "설명 없음"
+            
+            # 필요한 다른 필드 기본값 설정 (기존 로직 유지)
+            if 'installation_options' not in server:
+                server['installation_options'] = []
+            
+            if 'env_vars' not in server:
+                server['env_vars'] = []
+            
+            if 'args' not in server:
+                server['args'] = []
+            
+            if 'category' not in server:
+                server['category'] = "일반"
+            
+            processed_servers.append(server)
+        return processed_servers
+    
+    def _set_my_server_names(self, processed_servers):
+        """내 서버 이름 목록을 갱신하고 내 서버의 보강 작업을 최우선으로 처리합니다."""
+        self.my_server_names = [server['name'] for server in processed_servers]
+        if self.crawl_frontier is not None:
+            self.crawl_frontier.set_user_servers(self.my_server_names)
+    
+    def _on_config_file_changed(self, path):
+        """
+        설정 파일 외부 변경 이벤트 핸들러
+        
+        Args:
+            path (str): 내용이 바뀐 파일 경로
+        """
+        if os.path.abspath(path) == os.path.abspath(MANAGER_CONFIG_PATH):
+            # 직접 지정한 Claude 설정 파일 경로가 바뀌었으면 새 경로로 전환
+            # (이전 파일의 대기 중인 쓰기를 먼저 쓰고, 새 관리자는 작업 스레드에서 만듦)
+            write_delay = self.config_manager.write_delay
+            self.config_async.open_config(lambda: ConfigManager(write_delay=write_delay),
+                                          on_done=self._on_config_opened)
+            return
+        
+        if os.path.abspath(path) != os.path.abspath(self.config_manager.config_path):
+            return
+        
+        # 작업 스레드에서 다시 읽은 뒤 반영
+        config_manager = self.config_manager
+        self.config_async.reload(on_done=lambda result: self._on_config_reloaded(result, config_manager))
+    
+    def _on_config_opened(self, config_manager):
+        """
+        관리자 설정 변경 후 새 설정 파일 관리자 생성 완료 처리
+        
+        Args:
+            config_manager (ConfigManager): 작업 스레드에서 만든 설정 파일 관리자
+        """
+        if os.path.abspath(config_manager.config_path) == os.path.abspath(self.config_manager.config_path):
+            return
+        logger.info(f"설정 파일 경로가 변경되었습니다: {config_manager.config_path}")
+        self.config_watcher.remove_path(self.config_manager.config_path)
+        self.config_manager = config_manager
+        self.config_async.manager = config_manager
+        self.config_watcher.add_path(config_manager.config_path)
+        self.main_window.set_config_path(config_manager.config_path)
+        self.config_async.reload(on_done=lambda result: self._on_config_switched(result, config_manager))
+    
+    def _on_config_switched(self, result, config_manager):
+        """
+        설정 파일 경로 전환(또는 시작 시 첫 읽기) 후 다시 읽기 완료 처리
+        
+        Args:
+            result (dict): 작업 결과 ({'ok', 'conflicts', 'servers', 'snapshot'})
+            config_manager (ConfigManager): 다시 읽은 설정 파일 관리자
+        """
+        if config_manager is not self.config_manager:
+            return
+        self.launched_servers = result['snapshot']
+        self._load_my_mcp_servers(result['servers'])
+        self.config_async.profiles(on_done=self.main_window.set_profiles)
+    
+    def _on_config_reloaded(self, result, config_manager):
+        """
+        설정 파일 외부 변경 후 다시 읽기 완료 처리
+        
+        Args:
+            result (dict): 작업 결과 ({'ok', 'conflicts', 'servers', 'snapshot'})
+            config_manager (ConfigManager): 다시 읽은 설정 파일 관리자
+        """
+        # 그 사이 다른 설정 파일로 전환했으면 무시
+        if config_manager is not self.config_manager:
+            return
+        
+        # 목록을 다시 만들지 않고 바뀐 항목만 반영 (선택 상태 유지)
+        try:
+            processed_servers = self._prepare_my_servers(result['servers'])
+            counts = self.main_window.update_my_mcp_list(processed_servers)
+        except Exception as e:
+            logger.error(f"내 MCP 서버 갱신 오류: {e}")
+            return
+        if not any(counts.values()):
+            return
+        
+        self._set_my_server_names(processed_servers)
+        logger.info(f"외부 변경 반영: {counts}")
+        self.main_window.statusBar().showMessage(
+            f"설정 파일이 외부에서 변경되었습니다. 추가 {counts['added']}, 삭제 {counts['removed']}, "
+            f"변경 {counts['updated']}, 이동 {counts['moved']}")
+    
     def _on_mcp_servers_loaded(self, mcp_servers):
         """
-        MCP 서버 목록 로드 완료 이벤트 핸들러
+        MCP 서버 목록 로드 완료 이벤트 핸들러 (저장소, 유사 서버 인덱스, 순위는 작업 스레드에서 갱신)
         
         Args:
             mcp_servers (list): MCP 서버 정보 목록
         """
-        # MCP 서버 목록 채우기
-        self.main_window.populate_mcp_list(mcp_servers)
+        self.main_window.statusBar().showMessage(f"MCP 서버 {len(mcp_servers)}개를 정리하는 중...")
+        self.catalog_worker.refresh(mcp_servers, self.similarity_index, on_done=self._on_catalog_refreshed)
+    
+    def _on_catalog_refreshed(self, result):
+        """
+        카탈로그 갱신 완료 처리 (새 인덱스와 순위로 교체 후 목록 채우기)
+        
+        Args:
+            result (dict): 작업 결과 ({'servers', 'similarity_index', 'ranking'})
+        """
+        mcp_servers = result['servers']
+        self.similarity_index = result['similarity_index']
+        self.catalog_by_name = {server.get('name'): server for server in mcp_servers}
+        self.catalog_servers = mcp_servers
+        if result['ranking'] is not None:
+            self.ranking = result['ranking']
+            self.ranking_dirty = False
+        
+        # 미리 계산된 정렬 순열로 MCP 서버 목록 채우기
+        self.main_window.populate_mcp_list(
+            self.ranking.ordered(mcp_servers, self.main_window.current_sort_key()))
+        
+        # 보강 작업 등록 및 시작
+        self._schedule_enrichment(mcp_servers)
         
         # 상태 표시줄 업데이트
         self.main_window.statusBar().showMessage(f"총 {len(mcp_servers)}개의 MCP 서버를 로드했습니다.")
     
+    def _rebuild_ranking(self, on_done=None):
+        """
+        보강 정보를 반영하여 카탈로그 전체의 정렬 순열을 작업 스레드에서 다시 계산합니다.
+        
+        Args:
+            on_done (callable, optional): 새 순위로 교체한 뒤 호출할 함수 (메인 스레드)
+        """
+        # 계산 중에 들어온 보강 정보는 다시 표시되어 다음 계산에 반영
+        self.ranking_dirty = False
+        self.catalog_worker.rank(self.catalog_servers,
+                                 on_done=lambda result: self._on_ranking_rebuilt(result, on_done))
+    
+    def _on_ranking_rebuilt(self, result, on_done=None):
+        """
+        순위 재계산 완료 처리
+        
+        Args:
+            result (dict): 작업 결과 ({'servers', 'ranking'})
+            on_done (callable, optional): 새 순위로 교체한 뒤 호출할 함수
+        """
+        # 그 사이 카탈로그가 바뀌었으면 새 카탈로그의 순위가 따로 전달됨
+        if result['servers'] is not self.catalog_servers or result['ranking'] is None:
+            return
+        self.ranking = result['ranking']
+        if on_done is not None:
+            on_done()
+    
+    def _on_sort_changed(self, index):
+        """
+        정렬 방식 변경 이벤트 핸들러 (미리 계산된 순열 사용)
+        
+        Args:
+            index (int): 선택된 항목 인덱스
+        """
+        if not self.catalog_servers:
+            return
+        
+        # 그 사이 보강 정보가 들어왔으면 순위 갱신 후 채우기
+        if self.ranking_dirty:
+            self._rebuild_ranking(on_done=self._populate_sorted)
+            return
+        self._populate_sorted()
+    
+    def _populate_sorted(self):
+        """현재 정렬 방식의 순열로 MCP 서버 목록을 채우고 검색 필터를 다시 적용합니다."""
+        self.main_window.populate_mcp_list(
+            self.ranking.ordered(self.catalog_servers, self.main_window.current_sort_key()))
+        
+        # 검색 필터 다시 적용
+        self._on_search()
+    
+    def _schedule_enrichment(self, mcp_servers):
+        """
+        카탈로그 서버의 보강 작업을 크롤 프런티어에 등록하고 작업 스레드를 시작합니다.
+        
+        Args:
+            mcp_servers (list): MCP 서버 정보 목록
+        """
+        if self.crawl_frontier is None:
+            return
+        
+        try:
+            self.crawl_frontier.enqueue(
+                (server['name'], 'metadata', server.get('url'))
+                for server in mcp_servers if server.get('name') and server.get('url'))
+            # 하루 지난 메타데이터는 다시 가져옴
+            self.crawl_frontier.requeue_stale(24 * 3600, kinds=['metadata'])
+            self.crawl_frontier.set_user_servers(self.my_server_names)
+            self._update_visible_priority()
+        except Exception as e:
+            logger.error(f"보강 작업 등록 오류: {e}")
+            return
+        
+        if self.enrichment_thread is None or not self.enrichment_thread.isRunning():
+            self.enrichment_thread = MCPEnrichmentThread(self.crawl_frontier.db_path)
+            self.enrichment_thread.item_done.connect(self._on_enrichment_done)
+            self.enrichment_thread.stats_changed.connect(self._on_enrichment_stats)
+            self.enrichment_thread.start()
+    
+    def _update_visible_priority(self):
+        """현재 보이는 서버의 보강 작업 우선순위를 높입니다."""
+        if self.crawl_frontier is None:
+            return
+        try:
+            self.crawl_frontier.set_visible(self.main_window.visible_mcp_names())
+        except Exception as e:
+            logger.error(f"보이는 항목 우선순위 갱신 오류: {e}")
+    
+    def _on_enrichment_done(self, name, kind, result):
+        """
+        보강 작업 완료 이벤트 핸들러
+        
+        Args:
+            name (str): 서버 이름
+            kind (str): 작업 종류
+            result (dict): 작업 결과
+        """
+        if self.catalog_store is None or not result:
+            return
+        # 저장은 작업 스레드에서 하고, 저장되면 다음 순위 계산에 반영
+        self.catalog_worker.save_enrichment(name, result, on_done=self._on_enrichment_saved)
+    
+    def _on_enrichment_saved(self, saved):
+        """
+        보강 정보 저장 완료 처리
+        
+        Args:
+            saved (bool): 저장 여부
+        """
+        if saved:
+            self.ranking_dirty = True
+    
+    def _on_enrichment_stats(self, stats):
+        """
+        보강 작업 통계 이벤트 핸들러
+        
+        Args:
+            stats (dict): 큐 깊이와 처리량 통계
+        """
+        if stats['queue_depth']:
+            self.main_window.set_enrichment_status(
+                f"보강 대기 {stats['queue_depth']}개 · {stats['throughput_per_min']:.0f}개/분")
+        else:
+            self.main_window.set_enrichment_status("")
+        
+        # 처리할 보강 작업이 없으면 새 보강 정보로 정렬 순열을 미리 갱신
+        if self.ranking_dirty and not stats.get('ready'):
+            self._rebuild_ranking()
+    
     def _on_mcp_selected(self, item):
         """
         MCP 서버 선택 이벤트 핸들러
@@ -309,6 +859,89 @@ class MCPConfigManager:
         
         # MCP 상세 정보 표시
         self.main_window.show_mcp_detail(mcp_info)
+        
+        # 유사 서버 표시
+        self._show_similar_servers(mcp_info)
+        
+        # README 미리보기 표시 (캐시에 없으면 자리 표시 후 백그라운드 변환)
+        self._show_readme_preview(mcp_info)
+        
+        # 선택된 서버의 보강 작업을 먼저 처리
+        if self.crawl_frontier is not None:
+            try:
+                self.crawl_frontier.promote([mcp_info.get('name')])
+            except Exception as e:
+                logger.error(f"선택 항목 우선순위 갱신 오류: {e}")
+    
+    def _show_readme_preview(self, mcp_info):
+        """
+        선택된 서버의 README 미리보기 표시
+        
+        Args:
+            mcp_info (dict): 선택된 MCP 서버 정보
+        """
+        self.readme_url = mcp_info.get('url')
+        if not self.readme_url:
+            self.main_window.show_readme_placeholder(self.main_window.tr("No README available."))
+            return
+        
+        html = self.readme_loader.cached(self.readme_url)
+        if html is not None:
+            self.main_window.show_readme_html(html)
+            return
+        
+        self.main_window.show_readme_placeholder()
+        self.readme_loader.request(self.readme_url)
+    
+    def _on_readme_ready(self, url, html):
+        """
+        README 미리보기 준비 완료 이벤트 핸들러
+        
+        Args:
+            url (str): 서버 URL
+            html (str): README HTML
+        """
+        # 그 사이 다른 서버가 선택되었으면 캐시에만 남김
+        if url == self.readme_url:
+            self.main_window.show_readme_html(html)
+    
+    def _on_readme_failed(self, url):
+        """
+        README 미리보기 실패 이벤트 핸들러
+        
+        Args:
+            url (str): 서버 URL
+        """
+        if url == self.readme_url:
+            self.main_window.show_readme_placeholder(self.main_window.tr("No README available."))
+    
+    def _on_similar_selected(self, item):
+        """
+        유사 서버 선택 이벤트 핸들러
+        
+        Args:
+            item (QListWidgetItem): 선택된 항목
+        """
+        mcp_info = item.data(Qt.ItemDataRole.UserRole)
+        if mcp_info:
+            self.main_window.show_mcp_detail(mcp_info)
+            self._show_similar_servers(mcp_info)
+            self._show_readme_preview(mcp_info)
+    
+    def _show_similar_servers(self, mcp_info, k=5):
+        """
+        선택된 서버와 유사한 서버 목록을 표시합니다.
+        
+        Args:
+            mcp_info (dict): 기준 MCP 서버 정보
+            k (int, optional): 표시할 서버 수. 기본값은 5입니다.
+        """
+        try:
+            similar = self.similarity_index.most_similar(mcp_info.get('name'), k=k)
+            similar_servers = [self.catalog_by_name[name] for name, _ in similar if name in self.catalog_by_name]
+            self.main_window.show_similar_servers(similar_servers)
+        except Exception as e:
+            logger.error(f"유사 서버 검색 오류: {e}")
     
     def _on_my_mcp_selected(self, item):
         """
@@ -338,11 +971,27 @@ class MCPConfigManager:
         if install_method == "전체":
             install_method = None
         
+        # 카탈로그 저장소가 있으면 인덱스 기반 쿼리로 일치 항목 계산
+        matched_names = None
+        if self.catalog_store is not None:
+            try:
+                matched_names = set(self.catalog_store.search_names(
+                    search_text=search_text,
+                    category=category,
+                    install_method=install_method
+                ))
+            except Exception as e:
+                logger.error(f"카탈로그 저장소 검색 오류: {e}")
+        
         # 모든 항목 가져오기
         for i in range(self.main_window.mcp_list.count()):
             item = self.main_window.mcp_list.item(i)
             mcp_info = item.data(Qt.ItemDataRole.UserRole)
             
+            if matched_names is not None:
+                item.setHidden(mcp_info['name'] not in matched_names)
+                continue
+            
             # 검색 조건에 맞는지 확인
             match = True
             
@@ -383,32 +1032,36 @@ class MCPConfigManager:
             self.main_window.show_info_message("알림", "선택된 MCP 서버가 없습니다.")
             return
         
-        # 선택된 MCP 서버 정보 가져오기
-        selected_servers = [item.data(Qt.ItemDataRole.UserRole) for item in selected_items]
-        
-        # 현재 내 MCP 서버 목록 가져오기
-        my_mcp_servers = self.config_manager.get_mcp_servers()
+        # 선택된 MCP 서버 정보 가져오기 (카탈로그 전용 키 제외, 활성화 상태 추가)
+        selected_servers = [catalog_server_config(item.data(Qt.ItemDataRole.UserRole)) for item in selected_items]
         
-        # 선택된 서버 추가
-        for server in selected_servers:
-            # 중복 확인
-            if not any(my_server['name'] == server['name'] for my_server in my_mcp_servers):
-                # 활성화 상태 추가
-                server['enabled'] = True
-                my_mcp_servers.append(server)
+        # 선택된 서버 추가 (이미 있는 서버는 건너뜀, 작업 스레드에서 한 번의 저장으로 처리)
+        self.main_window.statusBar().showMessage("MCP 서버를 추가하는 중...")
+        self.config_async.add_servers(
+            selected_servers,
+            on_done=self._on_apply_done,
+            on_error=lambda message: self.main_window.show_error_message("오류", f"MCP 서버 추가 실패: {message}"))
+    
+    def _on_apply_done(self, result):
+        """
+        서버 추가 완료 처리
         
-        # 설정 파일에 저장
-        if self.config_manager.save_mcp_servers(my_mcp_servers):
-            # 내 MCP 서버 목록 다시 로드
-            self._load_my_mcp_servers()
-            
-            # 탭 전환
-            self.main_window.tab_widget.setCurrentIndex(1)
-            
-            # 알림 표시
-            self.main_window.show_info_message("알림", f"선택한 {len(selected_servers)}개의 MCP 서버를 추가했습니다.")
-        else:
+        Args:
+            result (dict): 작업 결과 ({'ok', 'conflicts', 'servers', 'count'})
+        """
+        if not result['ok']:
             self.main_window.show_error_message("오류", "MCP 서버 추가 실패")
+            return
+        
+        # 내 MCP 서버 목록 다시 로드
+        self._load_my_mcp_servers(result['servers'])
+        self._report_conflicts(result['conflicts'])
+        
+        # 탭 전환
+        self.main_window.tab_widget.setCurrentIndex(1)
+        
+        # 알림 표시
+        self.main_window.show_info_message("알림", f"{result['count']}개의 MCP 서버를 추가했습니다.")
     
     def _on_add(self):
         """추가 버튼 클릭 이벤트 핸들러"""
@@ -447,26 +1100,47 @@ class MCPConfigManager:
         if not self.main_window.show_confirm_message("확인", f"선택한 {len(selected_items)}개의 MCP 서버를 삭제하시겠습니까?"):
             return
         
-        # 현재 내 MCP 서버 목록 가져오기
-        my_mcp_servers = self.config_manager.get_mcp_servers()
-        
-        # 선택된 서버 삭제
-        for item in selected_items:
-            mcp_info = item.data(Qt.ItemDataRole.UserRole)
-            my_mcp_servers = [server for server in my_mcp_servers if server['name'] != mcp_info['name']]
+        # 선택된 서버 삭제 (작업 스레드에서 한 번의 저장으로 처리)
+        names = [item.data(Qt.ItemDataRole.UserRole)['name'] for item in selected_items]
+        self.main_window.statusBar().showMessage("MCP 서버를 삭제하는 중...")
+        self.config_async.delete_servers(
+            names,
+            on_done=self._on_delete_done,
+            on_error=lambda message: self.main_window.show_error_message("오류", f"MCP 서버 삭제 실패: {message}"))
+    
+    def _on_delete_done(self, result):
+        """
+        서버 삭제 완료 처리
         
-        # 설정 파일에 저장
-        if self.config_manager.save_mcp_servers(my_mcp_servers):
-            # 내 MCP 서버 목록 다시 로드
-            self._load_my_mcp_servers()
-            
-            # 알림 표시
-            self.main_window.show_info_message("알림", f"선택한 {len(selected_items)}개의 MCP 서버를 삭제했습니다.")
-        else:
+        Args:
+            result (dict): 작업 결과 ({'ok', 'conflicts', 'servers', 'count'})
+        """
+        if not result['ok']:
             self.main_window.show_error_message("오류", "MCP 서버 삭제 실패")
+            return
+        
+        # 내 MCP 서버 목록 다시 로드
+        self._load_my_mcp_servers(result['servers'])
+        self._report_conflicts(result['conflicts'])
+        
+        # 알림 표시
+        self.main_window.show_info_message("알림", f"{result['count']}개의 MCP 서버를 삭제했습니다.")
     
     def _on_move_up(self):
         """위로 버튼 클릭 이벤트 핸들러"""
+        self._move_selected_my_mcp(-1)
+    
+    def _on_move_down(self):
+        """아래로 버튼 클릭 이벤트 핸들러"""
+        self._move_selected_my_mcp(1)
+    
+    def _move_selected_my_mcp(self, direction):
+        """
+        선택된 내 MCP 서버들을 한 칸씩 이동합니다. 모든 이동은 한 번의 저장으로 처리됩니다.
+        
+        Args:
+            direction (int): -1이면 위로, 1이면 아래로
+        """
         # 선택된 항목 가져오기
         selected_items = self.main_window.my_mcp_list.selectedItems()
         
@@ -474,98 +1148,172 @@ class MCPConfigManager:
             self.main_window.show_info_message("알림", "이동할 MCP 서버를 선택하세요.")
             return
         
-        # 현재 내 MCP 서버 목록 가져오기
-        my_mcp_servers = self.config_manager.get_mcp_servers()
-        
-        # 선택된 서버 이동
-        for item in selected_items:
-            # 현재 인덱스 가져오기
-            current_index = self.main_window.my_mcp_list.row(item)
-            
-            # 첫 번째 항목이면 이동 불가
-            if current_index == 0:
-                continue
-            
-            # 서버 이동
-            if self.config_manager.move_mcp_server(current_index, current_index - 1):
-                # 내 MCP 서버 목록 다시 로드
-                self._load_my_mcp_servers()
-                
-                # 이동된 항목 선택
-                self.main_window.my_mcp_list.item(current_index - 1).setSelected(True)
-            else:
-                self.main_window.show_error_message("오류", "MCP 서버 이동 실패")
+        # 작업 스레드에서 한 번의 저장으로 이동
+        rows = [self.main_window.my_mcp_list.row(item) for item in selected_items]
+        self.config_async.move_servers(
+            rows, direction,
+            on_done=self._on_move_done,
+            on_error=lambda message: self.main_window.show_error_message("오류", f"MCP 서버 이동 실패: {message}"))
     
-    def _on_move_down(self):
-        """아래로 버튼 클릭 이벤트 핸들러"""
-        # 선택된 항목 가져오기
-        selected_items = self.main_window.my_mcp_list.selectedItems()
+    def _on_move_done(self, result):
+        """
+        서버 이동 완료 처리
         
-        if not selected_items:
-            self.main_window.show_info_message("알림", "이동할 MCP 서버를 선택하세요.")
+        Args:
+            result (dict): 작업 결과 ({'ok', 'conflicts', 'servers', 'count', 'rows'})
+        """
+        if not result['ok']:
+            self.main_window.show_error_message("오류", "MCP 서버 이동 실패")
             return
         
-        # 현재 내 MCP 서버 목록 가져오기
-        my_mcp_servers = self.config_manager.get_mcp_servers()
+        if result['count']:
+            # 내 MCP 서버 목록 다시 로드 후 이동된 항목 선택
+            self._load_my_mcp_servers(result['servers'])
+            self._report_conflicts(result['conflicts'])
+            for row in result['rows']:
+                item = self.main_window.my_mcp_list.item(row)
+                if item is not None:
+                    item.setSelected(True)
+    
+    def _report_conflicts(self, conflicts=None):
+        """
+        마지막 저장에서 다른 프로그램의 변경과 충돌한 항목을 알립니다.
+        충돌하지 않은 변경은 이미 병합되어 저장되었습니다.
         
-        # 선택된 서버 이동
-        for item in selected_items:
-            # 현재 인덱스 가져오기
-            current_index = self.main_window.my_mcp_list.row(item)
-            
-            # 마지막 항목이면 이동 불가
-            if current_index == len(my_mcp_servers) - 1:
-                continue
-            
-            # 서버 이동
-            if self.config_manager.move_mcp_server(current_index, current_index + 1):
-                # 내 MCP 서버 목록 다시 로드
-                self._load_my_mcp_servers()
-                
-                # 이동된 항목 선택
-                self.main_window.my_mcp_list.item(current_index + 1).setSelected(True)
-            else:
-                self.main_window.show_error_message("오류", "MCP 서버 이동 실패")
+        Args:
+            conflicts (list, optional): 작업 결과의 충돌 목록. 기본값은 None으로,
+                                       이 경우 ConfigManager.last_conflicts를 사용합니다.
+        
+        Returns:
+            bool: 충돌 여부
+        """
+        if conflicts is None:
+            conflicts = self.config_manager.last_conflicts
+        if not conflicts:
+            return False
+        names = "\n".join(f"- {conflict['name'] or '서버 순서'}" for conflict in conflicts)
+        self.main_window.show_info_message(
+            "알림",
+            f"다른 프로그램에서 변경된 설정과 충돌하여 다음 항목은 외부 변경을 유지했습니다.\n{names}\n\n"
+            "나머지 변경은 병합하여 저장했습니다. 다시 저장하면 현재 목록으로 덮어씁니다.")
+        return True
     
     def _on_save(self):
         """저장 버튼 클릭 이벤트 핸들러"""
-        # 현재 내 MCP 서버 목록 가져오기
-        my_mcp_servers = self.config_manager.get_mcp_servers()
+        # 현재 내 MCP 서버 목록을 설정 파일에 저장 (작업 스레드, 내용이 같으면 저장과 백업 생략)
+        self.main_window.statusBar().showMessage("설정을 저장하는 중...")
+        self.config_async.save_servers(
+            on_done=self._on_save_done,
+            on_error=lambda message: self.main_window.show_error_message("오류", f"설정 저장 실패: {message}"))
+    
+    def _on_save_done(self, result):
+        """
+        설정 저장 완료 처리
         
-        # 설정 파일에 저장
-        if self.config_manager.save_mcp_servers(my_mcp_servers):
-            # 알림 표시
-            self.main_window.show_info_message("알림", "설정을 저장했습니다.")
-            
-            # Claude Desktop 재시작 확인
-            if self.main_window.show_confirm_message("확인", "변경 사항을 적용하려면 Claude Desktop을 재시작해야 합니다. 지금 재시작하시겠습니까?"):
-                # Claude Desktop 재시작
-                if utils.restart_claude_desktop():
-                    self.main_window.show_info_message("알림", "Claude Desktop을 재시작했습니다.")
-                else:
-                    self.main_window.show_error_message("오류", "Claude Desktop 재시작 실패")
-        else:
+        Args:
+            result (dict): 작업 결과 ({'ok', 'conflicts', 'servers', 'snapshot'})
+        """
+        if not result['ok']:
             self.main_window.show_error_message("오류", "설정 저장 실패")
+            return
+        if self._report_conflicts(result['conflicts']):
+            self._load_my_mcp_servers(result['servers'])
+        
+        # Claude Desktop이 실행 중인 설정과 비교하여 실제로 바뀐 서버 확인
+        snapshot = result['snapshot']
+        changes = self.config_manager.diff_launch(self.launched_servers, snapshot)
+        if not any(changes.values()):
+            self.main_window.show_info_message("알림", "설정을 저장했습니다. Claude Desktop에 적용할 변경 사항이 없습니다.")
+            return
+        
+        # 알림 표시
+        self.main_window.show_info_message("알림", "설정을 저장했습니다.")
+        
+        # Claude Desktop 재시작 확인 (바뀐 서버 목록 표시)
+        summary = "\n".join(f"{label}: {', '.join(changes[key])}"
+                            for key, label in (('added', "추가"), ('removed', "삭제"), ('changed', "변경"))
+                            if changes[key])
+        if self.main_window.show_confirm_message("확인", f"다음 서버가 변경되었습니다.\n{summary}\n\n변경 사항을 적용하려면 Claude Desktop을 재시작해야 합니다. 지금 재시작하시겠습니까?"):
+            # Claude Desktop 재시작
+            if utils.restart_claude_desktop():
+                self.launched_servers = snapshot
+                self.main_window.show_info_message("알림", "Claude Desktop을 재시작했습니다.")
+            else:
+                self.main_window.show_error_message("오류", "Claude Desktop 재시작 실패")
+    
+    def _on_undo(self):
+        """실행 취소 단축키 이벤트 핸들러"""
+        self._step_history(undo=True)
+    
+    def _on_redo(self):
+        """다시 실행 단축키 이벤트 핸들러"""
+        self._step_history(undo=False)
+    
+    def _step_history(self, undo):
+        """
+        마지막 서버 변경을 실행 취소하거나 다시 실행하고 내 MCP 목록을 갱신합니다.
+        
+        Args:
+            undo (bool): True이면 실행 취소, False이면 다시 실행
+        """
+        self.config_async.step_history(
+            undo,
+            on_done=lambda result: self._on_history_done(result, undo),
+            on_error=lambda message: self.main_window.show_error_message(
+                "오류", f"{'실행 취소' if undo else '다시 실행'} 실패: {message}"))
+    
+    def _on_history_done(self, result, undo):
+        """
+        실행 취소/다시 실행 완료 처리
+        
+        Args:
+            result (dict): 작업 결과 ({'ok', 'conflicts', 'servers', 'count'})
+            undo (bool): 실행 취소 여부
+        """
+        action = "실행 취소" if undo else "다시 실행"
+        if not result['ok']:
+            self.main_window.show_error_message("오류", f"{action} 실패")
+            return
+        if not result['count']:
+            self.main_window.statusBar().showMessage(f"{action}할 변경이 없습니다.")
+            return
+        
+        self._load_my_mcp_servers(result['servers'])
+        self._report_conflicts(result['conflicts'])
+        self.main_window.statusBar().showMessage(f"서버 변경을 {action}했습니다.")
     
     def _on_backup(self):
         """백업 버튼 클릭 이벤트 핸들러"""
-        # 설정 파일 백업
-        self.config_manager._backup_config()
-        
-        # 백업 목록 가져오기
-        backup_list = self.config_manager.get_backup_list()
+        # 설정 파일 백업 (작업 스레드, 최신 백업과 내용이 같으면 그 백업을 그대로 사용)
+        self.config_async.backup(REASON_MANUAL, on_done=self._on_backup_done,
+                                 on_error=lambda message: self._on_backup_done(None))
+    
+    def _on_backup_done(self, entry):
+        """
+        백업 완료 처리
         
+        Args:
+            entry (dict): 백업 항목. 실패하면 None
+        """
         # 알림 표시
-        if backup_list:
-            self.main_window.show_info_message("알림", f"설정 파일을 백업했습니다.\n최신 백업: {backup_list[0]['filename']}")
+        if entry:
+            self.main_window.show_info_message("알림", f"설정 파일을 백업했습니다.\n최신 백업: {entry['name']}")
         else:
             self.main_window.show_info_message("알림", "설정 파일 백업 실패")
     
     def _on_restore(self):
         """복원 버튼 클릭 이벤트 핸들러"""
-        # 백업 목록 가져오기
-        backup_list = self.config_manager.get_backup_list()
+        # 백업 목록 가져오기 (작업 스레드)
+        self.config_async.backup_list(on_done=self._on_backup_list_ready,
+                                      on_error=lambda message: self._on_backup_list_ready([]))
+    
+    def _on_backup_list_ready(self, backup_list):
+        """
+        복원할 백업 목록을 받아 확인 후 복원합니다.
         
+        Args:
+            backup_list (list): 백업 목록 (최신순)
+        """
         if not backup_list:
             self.main_window.show_info_message("알림", "복원할 백업 파일이 없습니다.")
             return
@@ -574,16 +1322,94 @@ class MCPConfigManager:
         if not self.main_window.show_confirm_message("확인", f"최신 백업({backup_list[0]['filename']})에서 설정을 복원하시겠습니까?"):
             return
         
-        # 설정 파일 복원
-        if self.config_manager.restore_backup():
+        # 확인한 최신 백업에서 설정 파일 복원 (작업 스레드)
+        self.main_window.statusBar().showMessage("설정을 복원하는 중...")
+        self.config_async.restore(
+            backup_list[0]['filename'],
+            on_done=self._on_restore_done,
+            on_error=lambda message: self.main_window.show_error_message("오류", f"설정 복원 실패: {message}"))
+    
+    def _on_restore_done(self, result):
+        """
+        복원 완료 처리
+        
+        Args:
+            result (dict): 작업 결과 ({'ok', 'conflicts', 'servers'})
+        """
+        if result['ok']:
             # 내 MCP 서버 목록 다시 로드
-            self._load_my_mcp_servers()
+            self._load_my_mcp_servers(result['servers'])
             
             # 알림 표시
             self.main_window.show_info_message("알림", "설정을 복원했습니다.")
         else:
             self.main_window.show_error_message("오류", "설정 복원 실패")
             
+    def _on_save_profile(self):
+        """프로필 저장 버튼 클릭 이벤트 핸들러"""
+        name = self.main_window.ask_text("프로필 저장", "프로필 이름 (영문, 숫자, '_', '-', '.'):")
+        if name is None:
+            return
+        
+        # 현재 설정의 모든 서버를 프로필로 저장 (작업 스레드)
+        self.config_async.save_profile(
+            name,
+            on_done=lambda result: self._on_save_profile_done(result, name),
+            on_error=lambda message: self.main_window.show_error_message("오류", f"프로필 저장 실패: {message}"))
+    
+    def _on_save_profile_done(self, result, name):
+        """
+        프로필 저장 완료 처리
+        
+        Args:
+            result (dict): 작업 결과 ({'ok', 'conflicts', 'servers', 'profiles'})
+            name (str): 프로필 이름
+        """
+        self.main_window.set_profiles(result['profiles'])
+        if not result['ok']:
+            self.main_window.show_error_message("오류", f"프로필 '{name}' 저장 실패")
+            return
+        self.main_window.statusBar().showMessage(f"프로필 '{name}'을(를) 저장했습니다.")
+    
+    def _on_profile_selected(self, index):
+        """
+        프로필 선택 이벤트 핸들러
+        
+        Args:
+            index (int): 선택한 프로필 항목 위치
+        """
+        name = self.main_window.profile_combo.itemData(index)
+        if name is None:
+            return
+        
+        if not self.main_window.show_confirm_message("확인", f"프로필 '{name}'(으)로 전환하시겠습니까? 현재 서버 목록이 프로필의 서버로 바뀝니다."):
+            self.config_async.profiles(on_done=self.main_window.set_profiles)
+            return
+        
+        # 프로필로 전환 (작업 스레드, 미리 만든 설정 파일로 한 번에 교체)
+        self.main_window.statusBar().showMessage(f"프로필 '{name}'(으)로 전환하는 중...")
+        self.config_async.switch_profile(
+            name,
+            on_done=lambda result: self._on_profile_switched(result, name),
+            on_error=lambda message: self.main_window.show_error_message("오류", f"프로필 전환 실패: {message}"))
+    
+    def _on_profile_switched(self, result, name):
+        """
+        프로필 전환 완료 처리
+        
+        Args:
+            result (dict): 작업 결과 ({'ok', 'conflicts', 'servers', 'profiles'})
+            name (str): 프로필 이름
+        """
+        self.main_window.set_profiles(result['profiles'])
+        if not result['ok']:
+            self.main_window.show_error_message("오류", f"프로필 '{name}' 전환 실패")
+            return
+        
+        # 내 MCP 서버 목록 다시 로드
+        self._load_my_mcp_servers(result['servers'])
+        self.main_window.statusBar().showMessage(f"프로필 '{name}'(으)로 전환했습니다.")
+    
     def _on_change_config_path(self):
         """설정 파일 경로 변경 버튼 클릭 이벤트 핸들러"""
         # 확인 메시지 표시
@@ -629,10 +1455,39 @@ class MCPConfigManager:
         self.main_window.show()
         
         # 애플리케이션 실행
-        return self.app.exec()
+        exit_code = self.app.exec()
+        
+        # 종료 시 진행 중인 작업자 프로세스 정리
+        if isinstance(getattr(self, 'loader_thread', None), MCPProcessLoaderThread):
+            self.loader_thread.cancel()
+            self.loader_thread.wait()
+        
+        # 보강 작업 중단 (남은 작업은 다음 실행에서 이어서 처리)
+        if self.enrichment_thread is not None:
+            self.enrichment_thread.requestInterruption()
+            self.enrichment_thread.wait()
+        
+        # 진행 중인 카탈로그 저장소/인덱스 갱신 마무리
+        self.catalog_worker.shutdown()
+        
+        self.config_watcher.stop()
+        
+        # 요청된 설정 작업을 마치고 쓰기를 기다리는 설정 변경 저장
+        self.config_async.shutdown()
+        self.config_manager.flush()
+        
+        # 대기 중인 아이콘 요청 취소 및 디스크 캐시 색인 저장
+        if self.image_loader is not None:
+            self.image_loader.shutdown()
+        self.readme_loader.shutdown()
+        
+        return exit_code
 
 def main():
     """메인 함수"""
+    # 패키징된 실행 파일에서 작업자 프로세스 지원
+    multiprocessing.freeze_support()
+    
     # MCP 설정 관리자 생성 및 실행
     manager = MCPConfigManager()
     sys.exit(manager.run())
@@ -21,6 +21,7 @@ def create_pyinstaller_command():
         "--windowed",
         "--clean",
         "--add-data=LICENSE:.",
+        f"--add-data=resources/catalog_bundle.json.gz{os.pathsep}resources" if os.path.exists("resources/catalog_bundle.json.gz") else "",
         "--icon=resources/icon.ico" if system == "Windows" else "--icon=resources/icon.icns" if system == "Darwin" else "",
     ]
     
@@ -72,6 +73,14 @@ VSVersionInfo(
     with open("version_info.txt", "w") as f:
         f.write(version_info)
 
+# 카탈로그 번들 생성
+def create_catalog_bundle():
+    """GitHub README에서 카탈로그 번들을 빌드하여 resources 디렉토리에 저장합니다."""
+    from crawler.catalog_bundle import main as build_catalog_bundle
+    
+    if build_catalog_bundle(["build", "--output", os.path.join("resources", "catalog_bundle.json.gz")]) != 0:
+        print("카탈로그 번들 생성 실패: 번들 없이 패키징합니다.")
+
 # 리소스 디렉토리 생성
 def create_resources():
     """리소스 디렉토리와 파일을 생성합니다."""
@@ -385,6 +394,10 @@ def main():
     print("리소스 파일 생성 중...")
     create_resources()
     
+    # 카탈로그 번들 생성
+    print("카탈로그 번들 생성 중...")
+    create_catalog_bundle()
+    
     # 라이센스 파일 생성
     print("라이센스 파일 생성 중...")
     create_license()
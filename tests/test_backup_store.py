@@ -0,0 +1,154 @@
+"""
+백업 저장소 테스트 스크립트
+
+내용 주소 기반 압축 백업 저장소와 ConfigManager 백업/복원 연동을 테스트합니다.
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.backup_store import BackupStore, REASON_ERROR, REASON_BEFORE_RESTORE
+from config.config_manager import ConfigManager
+from config.retention import RetentionPolicy
+
+class TestBackupStore(unittest.TestCase):
+    """백업 저장소 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.backup_dir = os.path.join(self.test_dir, "backups")
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_identical_content_stored_once(self):
+        """같은 내용이 한 번만 저장되는지 테스트"""
+        store = BackupStore(self.backup_dir)
+        first = store.put(b'{"a": 1}')
+        self.assertIs(store.put(b'{"a": 1}'), first)
+        store.put(b'{"a": 2}')
+        third = store.put(b'{"a": 1}')
+
+        self.assertEqual(third['hash'], first['hash'])
+        self.assertNotEqual(third['name'], first['name'])
+        self.assertEqual(len(store.entries()), 3)
+        blobs = [f for _, _, files in os.walk(store.objects_dir) for f in files]
+        self.assertEqual(len(blobs), 2)
+        self.assertEqual(store.get(first['name']), b'{"a": 1}')
+
+    def test_manifest_persists_and_prunes(self):
+        """매니페스트가 유지되고 최대 개수를 넘으면 참조 없는 blob을 지우는지 테스트"""
+        store = BackupStore(self.backup_dir, max_backups=3)
+        for i in range(5):
+            store.put(json.dumps({'v': i}).encode(), timestamp=1000.0 + i)
+
+        reopened = BackupStore(self.backup_dir, max_backups=3)
+        self.assertEqual([e['timestamp'] for e in reopened.entries()], [1004.0, 1003.0, 1002.0])
+        self.assertEqual(reopened.latest()['id'], 5)
+        self.assertEqual(reopened.put(b'new')['id'], 6)
+        blobs = [f for _, _, files in os.walk(store.objects_dir) for f in files]
+        self.assertEqual(len(blobs), 3)
+
+    def test_torn_manifest_record_discarded(self):
+        """기록 도중 잘린 매니페스트 레코드를 버리고 이어서 기록하는지 테스트"""
+        store = BackupStore(self.backup_dir)
+        store.put(b'one', timestamp=1000.0)
+        store.put(b'two', timestamp=1001.0)
+        with open(store.manifest_path, 'ab') as f:
+            f.write(b'{"op": "add", "entry": {"id": 3, "na')
+
+        reopened = BackupStore(self.backup_dir)
+        self.assertEqual([e['id'] for e in reopened.entries()], [2, 1])
+        reopened.put(b'three')
+        self.assertEqual([e['id'] for e in BackupStore(self.backup_dir).entries()], [3, 2, 1])
+
+    def test_rebuild_from_objects(self):
+        """매니페스트가 없으면 blob 디렉토리에서 다시 만드는지 테스트"""
+        store = BackupStore(self.backup_dir)
+        first = store.put(b'one')
+        store.put(b'two')
+        os.remove(store.manifest_path)
+
+        rebuilt = BackupStore(self.backup_dir)
+        self.assertEqual({e['hash'] for e in rebuilt.entries()}, {first['hash'], store.latest()['hash']})
+        self.assertTrue(all(e['reason'] == 'recovered' for e in rebuilt.entries()))
+        self.assertIn(rebuilt.get(rebuilt.latest()['name']), (b'one', b'two'))
+
+    def test_listing_reads_only_manifest(self):
+        """목록/최신/정리가 백업 디렉토리를 다시 훑지 않는지 테스트"""
+        store = BackupStore(self.backup_dir, max_backups=2)
+        with patch('config.backup_store.os.listdir', side_effect=AssertionError), \
+             patch('config.backup_store.os.path.getmtime', side_effect=AssertionError):
+            for i in range(4):
+                store.put(str(i).encode())
+            self.assertEqual(len(store.entries()), 2)
+            self.assertEqual(store.latest()['id'], 4)
+            self.assertEqual(store.remove([store.latest()['name']]), 1)
+
+    def test_legacy_backups_migrated(self):
+        """이전 버전의 백업 파일을 저장소로 옮기는지 테스트"""
+        os.makedirs(self.backup_dir)
+        for i, name in enumerate(["claude_desktop_config_20250101_000000.json",
+                                  "claude_desktop_config_20250102_000000_error.json"]):
+            path = os.path.join(self.backup_dir, name)
+            with open(path, 'w') as f:
+                json.dump({'v': i}, f)
+            os.utime(path, (1000.0 + i, 1000.0 + i))
+
+        store = BackupStore(self.backup_dir, retention=RetentionPolicy())
+        self.assertEqual([e['reason'] for e in store.entries()], [REASON_ERROR, 'save'])
+        self.assertEqual([json.loads(store.get(e['name'])) for e in store.entries()], [{'v': 1}, {'v': 0}])
+        # 원본은 삭제하지 않고 legacy 디렉토리에 보관
+        self.assertFalse(any(f.endswith('.json') and f.startswith('claude') for f in os.listdir(self.backup_dir)))
+        self.assertEqual(sorted(os.listdir(os.path.join(self.backup_dir, "legacy"))),
+                         ["claude_desktop_config_20250101_000000.json", "claude_desktop_config_20250102_000000_error.json"])
+
+        # 1년보다 오래된 백업이지만 보존 정책에서 제외되어 다시 열어도 남아 있음
+        store = BackupStore(self.backup_dir, retention=RetentionPolicy())
+        self.assertEqual(len(store.entries()), 2)
+        store.put(b'{"v": 2}')
+        self.assertEqual(len(store.entries()), 3)
+
+    def test_legacy_backups_sorted_by_time(self):
+        """기존 백업이 있을 때 이전 백업 파일이 시간 순서 자리에 들어가는지 테스트"""
+        store = BackupStore(self.backup_dir)
+        newest = store.put(b'{"v": "current"}', timestamp=5000.0)
+        path = os.path.join(self.backup_dir, "claude_desktop_config_20250101_000000.json")
+        with open(path, 'wb') as f:
+            f.write(b'{"v": "current"}')
+        os.utime(path, (1000.0, 1000.0))
+
+        store = BackupStore(self.backup_dir)
+        self.assertEqual([e['timestamp'] for e in store.entries()], [5000.0, 1000.0])
+        self.assertEqual(store.latest()['name'], newest['name'])
+        # 최신 백업과 같은 내용은 중복으로 건너뛰고, 매니페스트도 시간 순서로 다시 읽힘
+        self.assertIs(store.put(b'{"v": "current"}'), store.latest())
+        reopened = BackupStore(self.backup_dir)
+        self.assertEqual([e['timestamp'] for e in reopened.entries()], [5000.0, 1000.0])
+        self.assertEqual(reopened.latest()['name'], newest['name'])
+
+    def test_config_manager_restore(self):
+        """ConfigManager 백업/복원이 저장소를 사용하는지 테스트"""
+        config_path = os.path.join(self.test_dir, "claude_desktop_config.json")
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump({'mcpServers': {'alpha': {'command': 'npx'}}}, f)
+        manager = ConfigManager(config_path=config_path)
+
+        self.assertTrue(manager.delete_mcp_server('alpha'))
+        self.assertEqual(manager.get_backup_list()[0]['reason'], 'checkpoint')
+        self.assertTrue(manager.restore_backup())
+        self.assertEqual([s['name'] for s in manager.get_mcp_servers()], ['alpha'])
+        self.assertEqual(manager.get_backup_list()[0]['reason'], REASON_BEFORE_RESTORE)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+카탈로그 번들 테스트 스크립트
+
+카탈로그 번들의 빌드, 내보내기, 가져오기 기능을 테스트합니다.
+"""
+
+import os
+import sys
+import json
+import shutil
+import time
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler.catalog_bundle import build_bundle, export_bundle, import_bundle, read_bundle, main, BUNDLE_FILENAME
+from crawler.catalog_store import CatalogStore
+from crawler.github_crawler import GitHubCrawler
+
+class TestCatalogBundle(unittest.TestCase):
+    """카탈로그 번들 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.servers = [
+            {'name': 'Brave Search', 'description': 'Web search', 'category': 'search',
+             'installation_options': ['npm'], 'type': 'reference'},
+            {'name': 'Time', 'description': 'Time and timezone conversion', 'category': 'time',
+             'installation_options': ['npm', 'pip'], 'type': 'reference'},
+        ]
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_build_bundle(self):
+        """번들 빌드 테스트 (레코드, 버전. 카테고리와 검색 인덱스는 카탈로그 저장소가 만듦)"""
+        bundle = build_bundle(self.servers)
+        self.assertEqual(bundle['count'], 2)
+        self.assertEqual(bundle['records'], self.servers)
+        self.assertNotIn('categories', bundle)
+        self.assertNotIn('search_index', bundle)
+        self.assertEqual(bundle['catalog_version'], build_bundle(list(self.servers))['catalog_version'])
+
+    def test_export_import_roundtrip(self):
+        """내보내기 후 가져오기 테스트"""
+        bundle_path = os.path.join(self.test_dir, "export", BUNDLE_FILENAME)
+        export_bundle(self.servers, bundle_path)
+        self.assertEqual(read_bundle(bundle_path)['records'], self.servers)
+
+        cache_dir = os.path.join(self.test_dir, "cache")
+        store = CatalogStore(db_path=':memory:')
+        self.assertIsNotNone(import_bundle(bundle_path, cache_dir, catalog_store=store))
+        self.assertEqual(store.count(), 2)
+        with open(os.path.join(cache_dir, "mcp_servers.json"), 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f), self.servers)
+        store.close()
+
+    def test_cli_import_updates_catalog_store(self):
+        """명령줄 import가 캐시 디렉토리의 카탈로그 저장소도 갱신하는지 테스트"""
+        bundle_path = os.path.join(self.test_dir, "export", BUNDLE_FILENAME)
+        export_bundle(self.servers, bundle_path)
+        cache_dir = os.path.join(self.test_dir, "cache")
+        crawler = GitHubCrawler(cache_dir=cache_dir)
+        with patch('crawler.github_crawler.GitHubCrawler', return_value=crawler):
+            self.assertEqual(main(['import', bundle_path]), 0)
+
+        store = CatalogStore(db_path=os.path.join(cache_dir, "catalog.db"))
+        self.assertEqual(store.count(), 2)
+        self.assertEqual(store.get_history(limit=1)[0]['event'], 'bundle_import')
+        store.close()
+
+    def test_crawler_falls_back_to_bundle(self):
+        """캐시와 네트워크가 없을 때 번들 사용 테스트"""
+        cache_dir = os.path.join(self.test_dir, "cache")
+        export_bundle(self.servers, os.path.join(cache_dir, BUNDLE_FILENAME))
+        crawler = GitHubCrawler(cache_dir=cache_dir)
+        self.assertEqual(crawler.get_offline_servers(), self.servers)
+
+    def test_newer_bundle_preferred_over_stale_cache(self):
+        """캐시보다 나중에 만들어진 번들을 캐시 대신 사용하는지 테스트"""
+        cache_dir = os.path.join(self.test_dir, "cache")
+        crawler = GitHubCrawler(cache_dir=cache_dir)
+        crawler._save_cache(self.servers[:1])
+        past = time.time() - 3600
+        os.utime(crawler.servers_cache_file, (past, past))
+        self.assertEqual(crawler.get_offline_servers(), self.servers[:1])
+
+        export_bundle(self.servers, os.path.join(cache_dir, BUNDLE_FILENAME))
+        self.assertEqual(crawler.get_offline_servers(), self.servers)
+
+        # 번들 뒤에 갱신된 캐시는 그대로 사용
+        crawler._save_cache(self.servers[1:])
+        self.assertEqual(crawler.get_offline_servers(), self.servers[1:])
+
+    def test_invalid_bundle(self):
+        """잘못된 번들 파일 처리 테스트"""
+        bad_path = os.path.join(self.test_dir, BUNDLE_FILENAME)
+        with open(bad_path, 'wb') as f:
+            f.write(b"not a bundle")
+        self.assertIsNone(read_bundle(bad_path))
+
+if __name__ == "__main__":
+    unittest.main()
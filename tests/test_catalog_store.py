@@ -0,0 +1,114 @@
+"""
+카탈로그 저장소 테스트 스크립트
+
+SQLite 카탈로그 저장소의 저장, 검색, 필터, 정렬 기능을 테스트합니다.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler.catalog_store import CatalogStore
+
+class TestCatalogStore(unittest.TestCase):
+    """카탈로그 저장소 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.store = CatalogStore(db_path=':memory:')
+        self.servers = [
+            {
+                'name': 'Brave Search',
+                'description': "Web and local search using Brave's Search API",
+                'installation_options': ['npm', 'pip'],
+                'category': 'search',
+                'type': 'reference'
+            },
+            {
+                'name': 'Filesystem',
+                'description': 'Secure file operations with configurable access controls',
+                'installation_options': ['npm', 'pip'],
+                'category': 'document',
+                'type': 'reference'
+            },
+            {
+                'name': 'Tavily',
+                'description': 'Search engine for AI agents (search + extract)',
+                'installation_options': ['npm'],
+                'category': 'search',
+                'type': 'official'
+            }
+        ]
+        self.store.upsert_servers(self.servers)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.store.close()
+
+    def test_search_text(self):
+        """전문 검색 테스트"""
+        self.assertEqual(self.store.search_names(search_text='search'), ['Brave Search', 'Tavily'])
+        self.assertEqual(self.store.search_names(search_text='secu'), ['Filesystem'])
+
+    def test_search_text_infix(self):
+        """단어 중간의 부분 문자열도 찾는지 테스트 (LIKE 검색과 같은 결과)"""
+        self.store.upsert_servers(self.servers + [
+            {'name': 'GitHub', 'description': 'Repository management', 'category': 'development'},
+            {'name': 'Postgres', 'description': 'Read-only PostgreSQL access', 'category': 'database'},
+        ])
+        self.assertTrue(self.store.fts_enabled)
+        self.assertEqual(self.store.search_names(search_text='hub'), ['GitHub'])
+        self.assertEqual(self.store.search_names(search_text='sql'), ['Postgres'])
+        self.assertEqual(self.store.search_names(search_text='ystem'), ['Filesystem'])
+        # trigram보다 짧은 검색어는 LIKE 검색으로 처리
+        self.assertEqual(self.store.search_names(search_text='hu'), ['GitHub'])
+
+    def test_word_index_upgraded(self):
+        """이전 버전의 단어 단위 인덱스를 부분 문자열 인덱스로 다시 만드는지 테스트"""
+        test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, test_dir, ignore_errors=True)
+        db_path = os.path.join(test_dir, "catalog.db")
+        store = CatalogStore(db_path=db_path)
+        store.upsert_servers(self.servers)
+        with store.conn:
+            store.conn.executescript("""
+                DROP TABLE servers_fts;
+                CREATE VIRTUAL TABLE servers_fts USING fts5(
+                    name, description, content='servers', content_rowid='id', tokenize='unicode61');
+                INSERT INTO servers_fts(servers_fts) VALUES ('rebuild');
+            """)
+        store.close()
+
+        store = CatalogStore(db_path=db_path)
+        self.addCleanup(store.close)
+        self.assertEqual(store.search_names(search_text='avily'), ['Tavily'])
+
+    def test_filters(self):
+        """카테고리, 유형, 설치 방법 필터 테스트"""
+        self.assertEqual(self.store.search_names(category='Search'), ['Brave Search', 'Tavily'])
+        self.assertEqual(self.store.search_names(server_type='official'), ['Tavily'])
+        self.assertEqual(self.store.search_names(install_method='pip'), ['Brave Search', 'Filesystem'])
+
+    def test_upsert_prunes_and_keeps_enrichment(self):
+        """재저장 시 삭제 반영 및 보강 정보 유지 테스트"""
+        self.store.set_enrichment('Tavily', {'stars': 42})
+        self.store.upsert_servers(self.servers[1:])
+        self.assertEqual(self.store.count(), 2)
+        self.assertIsNone(self.store.get_server('Brave Search'))
+        self.assertEqual(self.store.search_names(sort='stars')[0], 'Tavily')
+        self.assertEqual(self.store.search_names(search_text='brave'), [])
+
+    def test_history(self):
+        """이력 기록 테스트"""
+        self.store.record_history('refresh', payload={'count': 3})
+        history = self.store.get_history()
+        self.assertEqual(history[0]['event'], 'refresh')
+        self.assertEqual(history[0]['payload'], {'count': 3})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+카탈로그 작업자 테스트 스크립트
+
+카탈로그 저장소 갱신, 유사 서버 인덱스 갱신, 순위 계산, 보강 정보 저장이 작업 스레드에서 실행되고
+완성된 결과만 메인 스레드 콜백으로 전달되는지 테스트합니다.
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+# 화면이 없는 환경에서도 Qt 이벤트 루프를 사용할 수 있도록 설정
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtWidgets import QApplication
+
+from crawler.catalog_store import CatalogStore
+from crawler.similarity import SimilarityIndex
+from crawler.ranking import SORT_POPULAR
+from ui.catalog_worker import CatalogWorker
+
+class TestCatalogWorker(unittest.TestCase):
+    """카탈로그 작업자 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        """QApplication 생성"""
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.test_dir, "catalog.db")
+        self.index_path = os.path.join(self.test_dir, "similarity_index.npz")
+        self.worker = CatalogWorker(db_path=self.db_path, index_path=self.index_path)
+        self.servers = [
+            {'name': 'Brave Search', 'description': 'Web search using Brave Search API', 'category': 'search'},
+            {'name': 'Tavily', 'description': 'Search engine for AI agents', 'category': 'search'},
+            {'name': 'SQLite', 'description': 'Database interaction', 'category': 'database'},
+        ]
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.worker.shutdown()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def wait_for(self, condition, timeout=5):
+        """조건이 참이 될 때까지 이벤트를 처리합니다."""
+        deadline = time.time() + timeout
+        while not condition() and time.time() < deadline:
+            self.app.processEvents()
+            time.sleep(0.01)
+        return condition()
+
+    def test_refresh_runs_on_worker(self):
+        """저장소, 인덱스, 순위 갱신이 작업 스레드에서 실행되고 원본 인덱스는 바뀌지 않는지 테스트"""
+        threads = set()
+        upsert = CatalogStore.upsert_servers
+        update = SimilarityIndex.update
+
+        def record_upsert(store, *args, **kwargs):
+            threads.add(threading.get_ident())
+            return upsert(store, *args, **kwargs)
+
+        def record_update(index, *args, **kwargs):
+            threads.add(threading.get_ident())
+            return update(index, *args, **kwargs)
+
+        original = SimilarityIndex()
+        results = []
+        with patch.object(CatalogStore, 'upsert_servers', record_upsert), \
+             patch.object(SimilarityIndex, 'update', record_update):
+            self.worker.refresh(self.servers, original, on_done=results.append)
+            self.assertTrue(self.wait_for(lambda: results))
+
+        self.assertEqual(len(threads), 1)
+        self.assertNotIn(threading.get_ident(), threads)
+        result = results[0]
+        self.assertIs(result['servers'], self.servers)
+        self.assertEqual(original.names, [])
+        self.assertEqual(result['similarity_index'].most_similar('Brave Search', k=1)[0][0], 'Tavily')
+        self.assertEqual(result['ranking'].names, ['Brave Search', 'Tavily', 'SQLite'])
+        self.assertTrue(os.path.exists(self.index_path))
+
+        store = CatalogStore(self.db_path)
+        self.assertEqual(store.count(), 3)
+        self.assertEqual(store.get_history(limit=1)[0]['event'], 'refresh')
+        store.close()
+
+    def test_enrichment_saved_and_ranked(self):
+        """보강 정보를 작업 스레드에서 합쳐 저장하고 다음 순위 계산에 반영하는지 테스트"""
+        self.worker.refresh(self.servers, SimilarityIndex()).result(5)
+        self.assertTrue(self.worker.save_enrichment('SQLite', {'stars': 500}).result(5))
+        self.assertTrue(self.worker.save_enrichment('SQLite', {'archived': False}).result(5))
+
+        results = []
+        self.worker.rank(self.servers, on_done=results.append)
+        self.assertTrue(self.wait_for(lambda: results))
+        ranking = results[0]['ranking']
+        self.assertEqual(ranking.ordered(self.servers, SORT_POPULAR)[0]['name'], 'SQLite')
+
+        store = CatalogStore(self.db_path)
+        self.assertEqual(store.get_enrichment('SQLite'), {'stars': 500, 'archived': False})
+        store.close()
+
+    def test_without_store(self):
+        """카탈로그 저장소 없이도 인덱스와 순위를 계산하는지 테스트"""
+        worker = CatalogWorker(index_path=self.index_path)
+        self.addCleanup(worker.shutdown)
+        result = worker.refresh(self.servers, SimilarityIndex()).result(5)
+        self.assertEqual(len(result['ranking'].names), 3)
+        self.assertFalse(worker.save_enrichment('SQLite', {'stars': 1}).result(5))
+
+if __name__ == "__main__":
+    unittest.main()
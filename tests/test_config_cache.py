@@ -0,0 +1,91 @@
+"""
+설정 캐시 테스트 스크립트
+
+ConfigManager의 파일 상태(mtime_ns, 크기, inode) 기반 설정 캐시를 테스트합니다.
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config_manager import ConfigManager
+
+class TestConfigCache(unittest.TestCase):
+    """설정 캐시 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.test_dir, "claude_desktop_config.json")
+        self.write_config({'alpha': {'command': 'npx', 'args': ['-y', 'alpha']}})
+        self.manager = ConfigManager(config_path=self.config_path)
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def write_config(self, servers):
+        """설정 파일을 외부에서 직접 작성합니다 (새 inode)."""
+        temp_path = self.config_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'mcpServers': servers}, f)
+        os.replace(temp_path, self.config_path)
+
+    def test_repeated_reads_use_cache(self):
+        """파일이 바뀌지 않으면 다시 읽지 않는지 테스트"""
+        for _ in range(5):
+            self.assertEqual([s['name'] for s in self.manager.get_mcp_servers()], ['alpha'])
+        self.assertEqual(self.manager.cache_stats['disk_reads'], 1)
+        self.assertEqual(self.manager.cache_stats['avoided_reads'], 4)
+
+    def test_reload_log_has_no_secrets(self):
+        """다시 읽을 때 설정 내용(env 비밀 값)을 로그에 남기지 않고 서버 수를 바르게 기록하는지 테스트"""
+        self.write_config({'alpha': {'command': 'npx', 'env': {'API_KEY': 'sk-secret'}}, 'beta': {'command': 'uvx'}})
+        with self.assertLogs('config_manager', level='DEBUG') as logs:
+            self.manager.get_mcp_servers()
+        output = "\n".join(logs.output)
+        self.assertNotIn('sk-secret', output)
+        self.assertIn("MCP 서버 수: 2", output)
+
+    def test_external_change_detected(self):
+        """외부에서 파일을 바꾸면 다시 읽는지 테스트"""
+        self.manager.get_mcp_servers()
+        self.write_config({'beta': {'command': 'uvx'}})
+        self.assertEqual([s['name'] for s in self.manager.get_mcp_servers()], ['beta'])
+        self.assertEqual(self.manager.cache_stats['disk_reads'], 2)
+
+    def test_save_updates_cache(self):
+        """저장 후 다시 읽지 않고 캐시를 사용하는지 테스트"""
+        self.assertTrue(self.manager.add_mcp_server({'name': 'gamma', 'command': 'npx', 'args': []}))
+        reads = self.manager.cache_stats['disk_reads']
+        self.assertEqual([s['name'] for s in self.manager.get_mcp_servers()], ['alpha', 'gamma'])
+        self.assertEqual(self.manager.cache_stats['disk_reads'], reads)
+
+    def test_returned_values_are_copies(self):
+        """반환된 값을 수정해도 캐시가 바뀌지 않는지 테스트"""
+        servers = self.manager.get_mcp_servers()
+        servers[0]['args'].append('--mutated')
+        servers.append({'name': 'ghost'})
+        config = self.manager.load_config()
+        config['mcpServers']['alpha']['command'] = 'mutated'
+
+        self.assertEqual(self.manager.get_mcp_servers()[0]['args'], ['-y', 'alpha'])
+        self.assertEqual(self.manager.load_config()['mcpServers']['alpha']['command'], 'npx')
+        self.assertEqual(len(self.manager.get_mcp_servers()), 1)
+
+    def test_restore_invalidates_cache(self):
+        """백업 복원 후 복원된 내용을 읽는지 테스트"""
+        self.manager._backup_config()
+        self.assertTrue(self.manager.delete_mcp_server('alpha'))
+        self.assertEqual(self.manager.get_mcp_servers(), [])
+        self.assertTrue(self.manager.restore_backup())
+        self.assertEqual([s['name'] for s in self.manager.get_mcp_servers()], ['alpha'])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+설정 변경 감지 테스트 스크립트
+
+정규화된 설정 해시로 변경 없는 저장/백업을 생략하고,
+Claude Desktop 실행 설정이 바뀐 서버를 정확히 보고하는지 테스트합니다.
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config_manager import ConfigManager
+
+class TestConfigChanges(unittest.TestCase):
+    """설정 변경 감지 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.test_dir, "claude_desktop_config.json")
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'globalShortcut': 'Ctrl+Space',
+                'mcpServers': {
+                    'fetch': {'command': 'uvx', 'args': ['mcp-server-fetch']},
+                    'git': {'command': 'uvx', 'args': ['mcp-server-git'], 'env': {'A': '1', 'B': '2'}},
+                },
+            }, f)
+        self.manager = ConfigManager(config_path=self.config_path)
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def backups(self):
+        return os.listdir(self.manager.backup_dir)
+
+    def test_unchanged_save_skips_write_and_backup(self):
+        """변경 없는 저장은 파일 쓰기와 백업을 생략하는지 테스트"""
+        mtime = os.stat(self.config_path).st_mtime_ns
+        self.assertTrue(self.manager.save_mcp_servers(self.manager.get_mcp_servers()))
+        self.assertEqual(os.stat(self.config_path).st_mtime_ns, mtime)
+        self.assertEqual(self.backups(), [])
+
+    def test_hash_ignores_key_order_and_empty_values(self):
+        """키 순서와 빈 값의 차이를 무시하는지 테스트"""
+        a = {'mcpServers': {'x': {'command': 'npx', 'args': [], 'env': {'B': '2', 'A': '1'}}}}
+        b = {'mcpServers': {'x': {'env': {'A': '1', 'B': '2'}, 'command': 'npx', 'cwd': None}}}
+        c = {'mcpServers': {'x': {'command': 'npx', 'env': {'A': '1', 'B': '3'}}}}
+        self.assertEqual(self.manager.config_hash(a), self.manager.config_hash(b))
+        self.assertNotEqual(self.manager.config_hash(a), self.manager.config_hash(c))
+
+    def test_reorder_is_not_a_launch_change(self):
+        """순서 변경은 저장되지만 실행 설정 변경으로 보고되지 않는지 테스트"""
+        self.assertTrue(self.manager.move_mcp_server(0, 1))
+        self.assertEqual([s['name'] for s in self.manager.get_mcp_servers()], ['git', 'fetch'])
+        self.assertEqual(self.manager.last_changes, {'added': [], 'removed': [], 'changed': []})
+
+    def test_reports_changed_servers(self):
+        """추가/삭제/변경된 서버를 보고하는지 테스트"""
+        before = self.manager.launch_snapshot()
+        with self.manager.transaction() as txn:
+            txn.update('git', {'name': 'git', 'command': 'uvx', 'args': ['mcp-server-git', '--repo', '.']})
+            txn.delete('fetch')
+            txn.add({'name': 'time', 'command': 'uvx', 'args': ['mcp-server-time']})
+        expected = {'added': ['time'], 'removed': ['fetch'], 'changed': ['git']}
+        self.assertEqual(self.manager.last_changes, expected)
+        self.assertEqual(self.manager.diff_launch(before, self.manager.launch_snapshot()), expected)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,8 @@
 import os
 import sys
 import json
+import shutil
+import tempfile
 
 # 상위 디렉토리를 모듈 검색 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -17,11 +19,19 @@ def test_config_manager():
     """설정 파일 관리자 테스트 함수"""
     print("설정 파일 관리자 테스트를 시작합니다...")
     
-    # 테스트용 설정 디렉토리 설정
-    test_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_config")
-    os.makedirs(test_dir, exist_ok=True)
+    # 테스트용 설정 디렉토리 설정 (저장소의 테스트 파일을 바꾸지 않도록 임시 디렉토리에 복사)
+    fixture_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_config")
+    test_dir = tempfile.mkdtemp()
+    shutil.copytree(fixture_dir, test_dir, dirs_exist_ok=True)
     test_config_path = os.path.join(test_dir, "test_claude_desktop_config.json")
     
+    try:
+        _run_config_manager_checks(test_config_path)
+    finally:
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+def _run_config_manager_checks(test_config_path):
+    """설정 파일 관리자 기능을 차례로 실행합니다."""
     # ConfigManager 인스턴스 생성
     config_manager = ConfigManager(config_path=test_config_path)
     
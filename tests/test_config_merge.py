@@ -0,0 +1,121 @@
+"""
+설정 3-way 병합 테스트 스크립트
+
+불러온 뒤 외부에서 바뀐 설정을 저장 시 서버 단위로 병합하고 충돌을 보고하는지 테스트합니다.
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config_manager import ConfigManager, merge_configs
+
+class TestConfigMerge(unittest.TestCase):
+    """설정 3-way 병합 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.test_dir, "claude_desktop_config.json")
+        self.write_external({'globalShortcut': 'Ctrl+Space', 'mcpServers': {
+            'alpha': {'command': 'npx', 'args': ['alpha']},
+            'beta': {'command': 'uvx', 'args': ['beta']},
+            'gamma': {'command': 'npx', 'args': ['gamma']},
+        }})
+        self.manager = ConfigManager(config_path=self.config_path)
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def write_external(self, config):
+        """다른 프로세스의 저장을 흉내 냅니다."""
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump(config, f)
+        # 같은 크기로 빠르게 다시 쓰여도 변경이 감지되도록 mtime을 바꿈
+        st = os.stat(self.config_path)
+        os.utime(self.config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1000))
+
+    def external(self, edit):
+        with open(self.config_path, encoding='utf-8') as f:
+            config = json.load(f)
+        edit(config)
+        self.write_external(config)
+
+    def on_disk(self):
+        with open(self.config_path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def test_non_conflicting_changes_merged(self):
+        """양쪽의 서로 다른 서버 변경이 모두 반영되는지 테스트"""
+        servers = self.manager.get_mcp_servers()
+        self.external(lambda c: (c['mcpServers'].update(delta={'command': 'npx'}),
+                                 c['mcpServers']['beta'].update(args=['beta', '--v2']),
+                                 c.update(globalShortcut='Alt+Space')))
+
+        servers = [s for s in servers if s['name'] != 'gamma']
+        servers.append({'name': 'epsilon', 'command': 'uvx'})
+        self.assertTrue(self.manager.save_mcp_servers(servers))
+        self.assertEqual(self.manager.last_conflicts, [])
+
+        config = self.on_disk()
+        self.assertEqual(list(config['mcpServers']), ['alpha', 'beta', 'delta', 'epsilon'])
+        self.assertEqual(config['mcpServers']['beta']['args'], ['beta', '--v2'])
+        self.assertEqual(config['globalShortcut'], 'Alt+Space')
+
+    def test_conflict_keeps_theirs_and_reports(self):
+        """같은 서버를 양쪽에서 다르게 바꾸면 외부 값을 유지하고 충돌로 보고하는지 테스트"""
+        servers = self.manager.get_mcp_servers()
+        self.external(lambda c: (c['mcpServers']['alpha'].update(args=['alpha', '--theirs']),
+                                 c['mcpServers'].pop('beta')))
+
+        servers[0]['args'] = ['alpha', '--ours']
+        servers[1]['args'] = ['beta', '--ours']
+        servers[2]['args'] = ['gamma', '--ours']
+        self.assertTrue(self.manager.save_mcp_servers(servers))
+        self.assertEqual([(c['type'], c['name']) for c in self.manager.last_conflicts],
+                         [('server', 'alpha'), ('server', 'beta')])
+        self.assertIsNone(self.manager.last_conflicts[1]['theirs'])
+
+        config = self.on_disk()
+        self.assertEqual(config['mcpServers']['alpha']['args'], ['alpha', '--theirs'])
+        self.assertNotIn('beta', config['mcpServers'])
+        self.assertEqual(config['mcpServers']['gamma']['args'], ['gamma', '--ours'])
+
+        # 충돌 확인 후 다시 저장하면 우리 값이 반영됨
+        self.assertTrue(self.manager.save_mcp_servers(servers))
+        self.assertEqual(self.manager.last_conflicts, [])
+        self.assertEqual(self.on_disk()['mcpServers']['alpha']['args'], ['alpha', '--ours'])
+
+    def test_transaction_merges_and_keeps_journal_consistent(self):
+        """트랜잭션 도중 외부 변경이 있으면 병합하고 저널 재생 결과가 파일과 같은지 테스트"""
+        with self.manager.transaction() as txn:
+            txn.move(2, 0)
+            self.external(lambda c: c['mcpServers'].update(delta={'command': 'npx'}))
+        self.assertTrue(txn.committed)
+
+        config = self.on_disk()
+        self.assertEqual(list(config['mcpServers']), ['gamma', 'alpha', 'beta', 'delta'])
+        self.assertEqual(self.manager.config_hash(self.manager.config_at()), self.manager.config_hash(config))
+
+        # 이후 변경은 다시 저널에 기록
+        self.assertTrue(self.manager.delete_mcp_server('delta'))
+        self.assertEqual(self.manager.journal_history()[-1]['ops'], [['delete', 'delta']])
+
+    def test_order_conflict(self):
+        """양쪽에서 서버 순서를 다르게 바꾸면 외부 순서를 유지하는지 테스트"""
+        base = {'mcpServers': {'a': {}, 'b': {}, 'c': {}}}
+        ours = {'mcpServers': {'c': {}, 'a': {}, 'b': {}, 'x': {}}}
+        theirs = {'mcpServers': {'b': {}, 'a': {}, 'y': {}, 'c': {}}}
+        merged, conflicts = merge_configs(base, ours, theirs)
+        self.assertEqual([c['type'] for c in conflicts], ['order'])
+        self.assertEqual(list(merged['mcpServers']), ['b', 'a', 'y', 'c', 'x'])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+설정 트랜잭션 테스트 스크립트
+
+ConfigManager.transaction()의 일괄 저장과 롤백 동작을 테스트합니다.
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config_manager import ConfigManager
+
+class TestConfigTransaction(unittest.TestCase):
+    """설정 트랜잭션 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.test_dir, "claude_desktop_config.json")
+        servers = {f"server-{i}": {'command': 'npx', 'args': [str(i)]} for i in range(60)}
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({'mcpServers': servers}, f)
+        self.manager = ConfigManager(config_path=self.config_path)
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def names(self):
+        return [server['name'] for server in self.manager.get_mcp_servers()]
+
+    def test_batch_writes_once(self):
+        """여러 변경이 한 번의 검증/백업/저장으로 처리되는지 테스트"""
+        with patch.object(self.manager, '_backup_config', wraps=self.manager._backup_config) as backup, \
+             patch.object(self.manager, '_validate_config', wraps=self.manager._validate_config) as validate:
+            with self.manager.transaction() as txn:
+                for row in range(10, 60):
+                    self.assertTrue(txn.move(row, row - 1))
+                self.assertTrue(txn.add({'name': 'new', 'command': 'uvx'}))
+                self.assertFalse(txn.add({'name': 'new'}))
+                self.assertTrue(txn.delete('server-0'))
+                self.assertTrue(txn.update('server-1', {'name': 'renamed', 'command': 'docker'}))
+
+        self.assertTrue(txn.committed)
+        self.assertEqual(backup.call_count, 1)
+        self.assertEqual(validate.call_count, 1)
+        names = self.names()
+        self.assertEqual(names[:3], ['renamed', 'server-2', 'server-3'])
+        # 선택된 10~59번이 한 칸씩 올라가고 9번은 그 아래로 이동
+        self.assertEqual(names[8:10], ['server-10', 'server-11'])
+        self.assertEqual(names[-2:], ['server-9', 'new'])
+
+    def test_rollback_on_error(self):
+        """블록에서 예외가 발생하면 아무것도 저장하지 않는지 테스트"""
+        with open(self.config_path, 'rb') as f:
+            before = f.read()
+        with self.assertRaises(RuntimeError):
+            with self.manager.transaction() as txn:
+                txn.delete('server-5')
+                raise RuntimeError("중단")
+        self.assertFalse(txn.committed)
+        with open(self.config_path, 'rb') as f:
+            self.assertEqual(f.read(), before)
+        self.assertIn('server-5', self.names())
+
+    def test_failed_write_keeps_file(self):
+        """저장 중 실패해도 기존 파일이 유지되는지 테스트"""
+        with patch('config.config_manager.json_io.dump', side_effect=OSError("disk full")):
+            self.assertFalse(self.manager.delete_mcp_server('server-5'))
+        self.assertIn('server-5', self.names())
+        self.assertEqual(len(self.names()), 60)
+
+    def test_no_changes_no_write(self):
+        """변경이 없으면 저장하지 않는지 테스트"""
+        with patch.object(self.manager, 'save_config') as save:
+            with self.manager.transaction() as txn:
+                txn.delete('missing')
+        save.assert_not_called()
+        self.assertIsNone(txn.committed)
+
+    def test_concurrent_write_waits_for_commit(self):
+        """트랜잭션이 열려 있는 동안 다른 스레드의 쓰기가 기다렸다가 커밋 뒤에 반영되는지 테스트"""
+        other = threading.Thread(target=self.manager.add_mcp_server, args=({'name': 'other', 'command': 'uvx'},))
+        with self.manager.transaction() as txn:
+            txn.delete('server-0')
+            other.start()
+            other.join(0.2)
+            self.assertTrue(other.is_alive())
+        other.join(5)
+
+        self.assertTrue(txn.committed)
+        self.assertEqual(self.manager.last_conflicts, [])
+        self.assertNotIn('server-0', self.names())
+        self.assertEqual(self.names()[-1], 'other')
+
+if __name__ == "__main__":
+    unittest.main()
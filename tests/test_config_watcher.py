@@ -0,0 +1,124 @@
+"""
+설정 파일 감시 테스트 스크립트
+
+설정 파일 외부 변경 감지(내용 비교, 파일 교체 후 재등록)와
+내 MCP 목록의 변경분 반영을 테스트합니다.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+# 화면이 없는 환경에서도 위젯을 사용할 수 있도록 설정
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import Qt
+
+from ui import config_watcher
+from ui.config_watcher import ConfigWatcher
+from ui.main_window import MainWindow
+
+class TestConfigWatcher(unittest.TestCase):
+    """설정 파일 감시 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, "claude_desktop_config.json")
+        self.write({'alpha': {'command': 'npx'}})
+        self.watcher = ConfigWatcher([self.path], poll_ms=0)
+        # 기준 내용은 작업 스레드에서 기록하므로 기록이 끝날 때까지 기다림
+        self.watcher.pool.waitForDone()
+        self.changed = []
+        self.watcher.file_changed.connect(self.changed.append)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.watcher.stop()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def write(self, servers, mtime=None):
+        """설정 파일을 임시 파일로 쓴 뒤 교체합니다 (편집기 저장 방식)."""
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'mcpServers': servers}, f)
+        os.replace(temp_path, self.path)
+        if mtime is not None:
+            os.utime(self.path, (mtime, mtime))
+
+    def wait_for(self, condition, timeout=5.0):
+        """조건이 참이 될 때까지 이벤트를 처리하며 기다립니다."""
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                return False
+            self.app.processEvents()
+            time.sleep(0.01)
+        return True
+
+    def test_only_content_changes_reported(self):
+        """내용이 바뀐 경우에만 알리는지 테스트"""
+        self.assertEqual(self.watcher.check_now().result(5)[0], [])
+        self.write({'alpha': {'command': 'npx'}}, mtime=1000)
+        self.assertEqual(self.watcher.check_now().result(5)[0], [])
+        self.write({'alpha': {'command': 'uvx'}}, mtime=2000)
+        self.assertEqual(self.watcher.check_now().result(5)[0], [self.path])
+        self.assertTrue(self.wait_for(lambda: self.changed == [self.path]))
+        # 교체된 파일도 다시 감시
+        self.watcher.watcher.removePath(self.path)
+        self.watcher._on_event(self.path)
+        self.assertTrue(self.watcher.debounce_timer.isActive())
+        self.assertTrue(self.wait_for(lambda: self.path in self.watcher.watcher.files()))
+        self.assertEqual(self.changed, [self.path])
+
+    def test_checks_run_off_main_thread(self):
+        """파일 상태 확인과 내용 해시를 메인 스레드에서 하지 않는지 테스트"""
+        threads = set()
+        digest = config_watcher._content_digest
+        stat_key = config_watcher._stat_key
+        with patch.object(config_watcher, '_content_digest', lambda path: threads.add(threading.get_ident()) or digest(path)), \
+             patch.object(config_watcher, '_stat_key', lambda path: threads.add(threading.get_ident()) or stat_key(path)):
+            self.write({'beta': {'command': 'uvx'}}, mtime=3000)
+            self.watcher._poll()
+            self.assertTrue(self.wait_for(lambda: self.changed == [self.path]))
+            self.watcher.add_path(os.path.join(self.test_dir, "other.json"))
+            self.watcher.check_now().result(5)
+        self.assertTrue(threads)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    def test_minimal_list_update(self):
+        """내 MCP 목록에 바뀐 항목만 반영하는지 테스트"""
+        window = MainWindow()
+        servers = [{'name': name, 'command': 'npx'} for name in ('a', 'b', 'c', 'd')]
+        window.populate_my_mcp_list(servers)
+        kept = window.my_mcp_list.item(2)
+        kept.setSelected(True)
+
+        new_servers = [{'name': 'c', 'command': 'npx'}, {'name': 'a', 'command': 'uvx'},
+                       {'name': 'e', 'command': 'npx'}, {'name': 'd', 'command': 'npx'}]
+        counts = window.update_my_mcp_list(new_servers)
+
+        self.assertEqual(counts, {'added': 1, 'removed': 1, 'updated': 1, 'moved': 1})
+        items = [window.my_mcp_list.item(row) for row in range(window.my_mcp_list.count())]
+        self.assertEqual([item.text() for item in items], ['c', 'a', 'e', 'd'])
+        self.assertEqual(items[1].data(Qt.ItemDataRole.UserRole)['command'], 'uvx')
+        self.assertIs(items[0], kept)
+        self.assertTrue(kept.isSelected())
+        self.assertEqual(window.update_my_mcp_list(new_servers), {'added': 0, 'removed': 0, 'updated': 0, 'moved': 0})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,224 @@
+"""
+설정 작업자 테스트 스크립트
+
+ConfigManager 작업이 작업 스레드에서 요청 순서대로 실행되고, 결과가 메인 스레드 콜백으로 전달되는지 테스트합니다.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+# 화면이 없는 환경에서도 Qt 이벤트 루프를 사용할 수 있도록 설정
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtWidgets import QApplication
+
+from config.config_manager import ConfigManager
+from config.backup_store import REASON_MANUAL
+from ui.config_worker import AsyncConfigManager
+from ui.main_window import MainWindow
+from config.config_manager import MANAGER_CONFIG_PATH
+from main import MCPConfigManager
+
+class TestConfigWorker(unittest.TestCase):
+    """설정 작업자 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        """QApplication 생성"""
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.test_dir, "claude_desktop_config.json")
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({'mcpServers': {'alpha': {'command': 'npx'}}}, f)
+        self.manager = ConfigManager(config_path=self.config_path)
+        self.worker = AsyncConfigManager(self.manager)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.worker.shutdown()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def wait_for(self, condition, timeout=5):
+        """조건이 참이 될 때까지 이벤트를 처리합니다."""
+        deadline = time.time() + timeout
+        while not condition() and time.time() < deadline:
+            self.app.processEvents()
+            time.sleep(0.01)
+        return condition()
+
+    def test_operations_run_in_order_off_main_thread(self):
+        """작업이 작업 스레드에서 요청 순서대로 실행되고 콜백은 메인 스레드에서 호출되는지 테스트"""
+        threads = []
+        results = []
+        self.worker.submit("스레드 확인", lambda manager: threads.append(threading.get_ident()))
+        self.worker.add_servers([{'name': 'beta', 'command': 'uvx'}], on_done=results.append)
+        self.worker.delete_servers(['alpha'], on_done=results.append)
+        last = self.worker.save_servers(on_done=lambda result: results.append(threading.get_ident()))
+
+        self.assertTrue(self.wait_for(lambda: len(results) == 3))
+        self.assertNotEqual(threads, [threading.get_ident()])
+        self.assertEqual([s['name'] for s in results[0]['servers']], ['alpha', 'beta'])
+        self.assertEqual([s['name'] for s in results[1]['servers']], ['beta'])
+        self.assertEqual(results[2], threading.get_ident())
+        self.assertTrue(last.result()['ok'])
+        self.assertIn('beta', last.result()['snapshot'])
+
+    def test_result_ok_means_no_error(self):
+        """추가/삭제 결과가 같은 규칙(오류 없음이면 성공)을 따르고 바뀐 서버 수를 따로 알려주는지 테스트"""
+        added = self.worker.add_servers([{'name': 'alpha', 'command': 'npx'}, {'name': 'beta', 'command': 'uvx'}])
+        self.assertEqual((added.result()['ok'], added.result()['count']), (True, 1))
+        # 바꿀 것이 없는 작업도 오류가 아니므로 성공
+        unchanged = self.worker.add_servers([{'name': 'beta', 'command': 'uvx'}])
+        self.assertEqual((unchanged.result()['ok'], unchanged.result()['count']), (True, 0))
+        missing = self.worker.delete_servers(['missing'])
+        self.assertEqual((missing.result()['ok'], missing.result()['count']), (True, 0))
+        deleted = self.worker.delete_servers(['alpha', 'missing'])
+        self.assertEqual((deleted.result()['ok'], deleted.result()['count']), (True, 1))
+
+        # 저장에 실패하면 실패
+        self.manager._validate_config = lambda config: False
+        failed = self.worker.delete_servers(['beta'])
+        self.assertEqual((failed.result()['ok'], failed.result()['count']), (False, 0))
+
+    def test_backup_list_and_restore(self):
+        """백업, 백업 목록, 복원 결과가 전달되는지 테스트"""
+        entries = []
+        self.worker.backup(REASON_MANUAL, on_done=entries.append)
+        self.worker.add_servers([{'name': 'beta', 'command': 'uvx'}])
+        listed = self.worker.backup_list(on_done=entries.append)
+        restored = self.worker.restore()
+        self.assertTrue(self.wait_for(lambda: len(entries) == 2))
+        self.assertTrue(entries[0]['name'])
+        self.assertTrue(listed.result())
+        self.assertTrue(restored.result()['ok'])
+        self.assertEqual([s['name'] for s in restored.result()['servers']], ['alpha'])
+
+    def test_restore_prompt_restores_named_backup(self):
+        """복원 확인 창에 표시한 최신 백업을 복원하는지 테스트 (저널의 직전 상태가 아님)"""
+        self.worker.backup(REASON_MANUAL).result()
+        self.worker.add_servers([{'name': 'beta', 'command': 'uvx'}]).result()
+        self.worker.add_servers([{'name': 'gamma', 'command': 'uvx'}]).result()
+        backup_list = self.worker.backup_list().result()
+
+        restored = []
+        window = MagicMock()
+        window.show_confirm_message.return_value = True
+        app = SimpleNamespace(main_window=window, config_async=self.worker, _on_restore_done=restored.append)
+        MCPConfigManager._on_backup_list_ready(app, backup_list)
+        self.assertTrue(self.wait_for(lambda: restored))
+
+        self.assertIn(backup_list[0]['filename'], window.show_confirm_message.call_args.args[1])
+        with open(self.config_path, 'rb') as f:
+            self.assertEqual(f.read(), self.manager.backup_store.get(backup_list[0]['filename']))
+        self.assertEqual([s['name'] for s in restored[0]['servers']], ['alpha'])
+
+    def test_move_undo_and_reload_run_on_worker(self):
+        """이동, 실행 취소, 외부 변경 다시 읽기가 메인 스레드에서 설정 파일을 읽거나 쓰지 않는지 테스트"""
+        self.worker.add_servers([{'name': 'beta', 'command': 'uvx'}]).result()
+        threads = set()
+        load = self.manager._load_cached_config
+        self.manager._load_cached_config = lambda: threads.add(threading.get_ident()) or load()
+
+        results = []
+        window = MagicMock()
+        window.my_mcp_list.selectedItems.return_value = ['alpha']
+        window.my_mcp_list.row.return_value = 0
+        app = SimpleNamespace(main_window=window, config_async=self.worker, config_manager=self.manager,
+                              _on_move_done=results.append,
+                              _on_history_done=lambda result, undo: results.append(result),
+                              _on_config_reloaded=lambda result, manager: results.append(result))
+        MCPConfigManager._move_selected_my_mcp(app, 1)
+        MCPConfigManager._step_history(app, True)
+        MCPConfigManager._on_config_file_changed(app, self.config_path)
+        self.assertTrue(self.wait_for(lambda: len(results) == 3))
+
+        self.assertNotIn(threading.get_ident(), threads)
+        moved, undone, reloaded = results
+        self.assertEqual((moved['count'], moved['rows']), (1, [1]))
+        self.assertEqual([s['name'] for s in moved['servers']], ['beta', 'alpha'])
+        self.assertEqual(undone['count'], 1)
+        self.assertEqual([s['name'] for s in reloaded['servers']], ['alpha', 'beta'])
+
+    def test_config_path_switch_runs_on_worker(self):
+        """관리자 설정 변경 시 새 설정 파일 관리자 생성과 다시 읽기를 작업 스레드에서 하는지 테스트"""
+        other_path = os.path.join(self.test_dir, "other_config.json")
+        with open(other_path, 'w', encoding='utf-8') as f:
+            json.dump({'mcpServers': {'gamma': {'command': 'uvx'}}}, f)
+        threads = set()
+
+        def open_manager(write_delay):
+            threads.add(threading.get_ident())
+            return ConfigManager(config_path=other_path, write_delay=write_delay)
+
+        switched = []
+        app = SimpleNamespace(main_window=MagicMock(), config_watcher=MagicMock(), config_async=self.worker,
+                              config_manager=self.manager,
+                              _on_config_switched=lambda result, manager: switched.append((result, manager)))
+        app._on_config_opened = lambda manager: MCPConfigManager._on_config_opened(app, manager)
+        with patch('main.ConfigManager', side_effect=open_manager):
+            MCPConfigManager._on_config_file_changed(app, MANAGER_CONFIG_PATH)
+            self.assertTrue(self.wait_for(lambda: switched))
+
+        self.assertTrue(threads)
+        self.assertNotIn(threading.get_ident(), threads)
+        result, manager = switched[0]
+        self.assertIs(app.config_manager, manager)
+        self.assertIs(self.worker.manager, manager)
+        self.assertEqual([s['name'] for s in result['servers']], ['gamma'])
+        self.assertIn('gamma', result['snapshot'])
+        app.config_watcher.add_path.assert_called_once_with(other_path)
+
+    def test_profiles_from_main_window(self):
+        """메인 창에서 프로필을 저장하고 콤보 상자로 전환하는지 테스트 (작업 스레드 경유)"""
+        window = MainWindow()
+        self.addCleanup(window.close)
+        window.ask_text = MagicMock(return_value="solo")
+        window.show_confirm_message = MagicMock(return_value=True)
+        window.show_error_message = MagicMock()
+        loaded = []
+        app = SimpleNamespace(main_window=window, config_async=self.worker, config_manager=self.manager,
+                              _load_my_mcp_servers=loaded.append)
+        app._on_save_profile_done = lambda result, name: MCPConfigManager._on_save_profile_done(app, result, name)
+        app._on_profile_switched = lambda result, name: MCPConfigManager._on_profile_switched(app, result, name)
+
+        # 현재 서버(alpha)로 프로필 저장
+        MCPConfigManager._on_save_profile(app)
+        self.assertTrue(self.wait_for(lambda: window.profile_combo.count() == 2))
+        self.assertEqual(window.profile_combo.itemData(1), "solo")
+
+        # 서버를 추가한 뒤 프로필을 선택하면 프로필의 서버로 전환
+        self.worker.add_servers([{'name': 'beta', 'command': 'uvx'}]).result()
+        MCPConfigManager._on_profile_selected(app, 1)
+        self.assertTrue(self.wait_for(lambda: loaded))
+        window.show_error_message.assert_not_called()
+        self.assertEqual([s['name'] for s in loaded[0]], ['alpha'])
+        self.assertEqual([s['name'] for s in self.manager.get_mcp_servers()], ['alpha'])
+        self.assertEqual(window.profile_combo.currentIndex(), 1)
+
+        # (현재) 항목은 전환하지 않음
+        MCPConfigManager._on_profile_selected(app, 0)
+        self.assertEqual(window.show_confirm_message.call_count, 1)
+
+    def test_error_reported_to_callback(self):
+        """작업 중 예외가 오류 콜백과 Future로 전달되는지 테스트"""
+        errors = []
+        future = self.worker.submit("실패", lambda manager: 1 / 0, on_error=errors.append)
+        self.assertTrue(self.wait_for(lambda: errors))
+        self.assertIsInstance(future.exception(), ZeroDivisionError)
+
+if __name__ == "__main__":
+    unittest.main()
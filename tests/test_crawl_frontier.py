@@ -0,0 +1,72 @@
+"""
+크롤 프런티어 테스트 스크립트
+
+보강 작업 큐의 우선순위, 재시도, 재시작 후 재개, 통계 기능을 테스트합니다.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler.crawl_frontier import CrawlFrontier, STATE_FAILED
+
+class TestCrawlFrontier(unittest.TestCase):
+    """크롤 프런티어 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.test_dir, "crawl_frontier.db")
+        self.frontier = CrawlFrontier(db_path=self.db_path, max_retries=2, backoff_base=0)
+        self.frontier.enqueue([(name, 'metadata', f"https://github.com/example/{name}")
+                               for name in ['a', 'b', 'c', 'd']])
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.frontier.close()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_priority_order(self):
+        """내 서버 > 보이는 서버 > 기타 순서 테스트"""
+        self.frontier.set_user_servers(['d'])
+        self.frontier.set_visible(['c'])
+        self.assertEqual([item['name'] for item in self.frontier.claim(limit=4)], ['d', 'c', 'a', 'b'])
+
+    def test_visible_priority_is_reset(self):
+        """보이지 않게 된 서버의 우선순위 복원 테스트"""
+        self.frontier.set_visible(['c'])
+        self.frontier.set_visible(['b'])
+        self.assertEqual([item['name'] for item in self.frontier.claim(limit=2)], ['b', 'a'])
+
+    def test_resume_after_restart(self):
+        """재시작 후 처리 중이던 작업 재개 테스트"""
+        claimed = self.frontier.claim(limit=2)
+        self.frontier.complete(claimed[0]['id'], {'stars': 1})
+        self.frontier.close()
+
+        self.frontier = CrawlFrontier(db_path=self.db_path)
+        self.assertEqual(self.frontier.recover(), 1)
+        self.assertEqual([item['name'] for item in self.frontier.claim(limit=4)], ['b', 'c', 'd'])
+        self.assertEqual(self.frontier.get_result('a', 'metadata'), {'stars': 1})
+
+    def test_retry_and_stats(self):
+        """재시도 횟수 초과 시 실패 처리 및 통계 테스트"""
+        item = self.frontier.claim()[0]
+        self.frontier.fail(item['id'], "timeout")
+        self.assertIn(item['id'], [claimed['id'] for claimed in self.frontier.claim(limit=4)])
+        self.frontier.fail(item['id'], "timeout")
+        self.frontier.recover()
+
+        stats = self.frontier.stats()
+        self.assertEqual(stats['states'][STATE_FAILED], 1)
+        self.assertEqual(stats['queue_depth'], 3)
+        self.frontier.complete(self.frontier.claim()[0]['id'])
+        self.assertGreater(self.frontier.stats()['throughput_per_min'], 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+크롤링 작업자 프로세스 테스트 스크립트
+
+별도 프로세스에서의 README 파싱, 결과 스트리밍, 취소 기능을 테스트합니다.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler.crawl_worker import CrawlProcess, MSG_RECORDS, MSG_DONE, MSG_ERROR
+
+README = """# Model Context Protocol servers
+
+## Reference Servers
+
+- **[Brave Search](src/brave-search)** - Web and local search using Brave's Search API
+- **[Time](src/time)** - Time and timezone conversion capabilities
+
+## Official Integrations
+
+- **[Tavily](https://github.com/tavily-ai/tavily-mcp)** - Search engine for AI agents
+"""
+
+class TestCrawlProcess(unittest.TestCase):
+    """크롤링 작업자 프로세스 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.readme_file = os.path.join(self.test_dir, "README.md")
+        with open(self.readme_file, 'w', encoding='utf-8') as f:
+            f.write(README)
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_stream_records(self):
+        """작업자 프로세스 결과 스트리밍 테스트"""
+        process = CrawlProcess(cache_dir=self.test_dir, readme_file=self.readme_file)
+        process.start()
+
+        records = []
+        done = None
+        for kind, value in process.messages():
+            if kind == MSG_RECORDS:
+                records.extend(value)
+            elif kind == MSG_DONE:
+                done = value
+            elif kind == MSG_ERROR:
+                self.fail(value)
+
+        self.assertEqual(done, 3)
+        self.assertEqual([r['name'] for r in records], ['Brave Search', 'Time', 'Tavily'])
+        self.assertEqual(records[2]['type'], 'official')
+
+    def test_cancel(self):
+        """작업자 프로세스 취소 테스트"""
+        process = CrawlProcess(cache_dir=self.test_dir, readme_file=self.readme_file)
+        process.start()
+        self.assertEqual(list(process.messages(should_stop=lambda: True)), [])
+        self.assertFalse(process.process.is_alive())
+
+if __name__ == "__main__":
+    unittest.main()
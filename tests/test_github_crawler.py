@@ -7,6 +7,9 @@ MCP 서버 목록을 크롤링하는 기능을 테스트합니다.
 import os
 import sys
 import json
+import shutil
+import tempfile
+from unittest.mock import patch
 
 # 상위 디렉토리를 모듈 검색 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -64,5 +67,35 @@ def test_github_crawler():
     
     print("\nGitHub 크롤러 테스트를 완료했습니다.")
 
+def test_resolve_url():
+    """README 상대 링크 해석 테스트 (접두어 './'만 제거되고 '../', '.github'은 그대로 해석)"""
+    crawler = GitHubCrawler(cache_dir=os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_cache"))
+    base = f"{crawler.repo_url}/tree/main/"
+    assert crawler._resolve_url("./src/fetch") == base + "src/fetch"
+    assert crawler._resolve_url("src/fetch") == base + "src/fetch"
+    assert crawler._resolve_url(".github/README.md") == base + ".github/README.md"
+    assert crawler._resolve_url("../other") == f"{crawler.repo_url}/tree/other"
+    assert crawler._resolve_url("https://example.com/x") == "https://example.com/x"
+    assert crawler._resolve_url("") is None
+
+def test_fallback_keeps_existing_cache():
+    """네트워크 실패 시 만료된 캐시를 사용하고 대체 데이터로 캐시를 덮어쓰지 않는지 테스트"""
+    cache_dir = tempfile.mkdtemp()
+    try:
+        crawler = GitHubCrawler(cache_dir=cache_dir)
+        cached = [{'name': 'my-server', 'description': '', 'category': '일반'}]
+        with open(crawler.servers_cache_file, 'w', encoding='utf-8') as f:
+            json.dump(cached, f)
+        os.utime(crawler.servers_cache_file, (0, 0))
+
+        with patch.object(crawler, '_download_readme', return_value=None), \
+             patch('crawler.github_crawler.find_latest_bundle', return_value=None):
+            assert crawler.get_mcp_servers() == cached
+        with open(crawler.servers_cache_file, encoding='utf-8') as f:
+            assert json.load(f) == cached
+        assert os.path.getmtime(crawler.servers_cache_file) == 0
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
 if __name__ == "__main__":
     test_github_crawler()
@@ -0,0 +1,126 @@
+"""
+설정 실행 취소/다시 실행 테스트 스크립트
+
+서버 추가/삭제/수정/이동의 실행 취소와 다시 실행, 기록의 서버 설정 공유, 외부 변경 충돌을 테스트합니다.
+"""
+
+import os
+import sys
+import json
+import random
+import shutil
+import tempfile
+import unittest
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config_manager import ConfigManager, ConfigTransaction
+from config.history import HistoryEntry
+from config.server_model import ServerModel
+
+class TestConfigHistory(unittest.TestCase):
+    """설정 실행 취소/다시 실행 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.test_dir, "claude_desktop_config.json")
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({'globalShortcut': 'Ctrl+Space', 'mcpServers': {
+                name: {'command': 'npx', 'args': [name]} for name in ('alpha', 'beta', 'gamma')}}, f)
+        self.manager = ConfigManager(config_path=self.config_path)
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def on_disk(self):
+        with open(self.config_path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def test_undo_redo_round_trip(self):
+        """여러 변경을 차례로 실행 취소/다시 실행하면 각 단계의 파일 내용이 복원되는지 테스트"""
+        states = [self.on_disk()]
+        self.assertTrue(self.manager.add_mcp_server({'name': 'delta', 'command': 'uvx'}))
+        states.append(self.on_disk())
+        self.assertTrue(self.manager.move_mcp_server(3, 0))
+        states.append(self.on_disk())
+        with self.manager.transaction() as txn:
+            txn.update('beta', {'name': 'beta2', 'command': 'docker'})
+            txn.delete('alpha')
+        states.append(self.on_disk())
+
+        for expected in reversed(states[:-1]):
+            self.assertTrue(self.manager.undo())
+            self.assertEqual(json.dumps(self.on_disk()), json.dumps(expected))
+        self.assertFalse(self.manager.can_undo())
+        self.assertFalse(self.manager.undo())
+
+        for expected in states[1:]:
+            self.assertTrue(self.manager.redo())
+            self.assertEqual(json.dumps(self.on_disk()), json.dumps(expected))
+        self.assertFalse(self.manager.can_redo())
+
+        # 새 변경은 다시 실행 기록을 비움
+        self.assertTrue(self.manager.undo())
+        self.assertTrue(self.manager.delete_mcp_server('gamma'))
+        self.assertFalse(self.manager.can_redo())
+        # 실행 취소 결과도 저널에 기록되어 재생 결과가 파일과 같음
+        self.assertEqual(self.manager.config_at(), self.on_disk())
+
+    def test_entries_share_unchanged_servers(self):
+        """기록이 바뀐 서버만 가지고 서버 설정 객체를 캐시와 공유하는지 테스트"""
+        self.manager.get_mcp_servers()
+        self.assertTrue(self.manager.add_mcp_server({'name': 'delta', 'command': 'uvx'}))
+        entry = self.manager.history.peek()
+        self.assertEqual(list(entry.servers), ['delta'])
+        self.assertEqual(entry.before_order, [])
+        cached = self.manager._server_model(self.manager._load_cached_config())
+        self.assertIs(entry.servers['delta'][1], cached.get('delta'))
+
+    def test_external_change_reported_as_conflict(self):
+        """기록 뒤 외부에서 바뀐 서버는 건너뛰고 충돌로 보고하는지 테스트"""
+        self.assertTrue(self.manager.delete_mcp_server('beta'))
+        self.assertTrue(self.manager.add_mcp_server({'name': 'delta', 'command': 'uvx'}))
+        self.assertTrue(self.manager.undo())
+
+        config = self.on_disk()
+        config['mcpServers']['beta'] = {'command': 'external'}
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump(config, f)
+        st = os.stat(self.config_path)
+        os.utime(self.config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1000))
+
+        self.assertTrue(self.manager.undo())
+        self.assertEqual([c['name'] for c in self.manager.last_conflicts], ['beta'])
+        self.assertEqual(self.on_disk()['mcpServers']['beta'], {'command': 'external'})
+
+    def test_random_reorders_restored(self):
+        """임의의 추가/삭제/순서 변경 기록을 되돌리면 원래 모델과 같아지는지 테스트"""
+        rng = random.Random(3)
+        for _ in range(50):
+            old = ServerModel((f"s{i}", {'v': i}) for i in range(12))
+            new = old.copy()
+            for _ in range(rng.randrange(1, 6)):
+                names = new.names()
+                choice = rng.random()
+                if choice < 0.5:
+                    new.move(rng.choice(names), rng.choice(names + [None]))
+                elif choice < 0.75 and len(names) > 1:
+                    new.remove(rng.choice(names))
+                else:
+                    new.insert(f"n{rng.random()}", {'v': -1}, rng.choice(names + [None]))
+            entry = HistoryEntry.diff(old.to_mcp_servers(), new.to_mcp_servers())
+
+            txn = ConfigTransaction(new.copy())
+            self.assertEqual(entry.apply(txn, undo=True), [])
+            self.assertEqual(txn.model.to_mcp_servers(), old.to_mcp_servers())
+            self.assertEqual(txn.model.names(), old.names())
+
+            txn = ConfigTransaction(old.copy())
+            entry.apply(txn, undo=False)
+            self.assertEqual(txn.model.names(), new.names())
+
+if __name__ == "__main__":
+    unittest.main()
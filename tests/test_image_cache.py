@@ -0,0 +1,127 @@
+"""
+이미지 캐시 테스트 스크립트
+
+내용 주소 기반 디스크 캐시와 비동기 이미지 로더(축소, 메모리 LRU, 화면 밖 요청 취소)를 테스트합니다.
+네트워크 대신 로컬 이미지 생성 함수를 사용합니다.
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+
+# 화면이 없는 환경에서도 QImage/QPixmap을 사용할 수 있도록 설정
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QBuffer, QIODevice, Qt
+from PyQt6.QtGui import QImage, QColor
+
+from ui.image_cache import ImageDiskCache, ImageLoader, avatar_url_for
+
+def make_png(color, size=96):
+    """지정한 색상의 PNG 이미지 바이트를 생성합니다."""
+    image = QImage(size, size, QImage.Format.Format_ARGB32)
+    image.fill(QColor(color))
+    buffer = QBuffer()
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(buffer.data())
+
+class TestImageCache(unittest.TestCase):
+    """이미지 캐시 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        """QApplication 생성"""
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.fetched = []
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def fetcher(self, url):
+        """로컬 대체 이미지 다운로드 함수"""
+        self.gate.wait(5)
+        self.fetched.append(url)
+        return make_png('red' if 'red' in url else 'blue')
+
+    def wait_for(self, condition, timeout=5.0):
+        """조건이 참이 될 때까지 이벤트를 처리합니다."""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            self.app.processEvents()
+            if condition():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_avatar_url(self):
+        """아바타 URL 결정 테스트"""
+        self.assertEqual(avatar_url_for({'url': 'https://github.com/modelcontextprotocol/servers/tree/main/src/git'}),
+                         "https://github.com/modelcontextprotocol.png?size=48")
+        self.assertEqual(avatar_url_for({'avatar_url': 'https://example.com/a.png'}), 'https://example.com/a.png')
+        self.assertIsNone(avatar_url_for({'url': 'https://example.com/server'}))
+
+    def test_disk_cache_deduplicates(self):
+        """같은 내용의 이미지는 한 번만 저장되는지 테스트"""
+        cache = ImageDiskCache(self.test_dir)
+        data = make_png('red')
+        self.assertEqual(cache.put('https://a/red1', data), cache.put('https://a/red2', data))
+        cache.flush()
+
+        reloaded = ImageDiskCache(self.test_dir)
+        self.assertEqual(reloaded.get('https://a/red2'), data)
+        self.assertIsNone(reloaded.get('https://a/missing'))
+        blobs = [name for _, _, files in os.walk(self.test_dir) for name in files if name.endswith('.png')]
+        self.assertEqual(len(blobs), 1)
+
+    def test_loader_downscales_and_caches(self):
+        """이미지 축소와 메모리/디스크 캐시 테스트"""
+        loader = ImageLoader(cache_dir=self.test_dir, fetcher=self.fetcher, icon_size=24, memory_items=1)
+        ready = {}
+        loader.image_ready.connect(lambda url, pixmap: ready.__setitem__(url, pixmap))
+
+        self.assertEqual(loader.set_wanted(['https://a/red', 'https://a/blue']), 2)
+        self.assertTrue(self.wait_for(lambda: len(ready) == 2))
+        self.assertEqual(ready['https://a/red'].width(), 24)
+        # LRU 크기 1: 나중에 완료된 이미지만 메모리에 남음
+        self.assertEqual(len(loader.memory_cache), 1)
+
+        # 메모리에서 밀려난 이미지는 네트워크 대신 디스크 캐시에서 다시 로드
+        evicted = next(url for url in ready if loader.cached(url) is None)
+        ready.clear()
+        loader.set_wanted([evicted])
+        self.assertTrue(self.wait_for(lambda: evicted in ready))
+        self.assertEqual(len(self.fetched), 2)
+        loader.shutdown()
+
+    def test_scrolled_out_requests_are_dropped(self):
+        """화면 밖으로 나간 대기 요청이 취소되는지 테스트"""
+        loader = ImageLoader(cache_dir=self.test_dir, fetcher=self.fetcher, max_concurrency=1)
+        self.gate.clear()
+        loader.set_wanted([f"https://a/blue{i}" for i in range(10)])
+        # 첫 요청이 진행 중인 동안 다른 행으로 스크롤
+        loader.set_wanted(['https://a/red'])
+        self.gate.set()
+
+        self.assertTrue(self.wait_for(lambda: loader.cached('https://a/red') is not None))
+        self.assertTrue(self.wait_for(lambda: loader.pending_count() == 0))
+        self.assertLessEqual(len(self.fetched), 2)
+        loader.shutdown()
+
+if __name__ == "__main__":
+    unittest.main()
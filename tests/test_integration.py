@@ -6,6 +6,8 @@ MCP 설정 관리자 테스트 스크립트
 
 import os
 import sys
+import shutil
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -21,9 +23,10 @@ class TestMCPConfigManagerApp(unittest.TestCase):
     
     def setUp(self):
         """테스트 설정"""
-        # 테스트용 디렉토리 설정
-        self.test_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_integration")
-        os.makedirs(self.test_dir, exist_ok=True)
+        # 테스트용 디렉토리 설정 (저장소의 테스트 파일을 바꾸지 않도록 임시 디렉토리에 복사)
+        fixture_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_integration")
+        self.test_dir = tempfile.mkdtemp()
+        shutil.copytree(fixture_dir, self.test_dir, dirs_exist_ok=True)
         
         # 테스트용 설정 파일 경로
         self.test_config_path = os.path.join(self.test_dir, "test_claude_desktop_config.json")
@@ -236,9 +239,8 @@ class TestMCPConfigManagerApp(unittest.TestCase):
     
     def tearDown(self):
         """테스트 정리"""
-        # 테스트 파일 정리
-        if os.path.exists(self.test_config_path):
-            os.remove(self.test_config_path)
+        # 테스트 디렉토리 정리
+        shutil.rmtree(self.test_dir, ignore_errors=True)
 
 if __name__ == "__main__":
     unittest.main()
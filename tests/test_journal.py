@@ -0,0 +1,123 @@
+"""
+설정 변경 저널 테스트 스크립트
+
+변경 저널의 기록, 체크포인트, 재생 복구와 과거 상태 재구성을 테스트합니다.
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config_manager import ConfigManager
+from config.journal import ConfigJournal
+from config.backup_store import REASON_MANUAL
+
+class TestConfigJournal(unittest.TestCase):
+    """설정 변경 저널 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.test_dir, "claude_desktop_config.json")
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({'globalShortcut': 'Ctrl+Space',
+                       'mcpServers': {'alpha': {'command': 'npx'}, 'beta': {'command': 'uvx'}}}, f)
+        self.manager = ConfigManager(config_path=self.config_path)
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def names(self, manager=None):
+        return [server['name'] for server in (manager or self.manager).get_mcp_servers()]
+
+    def test_edits_journaled_without_full_backups(self):
+        """변경마다 전체 백업 대신 저널 레코드를 남기는지 테스트"""
+        for i in range(5):
+            self.assertTrue(self.manager.add_mcp_server({'name': f"s{i}", 'command': 'npx'}))
+        self.assertTrue(self.manager.move_mcp_server(0, 6))
+
+        self.assertEqual(len(self.manager.get_backup_list()), 1)
+        history = self.manager.journal_history()
+        self.assertEqual([h['seq'] for h in history], [1, 2, 3, 4, 5, 6])
+        self.assertEqual(history[-1]['ops'], [['move', 0, 6]])
+
+    def test_crash_before_write_recovered(self):
+        """저널 기록 후 파일 반영 전에 중단되면 재생으로 복구하는지 테스트"""
+        self.manager.add_mcp_server({'name': 'gamma', 'command': 'npx'})
+        with patch.object(ConfigManager, '_write_config', side_effect=SystemExit):
+            with self.assertRaises(SystemExit):
+                self.manager.delete_mcp_server('alpha')
+        with open(self.config_path, encoding='utf-8') as f:
+            self.assertIn('alpha', json.load(f)['mcpServers'])
+
+        recovered = ConfigManager(config_path=self.config_path)
+        self.assertEqual(self.names(recovered), ['beta', 'gamma'])
+        self.assertEqual(recovered.load_config()['globalShortcut'], 'Ctrl+Space')
+
+    def test_failed_write_aborted_and_external_edit_kept(self):
+        """저장 실패는 취소로 기록되고 외부 편집은 덮어쓰지 않는지 테스트"""
+        with patch('config.config_manager.json_io.dump', side_effect=OSError("disk full")):
+            self.assertFalse(self.manager.delete_mcp_server('alpha'))
+        self.assertEqual(self.manager.journal_history(), [])
+
+        self.manager.delete_mcp_server('beta')
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({'mcpServers': {'edited': {'command': 'npx'}}}, f)
+        self.assertEqual(self.names(ConfigManager(config_path=self.config_path)), ['edited'])
+
+    def test_past_state_reconstructed(self):
+        """체크포인트가 바뀐 뒤에도 과거 상태를 재구성하는지 테스트"""
+        self.manager._journal = ConfigJournal(os.path.join(self.manager.backup_dir, "journal"), checkpoint_every=3)
+        for i in range(8):
+            self.manager.add_mcp_server({'name': f"s{i}", 'command': 'npx'})
+        self.assertTrue(self.manager.delete_mcp_server('alpha'))
+
+        servers = lambda config: list(config['mcpServers'])
+        self.assertEqual(servers(self.manager.config_at(0)), ['alpha', 'beta'])
+        self.assertEqual(servers(self.manager.config_at(2)), ['alpha', 'beta', 's0', 's1'])
+        self.assertEqual(servers(self.manager.config_at()), ['beta'] + [f"s{i}" for i in range(8)])
+        self.assertEqual(len(self.manager.journal._records), 1)
+
+        # 지정 없이 복원하면 마지막 변경 직전 상태
+        self.assertTrue(self.manager.restore_backup())
+        self.assertEqual(self.names(), ['alpha', 'beta'] + [f"s{i}" for i in range(8)])
+
+    def test_own_rewrites_not_replayed(self):
+        """복원, 프로필 전환, 직접 되돌린 파일이 저널의 이전 상태와 같아도 다시 재생하지 않는지 테스트"""
+        backup = self.manager._backup_config(reason=REASON_MANUAL)
+        self.assertTrue(self.manager.save_profile('base'))
+        self.manager.add_mcp_server({'name': 'gamma', 'command': 'npx'})
+        self.manager.add_mcp_server({'name': 'delta', 'command': 'npx'})
+
+        # 이름을 지정한 복원
+        self.assertTrue(self.manager.restore_backup(backup['name']))
+        self.assertEqual(self.names(ConfigManager(config_path=self.config_path)), ['alpha', 'beta'])
+
+        # 지정 없이 복원 (마지막 변경 직전 상태)
+        self.manager.add_mcp_server({'name': 'gamma', 'command': 'npx'})
+        self.assertTrue(self.manager.restore_backup())
+        self.assertEqual(self.names(ConfigManager(config_path=self.config_path)), ['alpha', 'beta'])
+
+        # 프로필 전환
+        self.manager.add_mcp_server({'name': 'gamma', 'command': 'npx'})
+        self.assertTrue(self.manager.switch_profile('base'))
+        self.assertEqual(self.names(ConfigManager(config_path=self.config_path)), ['alpha', 'beta'])
+
+        # 두 변경 전 상태로 직접 되돌린 파일
+        self.manager.add_mcp_server({'name': 'gamma', 'command': 'npx'})
+        self.manager.add_mcp_server({'name': 'delta', 'command': 'npx'})
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({'globalShortcut': 'Ctrl+Space',
+                       'mcpServers': {'alpha': {'command': 'npx'}, 'beta': {'command': 'uvx'}}}, f)
+        self.assertEqual(self.names(ConfigManager(config_path=self.config_path)), ['alpha', 'beta'])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+JSON 직렬화 모듈 테스트 스크립트
+
+백엔드별 출력 형식과 표준 라이브러리 대체 처리를 테스트합니다.
+"""
+
+import os
+import sys
+import json
+import unittest
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import json_io
+
+CONFIG = {
+    'globalShortcut': 'Ctrl+Space',
+    'mcpServers': {
+        'fetch': {'command': 'uvx', 'args': ['mcp-server-fetch'], 'env': {}},
+        '메모리': {'command': 'npx', 'args': [], 'description': "설명 \"따옴표\"\n줄바꿈", 'disabled': False},
+    },
+    'ratio': 0.5,
+}
+
+class TestJsonIO(unittest.TestCase):
+    """JSON 직렬화 모듈 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.backends = ['json'] + (['orjson'] if json_io.orjson is not None else [])
+        self.previous = json_io.backend()
+
+    def tearDown(self):
+        """테스트 정리"""
+        json_io.set_backend(self.previous)
+
+    def test_output_matches_stdlib_format(self):
+        """pretty 출력은 indent=2, 압축 출력은 공백 없는 형식과 같은지 테스트"""
+        pretty = json.dumps(CONFIG, ensure_ascii=False, indent=2)
+        compact = json.dumps(CONFIG, ensure_ascii=False, separators=(',', ':'))
+        for name in self.backends:
+            with self.subTest(backend=name):
+                json_io.set_backend(name)
+                self.assertEqual(json_io.dumps(CONFIG, pretty=True), pretty)
+                self.assertEqual(json_io.dumps_bytes(CONFIG), compact.encode('utf-8'))
+                self.assertNotIn(b"\n", json_io.dumps_bytes(CONFIG))
+                self.assertEqual(json_io.loads(compact.encode('utf-8')), CONFIG)
+
+    def test_unsupported_values_fall_back_to_stdlib(self):
+        """orjson이 처리하지 못하는 값은 표준 라이브러리로 처리하는지 테스트"""
+        for name in self.backends:
+            with self.subTest(backend=name):
+                json_io.set_backend(name)
+                self.assertEqual(json_io.dumps({'n': 2 ** 70}), '{"n":1180591620717411303424}')
+                self.assertTrue(json_io.loads('[NaN]')[0] != json_io.loads('[NaN]')[0])
+                with self.assertRaises(json_io.JSONDecodeError):
+                    json_io.loads('{"broken": ')
+        with self.assertRaises(ValueError):
+            json_io.set_backend('simdjson')
+
+if __name__ == "__main__":
+    unittest.main()
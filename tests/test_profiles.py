@@ -0,0 +1,102 @@
+"""
+설정 프로필 테스트 스크립트
+
+프로필 저장, 서버 설정 조각 공유, 원자적 전환과 저널 연동을 테스트합니다.
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config_manager import ConfigManager
+
+class TestConfigProfiles(unittest.TestCase):
+    """설정 프로필 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.test_dir, "claude_desktop_config.json")
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({'globalShortcut': 'Ctrl+Space', 'mcpServers': {
+                'fetch': {'command': 'uvx', 'args': ['mcp-server-fetch']},
+                'github': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-github']},
+                'memory': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-memory']},
+            }}, f)
+        self.manager = ConfigManager(config_path=self.config_path)
+        self.profiles_dir = os.path.join(self.test_dir, "profiles")
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def names(self, manager=None):
+        return [server['name'] for server in (manager or self.manager).get_mcp_servers()]
+
+    def fragments(self):
+        return sorted(os.listdir(os.path.join(self.profiles_dir, "servers")))
+
+    def test_shared_servers_stored_once(self):
+        """프로필끼리 같은 서버 설정은 조각 하나만 저장하는지 테스트"""
+        self.assertTrue(self.manager.save_profile('dev'))
+        self.assertTrue(self.manager.save_profile('minimal', ['fetch']))
+        self.assertTrue(self.manager.save_profile('demo', ['memory', 'fetch']))
+        self.assertEqual(len(self.fragments()), 3)
+        self.assertFalse(self.manager.save_profile('bad', ['missing']))
+        self.assertFalse(self.manager.save_profile('../escape'))
+
+        profiles = {p['name']: p['servers'] for p in self.manager.get_profiles()}
+        self.assertEqual(profiles, {'demo': 2, 'dev': 3, 'minimal': 1})
+
+        # 마지막으로 참조하던 프로필을 지우면 조각도 정리
+        self.assertTrue(self.manager.delete_profile('dev'))
+        self.assertEqual(len(self.fragments()), 2)
+
+    def test_switch_is_single_rename(self):
+        """전환이 미리 만든 파일의 이름 변경 한 번으로 끝나는지 테스트"""
+        self.manager.save_profile('dev')
+        self.manager.save_profile('demo', ['memory', 'fetch'])
+
+        with patch('config.config_manager.json_io.dump') as dump, \
+                patch('config.profiles.os.replace', wraps=os.replace) as replace:
+            self.assertTrue(self.manager.switch_profile('demo'))
+        dump.assert_not_called()
+        installs = [call.args[0] for call in replace.call_args_list if call.args[1] == self.config_path]
+        self.assertEqual(len(installs), 1)
+        self.assertEqual(os.path.dirname(installs[0]), os.path.join(self.profiles_dir, "built"))
+
+        self.assertEqual(self.names(ConfigManager(config_path=self.config_path)), ['memory', 'fetch'])
+        self.assertEqual(self.manager.last_changes['removed'], ['github'])
+        self.assertEqual(self.manager.load_config()['globalShortcut'], 'Ctrl+Space')
+        self.assertEqual([p['name'] for p in self.manager.get_profiles() if p['active']], ['demo'])
+        self.assertEqual(len(self.manager.get_backup_list()), 1)
+
+        # 전환으로 소모된 파일도 다시 만들어 두어 다음 전환 준비
+        self.assertEqual(len(os.listdir(os.path.join(self.profiles_dir, "built"))), 2)
+        self.assertTrue(self.manager.switch_profile('dev'))
+        self.assertEqual(self.names(), ['fetch', 'github', 'memory'])
+        self.assertFalse(self.manager.switch_profile('missing'))
+
+    def test_settings_changes_kept_and_journal_checkpointed(self):
+        """전환 후 서버 외 설정 변경과 저널 기록이 이어지는지 테스트"""
+        self.manager.save_profile('minimal', ['fetch'])
+        config = self.manager.load_config()
+        config['globalShortcut'] = 'Alt+Space'
+        self.assertTrue(self.manager.save_config(config))
+
+        self.assertTrue(self.manager.switch_profile('minimal'))
+        self.assertEqual(self.manager.load_config()['globalShortcut'], 'Alt+Space')
+
+        self.assertTrue(self.manager.add_mcp_server({'name': 'time', 'command': 'uvx'}))
+        self.assertEqual(self.names(), ['fetch', 'time'])
+        self.assertEqual(list(self.manager.config_at(0)['mcpServers']), ['fetch'])
+
+if __name__ == "__main__":
+    unittest.main()
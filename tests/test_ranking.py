@@ -0,0 +1,63 @@
+"""
+카탈로그 순위 테스트 스크립트
+
+보강 정보 기반 복합 점수와 미리 계산된 정렬 순열을 테스트합니다.
+"""
+
+import os
+import sys
+import unittest
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler.ranking import RankingEngine, SORT_DEFAULT, SORT_NAME, SORT_POPULAR, SORT_RECENT, SORT_MAINTAINED
+
+NOW = 1760000000.0
+DAY = 86400.0
+
+class TestRankingEngine(unittest.TestCase):
+    """카탈로그 순위 엔진 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.servers = [
+            {'name': 'beta', 'description': 'short', 'type': 'community'},
+            {'name': 'Alpha', 'description': 'Reference server with full documentation',
+             'type': 'reference', 'url': 'https://github.com/a/alpha', 'installation_options': ['npm'],
+             'env_vars': ['TOKEN']},
+            {'name': 'gamma', 'description': 'Official integration with a long description',
+             'type': 'official', 'url': 'https://github.com/g/gamma'},
+        ]
+        self.enrichment = {
+            'beta': {'stars': 5000, 'pushed_at': NOW - 400 * DAY, 'archived': True},
+            'Alpha': {'stars': 50, 'pushed_at': NOW - 2 * DAY, 'license': 'MIT'},
+            'gamma': {'stars': 900, 'pushed_at': '2025-01-01T00:00:00Z'},
+        }
+        self.engine = RankingEngine()
+        self.engine.build(self.servers, self.enrichment, now=NOW)
+
+    def names(self, sort_key):
+        return [server['name'] for server in self.engine.ordered(self.servers, sort_key)]
+
+    def test_sort_orders(self):
+        """정렬 방식별 순열 테스트"""
+        self.assertEqual(self.names(SORT_DEFAULT), ['beta', 'Alpha', 'gamma'])
+        self.assertEqual(self.names(SORT_NAME), ['Alpha', 'beta', 'gamma'])
+        self.assertEqual(self.names(SORT_POPULAR), ['beta', 'gamma', 'Alpha'])
+        self.assertEqual(self.names(SORT_RECENT), ['Alpha', 'gamma', 'beta'])
+        # 보관(archived)된 저장소는 별 수가 많아도 유지 관리 순위가 가장 낮음
+        self.assertEqual(self.names(SORT_MAINTAINED)[-1], 'beta')
+        self.assertEqual(self.names(SORT_MAINTAINED)[0], 'Alpha')
+
+    def test_missing_enrichment(self):
+        """보강 정보가 없을 때 README 순서를 유지하는지 테스트"""
+        engine = RankingEngine()
+        engine.build([{'name': 'x'}, {'name': 'y'}], now=NOW)
+        self.assertEqual(list(engine.order(SORT_POPULAR)), [0, 1])
+        self.assertEqual(engine.score('x', SORT_RECENT), 0.0)
+        self.assertIsNone(engine.score('missing', SORT_RECENT))
+        self.assertEqual(list(engine.order('unknown')), [0, 1])
+
+if __name__ == "__main__":
+    unittest.main()
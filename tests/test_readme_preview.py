@@ -0,0 +1,115 @@
+"""
+README 미리보기 테스트 스크립트
+
+작업 스레드에서의 README 변환, 문서 해시 기반 메모이즈, 이전 선택 작업 취소를 테스트합니다.
+네트워크 대신 로컬 README 생성 함수를 사용합니다.
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+# 화면이 없는 환경에서도 Qt 이벤트 루프를 사용할 수 있도록 설정
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtWidgets import QApplication
+
+import ui.readme_preview as readme_preview
+from ui.readme_preview import ReadmePreviewLoader
+
+class TestReadmePreview(unittest.TestCase):
+    """README 미리보기 테스트 클래스"""
+
+    @classmethod
+    def setUpClass(cls):
+        """QApplication 생성"""
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.gate = threading.Event()
+        self.gate.set()
+        self.fetched = []
+        self.loader = ReadmePreviewLoader(cache_dir=self.test_dir, fetcher=self.fetcher)
+        self.ready = {}
+        self.failed = []
+        self.loader.preview_ready.connect(lambda url, html: self.ready.__setitem__(url, html))
+        self.loader.preview_failed.connect(self.failed.append)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.loader.shutdown()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def fetcher(self, url):
+        """로컬 대체 README 다운로드 함수 (shared로 끝나는 URL은 같은 문서 반환)"""
+        self.gate.wait(5)
+        self.fetched.append(url)
+        if url.endswith('missing'):
+            return None
+        if url.endswith('shared'):
+            return "# Shared\n\nSame document."
+        return f"# {url}\n\n| a | b |\n|---|---|\n| 1 | 2 |\n"
+
+    def wait_for(self, condition, timeout=5.0):
+        """조건이 참이 될 때까지 이벤트를 처리합니다."""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            self.app.processEvents()
+            if condition():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_render_and_cache(self):
+        """README 변환 및 재선택 시 캐시 사용 테스트"""
+        self.assertIsNone(self.loader.cached('https://a/one'))
+        self.assertTrue(self.loader.request('https://a/one'))
+        self.assertTrue(self.wait_for(lambda: 'https://a/one' in self.ready))
+        self.assertIn('<table>', self.ready['https://a/one'])
+        self.assertEqual(self.loader.cached('https://a/one'), self.ready['https://a/one'])
+
+    def test_memoized_by_document_hash(self):
+        """같은 문서는 한 번만 변환되는지 테스트"""
+        with patch.object(readme_preview, 'render_markdown', wraps=readme_preview.render_markdown) as render:
+            self.loader.request('https://a/shared')
+            self.assertTrue(self.wait_for(lambda: 'https://a/shared' in self.ready))
+            self.loader.request('https://b/shared')
+            self.assertTrue(self.wait_for(lambda: 'https://b/shared' in self.ready))
+            self.assertEqual(render.call_count, 1)
+
+            # 디스크에 저장된 변환 결과는 새 로더에서도 재사용
+            loader = ReadmePreviewLoader(cache_dir=self.test_dir, fetcher=self.fetcher)
+            loader.request('https://c/shared')
+            self.assertTrue(self.wait_for(lambda: loader.cached('https://c/shared') is not None))
+            self.assertEqual(render.call_count, 1)
+            loader.shutdown()
+
+    def test_stale_request_dropped(self):
+        """다른 서버를 선택하면 이전 대기 작업이 버려지는지 테스트"""
+        self.loader.pool.setMaxThreadCount(1)
+        self.gate.clear()
+        self.loader.request('https://a/first')
+        self.loader.request('https://a/second')
+        self.loader.request('https://a/third')
+        self.gate.set()
+
+        self.assertTrue(self.wait_for(lambda: 'https://a/third' in self.ready))
+        self.assertNotIn('https://a/second', self.fetched)
+
+    def test_missing_readme(self):
+        """README를 가져올 수 없는 경우 테스트"""
+        self.loader.request('https://a/missing')
+        self.assertTrue(self.wait_for(lambda: self.failed == ['https://a/missing']))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+백업 보존 정책 테스트 스크립트
+
+시간 구간별(GFS) 보존 정책의 점진적 정리와 미리보기(dry-run)를 테스트합니다.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.backup_store import BackupStore
+from config.retention import RetentionPolicy, HOUR, DAY, WEEK
+
+START = 1700000000.0
+
+class TestRetentionPolicy(unittest.TestCase):
+    """백업 보존 정책 테스트 클래스"""
+
+    def simulate(self, days, interval):
+        """interval초마다 백업하면서 점진적으로 정리하고 (남은 항목, 마지막 시각)을 반환합니다."""
+        policy = RetentionPolicy()
+        alive = {}
+        now = START
+        for i in range(int(days * DAY / interval)):
+            now = START + i * interval
+            entry = {'name': str(i), 'timestamp': now}
+            alive[entry['name']] = entry
+            policy.add(entry)
+            for name in policy.expire(now):
+                del alive[name]
+        return alive, now
+
+    def test_gfs_shape(self):
+        """구간별로 남는 백업 수 테스트"""
+        alive, now = self.simulate(days=60, interval=600)
+        ages = [now - entry['timestamp'] for entry in alive.values()]
+        self.assertEqual(sum(1 for age in ages if age < HOUR), 6)
+        self.assertLessEqual(sum(1 for age in ages if HOUR <= age < DAY), 24)
+        self.assertLessEqual(sum(1 for age in ages if DAY <= age < 30 * DAY), 31)
+        self.assertLessEqual(sum(1 for age in ages if 30 * DAY <= age), 6)
+        # 10분마다 60일 동안 8,640개 백업 중 90개 미만만 유지
+        self.assertLess(len(alive), 90)
+
+    def test_incremental_matches_full_pass(self):
+        """점진적 정리 결과가 전체 재계산 결과와 같은지 테스트"""
+        alive, now = self.simulate(days=40, interval=1800)
+        entries = [{'name': str(i), 'timestamp': START + i * 1800} for i in range(int(40 * DAY / 1800))]
+        dropped = set(RetentionPolicy().reset(entries, now))
+        self.assertEqual(set(alive), {entry['name'] for entry in entries} - dropped)
+
+    def test_older_than_last_tier_dropped(self):
+        """마지막 구간보다 오래된 백업을 삭제하는지 테스트"""
+        policy = RetentionPolicy(tiers=((HOUR, None), (WEEK, DAY)))
+        entries = [{'name': 'old', 'timestamp': START}, {'name': 'new', 'timestamp': START + 6 * DAY}]
+        self.assertEqual(policy.reset(entries, now=START + 8 * DAY), ['old'])
+
+    def test_store_dry_run(self):
+        """미리보기는 백업을 삭제하지 않는지 테스트"""
+        test_dir = tempfile.mkdtemp()
+        try:
+            with patch('config.retention.time.time', return_value=START):
+                store = BackupStore(test_dir, retention=RetentionPolicy())
+                for i in range(10):
+                    store.put(str(i).encode(), timestamp=START - 30 * 60 + i * 60)
+                self.assertEqual(len(store.entries()), 10)
+
+            preview = store.prune(dry_run=True, now=START + 3 * HOUR)
+            self.assertEqual([e['name'] for e in preview['keep']], [store.latest()['name']])
+            self.assertEqual(len(preview['drop']), 9)
+            self.assertEqual(len(store.entries()), 10)
+
+            store.prune(now=START + 3 * HOUR)
+            self.assertEqual(store.entries(), preview['keep'])
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    unittest.main()
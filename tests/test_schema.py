@@ -0,0 +1,123 @@
+"""
+설정 스키마 검증 테스트 스크립트
+
+컴파일된 스키마 검증기의 오류 경로 보고와 변경된 서버만 검사하는 증분 검증을 테스트합니다.
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+
+# 화면이 없는 환경에서도 main 모듈을 불러올 수 있도록 설정
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.schema import ConfigValidator, compile_schema, format_path, ROOT
+from config.config_manager import ConfigManager
+from crawler.github_crawler import GitHubCrawler
+from main import catalog_server_config, CATALOG_ONLY_KEYS
+
+class TestConfigValidator(unittest.TestCase):
+    """설정 스키마 검증 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.validator = ConfigValidator()
+        self.config = {
+            'globalShortcut': 'Ctrl+Space',
+            'mcpServers': {
+                'fetch': {'command': 'uvx', 'args': ['mcp-server-fetch'], 'futureKey': {'x': 1}},
+                'remote': {'type': 'sse', 'url': 'https://example.com/sse', 'headers': {'Authorization': 'Bearer x'}},
+            },
+        }
+
+    def test_valid_config(self):
+        """알 수 없는 키를 허용하고 올바른 설정을 통과시키는지 테스트"""
+        self.assertEqual(self.validator.validate(self.config), [])
+        self.assertEqual(self.validator.validate({'mcp_servers': [{'name': 'a', 'enabled': True}]}), [])
+        # 이전 버전이 카탈로그에서 복사한 type 값도 허용
+        self.assertEqual(self.validator.validate({'mcpServers': {'old': {'command': 'npx', 'type': 'reference'}}}), [])
+
+    def test_all_errors_with_paths(self):
+        """모든 오류를 JSON 경로와 함께 한 번에 보고하는지 테스트"""
+        self.config['mcpServers']['fetch']['args'] = ['ok', 3]
+        self.config['mcpServers']['my server'] = {'command': '', 'env': {'PORT': 8080}, 'type': 1}
+        self.config['mcpServers']['bad'] = []
+        errors = dict(self.validator.validate(self.config))
+
+        self.assertEqual(set(errors), {
+            "$.mcpServers.fetch.args[1]",
+            "$.mcpServers['my server'].command",
+            "$.mcpServers['my server'].env.PORT",
+            "$.mcpServers['my server'].type",
+            "$.mcpServers.bad",
+        })
+        self.assertIn("문자열", errors["$.mcpServers.fetch.args[1]"])
+
+    def test_structure_errors(self):
+        """최상위 구조 오류 테스트"""
+        self.assertEqual(self.validator.validate([]), [("$", "설정 파일이 JSON 객체가 아닙니다.")])
+        self.assertEqual([path for path, _ in self.validator.validate({'mcpServers': []})], ["$.mcpServers"])
+        self.assertEqual([path for path, _ in self.validator.validate({'mcp_servers': [{}]})], ["$.mcp_servers[0]"])
+        self.assertEqual(len(self.validator.validate({'other': 1})), 1)
+
+    def test_incremental_checks_changed_servers_only(self):
+        """이전에 통과한 설정과 같은 서버는 다시 검사하지 않는지 테스트"""
+        previous = {'mcpServers': {f"s{i}": {'command': 'npx', 'args': [str(i)]} for i in range(100)}}
+        config = {'mcpServers': dict(previous['mcpServers'])}
+        config['mcpServers']['s5'] = {'command': 'npx', 'args': [5]}
+        config['mcpServers']['new'] = {'command': 'uvx'}
+
+        errors = self.validator.validate(config, previous=previous)
+        self.assertEqual(self.validator.last_checked, 2)
+        self.assertEqual([path for path, _ in errors], ["$.mcpServers.s5.args[0]"])
+
+    def test_compile_schema(self):
+        """컴파일된 검사 함수와 경로 형식 테스트"""
+        check = compile_schema({'type': 'object', 'properties': {'a': {'type': 'integer'}},
+                                'required': ['b'], 'additionalProperties': False})
+        errors = []
+        check({'a': True, 'c': 1}, ROOT, errors)
+        self.assertEqual(sorted(format_path(path) for path, _ in errors), ["$", "$.a", "$.c"])
+
+class TestApplyCatalogEntry(unittest.TestCase):
+    """카탈로그 항목 적용 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir, ignore_errors=True)
+        self.config_path = os.path.join(self.test_dir, "claude_desktop_config.json")
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({'mcpServers': {}}, f)
+        self.manager = ConfigManager(config_path=self.config_path)
+        # 캐시와 번들이 없는 디렉토리이므로 크롤러의 기본 카탈로그 항목을 사용
+        self.entries = GitHubCrawler(cache_dir=os.path.join(self.test_dir, "cache")).get_offline_servers()
+
+    def test_apply_crawler_entry(self):
+        """크롤러 항목을 추가하면 검증을 통과하고 카탈로그 전용 키 없이 저장되는지 테스트"""
+        entry = self.entries[0]
+        self.assertIn('type', entry)
+        with self.manager.transaction() as txn:
+            txn.add(catalog_server_config(entry))
+        self.assertTrue(txn.committed)
+
+        with open(self.config_path, encoding='utf-8') as f:
+            saved = json.load(f)['mcpServers'][entry['name']]
+        self.assertTrue(saved['enabled'])
+        self.assertFalse(set(CATALOG_ONLY_KEYS) & set(saved))
+
+    def test_previous_catalog_keys_still_saved(self):
+        """이전 버전이 카탈로그 키까지 저장한 설정도 저장할 수 있는지 테스트"""
+        with self.manager.transaction() as txn:
+            for entry in self.entries[:3]:
+                txn.add(dict(entry, enabled=True))
+        self.assertTrue(txn.committed)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+MCP 서버 모델 테스트 스크립트
+
+이름 기반 조회/추가/삭제, 위치 이동, 보기 캐시와 이전 형식 변환을 테스트합니다.
+"""
+
+import os
+import sys
+import json
+import random
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config_manager import ConfigManager
+from config.server_model import ServerModel
+
+class TestServerModel(unittest.TestCase):
+    """MCP 서버 모델 테스트 클래스"""
+
+    def make_model(self, count):
+        return ServerModel((f"s{i}", {'command': 'npx', 'args': [str(i)]}) for i in range(count))
+
+    def test_move_index_matches_list_semantics(self):
+        """위치 이동이 list.insert(to, list.pop(from))와 같은 결과인지 테스트"""
+        rng = random.Random(7)
+        model = self.make_model(20)
+        expected = list(model.names())
+        for _ in range(200):
+            from_index, to_index = rng.randrange(20), rng.randrange(20)
+            self.assertTrue(model.move_index(from_index, to_index))
+            expected.insert(to_index, expected.pop(from_index))
+            self.assertEqual(model.names(), expected)
+            self.assertEqual(model.index_of(expected[5]), 5)
+        self.assertFalse(model.move_index(0, 20))
+        self.assertEqual([s['name'] for s in model.to_list()], expected)
+        self.assertEqual(list(model.to_mcp_servers()), expected)
+
+    def test_keyed_operations(self):
+        """이름 기반 추가/삭제/교체/이동과 복사본 분리를 테스트"""
+        model = self.make_model(4)
+        view = model.to_list()
+        self.assertTrue(model.insert('tail', {'command': 'uvx'}))
+        # 끝에 추가하면 기존 보기에 이어 붙임
+        self.assertIs(model.to_list(), view)
+        self.assertFalse(model.insert('s1', {}))
+
+        copy = model.copy()
+        self.assertTrue(copy.replace('s1', 'renamed', {'command': 'docker'}))
+        self.assertTrue(copy.move('tail', before='s0'))
+        self.assertEqual(copy.remove('s2'), {'command': 'npx', 'args': ['2']})
+        self.assertEqual(copy.names(), ['tail', 's0', 'renamed', 's3'])
+        self.assertEqual(model.names(), ['s0', 's1', 's2', 's3', 'tail'])
+        self.assertEqual(model.to_list()[-1], {'name': 'tail', 'command': 'uvx', 'args': [], 'env': {},
+                                               'description': "설명 없음", 'category': "일반"})
+
+        copy.insert('extra', {})
+        self.assertEqual(len(model), 5)
+        self.assertNotIn('extra', model)
+
+    def test_copy_on_first_write_only(self):
+        """스냅숏 뒤 첫 변경만 복사하고 이후 변경은 제자리에서 하는지 테스트"""
+        model = self.make_model(3)
+        view = model.to_list()
+        snapshot = model.copy()
+        self.assertIs(snapshot.to_list(), view)
+
+        self.assertTrue(model.insert('a', {}))
+        own_view = model.to_list()
+        self.assertIsNot(own_view, view)
+        self.assertEqual(len(view), 3)
+        # 같은 세대의 다음 변경은 복사하지 않고 캐시에 이어 붙임
+        servers = model._servers
+        self.assertTrue(model.insert('b', {}))
+        self.assertIs(model._servers, servers)
+        self.assertIs(model.to_list(), own_view)
+        self.assertEqual(snapshot.names(), ['s0', 's1', 's2'])
+
+        # 새 스냅숏을 만들면 다시 첫 변경 때 한 번 복사
+        second = model.copy()
+        self.assertEqual(model.remove('a'), {})
+        self.assertIsNot(model._servers, servers)
+        self.assertIn('a', second)
+        self.assertEqual(model.names(), ['s0', 's1', 's2', 'b'])
+
+    def test_legacy_config_migrated_once(self):
+        """이전 형식 설정을 한 번만 변환하고 저장 시 mcpServers로 옮기는지 테스트"""
+        test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, test_dir, ignore_errors=True)
+        config_path = os.path.join(test_dir, "claude_desktop_config.json")
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump({'mcp_servers': [{'name': 'old', 'command': 'npx', 'url': 'x'}, {'command': 'nameless'}]}, f)
+        manager = ConfigManager(config_path=config_path)
+
+        with patch.object(ServerModel, 'from_list', wraps=ServerModel.from_list) as from_list:
+            for _ in range(3):
+                servers = manager.get_mcp_servers()
+            self.assertEqual(from_list.call_count, 1)
+        self.assertEqual(servers[0]['url'], 'x')
+
+        self.assertTrue(manager.add_mcp_server({'name': 'new', 'command': 'uvx'}))
+        with open(config_path, encoding='utf-8') as f:
+            config = json.load(f)
+        self.assertNotIn('mcp_servers', config)
+        self.assertEqual(list(config['mcpServers']), ['old', 'new'])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+유사 서버 추천 테스트 스크립트
+
+해시 n-gram 유사도 인덱스의 생성, 검색, 증분 갱신, 저장 기능을 테스트합니다.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler.similarity import SimilarityIndex
+
+class TestSimilarityIndex(unittest.TestCase):
+    """유사도 인덱스 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.servers = [
+            {'name': 'Brave Search', 'description': 'Web and local search using Brave Search API', 'category': 'search'},
+            {'name': 'Tavily', 'description': 'Search engine for AI agents (search + extract)', 'category': 'search'},
+            {'name': 'PostgreSQL', 'description': 'Read-only database access with schema inspection', 'category': 'database'},
+            {'name': 'SQLite', 'description': 'Database interaction and business intelligence', 'category': 'database'},
+        ]
+        self.index = SimilarityIndex()
+        self.index.build(self.servers)
+
+    def test_most_similar(self):
+        """유사 서버 검색 테스트"""
+        self.assertEqual(self.index.most_similar('Brave Search', k=1)[0][0], 'Tavily')
+        self.assertEqual(self.index.most_similar('PostgreSQL', k=1)[0][0], 'SQLite')
+        self.assertNotIn('Brave Search', [name for name, _ in self.index.most_similar('Brave Search', k=3)])
+        self.assertEqual(self.index.most_similar('Unknown'), [])
+
+    def test_incremental_update(self):
+        """변경된 행만 재계산하는 증분 갱신 테스트"""
+        servers = self.servers + [{'name': 'MySQL', 'description': 'MySQL database integration', 'category': 'database'}]
+        self.assertEqual(self.index.update(servers), 1)
+        self.assertIn('MySQL', [name for name, _ in self.index.most_similar('SQLite', k=2)])
+        self.assertEqual(self.index.update(servers), 0)
+
+    def test_save_and_load(self):
+        """저장 및 불러오기 테스트"""
+        test_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(test_dir, "similarity_index.npz")
+            self.index.save(path)
+            loaded = SimilarityIndex.load(path)
+            self.assertEqual(loaded.most_similar('Tavily', k=2), self.index.most_similar('Tavily', k=2))
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+설정 쓰기 지연 모드 테스트 스크립트
+
+연속된 변경을 한 번의 쓰기로 모으는지, 백그라운드 쓰기와 명시적 저장, 비정상 종료 후 저널 복구,
+쓰기 대기 중 외부 변경 병합을 테스트합니다.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+# 상위 디렉토리를 모듈 검색 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.config_manager import ConfigManager
+
+class TestWriteBehind(unittest.TestCase):
+    """설정 쓰기 지연 모드 테스트 클래스"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.test_dir, "claude_desktop_config.json")
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({'globalShortcut': 'Ctrl+Space', 'mcpServers': {
+                name: {'command': 'npx', 'args': [name]} for name in ('alpha', 'beta', 'gamma')}}, f)
+        # 테스트 중에는 타이머로 쓰지 않도록 긴 지연 시간 사용
+        self.manager = ConfigManager(config_path=self.config_path, write_delay=60)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.manager._cancel_flush()
+        self.manager._pending = None
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def on_disk(self):
+        with open(self.config_path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def test_mutations_coalesced_into_one_write(self):
+        """여러 변경이 메모리에 바로 반영되고 flush 때 한 번만 쓰이는지 테스트"""
+        # 첫 변경은 저널 체크포인트를 만들므로 미리 한 번 저장
+        self.assertTrue(self.manager.add_mcp_server({'name': 'delta', 'command': 'uvx'}))
+        self.assertTrue(self.manager.flush())
+
+        with patch('config.config_manager.os.replace', wraps=os.replace) as replace:
+            for _ in range(5):
+                self.assertTrue(self.manager.move_mcp_server(0, 3))
+            self.assertTrue(self.manager.delete_mcp_server('beta'))
+            self.assertTrue(self.manager.has_pending_writes())
+            self.assertEqual([s['name'] for s in self.manager.get_mcp_servers()], ['gamma', 'delta', 'alpha'])
+            self.assertEqual(list(self.on_disk()['mcpServers']), ['alpha', 'beta', 'gamma', 'delta'])
+
+            self.assertTrue(self.manager.flush())
+            writes = [c for c in replace.call_args_list if c.args[1] == self.config_path]
+        self.assertEqual(len(writes), 1)
+        self.assertFalse(self.manager.has_pending_writes())
+        self.assertEqual(list(self.on_disk()['mcpServers']), ['gamma', 'delta', 'alpha'])
+        self.assertEqual(self.manager.config_at(), self.on_disk())
+
+    def test_background_flush_after_idle(self):
+        """마지막 변경 후 지연 시간이 지나면 백그라운드에서 파일에 쓰는지 테스트"""
+        self.manager.write_delay = 0.05
+        self.assertTrue(self.manager.add_mcp_server({'name': 'delta', 'command': 'uvx'}))
+        deadline = time.time() + 5
+        while self.manager.has_pending_writes() and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertIn('delta', self.on_disk()['mcpServers'])
+
+    def test_explicit_save_flushes(self):
+        """명시적 저장이 기다리는 변경을 먼저 쓰는지 테스트"""
+        self.assertTrue(self.manager.delete_mcp_server('alpha'))
+        self.assertTrue(self.manager.save_mcp_servers(self.manager.get_mcp_servers()))
+        self.assertFalse(self.manager.has_pending_writes())
+        self.assertNotIn('alpha', self.on_disk()['mcpServers'])
+
+    def test_crash_recovered_from_journal(self):
+        """파일에 쓰기 전에 종료되어도 다음 실행 시 저널에서 모든 변경이 복구되는지 테스트"""
+        self.assertTrue(self.manager.delete_mcp_server('alpha'))
+        self.assertTrue(self.manager.flush())
+        self.assertTrue(self.manager.move_mcp_server(1, 0))
+        self.assertTrue(self.manager.add_mcp_server({'name': 'delta', 'command': 'uvx'}))
+        expected = self.manager.load_config()
+        # 비정상 종료 흉내 (쓰기 취소)
+        self.manager._cancel_flush()
+        self.manager._pending = None
+        self.assertEqual(list(self.on_disk()['mcpServers']), ['beta', 'gamma'])
+
+        ConfigManager(config_path=self.config_path)
+        self.assertEqual(self.on_disk(), expected)
+
+    def test_external_change_while_pending_merged(self):
+        """쓰기를 기다리는 동안 외부에서 바뀐 설정을 병합하는지 테스트"""
+        self.assertTrue(self.manager.delete_mcp_server('alpha'))
+        config = self.on_disk()
+        config['mcpServers']['epsilon'] = {'command': 'docker'}
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump(config, f)
+        st = os.stat(self.config_path)
+        os.utime(self.config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1000))
+
+        self.assertEqual([s['name'] for s in self.manager.get_mcp_servers()], ['beta', 'gamma', 'epsilon'])
+        self.assertFalse(self.manager.has_pending_writes())
+        self.assertEqual(list(self.on_disk()['mcpServers']), ['beta', 'gamma', 'epsilon'])
+
+    def test_reload_and_undo_wait_for_lock(self):
+        """다른 스레드가 잠금을 가진 동안 다시 읽기와 실행 취소가 기다리는지 테스트"""
+        self.assertTrue(self.manager.delete_mcp_server('beta'))
+        self.assertTrue(self.manager.flush())
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump({'mcpServers': {'alpha': {'command': 'npx'}, 'gamma': {'command': 'npx'}, 'x': {}}}, f)
+        disk_reads = self.manager.cache_stats['disk_reads']
+
+        results = {}
+        workers = [threading.Thread(target=lambda: results.update(servers=self.manager.get_mcp_servers())),
+                   threading.Thread(target=lambda: results.update(undone=self.manager.undo()))]
+        with self.manager._lock:
+            for worker in workers:
+                worker.start()
+            time.sleep(0.1)
+            self.assertEqual(self.manager.cache_stats['disk_reads'], disk_reads)
+            self.assertTrue(self.manager._recording_history)
+        for worker in workers:
+            worker.join(5)
+
+        self.assertTrue(results['undone'])
+        self.assertIn('x', [s['name'] for s in results['servers']])
+        self.assertTrue(self.manager._recording_history)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,5 +5,10 @@ PyQt6를 사용한 사용자 인터페이스 구현을 제공합니다.
 """
 
 from .main_window import MainWindow
+from .image_cache import ImageLoader, ImageDiskCache
+from .readme_preview import ReadmePreviewLoader
+from .config_watcher import ConfigWatcher
+from .config_worker import AsyncConfigManager
+from .catalog_worker import CatalogWorker
 
-__all__ = ['MainWindow']
+__all__ = ['MainWindow', 'ImageLoader', 'ImageDiskCache', 'ReadmePreviewLoader', 'ConfigWatcher', 'AsyncConfigManager', 'CatalogWorker']
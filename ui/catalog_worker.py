@@ -0,0 +1,235 @@
+"""
+카탈로그 작업자 모듈
+
+카탈로그 새로고침 후처리(SQLite 카탈로그 저장소 갱신, 유사 서버 인덱스 갱신/저장, 정렬 순열 계산)와
+보강 정보 저장을 작업 스레드에서 실행하는 비동기 창구입니다.
+작업은 전용 작업 스레드(스레드 1개인 QThreadPool)에서 요청 순서대로 실행하고, 메인 스레드에는 완성된
+결과(새 인덱스, 새 순위 엔진)만 시그널로 전달하여 메인 스레드가 교체만 하도록 합니다.
+
+SQLite 연결은 만든 스레드에서만 쓸 수 있으므로 작업마다 카탈로그 저장소 연결을 열고 닫습니다.
+"""
+
+import logging
+import itertools
+from concurrent.futures import Future
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from crawler.github_crawler import GitHubCrawler
+from crawler.catalog_store import CatalogStore
+from crawler.ranking import RankingEngine
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('catalog_worker')
+
+
+def _open_store(db_path):
+    """카탈로그 저장소 연결을 엽니다 (작업 스레드). 경로가 없거나 열 수 없으면 None"""
+    if not db_path:
+        return None
+    try:
+        return CatalogStore(db_path)
+    except Exception as e:
+        logger.error(f"카탈로그 저장소 열기 오류: {e}")
+        return None
+
+
+def _build_ranking(store, servers):
+    """보강 정보를 반영하여 순위 엔진을 새로 만듭니다 (작업 스레드)."""
+    enrichment = {}
+    if store is not None:
+        try:
+            enrichment = store.get_all_enrichment()
+        except Exception as e:
+            logger.error(f"보강 정보 조회 오류: {e}")
+    ranking = RankingEngine()
+    try:
+        ranking.build(servers, enrichment)
+    except Exception as e:
+        logger.error(f"카탈로그 순위 계산 오류: {e}")
+        return None
+    return ranking
+
+
+def _refresh(db_path, similarity_index, index_path, servers):
+    """
+    새로 받은 카탈로그로 저장소, 유사 서버 인덱스, 순위를 갱신합니다 (작업 스레드).
+    유사 서버 인덱스는 복사본을 갱신하므로 메인 스레드는 결과를 받을 때까지 원본을 계속 조회할 수 있습니다.
+    """
+    store = _open_store(db_path)
+    try:
+        # 카탈로그 저장소 갱신 (단일 트랜잭션)
+        if store is not None:
+            try:
+                store.upsert_servers(servers)
+                store.record_history('refresh', payload={'count': len(servers)})
+            except Exception as e:
+                logger.error(f"카탈로그 저장소 갱신 오류: {e}")
+
+        # 유사 서버 인덱스 갱신 (변경된 행만 재계산)
+        index = similarity_index.copy()
+        try:
+            if index.update(servers):
+                index.save(index_path)
+        except Exception as e:
+            logger.error(f"유사 서버 인덱스 갱신 오류: {e}")
+            index = similarity_index
+
+        return {'servers': servers, 'similarity_index': index, 'ranking': _build_ranking(store, servers)}
+    finally:
+        if store is not None:
+            store.close()
+
+
+def _rank(db_path, servers):
+    """저장된 보강 정보로 순위 엔진을 새로 만듭니다 (작업 스레드)."""
+    store = _open_store(db_path)
+    try:
+        return {'servers': servers, 'ranking': _build_ranking(store, servers)}
+    finally:
+        if store is not None:
+            store.close()
+
+
+def _save_enrichment(db_path, name, result):
+    """보강 정보를 기존 정보와 합쳐 저장합니다 (작업 스레드). 저장했으면 True"""
+    store = _open_store(db_path)
+    if store is None:
+        return False
+    try:
+        enrichment = store.get_enrichment(name) or {}
+        enrichment.update(result)
+        store.set_enrichment(name, enrichment)
+        return True
+    except Exception as e:
+        logger.error(f"보강 정보 저장 오류: {e}")
+        return False
+    finally:
+        store.close()
+
+
+class _CatalogTaskSignals(QObject):
+    """카탈로그 작업 결과 시그널 (QRunnable은 시그널을 가질 수 없음)"""
+    done = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+
+
+class _CatalogTask(QRunnable):
+    """카탈로그 작업"""
+
+    def __init__(self, signals, call_id, function, args, future):
+        super().__init__()
+        self.signals = signals
+        self.call_id = call_id
+        self.function = function
+        self.args = args
+        self.future = future
+
+    def run(self):
+        """작업 실행 (작업 스레드)"""
+        try:
+            result = self.function(*self.args)
+        except Exception as e:
+            logger.error(f"카탈로그 작업 오류: {e}")
+            self.future.set_exception(e)
+            self.signals.failed.emit(self.call_id, str(e))
+            return
+        self.future.set_result(result)
+        self.signals.done.emit(self.call_id, result)
+
+
+class CatalogWorker(QObject):
+    """카탈로그 후처리 비동기 창구 클래스"""
+
+    def __init__(self, db_path=None, index_path=None, parent=None):
+        """
+        CatalogWorker 초기화
+
+        Args:
+            db_path (str, optional): 카탈로그 저장소 데이터베이스 경로. None이면 저장소 작업을 건너뜁니다.
+            index_path (str, optional): 유사 서버 인덱스 파일 경로
+            parent (QObject, optional): 부모 객체
+        """
+        super().__init__(parent)
+        self.db_path = db_path
+        self.index_path = index_path
+        # 작업 번호 -> (작업 이름, 완료 콜백)
+        self._callbacks = {}
+        self._ids = itertools.count(1)
+
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(1)
+        self._signals = _CatalogTaskSignals()
+        self._signals.done.connect(self._on_done)
+        self._signals.failed.connect(self._on_failed)
+
+    def _submit(self, name, function, *args, on_done=None):
+        """function(*args)를 작업 스레드에서 실행하고 결과를 메인 스레드의 on_done으로 전달합니다."""
+        call_id = next(self._ids)
+        future = Future()
+        self._callbacks[call_id] = (name, on_done)
+        self.pool.start(_CatalogTask(self._signals, call_id, function, args, future))
+        return future
+
+    def load_offline(self, on_done=None):
+        """
+        캐시 또는 카탈로그 번들에서 MCP 서버 목록을 읽습니다. 결과는 서버 정보 목록입니다.
+
+        Returns:
+            Future: 작업 결과
+        """
+        return self._submit("오프라인 목록", lambda: GitHubCrawler().get_offline_servers(), on_done=on_done)
+
+    def refresh(self, servers, similarity_index, on_done=None):
+        """
+        새로 받은 카탈로그로 저장소, 유사 서버 인덱스, 순위를 갱신합니다.
+        결과는 {'servers', 'similarity_index', 'ranking'}이며 ranking은 계산에 실패하면 None입니다.
+
+        Args:
+            servers (list): MCP 서버 정보 목록
+            similarity_index (SimilarityIndex): 현재 유사 서버 인덱스 (복사본을 갱신하므로 바뀌지 않음)
+
+        Returns:
+            Future: 작업 결과
+        """
+        return self._submit("카탈로그 갱신", _refresh, self.db_path, similarity_index, self.index_path, servers,
+                            on_done=on_done)
+
+    def rank(self, servers, on_done=None):
+        """
+        저장된 보강 정보로 순위를 다시 계산합니다. 결과는 {'servers', 'ranking'}입니다.
+
+        Returns:
+            Future: 작업 결과
+        """
+        return self._submit("카탈로그 순위", _rank, self.db_path, servers, on_done=on_done)
+
+    def save_enrichment(self, name, result, on_done=None):
+        """
+        서버의 보강 정보를 저장합니다. 결과는 저장 여부입니다.
+
+        Returns:
+            Future: 작업 결과
+        """
+        return self._submit("보강 정보 저장", _save_enrichment, self.db_path, name, dict(result), on_done=on_done)
+
+    def _on_done(self, call_id, result):
+        """작업 완료 처리 (메인 스레드)"""
+        name, on_done = self._callbacks.pop(call_id, (None, None))
+        if on_done is not None:
+            on_done(result)
+
+    def _on_failed(self, call_id, message):
+        """작업 실패 처리 (메인 스레드)"""
+        name, _ = self._callbacks.pop(call_id, (None, None))
+        logger.error(f"{name} 작업 실패: {message}")
+
+    def shutdown(self, timeout_ms=10000):
+        """
+        대기 중인 작업이 모두 끝날 때까지 기다립니다.
+
+        Args:
+            timeout_ms (int, optional): 최대 대기 시간 (밀리초). 기본값은 10000입니다.
+        """
+        self.pool.waitForDone(timeout_ms)
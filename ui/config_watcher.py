@@ -0,0 +1,260 @@
+"""
+설정 파일 감시 모듈
+
+claude_desktop_config.json과 관리자 설정 파일이 외부에서 변경되는 것을 감시합니다.
+QFileSystemWatcher 알림과 파일 상태(stat) 폴링을 함께 사용하고, 짧은 시간에 몰린 이벤트는
+한 번으로 모아 내용이 실제로 바뀐 경우에만 알립니다.
+
+파일 상태 확인과 내용 해시는 감시 전용 작업 스레드(스레드 1개인 QThreadPool)에서 요청 순서대로 실행하고,
+결과는 시그널로 메인 스레드에 전달합니다. 느린 디스크에서도 메인 창이 설정 파일을 읽지 않습니다.
+"""
+
+import os
+import hashlib
+import logging
+import itertools
+from concurrent.futures import Future
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, QFileSystemWatcher, pyqtSignal
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('config_watcher')
+
+# 이벤트를 모으는 시간 (밀리초)
+DEBOUNCE_MS = 300
+# 알림을 받지 못하는 환경(네트워크 드라이브, 파일 교체 직후 등)을 위한 폴링 주기 (밀리초)
+POLL_MS = 2000
+
+
+def _stat_key(path):
+    """파일 상태 키 (mtime_ns, 크기, inode)를 반환합니다. 파일이 없으면 None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _content_digest(path):
+    """파일 내용의 SHA-256 해시를 반환합니다. 파일이 없으면 None"""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+class _FileStates:
+    """감시 중인 파일의 (상태 키, 내용 해시) 기록 (감시 작업 스레드에서만 사용)"""
+
+    def __init__(self):
+        # 경로 -> (상태 키, 내용 해시)
+        self.known = {}
+
+    def add(self, path):
+        """
+        현재 내용을 기준으로 기록합니다.
+
+        Returns:
+            bool: 파일 존재 여부
+        """
+        key = _stat_key(path)
+        self.known[path] = (key, _content_digest(path))
+        return key is not None
+
+    def remove(self, path):
+        """기록을 지웁니다."""
+        self.known.pop(path, None)
+
+    def check(self):
+        """
+        파일 상태가 바뀐 파일만 내용을 비교합니다.
+
+        Returns:
+            tuple: (내용이 바뀐 파일 경로 목록, 존재하는 파일 경로 목록)
+        """
+        changed = []
+        existing = []
+        for path, (key, digest) in list(self.known.items()):
+            new_key = _stat_key(path)
+            if new_key is not None:
+                existing.append(path)
+            if new_key == key:
+                continue
+            # 상태만 바뀌고 내용이 같으면(touch, 같은 내용 저장) 알리지 않음
+            new_digest = _content_digest(path)
+            self.known[path] = (new_key, new_digest)
+            if new_digest != digest:
+                changed.append(path)
+        return changed, existing
+
+
+class _WatchTaskSignals(QObject):
+    """감시 작업 결과 시그널 (QRunnable은 시그널을 가질 수 없음)"""
+    done = pyqtSignal(int, object)
+
+
+class _WatchTask(QRunnable):
+    """감시 작업"""
+
+    def __init__(self, signals, call_id, function, args, future):
+        super().__init__()
+        self.signals = signals
+        self.call_id = call_id
+        self.function = function
+        self.args = args
+        self.future = future
+
+    def run(self):
+        """작업 실행 (감시 작업 스레드)"""
+        try:
+            result = self.function(*self.args)
+        except Exception as e:
+            logger.error(f"설정 파일 감시 작업 오류: {e}")
+            self.future.set_exception(e)
+            self.signals.done.emit(self.call_id, None)
+            return
+        self.future.set_result(result)
+        self.signals.done.emit(self.call_id, result)
+
+
+class ConfigWatcher(QObject):
+    """설정 파일 감시 클래스"""
+
+    # 내용이 바뀐 파일 경로
+    file_changed = pyqtSignal(str)
+
+    def __init__(self, paths=(), debounce_ms=DEBOUNCE_MS, poll_ms=POLL_MS, parent=None):
+        """
+        ConfigWatcher 초기화
+
+        Args:
+            paths (iterable, optional): 감시할 파일 경로 목록
+            debounce_ms (int, optional): 이벤트를 모으는 시간 (밀리초). 기본값은 300입니다.
+            poll_ms (int, optional): 파일 상태 폴링 주기 (밀리초). 0이면 폴링하지 않습니다. 기본값은 2000입니다.
+            parent (QObject, optional): 부모 객체
+        """
+        super().__init__(parent)
+        # 감시 중인 경로 (메인 스레드), 파일 상태 기록은 작업 스레드가 가짐
+        self._paths = []
+        self._states = _FileStates()
+        # 작업 번호 -> 완료 콜백, 진행 중인 확인 작업 수
+        self._callbacks = {}
+        self._ids = itertools.count(1)
+        self._pending_checks = 0
+
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(1)
+        self._signals = _WatchTaskSignals()
+        self._signals.done.connect(self._on_done)
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self._on_event)
+
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(debounce_ms)
+        self.debounce_timer.timeout.connect(self.check_now)
+
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(poll_ms)
+        self.poll_timer.timeout.connect(self._poll)
+        if poll_ms > 0:
+            self.poll_timer.start()
+
+        for path in paths:
+            self.add_path(path)
+
+    def _submit(self, function, *args, on_done=None):
+        """function(*args)를 감시 작업 스레드에서 실행하고 결과를 메인 스레드의 on_done으로 전달합니다."""
+        call_id = next(self._ids)
+        future = Future()
+        self._callbacks[call_id] = on_done
+        self.pool.start(_WatchTask(self._signals, call_id, function, args, future))
+        return future
+
+    def _on_done(self, call_id, result):
+        """작업 완료 처리 (메인 스레드)"""
+        on_done = self._callbacks.pop(call_id, None)
+        if on_done is not None:
+            on_done(result)
+
+    def add_path(self, path):
+        """
+        감시할 파일을 추가합니다. 현재 내용을 기준으로 이후 변경만 알립니다 (기준은 작업 스레드에서 기록).
+
+        Args:
+            path (str): 파일 경로
+        """
+        path = os.path.abspath(path)
+        if path not in self._paths:
+            self._paths.append(path)
+        self._submit(self._states.add, path, on_done=lambda exists: self._watch([path] if exists else []))
+
+    def remove_path(self, path):
+        """
+        파일 감시를 중단합니다.
+
+        Args:
+            path (str): 파일 경로
+        """
+        path = os.path.abspath(path)
+        if path in self._paths:
+            self._paths.remove(path)
+        self._submit(self._states.remove, path)
+        if path in self.watcher.files():
+            self.watcher.removePath(path)
+
+    def paths(self):
+        """감시 중인 파일 경로 목록을 반환합니다."""
+        return list(self._paths)
+
+    def _watch(self, paths):
+        """감시 중인 파일을 QFileSystemWatcher에 등록합니다 (이미 등록되어 있으면 무시)."""
+        files = self.watcher.files()
+        for path in paths:
+            if path in self._paths and path not in files:
+                self.watcher.addPath(path)
+
+    def _on_event(self, path):
+        """파일 변경 알림 처리 (디바운스 타이머 재시작). 교체된 파일은 확인 후 다시 등록합니다."""
+        self.debounce_timer.start()
+
+    def _poll(self):
+        """확인 중이 아니면 작업 스레드에서 파일 상태를 확인합니다."""
+        if self.debounce_timer.isActive() or self._pending_checks:
+            return
+        self.check_now()
+
+    def check_now(self):
+        """
+        감시 중인 파일을 작업 스레드에서 확인하고 내용이 바뀐 파일마다 file_changed 시그널을 보냅니다.
+
+        Returns:
+            Future: 내용이 바뀐 파일 경로 목록
+        """
+        self._pending_checks += 1
+        return self._submit(self._states.check, on_done=self._on_checked)
+
+    def _on_checked(self, result):
+        """확인 결과 처리 (메인 스레드)"""
+        self._pending_checks -= 1
+        if result is None:
+            return
+        changed, existing = result
+        # 편집기가 임시 파일로 교체하면 감시가 풀리므로 다시 등록
+        self._watch(existing)
+        for path in changed:
+            if path in self._paths:
+                logger.info(f"설정 파일 변경 감지: {path}")
+                self.file_changed.emit(path)
+
+    def stop(self):
+        """감시를 중단합니다."""
+        self.poll_timer.stop()
+        self.debounce_timer.stop()
+        if self.watcher.files():
+            self.watcher.removePaths(self.watcher.files())
+        self._paths = []
+        self.pool.waitForDone()
@@ -0,0 +1,357 @@
+"""
+설정 작업자 모듈
+
+ConfigManager의 파일 작업(서버 추가/삭제/이동, 실행 취소, 다시 읽기, 저장, 백업, 백업 목록, 복원, 프로필, 설정 파일 전환)을 작업 스레드에서 실행하는 비동기 창구입니다.
+설정 파일 경로마다 전용 작업 스레드(스레드 1개인 QThreadPool)를 두어 같은 파일에 대한 작업은 요청 순서대로 실행하고,
+결과는 시그널로 메인 스레드에 전달하여 콜백을 호출합니다. 네트워크 드라이브나 로밍 프로필처럼 느린 디스크에서도
+메인 창이 파일 작업을 기다리지 않습니다.
+
+요청 메서드는 concurrent.futures.Future를 반환하므로 종료 처리나 테스트에서는 결과를 기다릴 수도 있습니다.
+작업 결과에는 작업 후 서버 목록을 함께 담아, 메인 스레드에서 목록을 갱신할 때 다시 읽지 않도록 합니다.
+"""
+
+import os
+import logging
+import itertools
+from concurrent.futures import Future
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('config_worker')
+
+
+def _outcome(manager, ok, **extra):
+    """
+    작업 결과를 작업 후 서버 목록, 충돌 목록과 함께 반환합니다 (작업 스레드).
+    ok는 오류가 없었는지만 나타내며, 바꿀 것이 없었던 작업도 성공입니다.
+    """
+    result = {'ok': ok, 'conflicts': list(manager.last_conflicts), 'servers': manager.get_mcp_servers()}
+    result.update(extra)
+    return result
+
+
+def _add_servers(manager, servers):
+    """없는 서버만 한 번의 저장으로 추가합니다. count는 추가한 서버 수입니다."""
+    with manager.transaction() as txn:
+        count = sum(txn.add(server) for server in servers if server['name'] not in txn)
+    ok = txn.committed is not False
+    return _outcome(manager, ok, count=count if ok else 0)
+
+
+def _delete_servers(manager, names):
+    """서버들을 한 번의 저장으로 삭제합니다. count는 삭제한 서버 수입니다."""
+    with manager.transaction() as txn:
+        count = sum(txn.delete(name) for name in names)
+    ok = txn.committed is not False
+    return _outcome(manager, ok, count=count if ok else 0)
+
+
+def _move_servers(manager, rows, direction):
+    """
+    지정한 행의 서버들을 한 칸씩 한 번의 저장으로 이동합니다.
+    이동 방향의 끝에 가까운 행부터 처리하며 끝에 붙은 서버는 그대로 둡니다.
+    count는 실제로 이동한 서버 수, rows는 이동 후 각 서버의 행입니다.
+    """
+    new_rows = []
+    count = 0
+    with manager.transaction() as txn:
+        limit = 0 if direction < 0 else len(txn.model) - 1
+        for row in sorted(rows, reverse=direction > 0):
+            target = row + direction
+            if (direction < 0 and target >= limit) or (direction > 0 and target <= limit):
+                count += txn.move(row, target)
+                new_rows.append(target)
+                limit = row
+            else:
+                new_rows.append(row)
+                limit = row - direction
+    ok = txn.committed is not False
+    return _outcome(manager, ok, count=count if ok else 0, rows=new_rows if ok else list(rows))
+
+
+def _step_history(manager, undo):
+    """실행 취소(또는 다시 실행)합니다. count는 적용한 기록 수(0 또는 1)입니다."""
+    if not (manager.can_undo() if undo else manager.can_redo()):
+        return _outcome(manager, True, count=0)
+    done = manager.undo() if undo else manager.redo()
+    return _outcome(manager, done, count=1 if done else 0)
+
+
+def _reload(manager):
+    """설정 파일을 다시 읽어 서버 목록과 실행 설정 스냅샷을 반환합니다."""
+    return _outcome(manager, True, snapshot=manager.launch_snapshot())
+
+
+def _save_servers(manager):
+    """현재 서버 목록을 저장하고 저장 후 실행 설정 스냅샷을 함께 반환합니다."""
+    saved = manager.save_mcp_servers(manager.get_mcp_servers())
+    return _outcome(manager, saved, snapshot=manager.launch_snapshot() if saved else {})
+
+
+def _save_profile(manager, name):
+    """현재 서버 설정을 프로필로 저장하고 저장 후 프로필 목록을 함께 반환합니다."""
+    return _outcome(manager, manager.save_profile(name), profiles=manager.get_profiles())
+
+
+def _switch_profile(manager, name):
+    """프로필로 전환하고 전환 후 프로필 목록을 함께 반환합니다."""
+    return _outcome(manager, manager.switch_profile(name), profiles=manager.get_profiles())
+
+
+def _open_config(manager, factory):
+    """현재 설정 파일의 대기 중인 쓰기를 파일에 쓴 뒤 factory()로 새 설정 파일 관리자를 만듭니다."""
+    manager.flush()
+    return factory()
+
+
+def _restore(manager, backup_file):
+    """백업에서 복원합니다."""
+    return _outcome(manager, manager.restore_backup(backup_file))
+
+
+class _ConfigTaskSignals(QObject):
+    """설정 작업 결과 시그널 (QRunnable은 시그널을 가질 수 없음)"""
+    done = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+
+
+class _ConfigTask(QRunnable):
+    """설정 작업"""
+
+    def __init__(self, signals, call_id, function, args, future):
+        super().__init__()
+        self.signals = signals
+        self.call_id = call_id
+        self.function = function
+        self.args = args
+        self.future = future
+
+    def run(self):
+        """작업 실행 (작업 스레드)"""
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self.function(*self.args)
+        except Exception as e:
+            logger.error(f"설정 작업 오류: {e}")
+            self.future.set_exception(e)
+            self.signals.failed.emit(self.call_id, str(e))
+            return
+        self.future.set_result(result)
+        self.signals.done.emit(self.call_id, result)
+
+
+class AsyncConfigManager(QObject):
+    """ConfigManager 비동기 창구 클래스"""
+
+    def __init__(self, manager, parent=None):
+        """
+        AsyncConfigManager 초기화
+
+        Args:
+            manager (ConfigManager): 설정 파일 관리자. 설정 파일이 바뀌면 manager 속성을 교체합니다.
+            parent (QObject, optional): 부모 객체
+        """
+        super().__init__(parent)
+        self.manager = manager
+        # 설정 파일 경로 -> 전용 작업 스레드 (경로별 작업 순서 보장)
+        self._pools = {}
+        # 작업 번호 -> (작업 이름, 완료 콜백, 오류 콜백)
+        self._callbacks = {}
+        self._ids = itertools.count(1)
+
+        self._signals = _ConfigTaskSignals()
+        self._signals.done.connect(self._on_done)
+        self._signals.failed.connect(self._on_failed)
+
+    def _pool(self, config_path):
+        """설정 파일 경로의 작업 스레드를 반환합니다."""
+        key = os.path.abspath(config_path)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = QThreadPool()
+            pool.setMaxThreadCount(1)
+            self._pools[key] = pool
+        return pool
+
+    def submit(self, name, function, *args, on_done=None, on_error=None):
+        """
+        function(manager, *args)를 현재 설정 파일의 작업 스레드에서 실행합니다.
+
+        Args:
+            name (str): 작업 이름 (로그용)
+            function (callable): 실행할 함수. 첫 인자로 ConfigManager를 받습니다.
+            *args: 함수에 전달할 인자
+            on_done (callable, optional): 결과를 받는 콜백 (메인 스레드에서 호출)
+            on_error (callable, optional): 오류 메시지를 받는 콜백 (메인 스레드에서 호출)
+
+        Returns:
+            Future: 작업 결과
+        """
+        manager = self.manager
+        call_id = next(self._ids)
+        future = Future()
+        self._callbacks[call_id] = (name, on_done, on_error)
+        self._pool(manager.config_path).start(_ConfigTask(self._signals, call_id, function, (manager, *args), future))
+        return future
+
+    def add_servers(self, servers, on_done=None, on_error=None):
+        """
+        서버들을 추가합니다 (이미 있는 서버는 건너뜀). 결과는 {'ok', 'conflicts', 'servers', 'count'}이며
+        count는 실제로 추가한 서버 수입니다.
+
+        Returns:
+            Future: 작업 결과
+        """
+        return self.submit("서버 추가", _add_servers, [dict(server) for server in servers],
+                           on_done=on_done, on_error=on_error)
+
+    def delete_servers(self, names, on_done=None, on_error=None):
+        """
+        서버들을 삭제합니다. 결과는 {'ok', 'conflicts', 'servers', 'count'}이며
+        count는 실제로 삭제한 서버 수입니다.
+
+        Returns:
+            Future: 작업 결과
+        """
+        return self.submit("서버 삭제", _delete_servers, list(names), on_done=on_done, on_error=on_error)
+
+    def move_servers(self, rows, direction, on_done=None, on_error=None):
+        """
+        지정한 행의 서버들을 한 칸씩 이동합니다 (direction이 -1이면 위로, 1이면 아래로).
+        결과는 {'ok', 'conflicts', 'servers', 'count', 'rows'}이며 rows는 이동 후 각 서버의 행입니다.
+
+        Returns:
+            Future: 작업 결과
+        """
+        return self.submit("서버 이동", _move_servers, list(rows), direction, on_done=on_done, on_error=on_error)
+
+    def step_history(self, undo=True, on_done=None, on_error=None):
+        """
+        마지막 서버 변경을 실행 취소(undo=False이면 다시 실행)합니다.
+        결과는 {'ok', 'conflicts', 'servers', 'count'}이며 되돌릴 기록이 없으면 count가 0입니다.
+
+        Returns:
+            Future: 작업 결과
+        """
+        return self.submit("실행 취소" if undo else "다시 실행", _step_history, undo,
+                           on_done=on_done, on_error=on_error)
+
+    def reload(self, on_done=None, on_error=None):
+        """
+        설정 파일을 다시 읽습니다. 결과는 {'ok', 'conflicts', 'servers', 'snapshot'}입니다.
+
+        Returns:
+            Future: 작업 결과
+        """
+        return self.submit("설정 다시 읽기", _reload, on_done=on_done, on_error=on_error)
+
+    def open_config(self, factory, on_done=None, on_error=None):
+        """
+        대기 중인 쓰기를 현재 설정 파일에 쓴 뒤 factory()로 새 ConfigManager를 만듭니다
+        (관리자 설정 읽기, 저널 복구 등 생성 시 파일 작업도 작업 스레드에서 실행).
+        결과는 만든 ConfigManager이며, manager 속성 교체는 호출자가 합니다.
+
+        Returns:
+            Future: 작업 결과
+        """
+        return self.submit("설정 파일 열기", _open_config, factory, on_done=on_done, on_error=on_error)
+
+    def flush(self, on_done=None, on_error=None):
+        """
+        쓰기를 기다리는 변경을 파일에 씁니다. 결과는 flush()의 반환값입니다.
+
+        Returns:
+            Future: 작업 결과
+        """
+        return self.submit("설정 쓰기", lambda manager: manager.flush(), on_done=on_done, on_error=on_error)
+
+    def save_servers(self, on_done=None, on_error=None):
+        """
+        현재 서버 목록을 저장합니다. 결과는 {'ok', 'conflicts', 'servers', 'snapshot'}이며
+        snapshot은 저장 후 실행 설정 스냅샷입니다.
+
+        Returns:
+            Future: 작업 결과
+        """
+        return self.submit("설정 저장", _save_servers, on_done=on_done, on_error=on_error)
+
+    def backup(self, reason=None, on_done=None, on_error=None):
+        """
+        설정 파일을 백업합니다. 결과는 백업 항목(실패하면 None)입니다.
+
+        Returns:
+            Future: 작업 결과
+        """
+        return self.submit("백업", lambda manager: manager._backup_config(reason=reason),
+                           on_done=on_done, on_error=on_error)
+
+    def backup_list(self, on_done=None, on_error=None):
+        """
+        백업 목록을 가져옵니다. 결과는 get_backup_list()와 같습니다.
+
+        Returns:
+            Future: 작업 결과
+        """
+        return self.submit("백업 목록", lambda manager: manager.get_backup_list(), on_done=on_done, on_error=on_error)
+
+    def restore(self, backup_file=None, on_done=None, on_error=None):
+        """
+        백업에서 설정을 복원합니다. 결과는 {'ok', 'conflicts', 'servers'}입니다.
+
+        Returns:
+            Future: 작업 결과
+        """
+        return self.submit("복원", _restore, backup_file, on_done=on_done, on_error=on_error)
+
+    def profiles(self, on_done=None, on_error=None):
+        """
+        프로필 목록을 가져옵니다. 결과는 get_profiles()와 같습니다.
+
+        Returns:
+            Future: 작업 결과
+        """
+        return self.submit("프로필 목록", lambda manager: manager.get_profiles(), on_done=on_done, on_error=on_error)
+
+    def save_profile(self, name, on_done=None, on_error=None):
+        """
+        현재 서버 설정을 프로필로 저장합니다. 결과는 {'ok', 'conflicts', 'servers', 'profiles'}입니다.
+
+        Returns:
+            Future: 작업 결과
+        """
+        return self.submit("프로필 저장", _save_profile, name, on_done=on_done, on_error=on_error)
+
+    def switch_profile(self, name, on_done=None, on_error=None):
+        """
+        프로필로 전환합니다. 결과는 {'ok', 'conflicts', 'servers', 'profiles'}입니다.
+
+        Returns:
+            Future: 작업 결과
+        """
+        return self.submit("프로필 전환", _switch_profile, name, on_done=on_done, on_error=on_error)
+
+    def _on_done(self, call_id, result):
+        """작업 완료 처리 (메인 스레드)"""
+        name, on_done, _ = self._callbacks.pop(call_id, (None, None, None))
+        if on_done is not None:
+            on_done(result)
+
+    def _on_failed(self, call_id, message):
+        """작업 실패 처리 (메인 스레드)"""
+        name, _, on_error = self._callbacks.pop(call_id, (None, None, None))
+        logger.error(f"{name} 작업 실패: {message}")
+        if on_error is not None:
+            on_error(message)
+
+    def shutdown(self, timeout_ms=10000):
+        """
+        대기 중인 작업이 모두 끝날 때까지 기다립니다 (종료 시 사용, 저장 요청을 버리지 않음).
+
+        Args:
+            timeout_ms (int, optional): 경로별 최대 대기 시간 (밀리초). 기본값은 10000입니다.
+        """
+        for pool in self._pools.values():
+            pool.waitForDone(timeout_ms)
@@ -0,0 +1,320 @@
+"""
+이미지 캐시 모듈
+
+MCP 목록 항목 옆에 표시할 소유자 아바타/프로젝트 아이콘을 비동기로 가져옵니다.
+동시 요청 수를 제한하고, 목록 행 크기로 축소하는 작업을 작업 스레드에서 수행하며,
+내용 주소 기반(content-addressed) 디스크 캐시와 디코딩된 QPixmap 메모리 LRU 캐시를 사용합니다.
+"""
+
+import os
+import re
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+import requests
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QBuffer, QIODevice, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
+
+from utils import json_io
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('image_cache')
+
+# 목록 행 아이콘 크기 (픽셀)
+ICON_SIZE = 24
+
+
+def avatar_url_for(server, size=ICON_SIZE * 2):
+    """
+    서버 정보에서 아바타 이미지 URL을 구합니다.
+    보강 정보의 avatar_url이 없으면 GitHub 저장소 소유자의 아바타를 사용합니다.
+
+    Args:
+        server (dict): MCP 서버 정보
+        size (int, optional): 요청할 이미지 크기. 기본값은 아이콘 크기의 2배(고해상도 대응)입니다.
+
+    Returns:
+        str: 이미지 URL. 알 수 없으면 None
+    """
+    if server.get('avatar_url'):
+        return server['avatar_url']
+    match = re.match(r'^https?://github\.com/([^/#?]+)', server.get('url') or '')
+    if match:
+        return f"https://github.com/{match.group(1)}.png?size={size}"
+    return None
+
+
+def default_fetcher(url):
+    """
+    URL에서 이미지 바이트를 다운로드합니다.
+
+    Args:
+        url (str): 이미지 URL
+
+    Returns:
+        bytes: 이미지 데이터
+    """
+    response = requests.get(url, headers={'User-Agent': 'MCP-Config-Manager/1.0'}, timeout=10)
+    response.raise_for_status()
+    return response.content
+
+
+class ImageDiskCache:
+    """내용 주소 기반 이미지 디스크 캐시 클래스"""
+
+    def __init__(self, cache_dir=None, flush_every=50):
+        """
+        ImageDiskCache 초기화
+
+        Args:
+            cache_dir (str, optional): 캐시 디렉토리 경로. 기본값은 None으로,
+                                      이 경우 ~/.mcp_config_manager/cache/images를 사용합니다.
+            flush_every (int, optional): 색인을 파일에 저장할 추가 항목 간격. 기본값은 50입니다.
+        """
+        if cache_dir is None:
+            home_dir = os.path.expanduser("~")
+            cache_dir = os.path.join(home_dir, ".mcp_config_manager", "cache", "images")
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self.cache_dir = cache_dir
+        self.index_file = os.path.join(cache_dir, "index.json")
+        self.flush_every = flush_every
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._index = self._load_index()
+        self._unsaved = 0
+
+    def _load_index(self):
+        """URL → 내용 해시 색인을 로드합니다."""
+        try:
+            return json_io.load(self.index_file)
+        except (OSError, ValueError):
+            return {}
+
+    def _blob_path(self, digest):
+        """내용 해시에 해당하는 파일 경로를 반환합니다."""
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.png")
+
+    def get(self, url):
+        """
+        URL의 캐시된 이미지 데이터를 가져옵니다.
+
+        Args:
+            url (str): 이미지 URL
+
+        Returns:
+            bytes: 축소된 PNG 데이터. 없으면 None
+        """
+        with self._lock:
+            digest = self._index.get(url)
+        if digest is None:
+            return None
+        try:
+            with open(self._blob_path(digest), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, url, data):
+        """
+        이미지 데이터를 저장합니다. 같은 내용은 한 번만 저장됩니다.
+
+        Args:
+            url (str): 이미지 URL
+            data (bytes): 축소된 PNG 데이터
+
+        Returns:
+            str: 내용 해시
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        with self._lock:
+            self._index[url] = digest
+            self._unsaved += 1
+            should_flush = self._unsaved >= self.flush_every
+        if should_flush:
+            self.flush()
+        return digest
+
+    def flush(self):
+        """URL 색인을 파일에 저장합니다."""
+        # 오래된 스냅샷이 최신 색인을 덮어쓰지 않도록 저장을 직렬화
+        with self._flush_lock:
+            with self._lock:
+                if not self._unsaved:
+                    return
+                snapshot = dict(self._index)
+                self._unsaved = 0
+            try:
+                temp_path = f"{self.index_file}.tmp"
+                json_io.dump(snapshot, temp_path)
+                os.replace(temp_path, self.index_file)
+            except OSError as e:
+                logger.error(f"이미지 캐시 색인 저장 실패: {e}")
+
+
+class _ImageTaskSignals(QObject):
+    """이미지 작업 결과 시그널 (QRunnable은 시그널을 가질 수 없음)"""
+    done = pyqtSignal(str, QImage)
+    failed = pyqtSignal(str)
+
+
+class _ImageTask(QRunnable):
+    """이미지 다운로드/축소 작업"""
+
+    def __init__(self, loader, url):
+        super().__init__()
+        self.loader = loader
+        self.url = url
+
+    def run(self):
+        """작업 실행 (작업 스레드)"""
+        # 대기 중에 화면 밖으로 스크롤된 요청은 버림
+        if not self.loader._is_wanted(self.url):
+            self.loader._finish(self.url)
+            self.loader._signals.failed.emit(self.url)
+            return
+
+        try:
+            data = self.loader.disk_cache.get(self.url)
+            if data is not None:
+                image = QImage.fromData(data)
+            else:
+                image = QImage.fromData(self.loader.fetcher(self.url))
+                if image.isNull():
+                    raise ValueError("이미지를 디코딩할 수 없습니다.")
+                size = self.loader.icon_size
+                image = image.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                                     Qt.TransformationMode.SmoothTransformation)
+                buffer = QBuffer()
+                buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+                image.save(buffer, "PNG")
+                self.loader.disk_cache.put(self.url, bytes(buffer.data()))
+            self.loader._finish(self.url)
+            self.loader._signals.done.emit(self.url, image)
+        except Exception as e:
+            logger.debug(f"이미지 로드 실패: {self.url}: {e}")
+            self.loader._finish(self.url)
+            self.loader._signals.failed.emit(self.url)
+
+
+class ImageLoader(QObject):
+    """동시 요청 수가 제한된 비동기 이미지 로더 클래스"""
+
+    # 시그널 정의 (메인 스레드에서 전달)
+    image_ready = pyqtSignal(str, QPixmap)
+
+    def __init__(self, cache_dir=None, max_concurrency=4, memory_items=512,
+                 icon_size=ICON_SIZE, fetcher=None, parent=None):
+        """
+        ImageLoader 초기화
+
+        Args:
+            cache_dir (str, optional): 디스크 캐시 디렉토리 경로
+            max_concurrency (int, optional): 최대 동시 요청 수. 기본값은 4입니다.
+            memory_items (int, optional): 메모리 LRU 캐시 항목 수. 기본값은 512입니다.
+            icon_size (int, optional): 축소할 아이콘 크기. 기본값은 ICON_SIZE입니다.
+            fetcher (callable, optional): URL을 받아 이미지 바이트를 반환하는 함수 (테스트용 대체 가능)
+            parent (QObject, optional): 부모 객체
+        """
+        super().__init__(parent)
+        self.disk_cache = ImageDiskCache(cache_dir)
+        self.fetcher = fetcher or default_fetcher
+        self.icon_size = icon_size
+        self.memory_items = memory_items
+        self.memory_cache = OrderedDict()
+        self.failed_urls = set()
+
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max_concurrency)
+
+        self._lock = threading.Lock()
+        self._wanted = set()
+        self._in_flight = set()
+
+        self._signals = _ImageTaskSignals()
+        self._signals.done.connect(self._on_done)
+        self._signals.failed.connect(self._on_failed)
+
+    def _is_wanted(self, url):
+        with self._lock:
+            return url in self._wanted
+
+    def _finish(self, url):
+        with self._lock:
+            self._in_flight.discard(url)
+
+    def cached(self, url):
+        """
+        메모리 캐시에 있는 QPixmap을 반환합니다.
+
+        Args:
+            url (str): 이미지 URL
+
+        Returns:
+            QPixmap: 캐시된 이미지. 없으면 None
+        """
+        pixmap = self.memory_cache.get(url)
+        if pixmap is not None:
+            self.memory_cache.move_to_end(url)
+        return pixmap
+
+    def set_wanted(self, urls):
+        """
+        현재 필요한(보이는 행의) 이미지 URL 목록을 지정하고 아직 없는 이미지를 요청합니다.
+        목록에서 빠진 URL의 대기 중인 요청은 시작 전에 버려집니다.
+
+        Args:
+            urls (iterable): 이미지 URL 목록
+
+        Returns:
+            int: 새로 요청한 이미지 수
+        """
+        urls = [url for url in dict.fromkeys(urls) if url]
+        with self._lock:
+            self._wanted = set(urls)
+            to_start = [url for url in urls
+                        if url not in self._in_flight and url not in self.memory_cache
+                        and url not in self.failed_urls]
+            self._in_flight.update(to_start)
+
+        for url in to_start:
+            self.pool.start(_ImageTask(self, url))
+        return len(to_start)
+
+    def pending_count(self):
+        """진행 중이거나 대기 중인 요청 수를 반환합니다."""
+        with self._lock:
+            return len(self._in_flight)
+
+    def _on_done(self, url, image):
+        """작업 완료 처리 (메인 스레드): QPixmap 변환 및 LRU 캐시 저장"""
+        pixmap = QPixmap.fromImage(image)
+        self.memory_cache[url] = pixmap
+        self.memory_cache.move_to_end(url)
+        while len(self.memory_cache) > self.memory_items:
+            self.memory_cache.popitem(last=False)
+        self.image_ready.emit(url, pixmap)
+
+    def _on_failed(self, url):
+        """작업 실패/취소 처리 (메인 스레드)"""
+        # 취소된 요청은 다시 보일 때 재요청, 실제 실패만 기록
+        if self._is_wanted(url):
+            self.failed_urls.add(url)
+
+    def shutdown(self):
+        """대기 중인 요청을 버리고 작업 스레드를 정리합니다."""
+        with self._lock:
+            self._wanted = set()
+        self.pool.clear()
+        self.pool.waitForDone(3000)
+        self.disk_cache.flush()
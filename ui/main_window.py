@@ -11,9 +11,11 @@ from PyQt6.QtWidgets import (QMainWindow, QTabWidget, QWidget, QVBoxLayout,
                             QListWidget, QListWidgetItem, QComboBox, 
                             QCheckBox, QScrollArea, QSplitter, QDialog,
                             QMessageBox, QGroupBox, QFormLayout, QTextEdit,
-                            QMenuBar)
-from PyQt6.QtCore import Qt, QSize, pyqtSignal
-from PyQt6.QtGui import QIcon, QFont, QAction
+                            QTextBrowser, QMenuBar, QInputDialog)
+from PyQt6.QtCore import Qt, QSize, QTimer, pyqtSignal
+from PyQt6.QtGui import QIcon, QFont, QAction, QPixmap
+
+from .image_cache import ICON_SIZE, avatar_url_for
 
 class MainWindow(QMainWindow):
     """MCP 설정 관리자의 메인 윈도우 클래스"""
@@ -59,6 +61,18 @@ class MainWindow(QMainWindow):
         
         # 상태 표시줄 설정 (초기화 시에는 기본값 설정, retranslateUi에서 변경)
         # self.statusBar().showMessage("준비") # retranslateUi에서 처리
+        
+        # 보강 작업 진행 상태 표시 (상태 표시줄 오른쪽)
+        self.enrichment_status = QLabel()
+        self.statusBar().addPermanentWidget(self.enrichment_status)
+        
+        # 목록 아이콘 로더 (set_image_loader로 연결)
+        self.image_loader = None
+        self._icon_rows = {}
+        self.icon_timer = QTimer(self)
+        self.icon_timer.setSingleShot(True)
+        self.icon_timer.setInterval(50)
+        self.icon_timer.timeout.connect(self.load_visible_icons)
 
     def _create_menu_bar(self):
         """메뉴바 생성 및 언어 변경 메뉴 추가"""
@@ -110,6 +124,12 @@ class MainWindow(QMainWindow):
         search_layout.addWidget(self.install_label)
         search_layout.addWidget(self.install_filter)
         
+        # 정렬 방식 (항목 데이터는 RankingEngine의 정렬 키)
+        self.sort_label = QLabel() # 텍스트는 retranslateUi에서 설정
+        self.sort_combo = QComboBox() # 항목은 retranslateUi에서 설정
+        search_layout.addWidget(self.sort_label)
+        search_layout.addWidget(self.sort_combo)
+        
         # 검색 버튼
         self.search_button = QPushButton() # 텍스트는 retranslateUi에서 설정
         search_layout.addWidget(self.search_button)
@@ -131,8 +151,16 @@ class MainWindow(QMainWindow):
         # MCP 목록 위젯
         self.mcp_list = QListWidget()
         self.mcp_list.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
+        self.mcp_list.setIconSize(QSize(ICON_SIZE, ICON_SIZE))
+        self.mcp_list.setUniformItemSizes(True)
+        self.mcp_list.verticalScrollBar().valueChanged.connect(self._schedule_icon_load)
         list_layout.addWidget(self.mcp_list)
         
+        # 아이콘 로드 전 자리 표시 (행 높이가 바뀌지 않도록 같은 크기의 투명 이미지)
+        placeholder = QPixmap(ICON_SIZE, ICON_SIZE)
+        placeholder.fill(Qt.GlobalColor.transparent)
+        self.placeholder_icon = QIcon(placeholder)
+        
         # 선택 버튼 영역
         button_layout = QHBoxLayout()
         self.select_all_button = QPushButton() # 텍스트는 retranslateUi에서 설정
@@ -173,6 +201,15 @@ class MainWindow(QMainWindow):
         self.detail_layout.addWidget(self.detail_name)
         self.detail_layout.addWidget(self.detail_description)
         
+        # README 미리보기 그룹 (작업 스레드에서 변환된 HTML 표시)
+        self.readme_group = QGroupBox() # 텍스트는 retranslateUi에서 설정
+        readme_layout = QVBoxLayout(self.readme_group)
+        self.readme_view = QTextBrowser()
+        self.readme_view.setOpenExternalLinks(True)
+        self.readme_view.setMinimumHeight(250)
+        readme_layout.addWidget(self.readme_view)
+        self.detail_layout.addWidget(self.readme_group)
+        
         # 설치 옵션 그룹
         self.install_group = QGroupBox() # 텍스트는 retranslateUi에서 설정
         self.install_layout = QVBoxLayout(self.install_group)
@@ -188,6 +225,14 @@ class MainWindow(QMainWindow):
         self.args_layout = QFormLayout(self.args_group)
         self.detail_layout.addWidget(self.args_group)
         
+        # 유사 서버 그룹
+        self.similar_group = QGroupBox() # 텍스트는 retranslateUi에서 설정
+        similar_layout = QVBoxLayout(self.similar_group)
+        self.similar_list = QListWidget()
+        self.similar_list.setMaximumHeight(120)
+        similar_layout.addWidget(self.similar_list)
+        self.detail_layout.addWidget(self.similar_group)
+        
         # 스크롤 영역에 상세 정보 컨텐츠 설정
         scroll_area.setWidget(self.detail_content)
         detail_layout.addWidget(scroll_area)
@@ -219,6 +264,15 @@ class MainWindow(QMainWindow):
         self.backup_button = QPushButton() # 텍스트는 retranslateUi에서 설정
         self.restore_button = QPushButton() # 텍스트는 retranslateUi에서 설정
         
+        # 프로필 (선택하면 해당 프로필로 전환)
+        self.profile_label = QLabel() # 텍스트는 retranslateUi에서 설정
+        self.profile_combo = QComboBox()
+        self.profile_combo.setMinimumContentsLength(12)
+        self.save_profile_button = QPushButton() # 텍스트는 retranslateUi에서 설정
+        
+        config_info_layout.addWidget(self.profile_label)
+        config_info_layout.addWidget(self.profile_combo)
+        config_info_layout.addWidget(self.save_profile_button)
         config_info_layout.addWidget(self.change_config_path_button)
         config_info_layout.addWidget(self.backup_button)
         config_info_layout.addWidget(self.restore_button)
@@ -312,18 +366,71 @@ class MainWindow(QMainWindow):
         else:
             self.args_layout.addRow(QLabel(self.tr("No argument options info")))
     
+    def show_readme_placeholder(self, text=None):
+        """
+        README 미리보기 자리 표시 문구 표시
+        
+        Args:
+            text (str, optional): 표시할 문구. 기본값은 로딩 중 문구입니다.
+        """
+        self.readme_view.setPlainText(text or self.tr("Loading README..."))
+    
+    def show_readme_html(self, html):
+        """
+        변환된 README 미리보기 표시
+        
+        Args:
+            html (str): README HTML
+        """
+        self.readme_view.setHtml(html)
+    
+    def show_similar_servers(self, similar_servers):
+        """
+        유사 서버 목록 표시
+        
+        Args:
+            similar_servers (list): 유사 서버 정보 목록
+        """
+        self.similar_list.clear()
+        
+        if not similar_servers:
+            self.similar_list.addItem(QListWidgetItem(self.tr("No similar servers found")))
+            return
+        
+        for server in similar_servers:
+            item = QListWidgetItem(server.get('name', self.tr('Unnamed MCP Server')))
+            item.setData(Qt.ItemDataRole.UserRole, server)
+            self.similar_list.addItem(item)
+    
     def populate_mcp_list(self, mcp_servers):
         """MCP 서버 목록 채우기"""
         # 목록 초기화
         self.mcp_list.clear()
+        self._icon_rows = {}
         
         # MCP 서버 추가
-        for server in mcp_servers:
+        for row, server in enumerate(mcp_servers):
             # 이름이 없는 경우 처리
             name = server.get('name', self.tr('Unnamed MCP Server')) 
-            item = QListWidgetItem(name)
+            item = QListWidgetItem(self.placeholder_icon, name)
             item.setData(Qt.ItemDataRole.UserRole, server)
             self.mcp_list.addItem(item)
+            
+            # 아이콘 URL별 행 번호 기록 (같은 소유자의 서버는 이미지 공유)
+            url = avatar_url_for(server)
+            if url:
+                self._icon_rows.setdefault(url, []).append(row)
+        
+        self.icon_timer.start()
+    
+    def current_sort_key(self):
+        """
+        선택된 정렬 방식 반환
+        
+        Returns:
+            str: 정렬 키
+        """
+        return self.sort_combo.currentData() or 'default'
     
     def populate_my_mcp_list(self, my_mcp_servers):
         """내 MCP 서버 목록 채우기"""
@@ -338,6 +445,131 @@ class MainWindow(QMainWindow):
             item.setData(Qt.ItemDataRole.UserRole, server)
             self.my_mcp_list.addItem(item)
     
+    def update_my_mcp_list(self, my_mcp_servers):
+        """
+        내 MCP 서버 목록을 다시 만들지 않고 바뀐 항목만 반영합니다.
+        그대로 남은 항목은 선택 상태가 유지됩니다.
+        
+        Args:
+            my_mcp_servers (list): 새 MCP 서버 목록
+            
+        Returns:
+            dict: 반영한 변경 수 ('added', 'removed', 'updated', 'moved')
+        """
+        counts = {'added': 0, 'removed': 0, 'updated': 0, 'moved': 0}
+        target_names = [server.get('name', self.tr('Unnamed MCP Server')) for server in my_mcp_servers]
+        wanted = set(target_names)
+        
+        # 사라진 서버 삭제 (뒤에서부터)
+        for row in range(self.my_mcp_list.count() - 1, -1, -1):
+            if self.my_mcp_list.item(row).text() not in wanted:
+                self.my_mcp_list.takeItem(row)
+                counts['removed'] += 1
+        
+        present = {self.my_mcp_list.item(row).text() for row in range(self.my_mcp_list.count())}
+        for index, (name, server) in enumerate(zip(target_names, my_mcp_servers)):
+            item = self.my_mcp_list.item(index)
+            if item is None or item.text() != name:
+                if name in present:
+                    # 아래쪽에 있는 항목을 이 위치로 옮김
+                    row = self._find_my_mcp_row(name, index + 1)
+                    selected = self.my_mcp_list.item(row).isSelected()
+                    item = self.my_mcp_list.takeItem(row)
+                    self.my_mcp_list.insertItem(index, item)
+                    item.setSelected(selected)
+                    counts['moved'] += 1
+                else:
+                    item = QListWidgetItem(name)
+                    item.setData(Qt.ItemDataRole.UserRole, server)
+                    self.my_mcp_list.insertItem(index, item)
+                    counts['added'] += 1
+                    continue
+            if item.data(Qt.ItemDataRole.UserRole) != server:
+                item.setData(Qt.ItemDataRole.UserRole, server)
+                counts['updated'] += 1
+        return counts
+    
+    def _find_my_mcp_row(self, name, start):
+        """내 MCP 목록의 start 행부터 이름이 같은 항목의 행을 찾습니다."""
+        for row in range(start, self.my_mcp_list.count()):
+            if self.my_mcp_list.item(row).text() == name:
+                return row
+        return -1
+    
+    def _visible_mcp_items(self):
+        """사용 가능한 MCP 목록에서 현재 화면에 보이는 항목 목록을 반환합니다."""
+        rect = self.mcp_list.viewport().rect()
+        first = self.mcp_list.indexAt(rect.topLeft())
+        if not first.isValid():
+            return []
+        last = self.mcp_list.indexAt(rect.bottomLeft())
+        last_row = last.row() if last.isValid() else self.mcp_list.count() - 1
+        
+        items = []
+        for row in range(first.row(), last_row + 1):
+            item = self.mcp_list.item(row)
+            if item is not None and not item.isHidden():
+                items.append(item)
+        return items
+    
+    def visible_mcp_names(self):
+        """
+        사용 가능한 MCP 목록에서 현재 화면에 보이는 서버 이름 목록을 반환합니다.
+        
+        Returns:
+            list: 서버 이름 목록
+        """
+        names = []
+        for item in self._visible_mcp_items():
+            mcp_info = item.data(Qt.ItemDataRole.UserRole) or {}
+            names.append(mcp_info.get('name', item.text()))
+        return names
+    
+    def set_image_loader(self, image_loader):
+        """
+        목록 아이콘 로더 연결
+        
+        Args:
+            image_loader (ImageLoader): 비동기 이미지 로더
+        """
+        self.image_loader = image_loader
+        image_loader.image_ready.connect(self._on_icon_ready)
+        self.icon_timer.start()
+    
+    def _schedule_icon_load(self, *args):
+        """스크롤 중에는 일정 간격으로만 보이는 행의 아이콘을 요청합니다."""
+        if not self.icon_timer.isActive():
+            self.icon_timer.start()
+    
+    def load_visible_icons(self):
+        """화면에 보이는 행의 아이콘만 요청합니다 (화면 밖으로 나간 대기 요청은 취소)."""
+        if self.image_loader is None:
+            return
+        
+        wanted = []
+        for item in self._visible_mcp_items():
+            url = avatar_url_for(item.data(Qt.ItemDataRole.UserRole) or {})
+            if not url:
+                continue
+            pixmap = self.image_loader.cached(url)
+            if pixmap is not None:
+                item.setIcon(QIcon(pixmap))
+            else:
+                wanted.append(url)
+        self.image_loader.set_wanted(wanted)
+    
+    def _on_icon_ready(self, url, pixmap):
+        """아이콘 로드 완료 시 해당 URL을 사용하는 행에 적용"""
+        icon = QIcon(pixmap)
+        for row in self._icon_rows.get(url, []):
+            item = self.mcp_list.item(row)
+            if item is not None:
+                item.setIcon(icon)
+    
+    def set_enrichment_status(self, text):
+        """보강 작업 진행 상태 표시"""
+        self.enrichment_status.setText(text)
+    
     def set_config_path(self, path):
         """설정 파일 경로 설정"""
         # self.config_path QLabel에 경로 설정
@@ -346,6 +578,34 @@ class MainWindow(QMainWindow):
         else:
              print("Warning: config_path QLabel not found or not a QLabel")
     
+    def set_profiles(self, profiles):
+        """
+        프로필 목록 설정 (현재 프로필 선택)
+        
+        Args:
+            profiles (list): 프로필 정보 목록 ({'name', 'servers', 'active'})
+        """
+        self.profile_combo.blockSignals(True)
+        self.profile_combo.clear()
+        # 저장된 프로필이 아닌 현재 설정 상태
+        self.profile_combo.addItem(self.tr("(Current)"), None)
+        for profile in profiles:
+            self.profile_combo.addItem(f"{profile['name']} ({profile['servers']})", profile['name'])
+            if profile['active']:
+                self.profile_combo.setCurrentIndex(self.profile_combo.count() - 1)
+        self.profile_combo.blockSignals(False)
+    
+    def ask_text(self, title, label):
+        """
+        텍스트 입력 받기
+        
+        Returns:
+            str: 입력한 텍스트. 취소하거나 비어 있으면 None
+        """
+        text, ok = QInputDialog.getText(self, title, label)
+        text = text.strip()
+        return text if ok and text else None
+    
     def show_error_message(self, title, message):
         """오류 메시지 표시"""
         QMessageBox.critical(self, title, message)
@@ -377,6 +637,16 @@ class MainWindow(QMainWindow):
         # self.category_filter.clear()
         # self.category_filter.addItems([self.tr("All"), self.tr("Search"), ...]) 
         self.install_label.setText(self.tr("Install Method:"))
+        self.sort_label.setText(self.tr("Sort:"))
+        sort_index = max(0, self.sort_combo.currentIndex())
+        self.sort_combo.blockSignals(True)
+        self.sort_combo.clear()
+        for text, key in ((self.tr("README Order"), 'default'), (self.tr("Name"), 'name'),
+                          (self.tr("Most Popular"), 'popular'), (self.tr("Recently Updated"), 'recent'),
+                          (self.tr("Best Maintained"), 'maintained')):
+            self.sort_combo.addItem(text, key)
+        self.sort_combo.setCurrentIndex(sort_index)
+        self.sort_combo.blockSignals(False)
         # self.install_filter.clear()
         # self.install_filter.addItems([self.tr("All"), "npm", "uvx", "docker"])
         self.search_button.setText(self.tr("Search"))
@@ -392,6 +662,8 @@ class MainWindow(QMainWindow):
         self.install_group.setTitle(self.tr("Installation Options"))
         self.env_group.setTitle(self.tr("Environment Variables"))
         self.args_group.setTitle(self.tr("Argument Options"))
+        self.similar_group.setTitle(self.tr("Similar Servers"))
+        self.readme_group.setTitle(self.tr("README"))
 
         # 내 MCP 탭
         self.config_label.setText(self.tr("Current Config File:"))
@@ -399,6 +671,10 @@ class MainWindow(QMainWindow):
         self.change_config_path_button.setText(self.tr("Change Path"))
         self.backup_button.setText(self.tr("Backup"))
         self.restore_button.setText(self.tr("Restore"))
+        self.profile_label.setText(self.tr("Profile:"))
+        self.save_profile_button.setText(self.tr("Save Profile"))
+        if self.profile_combo.count():
+            self.profile_combo.setItemText(0, self.tr("(Current)"))
         self.my_mcp_label.setText(self.tr("Installed MCP Servers"))
         self.add_button.setText(self.tr("Add"))
         self.edit_button.setText(self.tr("Edit"))
@@ -0,0 +1,228 @@
+"""
+README 미리보기 모듈
+
+선택한 MCP 서버의 README를 작업 스레드에서 내려받아 HTML로 변환합니다.
+변환 결과는 문서 해시 기준으로 메모이즈(메모리 + 디스크)되어, 같은 문서는 한 번만 변환되고
+다시 선택한 서버의 미리보기는 즉시 표시됩니다.
+"""
+
+import os
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+import markdown
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('readme_preview')
+
+# 변환 방식이 바뀌면 증가 (디스크에 저장된 HTML 무효화)
+RENDERER_VERSION = 1
+
+# 변환할 README 최대 길이 (문자 수)
+MAX_README_CHARS = 200000
+
+
+def document_digest(text):
+    """
+    README 원문의 문서 해시를 반환합니다.
+
+    Args:
+        text (str): README 마크다운 원문
+
+    Returns:
+        str: 변환기 버전을 포함한 SHA-256 해시
+    """
+    return hashlib.sha256(f"{RENDERER_VERSION}\0{text}".encode('utf-8')).hexdigest()
+
+
+def render_markdown(text):
+    """
+    README 마크다운을 HTML로 변환합니다. 너무 긴 문서는 앞부분만 변환합니다.
+
+    Args:
+        text (str): README 마크다운 원문
+
+    Returns:
+        str: HTML 문자열
+    """
+    truncated = len(text) > MAX_README_CHARS
+    html = markdown.markdown(text[:MAX_README_CHARS], extensions=['fenced_code', 'tables'])
+    if truncated:
+        html += "<p><i>…</i></p>"
+    return html
+
+
+class _ReadmeTaskSignals(QObject):
+    """README 작업 결과 시그널 (QRunnable은 시그널을 가질 수 없음)"""
+    done = pyqtSignal(str, str, str)
+    failed = pyqtSignal(str)
+
+
+class _ReadmeTask(QRunnable):
+    """README 다운로드/변환 작업"""
+
+    def __init__(self, loader, url):
+        super().__init__()
+        self.loader = loader
+        self.url = url
+
+    def run(self):
+        """작업 실행 (작업 스레드)"""
+        # 대기 중에 다른 서버가 선택되었으면 버림
+        if self.loader._current_url() != self.url:
+            self.loader._finish(self.url)
+            return
+
+        try:
+            text = self.loader.fetcher(self.url)
+            if text is None:
+                raise ValueError("README를 가져올 수 없습니다.")
+            digest = document_digest(text)
+            html = self.loader._memoized(digest)
+            if html is None:
+                html = render_markdown(text)
+                self.loader._memoize(digest, html)
+            self.loader._finish(self.url)
+            self.loader._signals.done.emit(self.url, digest, html)
+        except Exception as e:
+            logger.debug(f"README 미리보기 실패: {self.url}: {e}")
+            self.loader._finish(self.url)
+            self.loader._signals.failed.emit(self.url)
+
+
+class ReadmePreviewLoader(QObject):
+    """백그라운드 README 미리보기 로더 클래스"""
+
+    # 시그널 정의 (메인 스레드에서 전달)
+    preview_ready = pyqtSignal(str, str)
+    preview_failed = pyqtSignal(str)
+
+    def __init__(self, cache_dir=None, fetcher=None, memory_items=64, parent=None):
+        """
+        ReadmePreviewLoader 초기화
+
+        Args:
+            cache_dir (str, optional): 변환된 HTML 캐시 디렉토리. 기본값은 None으로,
+                                      이 경우 ~/.mcp_config_manager/cache/readmes/html을 사용합니다.
+            fetcher (callable, optional): URL을 받아 README 원문을 반환하는 함수.
+                                          기본값은 GitHubCrawler.fetch_server_readme입니다.
+            memory_items (int, optional): 메모리 캐시 항목 수. 기본값은 64입니다.
+            parent (QObject, optional): 부모 객체
+        """
+        super().__init__(parent)
+        if cache_dir is None:
+            home_dir = os.path.expanduser("~")
+            cache_dir = os.path.join(home_dir, ".mcp_config_manager", "cache", "readmes", "html")
+        os.makedirs(cache_dir, exist_ok=True)
+        if fetcher is None:
+            from crawler.github_crawler import GitHubCrawler
+            fetcher = GitHubCrawler().fetch_server_readme
+
+        self.cache_dir = cache_dir
+        self.fetcher = fetcher
+        self.memory_items = memory_items
+        self.html_by_url = OrderedDict()
+        self.html_by_digest = OrderedDict()
+
+        # 다운로드 대기가 변환을 막지 않도록 작업 스레드 2개 사용
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(2)
+
+        self._lock = threading.Lock()
+        self._current = None
+        self._in_flight = set()
+
+        self._signals = _ReadmeTaskSignals()
+        self._signals.done.connect(self._on_done)
+        self._signals.failed.connect(self._on_failed)
+
+    def _current_url(self):
+        with self._lock:
+            return self._current
+
+    def _finish(self, url):
+        with self._lock:
+            self._in_flight.discard(url)
+
+    def _memoized(self, digest):
+        """문서 해시로 변환된 HTML을 찾습니다 (메모리 → 디스크)."""
+        with self._lock:
+            html = self.html_by_digest.get(digest)
+        if html is not None:
+            return html
+        try:
+            with open(os.path.join(self.cache_dir, f"{digest}.html"), 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _memoize(self, digest, html):
+        """변환된 HTML을 디스크에 저장합니다."""
+        path = os.path.join(self.cache_dir, f"{digest}.html")
+        try:
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(html)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.error(f"README 미리보기 캐시 저장 실패: {e}")
+
+    def cached(self, url):
+        """
+        메모리 캐시에 있는 미리보기 HTML을 반환합니다.
+
+        Args:
+            url (str): 서버 URL
+
+        Returns:
+            str: HTML 문자열. 없으면 None
+        """
+        html = self.html_by_url.get(url)
+        if html is not None:
+            self.html_by_url.move_to_end(url)
+        return html
+
+    def request(self, url):
+        """
+        서버의 README 미리보기를 요청합니다. 이전에 요청한 서버의 대기 작업은 버려집니다.
+        준비되면 preview_ready 시그널이 전달됩니다.
+
+        Args:
+            url (str): 서버 URL
+
+        Returns:
+            bool: 새 작업을 시작했으면 True, 이미 진행 중이거나 가져올 수 없으면 False
+        """
+        with self._lock:
+            self._current = url
+            if not url or url in self._in_flight:
+                return False
+            self._in_flight.add(url)
+
+        self.pool.start(_ReadmeTask(self, url))
+        return True
+
+    def _on_done(self, url, digest, html):
+        """작업 완료 처리 (메인 스레드)"""
+        for cache, key in ((self.html_by_url, url), (self.html_by_digest, digest)):
+            with self._lock:
+                cache[key] = html
+                cache.move_to_end(key)
+                while len(cache) > self.memory_items:
+                    cache.popitem(last=False)
+        self.preview_ready.emit(url, html)
+
+    def _on_failed(self, url):
+        """작업 실패 처리 (메인 스레드, 다시 선택하면 재시도)"""
+        self.preview_failed.emit(url)
+
+    def shutdown(self):
+        """대기 중인 작업을 버리고 작업 스레드를 정리합니다."""
+        with self._lock:
+            self._current = None
+        self.pool.clear()
+        self.pool.waitForDone(3000)
@@ -0,0 +1,148 @@
+"""
+JSON 직렬화 모듈
+
+설정 파일, 캐시, 백업 매니페스트, 저널의 JSON 읽기/쓰기를 한 곳에서 처리합니다.
+orjson이 설치되어 있으면 사용하고, 없으면 표준 라이브러리 json을 사용합니다.
+
+    - 사용자가 보는 파일(Claude 설정 파일 등)은 pretty=True로 들여쓰기(2칸)하여 저장
+    - 내부 캐시와 기록은 공백 없는 압축 형식으로 저장
+
+두 백엔드 모두 ensure_ascii=False와 같은 UTF-8 출력을 만들며, orjson이 직렬화하지 못하는 값
+(64비트를 넘는 정수 등)과 파싱하지 못하는 값(NaN 등)은 표준 라이브러리로 다시 처리합니다.
+"""
+
+import json
+import logging
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger('json_io')
+
+# 두 백엔드의 파싱 오류를 모두 잡을 수 있는 예외 (orjson.JSONDecodeError는 이 클래스의 하위 클래스)
+JSONDecodeError = json.JSONDecodeError
+
+_backend = 'orjson' if orjson is not None else 'json'
+
+
+def backend():
+    """현재 사용 중인 백엔드 이름('orjson' 또는 'json')을 반환합니다."""
+    return _backend
+
+
+def set_backend(name):
+    """
+    사용할 백엔드를 지정합니다 (벤치마크와 테스트용).
+
+    Args:
+        name (str): 'orjson' 또는 'json'
+
+    Returns:
+        str: 이전 백엔드 이름
+    """
+    global _backend
+    if name not in ('orjson', 'json'):
+        raise ValueError(f"알 수 없는 JSON 백엔드입니다: {name}")
+    if name == 'orjson' and orjson is None:
+        raise ValueError("orjson이 설치되어 있지 않습니다.")
+    previous, _backend = _backend, name
+    return previous
+
+
+def dumps_bytes(value, pretty=False):
+    """
+    값을 UTF-8 JSON 바이트로 직렬화합니다.
+
+    Args:
+        value: 직렬화할 값
+        pretty (bool, optional): True이면 2칸 들여쓰기, False이면 압축 형식. 기본값은 False입니다.
+
+    Returns:
+        bytes: JSON 바이트
+    """
+    if _backend == 'orjson':
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(value, option=option)
+        except orjson.JSONEncodeError:
+            pass
+    return _stdlib_dumps(value, pretty).encode('utf-8')
+
+
+def _stdlib_dumps(value, pretty):
+    """표준 라이브러리로 JSON 문자열을 만듭니다."""
+    if pretty:
+        return json.dumps(value, ensure_ascii=False, indent=2)
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def dumps(value, pretty=False):
+    """
+    값을 JSON 문자열로 직렬화합니다.
+
+    Args:
+        value: 직렬화할 값
+        pretty (bool, optional): True이면 2칸 들여쓰기, False이면 압축 형식. 기본값은 False입니다.
+
+    Returns:
+        str: JSON 문자열
+    """
+    if _backend == 'orjson':
+        return dumps_bytes(value, pretty).decode('utf-8')
+    return _stdlib_dumps(value, pretty)
+
+
+def loads(data):
+    """
+    JSON 문자열 또는 바이트를 파싱합니다.
+
+    Args:
+        data (str | bytes): JSON 데이터
+
+    Returns:
+        파싱된 값
+
+    Raises:
+        JSONDecodeError: JSON 형식이 잘못된 경우
+    """
+    if _backend == 'orjson':
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson이 거부하는 확장 값(NaN, 큰 정수)은 표준 라이브러리로 다시 시도
+            pass
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode('utf-8')
+    return json.loads(data)
+
+
+def load(path):
+    """
+    JSON 파일을 읽어 파싱합니다.
+
+    Args:
+        path (str): 파일 경로
+
+    Returns:
+        파싱된 값
+    """
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dump(value, path, pretty=False):
+    """
+    값을 JSON 파일로 저장합니다. 원자적 교체가 필요하면 호출자가 임시 파일 경로를 넘깁니다.
+
+    Args:
+        value: 저장할 값
+        path (str): 파일 경로
+        pretty (bool, optional): True이면 2칸 들여쓰기, False이면 압축 형식. 기본값은 False입니다.
+    """
+    data = dumps_bytes(value, pretty)
+    with open(path, 'wb') as f:
+        f.write(data)